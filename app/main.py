@@ -1,5 +1,6 @@
 import os
 import sys
+import importlib
 import logging
 import traceback
 from datetime import datetime
@@ -15,12 +16,21 @@ if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
 from config.settings import FLASK_CONFIG
-from database.models import db
-from app.routes.parlamento import parlamento_bp
-from app.routes.agenda import agenda_bp
-from app.routes.health import health_bp
-from app.routes.transparency import transparency_bp
-from app.routes.admin import admin_bp
+from database.connection import prewarm_pool
+from app.utils.lazy_blueprints import LazyBlueprints
+
+# (module, blueprint) pairs registered under /api, in order
+BLUEPRINTS = [
+    ('app.routes.parlamento', 'parlamento_bp'),
+    ('app.routes.agenda', 'agenda_bp'),
+    ('app.routes.health', 'health_bp'),
+    ('app.routes.transparency', 'transparency_bp'),
+    ('app.routes.admin', 'admin_bp'),
+]
+
+# Startup-optimized mode: route modules and models are loaded in the background
+# and registered on the first request (see app/utils/lazy_blueprints.py)
+LAZY_BLUEPRINTS = os.getenv('API_LAZY_BLUEPRINTS', 'false').lower() in ('1', 'true', 'yes')
 
 # Configure logging with more detailed formatting for debugging
 log_dir = os.path.join(parent_dir, 'logs')
@@ -88,19 +98,24 @@ app.debug = True
 # Ativar CORS para permitir requests do frontend
 CORS(app)
 
-app.register_blueprint(parlamento_bp, url_prefix='/api')
-app.register_blueprint(agenda_bp, url_prefix='/api')
-app.register_blueprint(health_bp, url_prefix='/api')
-app.register_blueprint(transparency_bp, url_prefix='/api')
-app.register_blueprint(admin_bp, url_prefix='/api')
-
-# Initialize database - defer actual connection until first use
-try:
-    db.init_app(app)
-    print("Database initialization completed (no connection established yet)")
-except Exception as e:
-    print(f"Database initialization failed: {e}")
-    # Continue without database - routes will handle connection errors
+if LAZY_BLUEPRINTS:
+    lazy_blueprints = LazyBlueprints(app, BLUEPRINTS, url_prefix='/api')
+    lazy_blueprints.preload_in_background()
+else:
+    for module_name, blueprint_name in BLUEPRINTS:
+        app.register_blueprint(getattr(importlib.import_module(module_name), blueprint_name), url_prefix='/api')
+
+    # Initialize database - defer actual connection until first use
+    try:
+        from database.models import db
+        db.init_app(app)
+        print("Database initialization completed (no connection established yet)")
+    except Exception as e:
+        print(f"Database initialization failed: {e}")
+        # Continue without database - routes will handle connection errors
+
+# Open DB_POOL_PREWARM pool connections in the background (disabled by default)
+prewarm_pool()
 
 # Create a dedicated exception logger
 exception_logger = logging.getLogger('flask.exceptions')
@@ -20,6 +20,7 @@ if parent_dir not in sys.path:
 from database.connection import get_session
 from database.models import ImportStatus
 from sqlalchemy import func, desc, case
+import json
 
 admin_bp = Blueprint('admin', __name__)
 
@@ -106,6 +107,7 @@ def get_import_status():
                 'records_imported': r.records_imported,
                 'file_size': r.file_size,
                 'processing_duration_seconds': r.processing_duration_seconds,
+                'phase_profile': json.loads(r.phase_profile) if r.phase_profile else None,
                 'processing_started_at': r.processing_started_at.isoformat() if r.processing_started_at else None,
                 'processing_completed_at': r.processing_completed_at.isoformat() if r.processing_completed_at else None,
                 'error_count': r.error_count,
@@ -133,6 +135,9 @@ def get_import_status():
 def get_import_stats():
     """
     Get aggregated statistics about import status.
+
+    Query params:
+    - profile_limit: Recent profiled imports aggregated in phase_profile (default 200)
     """
     try:
         session = get_session()
@@ -199,8 +204,17 @@ def get_import_stats():
             ImportStatus.status.in_(['pending', 'download_pending', 'discovered'])
         ).scalar()
 
+        # Phase breakdown of the most recent profiled imports
+        profile_limit = min(max(request.args.get('profile_limit', 200, type=int), 0), 2000)
+        profiled = session.query(ImportStatus.file_name, ImportStatus.phase_profile).filter(
+            ImportStatus.phase_profile.isnot(None)
+        ).order_by(ImportStatus.processing_completed_at.desc()).limit(profile_limit).all()
+
         session.close()
 
+        # Imported here: route modules do not load the importer package at startup
+        from scripts.data_processing.import_profiler import summarize_profiles
+
         return jsonify({
             'status_counts': {s: c for s, c in status_counts},
             'category_counts': {c: n for c, n in category_counts},
@@ -215,7 +229,8 @@ def get_import_stats():
                 'avg_processing_seconds': round(float(avg_duration), 2),
                 'currently_processing': processing_count,
                 'pending': pending_count
-            }
+            },
+            'phase_profile': summarize_profiles([(name, json.loads(profile)) for name, profile in profiled])
         })
 
     except Exception as e:
@@ -5,9 +5,7 @@ Implementa funcionalidades de agenda diária, ordens de trabalho e eventos
 
 from flask import Blueprint, jsonify, request
 from datetime import datetime, date, timedelta
-from sqlalchemy import func
-import html
-import re
+from sqlalchemy import func, or_
 import sys
 import os
 
@@ -18,6 +16,8 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from database.connection import get_session
+from database.legislature_registry import get_legislature_registry
+from app.utils.html_text import clean_html_content
 
 agenda_bp = Blueprint('agenda', __name__)
 
@@ -36,59 +36,9 @@ def format_time_display(time_str):
     
     return time_str
 
-def clean_html_content(content):
-    """Clean HTML entities and tags from content, converting br tags to line breaks.
-
-    Handles double-encoded HTML entities (e.g., &amp;lt; -> &lt; -> <)
-    Also removes embedded <style> and <script> blocks entirely.
-    """
-    if not content:
-        return content
-
-    # Decode HTML entities multiple times to handle double/triple encoding
-    decoded = content
-    prev = None
-    max_iterations = 5  # Safety limit
-    iteration = 0
-
-    while decoded != prev and iteration < max_iterations:
-        prev = decoded
-        decoded = html.unescape(decoded)
-        iteration += 1
-
-    # Remove <style>...</style> blocks entirely (including content)
-    decoded = re.sub(r'<style[^>]*>.*?</style>', '', decoded, flags=re.IGNORECASE | re.DOTALL)
-
-    # Remove <script>...</script> blocks entirely (including content)
-    decoded = re.sub(r'<script[^>]*>.*?</script>', '', decoded, flags=re.IGNORECASE | re.DOTALL)
-
-    # Remove <head>...</head> blocks entirely
-    decoded = re.sub(r'<head[^>]*>.*?</head>', '', decoded, flags=re.IGNORECASE | re.DOTALL)
-
-    # Convert <br /> and <br> tags to line breaks
-    with_breaks = re.sub(r'<br\s*/?>', '\n', decoded, flags=re.IGNORECASE)
-
-    # Convert </p> and </li> to line breaks for better formatting
-    with_breaks = re.sub(r'</p>', '\n', with_breaks, flags=re.IGNORECASE)
-    with_breaks = re.sub(r'</li>', '\n', with_breaks, flags=re.IGNORECASE)
-
-    # Remove remaining HTML tags
-    clean_text = re.sub(r'<[^>]+>', '', with_breaks)
-
-    # Remove &nbsp; entities that might remain
-    clean_text = clean_text.replace('\xa0', ' ')
-    clean_text = re.sub(r'&nbsp;?', ' ', clean_text, flags=re.IGNORECASE)
-
-    # Remove CSS-like content that might have leaked through (e.g., "font-family:...")
-    clean_text = re.sub(r'\{[^}]*\}', '', clean_text)
-
-    # Clean up extra whitespace but preserve single line breaks
-    clean_text = re.sub(r'[ \t]+', ' ', clean_text)  # Normalize horizontal whitespace
-    clean_text = re.sub(r'\n\s*\n+', '\n\n', clean_text)  # Max 2 consecutive newlines
-    clean_text = re.sub(r'^\s+', '', clean_text, flags=re.MULTILINE)  # Remove leading spaces per line
-    clean_text = clean_text.strip()
-
-    return clean_text
+def agenda_text(raw, texto):
+    """Plain text of an agenda HTML field: the one rendered at import, or sanitized now for rows not backfilled yet"""
+    return texto if texto is not None else clean_html_content(raw)
 
 @agenda_bp.route('/agenda/hoje', methods=['GET'])
 def get_agenda_hoje():
@@ -126,11 +76,11 @@ def get_agenda_hoje():
                 'id': agenda_item.id,
                 'id_externo': agenda_item.id_externo,
                 'titulo': agenda_item.titulo or 'Evento Parlamentar',
-                'subtitulo': clean_html_content(agenda_item.subtitulo),
+                'subtitulo': agenda_text(agenda_item.subtitulo, agenda_item.subtitulo_texto),
                 'hora_inicio': format_time_display(str(agenda_item.hora_inicio) if agenda_item.hora_inicio else None),
                 'hora_fim': format_time_display(str(agenda_item.hora_fim) if agenda_item.hora_fim else None),
                 'tipo': tipo,
-                'descricao': clean_html_content(agenda_item.descricao),
+                'descricao': agenda_text(agenda_item.descricao, agenda_item.descricao_texto),
                 'local': agenda_item.local_evento,
                 'grupo_parlamentar': agenda_item.grupo_parlamentar,
                 'estado': agenda_item.estado or 'agendado'
@@ -198,7 +148,7 @@ def get_agenda_semana():
                     eventos_dia.append({
                         'id': evento.id,
                         'titulo': evento.titulo,
-                        'subtitulo': clean_html_content(evento.subtitulo),
+                        'subtitulo': agenda_text(evento.subtitulo, evento.subtitulo_texto),
                         'hora_inicio': format_time_display(str(evento.hora_inicio) if evento.hora_inicio else None),
                         'hora_fim': format_time_display(str(evento.hora_fim) if evento.hora_fim else None),
                         'tipo': tipo,
@@ -246,32 +196,40 @@ def get_agenda_mes():
         else:
             ultimo_dia = date(ano, mes + 1, 1) - timedelta(days=1)
         
-        # Simular eventos do mês
-        eventos_mes = []
-        data_atual = primeiro_dia
-        
-        while data_atual <= ultimo_dia:
-            if data_atual.weekday() < 5:  # Segunda a sexta
-                num_eventos = 0
-                
-                # Simular padrão de eventos
-                if data_atual.weekday() in [1, 3]:  # Terça e quinta - sessões plenárias
-                    num_eventos += 1
-                
-                if data_atual.day % 3 == 0:  # A cada 3 dias - comissões
-                    num_eventos += 1
-                
-                if num_eventos > 0:
-                    eventos_mes.append({
-                        'data': data_atual.isoformat(),
-                        'dia': data_atual.day,
-                        'dia_semana': data_atual.strftime('%A'),
-                        'num_eventos': num_eventos,
-                        'tem_plenario': data_atual.weekday() in [1, 3],
-                        'tem_comissoes': data_atual.day % 3 == 0
-                    })
-            
-            data_atual += timedelta(days=1)
+        session = get_db_connection()
+        
+        from database.models import AgendaParlamentar
+        
+        # Eventos do mês agrupados por dia numa única consulta
+        titulo = AgendaParlamentar.titulo
+        e_plenario = or_(titulo.ilike('%plenár%'), titulo.ilike('%sessão%'))
+        e_comissao = titulo.ilike('%comissão%')
+        dias = session.query(
+            AgendaParlamentar.data_evento,
+            func.count(AgendaParlamentar.id),
+            func.count(AgendaParlamentar.id).filter(e_plenario),
+            func.count(AgendaParlamentar.id).filter(e_comissao),
+        ).filter(
+            AgendaParlamentar.data_evento >= primeiro_dia,
+            AgendaParlamentar.data_evento <= ultimo_dia
+        ).group_by(
+            AgendaParlamentar.data_evento
+        ).order_by(
+            AgendaParlamentar.data_evento
+        ).all()
+        session.close()
+        
+        eventos_mes = [
+            {
+                'data': data_dia.isoformat(),
+                'dia': data_dia.day,
+                'dia_semana': data_dia.strftime('%A'),
+                'num_eventos': num_eventos,
+                'tem_plenario': num_plenario > 0,
+                'tem_comissoes': num_comissao > 0
+            }
+            for data_dia, num_eventos, num_plenario, num_comissao in dias
+        ]
         
         return jsonify({
             'periodo': {
@@ -549,11 +507,15 @@ def get_estatisticas_atividade():
         
         # Count unique active deputies for accurate per-deputy averages
         from database.models import Deputado, DeputadoMandatoLegislativo
-        unique_active_deputies = session.query(func.count(func.distinct(Deputado.id_cadastro))).join(
-            DeputadoMandatoLegislativo, Deputado.id == DeputadoMandatoLegislativo.deputado_id
-        ).filter(
-            DeputadoMandatoLegislativo.leg_des == 'XVII'  # Current legislature
-        ).scalar() or 1
+        # (none until a legislature is imported)
+        current_leg = get_legislature_registry().current
+        unique_active_deputies = 0
+        if current_leg is not None:
+            unique_active_deputies = session.query(func.count(func.distinct(Deputado.id_cadastro))).join(
+                DeputadoMandatoLegislativo, Deputado.id == DeputadoMandatoLegislativo.deputado_id
+            ).filter(
+                DeputadoMandatoLegislativo.legislatura_id == current_leg.id
+            ).scalar() or 0
         
         # Reuniões de comissão (aproximação baseada em títulos)
         reunioes_comissao = session.query(AgendaParlamentar).filter(
@@ -595,7 +557,7 @@ def get_estatisticas_atividade():
             },
             'intervencoes': {
                 'total': total_intervencoes,
-                'media_por_deputado': round(total_intervencoes / unique_active_deputies, 1) if total_intervencoes > 0 else 0
+                'media_por_deputado': round(total_intervencoes / unique_active_deputies, 1) if total_intervencoes > 0 and unique_active_deputies else 0
             },
             'comissoes': {
                 'reunioes_mes': reunioes_comissao,
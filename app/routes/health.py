@@ -2,6 +2,8 @@ from flask import Blueprint, jsonify
 import os
 import sys
 import logging
+import threading
+import time
 from datetime import datetime
 
 # Set up logging
@@ -17,11 +19,81 @@ parent_dir = os.path.dirname(os.path.dirname(current_dir))
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from database.connection import get_database_url, create_database_engine
+from database.connection import get_engine, get_pool_status
+from database.reference_cache import reference_cache_stats
 from sqlalchemy import text
 
 health_bp = Blueprint('health', __name__)
 
+# Probe results are reused for this many seconds (ALB/ECS probe every few seconds)
+PROBE_CACHE_TTL = float(os.getenv('HEALTH_PROBE_CACHE_TTL', '5'))
+
+_probe_cache = {}  # probe name -> (monotonic timestamp, result)
+_probe_lock = threading.Lock()
+
+
+def _cached_probe(name, probe):
+    """
+    Run probe() at most once per PROBE_CACHE_TTL seconds.
+
+    Returns:
+        (result, age in seconds or None if just computed)
+    """
+    now = time.monotonic()
+    with _probe_lock:
+        cached = _probe_cache.get(name)
+        if cached and now - cached[0] < PROBE_CACHE_TTL:
+            return cached[1], round(now - cached[0], 2)
+        result = probe()
+        _probe_cache[name] = (time.monotonic(), result)
+        return result, None
+
+
+def _probe_database():
+    """SELECT 1 on a pooled connection of the shared engine"""
+    try:
+        engine = get_engine()
+        with engine.connect() as conn:
+            result = conn.execute(text("SELECT 1 as test")).fetchone()
+        return {
+            'database': "healthy" if result[0] == 1 else "unhealthy",
+            'database_type': engine.dialect.name,
+        }
+    except Exception as e:
+        return {'database': f"error: {str(e)}", 'database_type': "unknown"}
+
+
+def _probe_readiness():
+    """
+    Check that the deputados table exists and estimate its size.
+
+    Uses the planner's row estimate (pg_class.reltuples) instead of a full
+    COUNT(*); when the table has never been analyzed the estimate is -1 and
+    an EXISTS query decides whether it is empty.
+    """
+    try:
+        with get_engine().connect() as conn:
+            row = conn.execute(text(
+                "SELECT c.reltuples::bigint FROM pg_class c WHERE c.oid = to_regclass('deputados')"
+            )).fetchone()
+            if row is None:
+                return {'status': 'not_ready', 'reason': 'database_tables_missing'}, 503
+            estimate = row[0]
+            if estimate is None or estimate < 0:
+                has_rows = conn.execute(text("SELECT EXISTS (SELECT 1 FROM deputados)")).scalar()
+                estimate = 1 if has_rows else 0
+    except Exception as e:
+        return {'status': 'not_ready', 'reason': str(e)}, 503
+
+    if estimate == 0:
+        return {
+            'status': 'ready',  # Ready but empty is still ready
+            'reason': 'database_empty_but_accessible',
+            'deputies_count': 0
+        }, 200
+    return {'status': 'ready', 'deputies_count': estimate, 'deputies_count_estimated': True}, 200
+
+
 @health_bp.route('/ping', methods=['GET'])
 def ping():
     """Simple ping endpoint that doesn't touch the database"""
@@ -36,30 +108,15 @@ def ping():
 @health_bp.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint for Lambda and container orchestration"""
-    try:
-        logger.info("=== HEALTH CHECK DEBUG START ===")
-        logger.info("About to create database engine...")
-        # Check database connectivity using the proper database connection
-        engine = create_database_engine()
-        logger.info("Database engine created successfully")
-        logger.info("About to connect to database...")
-        with engine.connect() as conn:
-            # Test query that works with both PostgreSQL and SQLite
-            result = conn.execute(text("SELECT 1 as test")).fetchone()
-            db_status = "healthy" if result[0] == 1 else "unhealthy"
-            
-        db_url = get_database_url()
-        db_type = "postgresql" if db_url.startswith("postgresql://") else "sqlite"
-        
-    except Exception as e:
-        db_status = f"error: {str(e)}"
-        db_type = "unknown"
-    
+    db_result, cache_age = _cached_probe('health', _probe_database)
+
     return jsonify({
         'status': 'healthy',
         'service': 'parliament-backend',
-        'database': db_status,
-        'database_type': db_type,
+        **db_result,
+        'pool': get_pool_status(),
+        'reference_cache': reference_cache_stats(),
+        'cache_age_seconds': cache_age,
         'environment': os.getenv('AWS_LAMBDA_FUNCTION_NAME', 'local'),
         'version': APP_VERSION,
         'build_time': BUILD_TIME
@@ -68,40 +125,5 @@ def health_check():
 @health_bp.route('/ready', methods=['GET'])
 def readiness_check():
     """Readiness check for Lambda/ECS"""
-    try:
-        # Check if database is accessible and has data
-        engine = create_database_engine()
-        with engine.connect() as conn:
-            # Try to query for deputies/deputados table
-            try:
-                result = conn.execute(text("SELECT COUNT(*) FROM deputado")).fetchone()
-                count = result[0] if result else 0
-            except:
-                # Try alternative table name
-                try:
-                    result = conn.execute(text("SELECT COUNT(*) FROM deputados")).fetchone()
-                    count = result[0] if result else 0
-                except:
-                    # Database exists but tables might not be created yet
-                    return jsonify({
-                        'status': 'not_ready',
-                        'reason': 'database_tables_missing'
-                    }), 503
-        
-        if count == 0:
-            return jsonify({
-                'status': 'ready',  # Ready but empty is still ready
-                'reason': 'database_empty_but_accessible',
-                'deputies_count': count
-            }), 200
-        
-        return jsonify({
-            'status': 'ready',
-            'deputies_count': count
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'status': 'not_ready',
-            'reason': str(e)
-        }), 503
\ No newline at end of file
+    (payload, status_code), cache_age = _cached_probe('ready', _probe_readiness)
+    return jsonify(dict(payload, cache_age_seconds=cache_age)), status_code
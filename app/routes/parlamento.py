@@ -3,9 +3,14 @@ Parliament API Routes - MySQL Implementation
 Clean implementation with proper MySQL/SQLAlchemy patterns
 """
 from flask import Blueprint, request, jsonify
-from sqlalchemy import func, desc, distinct, or_, and_, case, exists, select
+from sqlalchemy import func, desc, distinct, or_, and_, case, exists, false, select
 from sqlalchemy.orm import aliased
 from database.connection import DatabaseSession
+from database.legislature_registry import get_legislature_registry, legislature_ordinal
+from database.reference_cache import (
+    circle_by_designacao, coalition_by_id, legislature_by_id, legislature_by_numero, party_by_sigla,
+    reference_coalitions, reference_legislatures, reference_parties
+)
 from database.models import (
     Deputado, Partido, Legislatura, CirculoEleitoral,
     DeputadoMandatoLegislativo, DeputadoHabilitacao,
@@ -13,15 +18,69 @@ from database.models import (
     DeputadoObraPublicada, IntervencaoParlamentar, IntervencaoDeputado,
     IniciativaParlamentar, IniciativaAutorDeputado, IniciativaEvento, IniciativaEventoVotacao,
     AtividadeParlamentar, AtividadeParlamentarVotacao, OrcamentoEstadoVotacao,
-    OrcamentoEstadoGrupoParlamentarVoto, Coligacao, ColigacaoPartido,
-    RegistoInteressesUnified
+    OrcamentoEstadoPartidoVotoStats, ColigacaoPartido,
+    RegistoInteressesUnified, ActivityEvent, InterestEntity, InterestEntityCooccurrence
 )
-from scripts.data_processing.mappers.political_entity_queries import PoliticalEntityQueries
 from app.utils.attribution import AttributionBuilder, format_attribution_response
+from app.utils.dashboard_aggregates import get_dashboard_aggregate, AGGREGATE_ESTATISTICAS
+from app.utils.json_response import json_response, parse_fields, select_fields, wants
+from app.utils.pagination import (
+    keyset_page, keyset_cursor, keyset_sort_key,
+    apply_keyset, decode_keyset_cursor
+)
+from app.utils.party_votes import party_activity_vote_counts, party_deputies
 
 parlamento_bp = Blueprint('parlamento', __name__)
 
 
+def _current_legislatura_id():
+    """Id of the current legislature (None until a legislature is imported)"""
+    current = get_legislature_registry().current
+    return current.id if current else None
+
+
+def _in_current_legislatura(column):
+    """
+    Filter on column == the current legislature's id.
+
+    Matches nothing until a legislature is imported (column == None would
+    compile to IS NULL and match rows without a legislature instead).
+    """
+    legislatura_id = _current_legislatura_id()
+    return column == legislatura_id if legislatura_id is not None else false()
+
+
+def _current_legislatura_numero():
+    """Numero of the current legislature, e.g. 'XVII'"""
+    current = get_legislature_registry().current
+    return current.numero if current else None
+
+
+def _is_current_legislatura(numero) -> bool:
+    return get_legislature_registry().is_current(numero)
+
+
+def _political_entity_queries(session):
+    """PoliticalEntityQueries for a session, imported on first use (it loads the importer's mapper package)"""
+    from scripts.data_processing.mappers.political_entity_queries import PoliticalEntityQueries
+    return PoliticalEntityQueries(session)
+
+
+def budget_votes_query(session, sigla):
+    """Budget votes in which a party voted, newest first (GIN index on votos_partidos)"""
+    return session.query(OrcamentoEstadoVotacao).filter(
+        OrcamentoEstadoVotacao.votos_partidos.has_key(sigla)
+    ).order_by(desc(OrcamentoEstadoVotacao.data_votacao), desc(OrcamentoEstadoVotacao.id))
+
+
+def budget_party_votes(votacao):
+    """[{'partido', 'voto'}] of a budget votacao from its party x votacao matrix"""
+    return [
+        {'partido': partido, 'voto': voto}
+        for partido, voto in (votacao.votos_partidos or {}).items()
+    ]
+
+
 def calculate_party_demographics(deputados, session=None):
     """Calculate comprehensive demographic statistics for a list of deputies"""
     if not deputados:
@@ -239,25 +298,41 @@ def calculate_party_demographics(deputados, session=None):
     }
 
 
-def deputado_to_dict(deputado, session=None):
-    """Convert Deputado object to dictionary for JSON serialization with related data"""
-    
+def deputado_to_dict(deputado, session=None, fields=None):
+    """Convert Deputado object to dictionary for JSON serialization with related data
+
+    Args:
+        deputado: Deputado instance
+        session: Optional session used to load mandate and legislature data
+        fields: Optional FieldSelector; related queries and status properties
+                (each a separate query) are only evaluated for selected fields
+    """
+    need_mandato = wants(fields, 'partido_sigla', 'circulo', 'career_info')
+    need_legislatura = wants(
+        fields, 'legislatura_nome', 'legislatura_numero', 'mandato_ativo',
+        'ultima_legislatura', 'career_info'
+    )
+
     # Get related data if session is provided
+    mandato = None
+    legislatura = None
     if session:
-        # Get mandate info
-        mandato = session.query(DeputadoMandatoLegislativo).filter_by(
-            deputado_id=deputado.id
-        ).first()
-        
-        # Get legislature info
-        legislatura = session.query(Legislatura).filter_by(
-            id=deputado.legislatura_id
-        ).first()
-    else:
-        mandato = None
-        legislatura = None
-    
-    return {
+        if need_mandato:
+            # Get mandate info
+            mandato = session.query(DeputadoMandatoLegislativo).filter_by(
+                deputado_id=deputado.id
+            ).first()
+
+        if need_legislatura:
+            # Get legislature info
+            legislatura = legislature_by_id(deputado.legislatura_id, session)
+
+    # Status properties each run their own query - evaluate once, only if needed
+    is_active = deputado.is_active if wants(fields, 'ativo', 'mandato_ativo', 'career_info') else None
+    is_seated = deputado.is_seated if wants(fields, 'is_seated', 'career_info') else None
+    mandate_status = deputado.mandate_status if wants(fields, 'mandate_status', 'career_info') else None
+
+    result = {
         'deputado_id': deputado.id,  # Frontend expects deputado_id
         'id': deputado.id,
         'id_cadastro': deputado.id_cadastro,
@@ -270,11 +345,11 @@ def deputado_to_dict(deputado, session=None):
         'foto_url': deputado.foto_url,  # Deprecated - kept for backward compatibility
         'picture_url': f'https://app.parlamento.pt/webutils/getimage.aspx?id={deputado.id_cadastro}&type=deputado' if deputado.id_cadastro else None,
         'sexo': deputado.sexo,
-        'ativo': deputado.is_active,
+        'ativo': is_active,
 
         # Seat status - derived from DadosSituacaoDeputado
-        'is_seated': deputado.is_seated,  # True if currently occupying a seat (Efetivo*)
-        'mandate_status': deputado.mandate_status,  # Efetivo, Suspenso(Eleito), Renunciou, etc.
+        'is_seated': is_seated,  # True if currently occupying a seat (Efetivo*)
+        'mandate_status': mandate_status,  # Efetivo, Suspenso(Eleito), Renunciou, etc.
 
         # Mandate related data - use individual party sigla
         'partido_sigla': (
@@ -289,14 +364,16 @@ def deputado_to_dict(deputado, session=None):
         'legislatura_numero': legislatura.numero if legislatura else None,
         
         # Fields expected by party page frontend
-        'mandato_ativo': True if legislatura and legislatura.numero == 'XVII' else deputado.is_active,  # Party page expects this field name
+        'mandato_ativo': True if legislatura and _is_current_legislatura(legislatura.numero) else is_active,  # Party page expects this field name
         'ultima_legislatura': legislatura.numero if legislatura else None,  # Party page expects this field name
-        
+    }
+
+    if wants(fields, 'career_info'):
         # Basic career info placeholder (frontend expects this structure)
-        'career_info': {
-            'is_currently_active': deputado.is_active,
-            'is_seated': deputado.is_seated,  # Currently occupying a seat
-            'mandate_status': deputado.mandate_status,  # Current status description
+        result['career_info'] = {
+            'is_currently_active': is_active,
+            'is_seated': is_seated,  # Currently occupying a seat
+            'mandate_status': mandate_status,  # Current status description
             'is_multi_term': False,  # Would need complex query to determine
             'total_mandates': 1,  # Simplified for now
             'first_mandate': legislatura.numero if legislatura else None,
@@ -306,7 +383,8 @@ def deputado_to_dict(deputado, session=None):
                 else mandato.par_sigla
             )] if mandato and (mandato.par_sigla or mandato.gp_sigla) else []
         }
-    }
+
+    return select_fields(result, fields)
 
 
 def partido_to_dict(partido):
@@ -381,7 +459,7 @@ def get_most_recent_deputy(session, cad_id):
         deputado = session.query(Deputado).filter(
             Deputado.id_cadastro == cad_id
         ).join(Legislatura).filter(
-            Legislatura.numero == 'XVII'
+            _in_current_legislatura(Legislatura.id)
         ).first()
 
         if deputado:
@@ -507,9 +585,7 @@ def get_deputado_detalhes(cad_id):
                 attribution.track_query(DeputadoMandatoLegislativo, [mandato_info], purpose="get_mandate_info")
             
             # Get legislature information
-            legislatura = session.query(Legislatura).filter_by(
-                id=deputado.legislatura_id
-            ).first()
+            legislatura = legislature_by_id(deputado.legislatura_id, session)
             
             # Build response with deputy details and mandate info
             response = deputado_to_dict(deputado, session)
@@ -537,7 +613,7 @@ def get_deputado_detalhes(cad_id):
                 response['legislatura'] = {
                     'numero': legislatura.numero,
                     'designacao': legislatura.designacao,
-                    'ativa': legislatura.numero == 'XVII'  # Only XVII is the current active legislature
+                    'ativa': _is_current_legislatura(legislatura.numero)
                 }
             
             # Calculate statistics for this deputy
@@ -715,7 +791,7 @@ def get_deputado_detalhes(cad_id):
                     DeputadoMandatoLegislativo, Deputado.id == DeputadoMandatoLegislativo.deputado_id
                 ).filter(
                     DeputadoMandatoLegislativo.par_sigla == current_party,
-                    DeputadoMandatoLegislativo.leg_des == 'XVII'  # Current legislature
+                    _in_current_legislatura(DeputadoMandatoLegislativo.legislatura_id)  # Current legislature
                 ).scalar() or 1
                 
                 # Party total initiatives
@@ -731,7 +807,7 @@ def get_deputado_detalhes(cad_id):
                 total_active_deputies = session.query(func.count(distinct(Deputado.id_cadastro))).join(
                     DeputadoMandatoLegislativo, Deputado.id == DeputadoMandatoLegislativo.deputado_id
                 ).filter(
-                    DeputadoMandatoLegislativo.leg_des == 'XVII'
+                    _in_current_legislatura(DeputadoMandatoLegislativo.legislatura_id)
                 ).scalar() or 1
                 
                 # Simple percentile based on initiative count (could be enhanced)
@@ -779,12 +855,9 @@ def get_deputado_detalhes(cad_id):
                 leg_interventions = session.query(func.count(IntervencaoParlamentar.id)).join(
                     IntervencaoDeputado,
                     IntervencaoParlamentar.id == IntervencaoDeputado.intervencao_id
-                ).join(
-                    Legislatura,
-                    IntervencaoParlamentar.legislatura_id == Legislatura.id
                 ).filter(
                     IntervencaoDeputado.id_cadastro == deputado.id_cadastro,
-                    Legislatura.numero == leg.numero
+                    IntervencaoParlamentar.legislatura_id == leg.id
                 ).scalar() or 0
 
                 evolucao_legislaturas.append({
@@ -794,8 +867,7 @@ def get_deputado_detalhes(cad_id):
                 })
 
             # Sort by legislature number (most recent first for display)
-            leg_order = {'XVII': 1, 'XVI': 2, 'XV': 3, 'XIV': 4, 'XIII': 5, 'XII': 6}
-            evolucao_legislaturas.sort(key=lambda x: leg_order.get(x['legislatura'], 99))
+            evolucao_legislaturas.sort(key=lambda x: -(legislature_ordinal(x['legislatura']) or -1))
 
             # Determine if deputy is in opposition (simplified check)
             # Government parties in XVII: PS (minority government)
@@ -875,7 +947,7 @@ def get_deputado_detalhes(cad_id):
                         'circulo': mand.ce_des,
                         'partido_sigla': mand.par_sigla,
                         'partido_nome': mand.par_des,
-                        'is_current': leg.numero == 'XVII'
+                        'is_current': _is_current_legislatura(leg.numero)
                     }
                     mandatos_historico.append(mandato_data)
 
@@ -925,6 +997,12 @@ def get_partido_deputados(partido_sigla):
 
         legislatura = request.args.get('legislatura', None, type=str)
 
+        try:
+            fields = parse_fields(request.args.get('fields'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        need_legislatura = wants(fields, 'legislatura_nome', 'legislatura_numero')
+
         with DatabaseSession() as session:
             # First try to get the party information from the partidos table
             partido = session.query(Partido).filter_by(sigla=partido_sigla).first()
@@ -1024,7 +1102,7 @@ def get_partido_deputados(partido_sigla):
                 Legislatura, Deputado.legislatura_id == Legislatura.id
             ).filter(
                 DeputadoMandatoLegislativo.gp_sigla == partido_sigla,
-                DeputadoMandatoLegislativo.leg_des == 'XVII'
+                _in_current_legislatura(DeputadoMandatoLegislativo.legislatura_id)
             ).all()
 
             # Get existing id_cadastros from deputy_mandates
@@ -1065,7 +1143,7 @@ def get_partido_deputados(partido_sigla):
                 DeputadoMandatoLegislativo, Deputado.id == DeputadoMandatoLegislativo.deputado_id
             ).filter(
                 party_filter,
-                DeputadoMandatoLegislativo.leg_des == 'XVII'
+                _in_current_legislatura(DeputadoMandatoLegislativo.legislatura_id)
             ).distinct()
 
             for row in active_query:
@@ -1080,7 +1158,7 @@ def get_partido_deputados(partido_sigla):
                     DeputadoMandatoLegislativo, Deputado.id == DeputadoMandatoLegislativo.deputado_id
                 ).filter(
                     party_filter,
-                    DeputadoMandatoLegislativo.leg_des == 'XVII'
+                    _in_current_legislatura(DeputadoMandatoLegislativo.legislatura_id)
                 ).distinct()
 
                 for row in active_query:
@@ -1094,7 +1172,7 @@ def get_partido_deputados(partido_sigla):
                 DeputadoMandatoLegislativo, Deputado.id == DeputadoMandatoLegislativo.deputado_id
             ).filter(
                 DeputadoMandatoLegislativo.gp_sigla == partido_sigla,
-                DeputadoMandatoLegislativo.leg_des == 'XVII'
+                _in_current_legislatura(DeputadoMandatoLegislativo.legislatura_id)
             ).distinct()
 
             for row in gp_active_query:
@@ -1113,12 +1191,12 @@ def get_partido_deputados(partido_sigla):
                         DeputadoMandatoLegislativo, Deputado.id == DeputadoMandatoLegislativo.deputado_id
                     ).filter(
                         Deputado.id_cadastro == id_cadastro,
-                        DeputadoMandatoLegislativo.leg_des == 'XVII'
+                        _in_current_legislatura(DeputadoMandatoLegislativo.legislatura_id)
                     ).first()
 
                     if xvii_deputado:
                         deputado = xvii_deputado
-                        legislatura_obj = session.query(Legislatura).filter_by(numero='XVII').first()
+                        legislatura_obj = legislature_by_id(_current_legislatura_id(), session) if need_legislatura else None
                         # Update mandate_info to reflect XVII data
                         xvii_mandate = session.query(DeputadoMandatoLegislativo).filter_by(
                             deputado_id=xvii_deputado.id
@@ -1127,7 +1205,7 @@ def get_partido_deputados(partido_sigla):
                             mandate_info = {
                                 'deputado_id': xvii_deputado.id,
                                 'id_cadastro': id_cadastro,
-                                'leg_des': 'XVII',
+                                'leg_des': _current_legislatura_numero(),
                                 'ce_des': xvii_mandate.ce_des,
                                 'par_sigla': xvii_mandate.par_sigla,
                                 'gp_sigla': xvii_mandate.gp_sigla,
@@ -1136,11 +1214,11 @@ def get_partido_deputados(partido_sigla):
                     else:
                         # Fallback to stored mandate_info if XVII not found
                         deputado = session.query(Deputado).filter_by(id=mandate_info['deputado_id']).first()
-                        legislatura_obj = session.query(Legislatura).filter_by(id=deputado.legislatura_id).first() if deputado else None
+                        legislatura_obj = legislature_by_id(deputado.legislatura_id, session) if deputado and need_legislatura else None
                 else:
                     # For inactive deputies, use the stored mandate info (most recent mandate)
                     deputado = session.query(Deputado).filter_by(id=mandate_info['deputado_id']).first()
-                    legislatura_obj = session.query(Legislatura).filter_by(id=deputado.legislatura_id).first() if deputado else None
+                    legislatura_obj = legislature_by_id(deputado.legislatura_id, session) if deputado and need_legislatura else None
 
                 if not deputado:
                     continue
@@ -1158,7 +1236,7 @@ def get_partido_deputados(partido_sigla):
                     'foto_url': deputado.foto_url,
                     'picture_url': f'https://app.parlamento.pt/webutils/getimage.aspx?id={deputado.id_cadastro}&type=deputado' if deputado.id_cadastro else None,
                     'sexo': deputado.sexo,
-                    'ativo': deputado.is_active,
+                    'ativo': deputado.is_active if wants(fields, 'ativo') else None,
                     'partido_sigla': (
                         mandate_info['gp_sigla'] if mandate_info.get('eh_coligacao') and mandate_info.get('gp_sigla')
                         else mandate_info['par_sigla']
@@ -1199,7 +1277,7 @@ def get_partido_deputados(partido_sigla):
             coalition_data = None
             if coalition_info and coalition_info.coligacao_id:
                 # Get coalition information
-                coalition = session.query(Coligacao).filter_by(id=coalition_info.coligacao_id).first()
+                coalition = coalition_by_id(coalition_info.coligacao_id, session)
                 if coalition:
                     coalition_data = {
                         'sigla': coalition.sigla,
@@ -1216,8 +1294,8 @@ def get_partido_deputados(partido_sigla):
             # This is the intersection of our unique people and those with XVII mandate
             mandatos_ativos = sum(1 for d in result_deputies if d['mandato_ativo'])
 
-            return jsonify({
-                'deputados': result_deputies,
+            return json_response({
+                'deputados': [select_fields(d, fields) for d in result_deputies],
                 'total': len(result_deputies),
                 'mandatos_ativos': mandatos_ativos,
                 'partido': {
@@ -1241,19 +1319,17 @@ def get_legislaturas():
     """Retorna lista de legislaturas com informação sobre mandatos"""
     try:
         with DatabaseSession() as session:
-            legislaturas = session.query(Legislatura).order_by(
-                desc(Legislatura.numero)
-            ).all()
+            legislaturas = sorted(reference_legislatures(session), key=lambda leg: leg.numero, reverse=True)
+
+            # Count unique people (not records) per legislature in one grouped query
+            deputy_counts = dict(session.query(
+                Deputado.legislatura_id, func.count(func.distinct(Deputado.id_cadastro))
+            ).group_by(Deputado.legislatura_id).all())
             
             result = []
             for leg in legislaturas:
-                # Count unique people (not records) in this legislature
-                deputy_count = session.query(func.count(func.distinct(Deputado.id_cadastro))).filter(
-                    Deputado.legislatura_id == leg.id
-                ).scalar()
-                
                 leg_dict = legislatura_to_dict(leg)
-                leg_dict['total_deputados'] = deputy_count
+                leg_dict['total_deputados'] = deputy_counts.get(leg.id, 0)
                 result.append(leg_dict)
             
             return jsonify({'legislaturas': result})
@@ -1270,29 +1346,32 @@ def get_legislaturas():
 def get_circulos():
     """Retorna lista de círculos eleitorais com contagem de deputados"""
     try:
-        legislatura = request.args.get('legislatura', 'XVII', type=str)
+        legislatura = request.args.get('legislatura', _current_legislatura_numero(), type=str)
         
         with DatabaseSession() as session:
+            leg = legislature_by_numero(legislatura, session)
+
             # Get electoral circles with deputy counts using new schema
             circulos_result = session.query(
                 DeputadoMandatoLegislativo.ce_des.label('designacao'),
                 func.count(Deputado.id).label('num_deputados')
             ).join(
                 Deputado, DeputadoMandatoLegislativo.deputado_id == Deputado.id
-            ).join(
-                Legislatura, Deputado.legislatura_id == Legislatura.id
             ).filter(
-                Legislatura.numero == legislatura,
+                Deputado.legislatura_id == leg.id,
                 DeputadoMandatoLegislativo.ce_des.isnot(None)
             ).group_by(
                 DeputadoMandatoLegislativo.ce_des
-            ).order_by(desc('num_deputados')).all()
+            ).order_by(desc('num_deputados')).all() if leg else []
             
             result = []
             for c in circulos_result:
+                circulo = circle_by_designacao(c.designacao, session)
                 result.append({
                     'designacao': c.designacao,
-                    'num_deputados': c.num_deputados
+                    'num_deputados': c.num_deputados,
+                    'codigo': circulo.codigo if circulo else None,
+                    'regiao': circulo.regiao if circulo else None
                 })
             
             return jsonify({
@@ -1305,179 +1384,189 @@ def get_circulos():
         return log_and_return_error(e, '/api/circulos')
 
 
+def compute_estatisticas(session, legislatura):
+    """Compute the /estatisticas payload for a legislature (also used by the aggregate refresh)"""
+    # Get legislature information
+    legislature_info = legislature_by_numero(legislatura, session)
+    
+    # Count unique people (not records) in the specified legislature using id_cadastro
+    total_deputados = session.query(
+        func.count(func.distinct(Deputado.id_cadastro))
+    ).join(
+        DeputadoMandatoLegislativo, Deputado.id == DeputadoMandatoLegislativo.deputado_id
+    ).filter(
+        DeputadoMandatoLegislativo.leg_des == legislatura
+    ).scalar()
+
+    # Count seated deputies (those with Efetivo* status) for current legislature
+    from app.utils.deputy_status import get_seated_deputies_count
+    seated_deputados = get_seated_deputies_count(legislatura, session)
+    
+    # Count distinct individual parties represented (not coalitions)
+    individual_parties = session.query(
+        distinct(DeputadoMandatoLegislativo.par_sigla)
+    ).filter(
+        DeputadoMandatoLegislativo.leg_des == legislatura,
+        DeputadoMandatoLegislativo.eh_coligacao == False,
+        DeputadoMandatoLegislativo.par_sigla.isnot(None)
+    ).all()
+    
+    coalition_parties = session.query(
+        distinct(DeputadoMandatoLegislativo.gp_sigla)
+    ).filter(
+        DeputadoMandatoLegislativo.leg_des == legislatura,
+        DeputadoMandatoLegislativo.eh_coligacao == True,
+        DeputadoMandatoLegislativo.gp_sigla.isnot(None)
+    ).all()
+    
+    # Combine unique parties
+    all_parties = set([p[0] for p in individual_parties] + [p[0] for p in coalition_parties])
+    total_partidos = len(all_parties)
+    
+    # Count distinct electoral circles - simplified direct approach
+    total_circulos = session.query(
+        func.count(distinct(DeputadoMandatoLegislativo.ce_des))
+    ).filter(
+        DeputadoMandatoLegislativo.leg_des == legislatura,
+        DeputadoMandatoLegislativo.ce_des.isnot(None)
+    ).scalar()
+    
+    # Total mandates = total deputies in this context
+    total_mandatos = total_deputados
+    
+    # Distribution by individual parties (not coalitions) - count unique people by id_cadastro
+    # First get individual party records
+    individual_party_dist = session.query(
+        DeputadoMandatoLegislativo.par_sigla.label('sigla'),
+        DeputadoMandatoLegislativo.par_des.label('nome'),
+        func.count(func.distinct(Deputado.id_cadastro)).label('deputados')
+    ).join(
+        Deputado, DeputadoMandatoLegislativo.deputado_id == Deputado.id
+    ).filter(
+        DeputadoMandatoLegislativo.leg_des == legislatura,
+        DeputadoMandatoLegislativo.eh_coligacao == False,
+        DeputadoMandatoLegislativo.par_sigla.isnot(None)
+    ).group_by(
+        DeputadoMandatoLegislativo.par_sigla,
+        DeputadoMandatoLegislativo.par_des
+    ).all()
+    
+    # Then get coalition records using gp_sigla (parliamentary group = individual party) - count unique people
+    coalition_party_dist = session.query(
+        DeputadoMandatoLegislativo.gp_sigla.label('sigla'),
+        DeputadoMandatoLegislativo.gp_des.label('nome'),
+        func.count(func.distinct(Deputado.id_cadastro)).label('deputados')
+    ).join(
+        Deputado, DeputadoMandatoLegislativo.deputado_id == Deputado.id
+    ).filter(
+        DeputadoMandatoLegislativo.leg_des == legislatura,
+        DeputadoMandatoLegislativo.eh_coligacao == True,
+        DeputadoMandatoLegislativo.gp_sigla.isnot(None)
+    ).group_by(
+        DeputadoMandatoLegislativo.gp_sigla,
+        DeputadoMandatoLegislativo.gp_des
+    ).all()
+    
+    # Combine and aggregate party counts
+    party_counts = {}
+    for party in individual_party_dist:
+        party_counts[party.sigla] = {
+            'sigla': party.sigla,
+            'nome': party.nome,
+            'deputados': party.deputados
+        }
+        
+    for party in coalition_party_dist:
+        if party.sigla in party_counts:
+            party_counts[party.sigla]['deputados'] += party.deputados
+        else:
+            party_counts[party.sigla] = {
+                'sigla': party.sigla,
+                'nome': party.nome,
+                'deputados': party.deputados
+            }
+    
+    # Convert to list and sort by deputy count
+    distribuicao_partidos = sorted(
+        party_counts.values(), 
+        key=lambda x: x['deputados'], 
+        reverse=True
+    )
+    
+    # Distribution by electoral circles - count unique people by id_cadastro
+    distribuicao_circulos = session.query(
+        DeputadoMandatoLegislativo.ce_des.label('circulo'),
+        func.count(func.distinct(Deputado.id_cadastro)).label('deputados')
+    ).join(
+        Deputado, DeputadoMandatoLegislativo.deputado_id == Deputado.id
+    ).filter(
+        DeputadoMandatoLegislativo.leg_des == legislatura,
+        DeputadoMandatoLegislativo.ce_des.isnot(None)
+    ).group_by(
+        DeputadoMandatoLegislativo.ce_des
+    ).order_by(func.count(func.distinct(Deputado.id_cadastro)).desc()).limit(10).all()
+    
+    # Largest party
+    maior_partido = distribuicao_partidos[0] if distribuicao_partidos else None
+    
+    # Largest electoral circle
+    maior_circulo = distribuicao_circulos[0] if distribuicao_circulos else None
+    
+    return {
+        'totais': {
+            'deputados': total_deputados,
+            'deputados_eleitos': total_deputados,  # All elected deputies
+            'deputados_em_exercicio': seated_deputados,  # Currently seated
+            'seated_deputies': seated_deputados,  # Alias for frontend compatibility
+            'partidos': total_partidos,
+            'circulos': total_circulos,
+            'mandatos': total_mandatos
+        },
+        'distribuicao_partidos': [
+            {
+                'id': p['sigla'],  # Frontend expects 'id' field for routing
+                'sigla': p['sigla'],
+                'nome': p['nome'] or 'Partido não especificado',
+                'deputados': p['deputados']
+            } for p in distribuicao_partidos
+        ],
+        'distribuicao_circulos': [
+            {
+                'circulo': c.circulo or 'Círculo não especificado',
+                'deputados': c.deputados
+            } for c in distribuicao_circulos
+        ],
+        'maior_partido': {
+            'sigla': maior_partido['sigla'] if maior_partido else None,
+            'deputados': maior_partido['deputados'] if maior_partido else 0
+        },
+        'maior_circulo': {
+            'designacao': maior_circulo.circulo if maior_circulo else None,
+            'deputados': maior_circulo.deputados if maior_circulo else 0
+        },
+        'legislatura': {
+            'numero': legislature_info.numero if legislature_info else legislatura,
+            'designacao': legislature_info.designacao if legislature_info else f'{legislatura} Legislatura',
+            'data_inicio': legislature_info.data_inicio.isoformat() if legislature_info and legislature_info.data_inicio else None,
+            'data_fim': legislature_info.data_fim.isoformat() if legislature_info and legislature_info.data_fim else None,
+            'ativa': legislature_info.data_fim is None if legislature_info else True
+        }
+    }
+
+
 @parlamento_bp.route('/estatisticas', methods=['GET'])
 def get_estatisticas():
     """Retorna estatísticas gerais do parlamento para uma legislatura específica"""
     try:
-        with DatabaseSession() as session:
-            legislatura = request.args.get('legislatura', 'XVII', type=str)
-            
-            # Get legislature information
-            legislature_info = session.query(Legislatura).filter_by(numero=legislatura).first()
-            
-            # Count unique people (not records) in the specified legislature using id_cadastro
-            total_deputados = session.query(
-                func.count(func.distinct(Deputado.id_cadastro))
-            ).join(
-                DeputadoMandatoLegislativo, Deputado.id == DeputadoMandatoLegislativo.deputado_id
-            ).filter(
-                DeputadoMandatoLegislativo.leg_des == legislatura
-            ).scalar()
+        legislatura = request.args.get('legislatura', _current_legislatura_numero(), type=str)
 
-            # Count seated deputies (those with Efetivo* status) for current legislature
-            from app.utils.deputy_status import get_seated_deputies_count
-            seated_deputados = get_seated_deputies_count(legislatura, session)
-            
-            # Count distinct individual parties represented (not coalitions)
-            individual_parties = session.query(
-                distinct(DeputadoMandatoLegislativo.par_sigla)
-            ).filter(
-                DeputadoMandatoLegislativo.leg_des == legislatura,
-                DeputadoMandatoLegislativo.eh_coligacao == False,
-                DeputadoMandatoLegislativo.par_sigla.isnot(None)
-            ).all()
-            
-            coalition_parties = session.query(
-                distinct(DeputadoMandatoLegislativo.gp_sigla)
-            ).filter(
-                DeputadoMandatoLegislativo.leg_des == legislatura,
-                DeputadoMandatoLegislativo.eh_coligacao == True,
-                DeputadoMandatoLegislativo.gp_sigla.isnot(None)
-            ).all()
-            
-            # Combine unique parties
-            all_parties = set([p[0] for p in individual_parties] + [p[0] for p in coalition_parties])
-            total_partidos = len(all_parties)
-            
-            # Count distinct electoral circles - simplified direct approach
-            total_circulos = session.query(
-                func.count(distinct(DeputadoMandatoLegislativo.ce_des))
-            ).filter(
-                DeputadoMandatoLegislativo.leg_des == legislatura,
-                DeputadoMandatoLegislativo.ce_des.isnot(None)
-            ).scalar()
-            
-            # Total mandates = total deputies in this context
-            total_mandatos = total_deputados
-            
-            # Distribution by individual parties (not coalitions) - count unique people by id_cadastro
-            # First get individual party records
-            individual_party_dist = session.query(
-                DeputadoMandatoLegislativo.par_sigla.label('sigla'),
-                DeputadoMandatoLegislativo.par_des.label('nome'),
-                func.count(func.distinct(Deputado.id_cadastro)).label('deputados')
-            ).join(
-                Deputado, DeputadoMandatoLegislativo.deputado_id == Deputado.id
-            ).filter(
-                DeputadoMandatoLegislativo.leg_des == legislatura,
-                DeputadoMandatoLegislativo.eh_coligacao == False,
-                DeputadoMandatoLegislativo.par_sigla.isnot(None)
-            ).group_by(
-                DeputadoMandatoLegislativo.par_sigla,
-                DeputadoMandatoLegislativo.par_des
-            ).all()
-            
-            # Then get coalition records using gp_sigla (parliamentary group = individual party) - count unique people
-            coalition_party_dist = session.query(
-                DeputadoMandatoLegislativo.gp_sigla.label('sigla'),
-                DeputadoMandatoLegislativo.gp_des.label('nome'),
-                func.count(func.distinct(Deputado.id_cadastro)).label('deputados')
-            ).join(
-                Deputado, DeputadoMandatoLegislativo.deputado_id == Deputado.id
-            ).filter(
-                DeputadoMandatoLegislativo.leg_des == legislatura,
-                DeputadoMandatoLegislativo.eh_coligacao == True,
-                DeputadoMandatoLegislativo.gp_sigla.isnot(None)
-            ).group_by(
-                DeputadoMandatoLegislativo.gp_sigla,
-                DeputadoMandatoLegislativo.gp_des
-            ).all()
-            
-            # Combine and aggregate party counts
-            party_counts = {}
-            for party in individual_party_dist:
-                party_counts[party.sigla] = {
-                    'sigla': party.sigla,
-                    'nome': party.nome,
-                    'deputados': party.deputados
-                }
-                
-            for party in coalition_party_dist:
-                if party.sigla in party_counts:
-                    party_counts[party.sigla]['deputados'] += party.deputados
-                else:
-                    party_counts[party.sigla] = {
-                        'sigla': party.sigla,
-                        'nome': party.nome,
-                        'deputados': party.deputados
-                    }
-            
-            # Convert to list and sort by deputy count
-            distribuicao_partidos = sorted(
-                party_counts.values(), 
-                key=lambda x: x['deputados'], 
-                reverse=True
-            )
-            
-            # Distribution by electoral circles - count unique people by id_cadastro
-            distribuicao_circulos = session.query(
-                DeputadoMandatoLegislativo.ce_des.label('circulo'),
-                func.count(func.distinct(Deputado.id_cadastro)).label('deputados')
-            ).join(
-                Deputado, DeputadoMandatoLegislativo.deputado_id == Deputado.id
-            ).filter(
-                DeputadoMandatoLegislativo.leg_des == legislatura,
-                DeputadoMandatoLegislativo.ce_des.isnot(None)
-            ).group_by(
-                DeputadoMandatoLegislativo.ce_des
-            ).order_by(func.count(func.distinct(Deputado.id_cadastro)).desc()).limit(10).all()
-            
-            # Largest party
-            maior_partido = distribuicao_partidos[0] if distribuicao_partidos else None
-            
-            # Largest electoral circle
-            maior_circulo = distribuicao_circulos[0] if distribuicao_circulos else None
-            
-            return jsonify({
-                'totais': {
-                    'deputados': total_deputados,
-                    'deputados_eleitos': total_deputados,  # All elected deputies
-                    'deputados_em_exercicio': seated_deputados,  # Currently seated
-                    'seated_deputies': seated_deputados,  # Alias for frontend compatibility
-                    'partidos': total_partidos,
-                    'circulos': total_circulos,
-                    'mandatos': total_mandatos
-                },
-                'distribuicao_partidos': [
-                    {
-                        'id': p['sigla'],  # Frontend expects 'id' field for routing
-                        'sigla': p['sigla'],
-                        'nome': p['nome'] or 'Partido não especificado',
-                        'deputados': p['deputados']
-                    } for p in distribuicao_partidos
-                ],
-                'distribuicao_circulos': [
-                    {
-                        'circulo': c.circulo or 'Círculo não especificado',
-                        'deputados': c.deputados
-                    } for c in distribuicao_circulos
-                ],
-                'maior_partido': {
-                    'sigla': maior_partido['sigla'] if maior_partido else None,
-                    'deputados': maior_partido['deputados'] if maior_partido else 0
-                },
-                'maior_circulo': {
-                    'designacao': maior_circulo.circulo if maior_circulo else None,
-                    'deputados': maior_circulo.deputados if maior_circulo else 0
-                },
-                'legislatura': {
-                    'numero': legislature_info.numero if legislature_info else legislatura,
-                    'designacao': legislature_info.designacao if legislature_info else f'{legislatura} Legislatura',
-                    'data_inicio': legislature_info.data_inicio.isoformat() if legislature_info and legislature_info.data_inicio else None,
-                    'data_fim': legislature_info.data_fim.isoformat() if legislature_info and legislature_info.data_fim else None,
-                    'ativa': legislature_info.data_fim is None if legislature_info else True
-                }
-            })
+        # Served from the precomputed summary table when available
+        cached = get_dashboard_aggregate(AGGREGATE_ESTATISTICAS, legislatura)
+        if cached is not None:
+            return jsonify(cached)
+
+        with DatabaseSession() as session:
+            return jsonify(compute_estatisticas(session, legislatura))
         
     except Exception as e:
         return log_and_return_error(e, '/api/estatisticas')
@@ -1488,7 +1577,7 @@ def search():
     """Pesquisa global por deputados e partidos"""
     try:
         query_param = request.args.get('q', '', type=str)
-        legislatura = request.args.get('legislatura', 'XVII', type=str)
+        legislatura = request.args.get('legislatura', _current_legislatura_numero(), type=str)
         
         if not query_param:
             return jsonify({'deputados': [], 'partidos': []})
@@ -1539,12 +1628,12 @@ def search():
 def get_partidos():
     """Retorna lista de partidos com contagem de deputados para a legislatura especificada"""
     try:
-        legislatura = request.args.get('legislatura', 'XVII', type=str)
+        legislatura = request.args.get('legislatura', _current_legislatura_numero(), type=str)
         active_only = request.args.get('active_only', 'true').lower() == 'true'
         
         with DatabaseSession() as session:
-            # Get all parties from the partidos table (source of truth for individual parties)
-            all_parties = session.query(Partido).all()
+            # Parties from the reference cache of the partidos table (source of truth for individual parties)
+            all_parties = reference_parties(session)
             
             # Get deputy counts for each party in the specified legislature
             deputy_counts = {}
@@ -1637,7 +1726,7 @@ def get_partidos():
 def get_partido_votacoes(partido_id):
     """Retorna estatísticas de votações agregadas de um partido"""
     try:
-        legislatura = request.args.get('legislatura', 'XVII', type=str)
+        legislatura = request.args.get('legislatura', _current_legislatura_numero(), type=str)
         
         with DatabaseSession() as session:
             # Find party by sigla from the mandate table since we no longer have direct partido table access
@@ -1707,12 +1796,24 @@ def get_deputado_atividades(cad_id):
     try:
         # Get legislature parameter (defaults to current/latest)
         requested_legislature = request.args.get('legislatura', None, type=str)
+
+        # Page size and keyset cursors for each list (see app.utils.pagination)
+        limit = min(max(request.args.get('limit', 50, type=int), 1), 200)
+        intervencoes_cursor = request.args.get('intervencoes_cursor', None, type=str)
+        iniciativas_cursor = request.args.get('iniciativas_cursor', None, type=str)
+        timeline_cursor = request.args.get('timeline_cursor', None, type=str)
+
+        # Sparse fieldset applies to each intervencao/iniciativa item
+        try:
+            fields = parse_fields(request.args.get('fields'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
         with DatabaseSession() as session:
             # Find deputado by cad_id (unique across all legislatures)
             if requested_legislature:
                 # Get specific legislature
-                leg = session.query(Legislatura).filter_by(numero=requested_legislature).first()
+                leg = legislature_by_numero(requested_legislature, session)
                 if not leg:
                     return jsonify({'error': f'Legislature {requested_legislature} not found'}), 404
                 
@@ -1740,7 +1841,7 @@ def get_deputado_atividades(cad_id):
                     return jsonify({'error': 'Deputado not found'}), 404
                 
                 # Use the deputy's actual legislature for filtering
-                leg = session.query(Legislatura).filter_by(id=deputado.legislatura_id).first()
+                leg = legislature_by_id(deputado.legislatura_id, session)
                 if not leg:
                     return jsonify({
                         'intervencoes': [],
@@ -1748,19 +1849,26 @@ def get_deputado_atividades(cad_id):
                         'votacoes': []
                     })
             
-            # Get interventions for this deputy using id_cadastro
-            intervencoes_query = session.query(IntervencaoParlamentar).join(
+            # Get interventions for this deputy using id_cadastro (newest first)
+            intervencoes_base = session.query(IntervencaoParlamentar).join(
                 IntervencaoDeputado, IntervencaoParlamentar.id == IntervencaoDeputado.intervencao_id
             ).filter(
                 IntervencaoDeputado.id_cadastro == deputado.id_cadastro,
                 IntervencaoParlamentar.legislatura_id == leg.id
-            ).limit(50).all()
+            )
+            try:
+                intervencoes_page = keyset_page(
+                    intervencoes_base, IntervencaoParlamentar.data_reuniao_plenaria,
+                    IntervencaoParlamentar.id, intervencoes_cursor, limit
+                )
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
             
             intervencoes = []
-            for interv in intervencoes_query:
+            for interv in intervencoes_page.items:
                 # Get publication data from related publications
                 publicacao = None
-                if interv.publicacoes:
+                if wants(fields, 'publicacao') and interv.publicacoes:
                     pub = interv.publicacoes[0]  # Get first publication
                     publicacao = {
                         'pub_tipo': pub.pub_tp if hasattr(pub, 'pub_tp') else None,
@@ -1770,7 +1878,7 @@ def get_deputado_atividades(cad_id):
                         'url_diario': pub.url_diario if hasattr(pub, 'url_diario') else None
                     }
                 
-                intervencoes.append({
+                intervencoes.append(select_fields({
                     'id': interv.intervencao_id or interv.id,
                     'tipo': interv.tipo_intervencao,
                     'qualidade': interv.qualidade,
@@ -1785,15 +1893,23 @@ def get_deputado_atividades(cad_id):
                     'url_video': None,
                     'thumbnail_url': None,
                     'duracao_video': None
-                })
+                }, fields))
             
-            # Get initiatives authored by this deputy using id_cadastro
-            iniciativas_query = session.query(IniciativaParlamentar).join(
+            # Get initiatives authored by this deputy using id_cadastro (highest number first -
+            # initiatives carry no date of their own, only their events do)
+            iniciativas_base = session.query(IniciativaParlamentar).join(
                 IniciativaAutorDeputado, IniciativaParlamentar.id == IniciativaAutorDeputado.iniciativa_id
             ).filter(
                 IniciativaAutorDeputado.id_cadastro == deputado.id_cadastro,
                 IniciativaParlamentar.legislatura_id == leg.id
-            ).limit(50).all()
+            )
+            try:
+                iniciativas_page = keyset_page(
+                    iniciativas_base, IniciativaParlamentar.ini_nr,
+                    IniciativaParlamentar.id, iniciativas_cursor, limit
+                )
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
 
             # Phase codes for status determination
             approval_phases = {380, 526, 532, 537, 580, 600}  # Promulgação and publication phases
@@ -1824,11 +1940,16 @@ def get_deputado_atividades(cad_id):
 
                 return 'Em tramitação', False
 
+            # Event-derived fields load every event (and its votes) per initiative
+            need_events = wants(
+                fields, 'estado', 'aprovada', 'fase_atual', 'data_apresentacao', 'data', 'resultado'
+            )
+
             iniciativas = []
-            for inic in iniciativas_query:
+            for inic in iniciativas_page.items:
                 # Get the latest event to determine current status/phase
                 latest_event = None
-                if inic.eventos:
+                if need_events and inic.eventos:
                     # Sort events by date_fase to get the most recent
                     sorted_events = sorted(
                         [e for e in inic.eventos if e.data_fase],
@@ -1851,7 +1972,7 @@ def get_deputado_atividades(cad_id):
                         resultado = latest_voting[0].resultado
 
                 # Determine initiative status based on all events
-                estado, aprovada = get_initiative_status(inic.eventos)
+                estado, aprovada = get_initiative_status(inic.eventos) if need_events else (None, None)
 
                 # Build URLs object for parliamentary links
                 urls = {}
@@ -1863,7 +1984,7 @@ def get_deputado_atividades(cad_id):
                 urls['debates'] = f"https://www.parlamento.pt/site/search/Pages/pesquisa.aspx?sq={search_title}"
                 urls['oficial'] = f"https://www.parlamento.pt/ActividadeParlamentar/Paginas/Iniciativas.aspx?txt={search_title}"
 
-                iniciativas.append({
+                iniciativas.append(select_fields({
                     'id': inic.ini_id if hasattr(inic, 'ini_id') else inic.id,
                     'numero': inic.ini_nr if hasattr(inic, 'ini_nr') else None,
                     'titulo': inic.ini_titulo if hasattr(inic, 'ini_titulo') else None,
@@ -1878,24 +1999,41 @@ def get_deputado_atividades(cad_id):
                     'urls': urls,
                     'link_texto': inic.ini_link_texto if hasattr(inic, 'ini_link_texto') else None,
                     'observacoes': inic.ini_obs if hasattr(inic, 'ini_obs') else None
-                })
+                }, fields))
             
-            # Get total counts across all legislatures for this deputy
-            total_intervencoes_count = session.query(func.count(IntervencaoParlamentar.id)).join(
-                IntervencaoDeputado, IntervencaoParlamentar.id == IntervencaoDeputado.intervencao_id
+            # Career totals per activity type from the timeline (one index range scan)
+            career_counts = dict(session.query(
+                ActivityEvent.event_type, func.count(ActivityEvent.id)
             ).filter(
-                IntervencaoDeputado.id_cadastro == deputado.id_cadastro
-            ).scalar()
+                ActivityEvent.id_cadastro == deputado.id_cadastro
+            ).group_by(ActivityEvent.event_type).all())
+            total_intervencoes_count = career_counts.get('intervencao', 0)
+            total_iniciativas_count = career_counts.get('iniciativa', 0)
+
+            # Unified timeline of every activity type in this legislature (newest first)
+            timeline = []
+            timeline_page = None
+            if wants(fields, 'timeline'):
+                timeline_base = session.query(ActivityEvent).filter(
+                    ActivityEvent.id_cadastro == deputado.id_cadastro,
+                    ActivityEvent.legislatura_id == leg.id
+                )
+                try:
+                    timeline_page = keyset_page(
+                        timeline_base, ActivityEvent.event_date, ActivityEvent.id,
+                        timeline_cursor, limit
+                    )
+                except ValueError as e:
+                    return jsonify({'error': str(e)}), 400
+                timeline = [activity_event_to_dict(event) for event in timeline_page.items]
             
-            total_iniciativas_count = session.query(func.count(IniciativaParlamentar.id)).join(
-                IniciativaAutorDeputado, IniciativaParlamentar.id == IniciativaAutorDeputado.iniciativa_id
-            ).filter(
-                IniciativaAutorDeputado.id_cadastro == deputado.id_cadastro
+            # Current legislature counts (not just the returned page)
+            current_intervencoes_count = intervencoes_base.with_entities(
+                func.count(IntervencaoParlamentar.id)
+            ).scalar()
+            current_iniciativas_count = iniciativas_base.with_entities(
+                func.count(IniciativaParlamentar.id)
             ).scalar()
-            
-            # Current legislature counts
-            current_intervencoes_count = len(intervencoes)
-            current_iniciativas_count = len(iniciativas)
             
             # Get attendance statistics
             attendance_stats = {'current_legislature': {'attendance_rate': 0}, 'total_career': {'attendance_rate': 0}}
@@ -1948,7 +2086,7 @@ def get_deputado_atividades(cad_id):
             except Exception as e:
                 print(f"Warning: Could not get attendance data: {e}")
             
-            return jsonify({
+            return json_response({
                 'deputado': {
                     'id': deputado.id,
                     'nome': deputado.nome,
@@ -1971,46 +2109,86 @@ def get_deputado_atividades(cad_id):
                         'iniciativas_count': total_iniciativas_count,
                         'votacoes_count': 0,  # Placeholder
                         'attendance_rate': attendance_stats['total_career']['attendance_rate'],
-                        'total_sessions': attendance_stats['total_career'].get('total_sessions', 0)
+                        'total_sessions': attendance_stats['total_career'].get('total_sessions', 0),
+                        'atividades_por_tipo': career_counts
                     }
                 },
                 'intervencoes': intervencoes,
                 'iniciativas': iniciativas,
-                'votacoes': []  # Voting data would need separate implementation
+                'timeline': timeline,
+                'votacoes': [],  # Voting data would need separate implementation
+                'pagination': {
+                    'limit': limit,
+                    'intervencoes': {
+                        'next_cursor': intervencoes_page.next_cursor,
+                        'has_more': intervencoes_page.has_more
+                    },
+                    'iniciativas': {
+                        'next_cursor': iniciativas_page.next_cursor,
+                        'has_more': iniciativas_page.has_more
+                    },
+                    'timeline': {
+                        'next_cursor': timeline_page.next_cursor if timeline_page else None,
+                        'has_more': timeline_page.has_more if timeline_page else False
+                    }
+                }
             })
         
     except Exception as e:
         return log_and_return_error(e, '/api/deputados/<id>/atividades')
 
 
+def activity_event_to_dict(event):
+    """Serialize an ActivityEvent row for the feed and deputy timelines"""
+    return {
+        'id': event.source_id,
+        'tipo': event.event_type,
+        'data': event.event_date.isoformat() if event.event_date else None,
+        'titulo': event.title,
+        'id_cadastro': event.id_cadastro
+    }
+
+
 @parlamento_bp.route('/feed/atividades', methods=['GET'])
 def get_atividades_feed():
     """Retorna feed de atividades parlamentares organizadas por data"""
     try:
-        legislatura = request.args.get('legislatura', 'XVII', type=str)
-        page = request.args.get('page', 1, type=int)
-        per_page = min(request.args.get('per_page', 20, type=int), 100)
+        legislatura = request.args.get('legislatura', _current_legislatura_numero(), type=str)
+        limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+        cursor = request.args.get('cursor', None, type=str)
         tipo_filter = request.args.get('tipo', '')
         
         with DatabaseSession() as session:
             # Get legislature info
-            leg = session.query(Legislatura).filter_by(numero=legislatura).first()
+            leg = legislature_by_numero(legislatura, session)
             if not leg:
-                return jsonify({'atividades': [], 'total': 0})
+                return json_response({'atividades': [], 'next_cursor': None, 'has_more': False})
             
-            # For now, return that activity feed data needs to be implemented in MySQL
-            return jsonify({
-                'error': 'Activity feed data not yet available in MySQL schema',
+            # One feed entry per activity, newest first (partial keyset index)
+            query = session.query(ActivityEvent).filter(
+                ActivityEvent.legislatura_id == leg.id,
+                ActivityEvent.is_feed_entry
+            )
+            if tipo_filter:
+                query = query.filter(ActivityEvent.event_type == tipo_filter)
+            
+            try:
+                page = keyset_page(query, ActivityEvent.event_date, ActivityEvent.id, cursor, limit)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            
+            return json_response({
+                'atividades': [activity_event_to_dict(event) for event in page.items],
                 'legislatura': {
                     'numero': leg.numero,
                     'designacao': leg.designacao
                 },
-                'message': 'This endpoint requires initiative, intervention, and voting activity tables to be migrated to MySQL'
-            }), 501
+                'next_cursor': page.next_cursor,
+                'has_more': page.has_more
+            })
         
     except Exception as e:
-        import traceback
-        return log_and_return_error(e, '/api/deputados/<id>/biografia', 500)
+        return log_and_return_error(e, '/api/feed/atividades', 500)
 
 
 @parlamento_bp.route('/feed/atividades/<string:tipo>/<int:atividade_id>/participantes', methods=['GET'])
@@ -2125,22 +2303,20 @@ def get_deputado_biografia(cad_id):
 def get_deputado_by_name(nome_completo):
     """Encontra um deputado por nome em uma legislatura específica"""
     try:
-        legislatura = request.args.get('legislatura', 'XVII', type=str)
+        legislatura = request.args.get('legislatura', _current_legislatura_numero(), type=str)
         
         with DatabaseSession() as session:
             # Get legislature record
-            leg = session.query(Legislatura).filter_by(numero=legislatura).first()
+            leg = legislature_by_numero(legislatura, session)
             if not leg:
                 return jsonify({'error': 'Legislatura não encontrada'}), 404
             
             # Find deputy by name in the specified legislature using new schema
             # Sanitize input to prevent SQL injection
             sanitized_name = nome_completo.replace('%', '\\%').replace('_', '\\_')
-            deputado = session.query(Deputado).join(
-                Legislatura, Deputado.legislatura_id == Legislatura.id
-            ).filter(
+            deputado = session.query(Deputado).filter(
                 Deputado.nome_completo.ilike(f'%{sanitized_name}%'),
-                Legislatura.numero == legislatura
+                Deputado.legislatura_id == leg.id
             ).first()
             
             if not deputado:
@@ -2182,24 +2358,22 @@ def get_deputado_conflitos_interesse(cad_id):
                 # Take the most recent record (or first one if only one exists)
                 record = interesse_records[0]
                 
-                # Check if deputy's spouse is also a deputy
+                # Spouse who is also a deputy (linked at import, see interest_links.py)
                 spouse_deputy = None
-                if record.spouse_name:
-                    # Search for spouse by name in deputados table
-                    spouse_dep = session.query(Deputado).filter(
-                        func.lower(Deputado.nome_completo).contains(func.lower(record.spouse_name.strip()))
-                    ).first()
+                if record.spouse_deputado_id:
+                    spouse = session.query(
+                        Deputado.id, Deputado.id_cadastro, DeputadoMandatoLegislativo.par_sigla
+                    ).outerjoin(
+                        DeputadoMandatoLegislativo, DeputadoMandatoLegislativo.deputado_id == Deputado.id
+                    ).filter(
+                        Deputado.id == record.spouse_deputado_id
+                    ).order_by(DeputadoMandatoLegislativo.id.desc()).first()
                     
-                    if spouse_dep:
-                        # Get spouse's party info
-                        spouse_mandato = session.query(DeputadoMandatoLegislativo).filter_by(
-                            deputado_id=spouse_dep.id
-                        ).order_by(DeputadoMandatoLegislativo.id.desc()).first()
-                        
+                    if spouse:
                         spouse_deputy = {
-                            'cad_id': spouse_dep.id_cadastro,
-                            'id': spouse_dep.id,
-                            'partido_sigla': spouse_mandato.par_sigla if spouse_mandato else None
+                            'cad_id': spouse.id_cadastro,
+                            'id': spouse.id,
+                            'partido_sigla': spouse.par_sigla
                         }
                 
                 # Determine if there's conflict potential
@@ -2242,10 +2416,57 @@ def get_deputado_conflitos_interesse(cad_id):
         return log_and_return_error(e, '/api/deputados/<id>/conflitos-interesse', 500)
 
 
+@parlamento_bp.route('/deputados/<int:cad_id>/conflitos-interesse/entidades-partilhadas', methods=['GET'])
+def get_deputado_entidades_partilhadas(cad_id):
+    """Retorna as entidades declaradas por um deputado que outros deputados também declaram"""
+    try:
+        with DatabaseSession() as session:
+            # Co-occurrences are precomputed per deputy (see interest_entities.py)
+            rows = session.query(
+                InterestEntity.id, InterestEntity.nome, InterestEntity.nipc,
+                InterestEntityCooccurrence.other_id_cadastro
+            ).join(
+                InterestEntityCooccurrence, InterestEntityCooccurrence.entity_id == InterestEntity.id
+            ).filter(
+                InterestEntityCooccurrence.id_cadastro == cad_id
+            ).order_by(InterestEntity.nome, InterestEntityCooccurrence.other_id_cadastro).all()
+
+            other_ids = {row.other_id_cadastro for row in rows}
+            nomes = {}
+            if other_ids:
+                nomes = dict(session.query(Deputado.id_cadastro, Deputado.nome).filter(
+                    Deputado.id_cadastro.in_(other_ids)
+                ).distinct(Deputado.id_cadastro).order_by(Deputado.id_cadastro, Deputado.nome).all())
+
+            entidades = {}
+            for row in rows:
+                entidade = entidades.setdefault(row.id, {
+                    'entidade': row.nome,
+                    'nipc': row.nipc,
+                    'deputados': []
+                })
+                entidade['deputados'].append({
+                    'cad_id': row.other_id_cadastro,
+                    'nome': nomes.get(row.other_id_cadastro)
+                })
+
+            return jsonify({
+                'deputado_id': cad_id,
+                'entidades': list(entidades.values()),
+                'total_entidades': len(entidades)
+            })
+
+    except Exception as e:
+        return log_and_return_error(e, '/api/deputados/<id>/conflitos-interesse/entidades-partilhadas', 500)
+
+
 @parlamento_bp.route('/deputados/<int:cad_id>/attendance', methods=['GET'])
 def get_deputado_attendance(cad_id):
     """Retorna timeline de presenças/faltas de um deputado"""
     try:
+        limit = min(max(request.args.get('limit', 200, type=int), 1), 500)
+        cursor = request.args.get('cursor', None, type=str)
+
         with DatabaseSession() as session:
             # Find deputado by cad_id (unique across all legislatures)
             # Get their most recent legislature entry using proper ordering
@@ -2254,26 +2475,24 @@ def get_deputado_attendance(cad_id):
             if not deputado:
                 return jsonify({'error': 'Deputado não encontrado'}), 404
             
-            # Query attendance records from meeting_attendances table
-            from sqlalchemy import text
-            
-            attendance_query = text("""
-                SELECT 
-                    dt_reuniao,
-                    tipo_reuniao,
-                    sigla_falta,
-                    motivo_falta,
-                    pres_justificacao,
-                    observacoes,
-                    sigla_grupo
-                FROM meeting_attendances 
-                WHERE dep_nome_parlamentar = :deputy_name
-                AND dt_reuniao IS NOT NULL
-                ORDER BY dt_reuniao DESC
-                LIMIT 200
-            """)
-            
-            attendance_records = session.execute(attendance_query, {'deputy_name': deputado.nome}).fetchall()
+            # Query attendance records from meeting_attendances table (newest first)
+            from database.models import MeetingAttendance
+
+            attendance_base = session.query(MeetingAttendance).filter(
+                MeetingAttendance.dep_nome_parlamentar == deputado.nome,
+                MeetingAttendance.dt_reuniao.isnot(None)
+            )
+            try:
+                attendance_page = keyset_page(
+                    attendance_base, MeetingAttendance.dt_reuniao, MeetingAttendance.id, cursor, limit
+                )
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+
+            # Summary covers the full history, not just the returned page
+            attendance_counts = attendance_base.with_entities(
+                MeetingAttendance.sigla_falta, func.count(MeetingAttendance.id)
+            ).group_by(MeetingAttendance.sigla_falta).all()
             
             # Process attendance records
             timeline = []
@@ -2300,8 +2519,8 @@ def get_deputado_attendance(cad_id):
                 'FIJ': {'type': 'justified', 'description': 'Falta Injustificada (Justificada)', 'status': 'warning'}
             }
             
-            for record in attendance_records:
-                dt_reuniao, tipo_reuniao, sigla_falta, motivo_falta, pres_justificacao, observacoes, sigla_grupo = record
+            for record in attendance_page.items:
+                sigla_falta = record.sigla_falta
                 
                 # Get attendance info
                 attendance_info = attendance_codes.get(sigla_falta, {
@@ -2312,30 +2531,32 @@ def get_deputado_attendance(cad_id):
                 
                 # Build timeline entry
                 timeline_entry = {
-                    'date': dt_reuniao.isoformat() if dt_reuniao else None,
-                    'session_type': tipo_reuniao,
+                    'date': record.dt_reuniao.isoformat() if record.dt_reuniao else None,
+                    'session_type': record.tipo_reuniao,
                     'attendance_code': sigla_falta,
                     'attendance_type': attendance_info['type'],
                     'attendance_description': attendance_info['description'],
                     'status': attendance_info['status'],
-                    'reason': motivo_falta,
-                    'justification': pres_justificacao,
-                    'observations': observacoes,
-                    'parliamentary_group': sigla_grupo
+                    'reason': record.motivo_falta,
+                    'justification': record.pres_justificacao,
+                    'observations': record.observacoes,
+                    'parliamentary_group': record.sigla_grupo
                 }
                 
                 timeline.append(timeline_entry)
-                
-                # Update summary
-                summary['total_sessions'] += 1
-                if attendance_info['type'] == 'present':
-                    summary['present'] += 1
-                elif attendance_info['type'] == 'justified':
-                    summary['justified_absence'] += 1
-                elif attendance_info['type'] == 'unjustified':
-                    summary['unjustified_absence'] += 1
+
+            # Update summary
+            for sigla_falta, count in attendance_counts:
+                attendance_type = attendance_codes.get(sigla_falta, {'type': 'other'})['type']
+                summary['total_sessions'] += count
+                if attendance_type == 'present':
+                    summary['present'] += count
+                elif attendance_type == 'justified':
+                    summary['justified_absence'] += count
+                elif attendance_type == 'unjustified':
+                    summary['unjustified_absence'] += count
                 else:
-                    summary['other'] += 1
+                    summary['other'] += count
             
             # Calculate attendance rate
             attendance_rate = 0
@@ -2355,6 +2576,8 @@ def get_deputado_attendance(cad_id):
                     'attendance_rate': round(attendance_rate, 3)
                 },
                 'timeline': timeline,
+                'next_cursor': attendance_page.next_cursor,
+                'has_more': attendance_page.has_more,
                 'codes_legend': attendance_codes
             })
             
@@ -2379,8 +2602,8 @@ def get_deputado_votacoes(cad_id):
     and individual deputy names when they diverge from party line.
     """
     try:
-        limit = request.args.get('limit', 50, type=int)
-        offset = request.args.get('offset', 0, type=int)
+        limit = min(max(request.args.get('limit', 50, type=int), 1), 200)
+        cursor = request.args.get('cursor', None, type=str)
 
         with DatabaseSession() as session:
             deputado = get_most_recent_deputy(session, cad_id)
@@ -2388,7 +2611,7 @@ def get_deputado_votacoes(cad_id):
             if not deputado:
                 return jsonify({'error': 'Deputado não encontrado'}), 404
 
-            leg = session.query(Legislatura).filter_by(id=deputado.legislatura_id).first()
+            leg = legislature_by_id(deputado.legislatura_id, session)
             if not leg:
                 return jsonify({'error': 'Legislatura não encontrada'}), 404
 
@@ -2401,10 +2624,18 @@ def get_deputado_votacoes(cad_id):
 
             # Get initiative votes (the main source of voting data)
             # Filter for votes where the deputy's party position is recorded in detalhe
-            initiative_votes = session.query(IniciativaEventoVotacao).filter(
-                IniciativaEventoVotacao.detalhe.isnot(None),
-                IniciativaEventoVotacao.data_votacao.isnot(None)
-            ).order_by(desc(IniciativaEventoVotacao.data_votacao)).offset(offset).limit(limit).all()
+            try:
+                votes_page = keyset_page(
+                    session.query(IniciativaEventoVotacao).filter(
+                        IniciativaEventoVotacao.detalhe.isnot(None),
+                        IniciativaEventoVotacao.data_votacao.isnot(None)
+                    ),
+                    IniciativaEventoVotacao.data_votacao, IniciativaEventoVotacao.id,
+                    cursor, limit
+                )
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            initiative_votes = votes_page.items
 
             # Parse party position from vote details
             def get_party_vote(detalhe, party_sigla):
@@ -2453,6 +2684,8 @@ def get_deputado_votacoes(cad_id):
                 },
                 'votacoes': votacoes,
                 'total': len(votacoes),
+                'next_cursor': votes_page.next_cursor,
+                'has_more': votes_page.has_more,
                 'legislatura': leg.numero,
                 'partido': partido_sigla,
                 'nota': 'Os votos refletem a posição do grupo parlamentar do deputado. Votações individuais só aparecem quando divergem do partido.'
@@ -2470,36 +2703,24 @@ def get_partido_votacoes_by_sigla(partido_sigla):
         from urllib.parse import unquote
         partido_sigla = unquote(partido_sigla)
         
-        legislatura = request.args.get('legislatura', 'XVII', type=str)
+        legislatura = request.args.get('legislatura', _current_legislatura_numero(), type=str)
         limit = request.args.get('limit', 50, type=int)
         
         with DatabaseSession() as session:
             # Get party
-            partido = session.query(Partido).filter_by(sigla=partido_sigla).first()
+            partido = party_by_sigla(partido_sigla, session)
             if not partido:
                 return jsonify({'error': 'Partido não encontrado'}), 404
             
-            # Get budget voting records where this party participated
-            party_votes = session.query(OrcamentoEstadoVotacao).join(
-                OrcamentoEstadoGrupoParlamentarVoto,
-                OrcamentoEstadoVotacao.id == OrcamentoEstadoGrupoParlamentarVoto.votacao_id
-            ).filter(
-                OrcamentoEstadoGrupoParlamentarVoto.grupo_parlamentar.like(f'%{partido_sigla}%')
-            ).order_by(desc(OrcamentoEstadoVotacao.data_votacao)).limit(limit).all()
+            # Get budget voting records where this party voted (party x votacao matrix)
+            party_votes = budget_votes_query(session, partido_sigla).limit(limit).all()
             
             # Format voting records
             votacoes = []
             vote_summary = {'Favor': 0, 'Contra': 0, 'Abstenção': 0}
             
             for votacao in party_votes:
-                # Get this party's specific vote
-                party_vote = session.query(OrcamentoEstadoGrupoParlamentarVoto).filter_by(
-                    votacao_id=votacao.id
-                ).filter(
-                    OrcamentoEstadoGrupoParlamentarVoto.grupo_parlamentar.like(f'%{partido_sigla}%')
-                ).first()
-                
-                vote_result = party_vote.voto if party_vote else 'N/A'
+                vote_result = votacao.votos_partidos.get(partido_sigla, 'N/A')
                 if vote_result in vote_summary:
                     vote_summary[vote_result] += 1
                 
@@ -2531,48 +2752,68 @@ def get_partido_votacoes_by_sigla(partido_sigla):
 def get_votacoes():
     """Retorna lista de votações por legislatura"""
     try:
-        legislatura = request.args.get('legislatura', 'XVII', type=str)
+        legislatura = request.args.get('legislatura', _current_legislatura_numero(), type=str)
         tipo = request.args.get('tipo', 'all', type=str)  # 'all', 'parlamentar', 'orcamento'
-        limit = request.args.get('limit', 50, type=int)
-        offset = request.args.get('offset', 0, type=int)
+        limit = min(max(request.args.get('limit', 50, type=int), 1), 200)
+        cursor = request.args.get('cursor', None, type=str)
+
+        try:
+            fields = parse_fields(request.args.get('fields'))
+            # Both sources share the (date, uuid) key domain, so one cursor covers the merged list
+            after = decode_keyset_cursor(cursor, OrcamentoEstadoVotacao.data_votacao)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        need_party_votes = wants(fields, 'votos_partidos', 'total_partidos')
         
         with DatabaseSession() as session:
-            votacoes = []
+            # (date, id, tipo, row) candidates from each source; limit + 1 each tells
+            # whether anything remains after the merged page
+            candidates = []
             
             # Get budget voting records
             if tipo in ['all', 'orcamento']:
-                orcamento_votacoes = session.query(OrcamentoEstadoVotacao).order_by(
-                    desc(OrcamentoEstadoVotacao.data_votacao)
-                ).offset(offset).limit(limit).all()
-                
-                for votacao in orcamento_votacoes:
-                    # Get all party votes for this voting record
-                    party_votes = session.query(OrcamentoEstadoGrupoParlamentarVoto).filter_by(
-                        votacao_id=votacao.id
-                    ).all()
-                    
+                orcamento_votacoes = apply_keyset(
+                    session.query(OrcamentoEstadoVotacao),
+                    OrcamentoEstadoVotacao.data_votacao, OrcamentoEstadoVotacao.id, after
+                ).limit(limit + 1).all()
+                candidates.extend(
+                    (votacao.data_votacao, votacao.id, 'orcamento', votacao)
+                    for votacao in orcamento_votacoes
+                )
+            
+            # Get parliamentary voting records  
+            if tipo in ['all', 'parlamentar']:
+                parlamentar_votacoes = apply_keyset(
+                    session.query(AtividadeParlamentarVotacao),
+                    AtividadeParlamentarVotacao.data, AtividadeParlamentarVotacao.id, after
+                ).limit(limit + 1).all()
+                candidates.extend(
+                    (votacao.data, votacao.id, 'parlamentar', votacao)
+                    for votacao in parlamentar_votacoes
+                )
+            
+            # Merge by date (newest first) and keep one page
+            candidates.sort(key=lambda c: keyset_sort_key(c[0], c[1]), reverse=True)
+            next_cursor = None
+            if len(candidates) > limit:
+                candidates = candidates[:limit]
+                next_cursor = keyset_cursor(candidates[-1][0], candidates[-1][1])
+
+            votacoes = []
+            for _, _, votacao_tipo, votacao in candidates:
+                if votacao_tipo == 'orcamento':
+                    # Party positions are stored on the votacao row (votos_partidos)
+                    party_votes = budget_party_votes(votacao) if need_party_votes else []
                     votacoes.append({
                         'id': votacao.id,
                         'tipo': 'orcamento',
                         'data': votacao.data_votacao.isoformat() if votacao.data_votacao else None,
                         'descricao': votacao.descricao,
                         'resultado': votacao.resultado,
-                        'votos_partidos': [
-                            {
-                                'partido': pv.grupo_parlamentar,
-                                'voto': pv.voto
-                            } for pv in party_votes
-                        ],
+                        'votos_partidos': party_votes,
                         'total_partidos': len(party_votes)
                     })
-            
-            # Get parliamentary voting records  
-            if tipo in ['all', 'parlamentar']:
-                parlamentar_votacoes = session.query(AtividadeParlamentarVotacao).order_by(
-                    desc(AtividadeParlamentarVotacao.data)
-                ).offset(offset).limit(min(limit, 25)).all()
-                
-                for votacao in parlamentar_votacoes:
+                else:
                     votacoes.append({
                         'id': votacao.id,
                         'tipo': 'parlamentar',
@@ -2584,12 +2825,11 @@ def get_votacoes():
                         'publicacao': votacao.publicacao
                     })
             
-            # Sort by date
-            votacoes.sort(key=lambda x: x['data'] or '', reverse=True)
-            
-            return jsonify({
-                'votacoes': votacoes[:limit],
+            return json_response({
+                'votacoes': [select_fields(v, fields) for v in votacoes],
                 'total': len(votacoes),
+                'next_cursor': next_cursor,
+                'has_more': next_cursor is not None,
                 'legislatura': legislatura,
                 'tipo': tipo
             })
@@ -2611,10 +2851,8 @@ def get_votacao_detalhes(votacao_id):
                 if not votacao:
                     return jsonify({'error': 'Votação não encontrada'}), 404
                 
-                # Get all party votes
-                party_votes = session.query(OrcamentoEstadoGrupoParlamentarVoto).filter_by(
-                    votacao_id=votacao.id
-                ).all()
+                # All party votes (party x votacao matrix)
+                party_votes = budget_party_votes(votacao)
                 
                 return jsonify({
                     'id': votacao.id,
@@ -2622,17 +2860,12 @@ def get_votacao_detalhes(votacao_id):
                     'data': votacao.data_votacao.isoformat() if votacao.data_votacao else None,
                     'descricao': votacao.descricao,
                     'resultado': votacao.resultado,
-                    'votos_partidos': [
-                        {
-                            'partido': pv.grupo_parlamentar,
-                            'voto': pv.voto
-                        } for pv in party_votes
-                    ],
+                    'votos_partidos': party_votes,
                     'resumo': {
                         'total_partidos': len(party_votes),
-                        'favor': len([pv for pv in party_votes if pv.voto == 'Favor']),
-                        'contra': len([pv for pv in party_votes if pv.voto == 'Contra']),
-                        'abstencoes': len([pv for pv in party_votes if pv.voto == 'Abstenção'])
+                        'favor': len([pv for pv in party_votes if pv['voto'] == 'Favor']),
+                        'contra': len([pv for pv in party_votes if pv['voto'] == 'Contra']),
+                        'abstencoes': len([pv for pv in party_votes if pv['voto'] == 'Abstenção'])
                     }
                 })
                 
@@ -2686,7 +2919,7 @@ def get_deputado_voting_analytics(cad_id):
             partido_sigla = None
             if mandato_recente:
                 partido_sigla = mandato_recente.par_sigla
-                partido_info = session.query(Partido).filter_by(sigla=partido_sigla).first()
+                partido_info = party_by_sigla(partido_sigla, session)
             
             # Get recent parliamentary activity voting records (INCREASED RANGE FOR LAST YEAR)
             # Note: Voting data is not normalized by deputy - stored as HTML text in 'detalhe' field
@@ -2710,23 +2943,13 @@ def get_deputado_voting_analytics(cad_id):
                 IniciativaEventoVotacao.data_votacao >= one_year_ago  # Only last year
             ).order_by(IniciativaEventoVotacao.data_votacao.desc()).limit(300).all()
             
-            # Get budget voting records through party affiliation
+            # Get budget voting records through party affiliation (one read of the party x votacao matrix)
             orcamento_votacoes = []
             if partido_sigla:
-                orcamento_party_votes = session.query(OrcamentoEstadoGrupoParlamentarVoto).filter_by(
-                    grupo_parlamentar=partido_sigla
-                ).all()
-                
-                # Get corresponding voting records
-                for party_vote in orcamento_party_votes:
-                    orcamento_vote = session.query(OrcamentoEstadoVotacao).filter_by(
-                        id=party_vote.votacao_id
-                    ).first()
-                    if orcamento_vote:
-                        orcamento_votacoes.append({
-                            'votacao': orcamento_vote,
-                            'voto_partido': party_vote.voto
-                        })
+                orcamento_votacoes = [
+                    {'votacao': votacao, 'voto_partido': votacao.votos_partidos[partido_sigla]}
+                    for votacao in budget_votes_query(session, partido_sigla).all()
+                ]
             
             # Parse party voting patterns from initiative votes
             import re
@@ -2740,8 +2963,7 @@ def get_deputado_voting_analytics(cad_id):
                 valid_party_siglas = set()
                 try:
                     # Add known parties from Partido table
-                    parties = session.query(Partido.sigla).distinct().all()
-                    for party in parties:
+                    for party in reference_parties(session):
                         if party.sigla:
                             valid_party_siglas.add(party.sigla.strip())
                     
@@ -2940,7 +3162,7 @@ def get_deputado_voting_analytics(cad_id):
             if partido_sigla and cross_party_data:
                 # Get party names for display
                 for other_party_sigla, data in cross_party_data.items():
-                    party_obj = session.query(Partido).filter_by(sigla=other_party_sigla).first()
+                    party_obj = party_by_sigla(other_party_sigla, session)
                     alignment_rate = data['aligned'] / data['total'] if data['total'] > 0 else 0
                     
                     cross_party_collaboration.append({
@@ -3185,87 +3407,51 @@ def get_partido_voting_analytics(partido_sigla):
         
         with DatabaseSession() as session:
             # Get party information
-            partido = session.query(Partido).filter_by(sigla=partido_sigla).first()
+            partido = party_by_sigla(partido_sigla, session)
             if not partido:
                 return jsonify({'error': 'Partido não encontrado'}), 404
             
-            # Get all budget voting records for this party
-            orcamento_party_votes = session.query(OrcamentoEstadoGrupoParlamentarVoto).filter_by(
-                grupo_parlamentar=partido_sigla
-            ).all()
-            
-            # Get corresponding voting details
-            orcamento_votacoes = []
-            for party_vote in orcamento_party_votes:
-                orcamento_vote = session.query(OrcamentoEstadoVotacao).filter_by(
-                    id=party_vote.votacao_id
-                ).first()
-                if orcamento_vote:
-                    orcamento_votacoes.append({
-                        'votacao': orcamento_vote,
-                        'voto': party_vote.voto,
-                        'data': orcamento_vote.data_votacao
-                    })
+            # Budget vote totals are precomputed per legislature (see budget_votes.py)
+            orcamento_stats = session.query(
+                func.coalesce(func.sum(OrcamentoEstadoPartidoVotoStats.total), 0),
+                func.coalesce(func.sum(OrcamentoEstadoPartidoVotoStats.favor), 0),
+                func.coalesce(func.sum(OrcamentoEstadoPartidoVotoStats.contra), 0),
+                func.coalesce(func.sum(OrcamentoEstadoPartidoVotoStats.abstencao), 0)
+            ).filter(
+                OrcamentoEstadoPartidoVotoStats.grupo_parlamentar == partido_sigla
+            ).one()
             
-            # Get parliamentary activity voting records from party deputies
             # Get all deputies who have ever had mandates with this party (historical analysis)
-            deputados_partido_ids = session.query(DeputadoMandatoLegislativo.deputado_id).filter(
-                DeputadoMandatoLegislativo.par_sigla == partido_sigla
-            ).distinct().all()
-            
-            # If no exact match, try pattern matching for coalitions
-            if not deputados_partido_ids:
-                deputados_partido_ids = session.query(DeputadoMandatoLegislativo.deputado_id).filter(
-                    DeputadoMandatoLegislativo.par_sigla.like(f'%{partido_sigla}%')
-                ).distinct().all()
+            deputados_partido = party_deputies(session, partido_sigla)
             
-            deputados_partido = session.query(Deputado).filter(
-                Deputado.id.in_([d[0] for d in deputados_partido_ids])
-            ).all()
-            
-            parlamentar_votacoes = []
-            
-            for deputado in deputados_partido:
-                dep_parlamentar_votacoes = session.query(AtividadeParlamentarVotacao).join(
-                    IntervencaoDeputado, AtividadeParlamentarVotacao.atividade_id == IntervencaoDeputado.intervencao_id
-                ).filter(
-                    IntervencaoDeputado.id_cadastro == deputado.id_cadastro
-                ).all()
-                parlamentar_votacoes.extend(dep_parlamentar_votacoes)
+            # Recent voting patterns (last 6 months)
+            from datetime import datetime, timedelta
+            six_months_ago = datetime.now().date() - timedelta(days=180)
             
-            # Remove duplicates (same voting record from multiple deputies)
-            unique_parlamentar = {}
-            for votacao in parlamentar_votacoes:
-                unique_parlamentar[votacao.id] = votacao
-            parlamentar_votacoes = list(unique_parlamentar.values())
+            # Parliamentary activity votes of the party's deputies, counted server-side
+            parlamentar_counts = party_activity_vote_counts(
+                session, [d.id_cadastro for d in deputados_partido], six_months_ago
+            )
             
             # Calculate analytics
-            total_orcamento = len(orcamento_votacoes)
-            total_parlamentar = len(parlamentar_votacoes)
+            total_orcamento = orcamento_stats[0]
+            total_parlamentar = parlamentar_counts['total']
             
             # Budget voting patterns
-            orcamento_favor = len([v for v in orcamento_votacoes if v['voto'] == 'Favor'])
-            orcamento_contra = len([v for v in orcamento_votacoes if v['voto'] == 'Contra'])
-            orcamento_abstencoes = len([v for v in orcamento_votacoes if v['voto'] == 'Abstenção'])
+            orcamento_favor, orcamento_contra, orcamento_abstencoes = orcamento_stats[1:]
             
             # Parliamentary voting patterns  
-            parlamentar_unanimes = len([v for v in parlamentar_votacoes if v.unanime])
-            
-            # Recent voting patterns (last 6 months)
-            from datetime import datetime, timedelta
-            six_months_ago = datetime.now().date() - timedelta(days=180)
+            parlamentar_unanimes = parlamentar_counts['unanimes']
             
-            def get_date(dt):
-                """Convert datetime or date to date for comparison"""
-                if hasattr(dt, 'date'):
-                    return dt.date()
-                return dt
-            
-            recent_orcamento = [v for v in orcamento_votacoes if v['data'] and get_date(v['data']) >= six_months_ago]
-            recent_parlamentar = [v for v in parlamentar_votacoes if v.data and get_date(v.data) >= six_months_ago]
+            recent_orcamento = [
+                votacao.votos_partidos[partido_sigla]
+                for votacao in budget_votes_query(session, partido_sigla).filter(
+                    OrcamentoEstadoVotacao.data_votacao >= six_months_ago
+                ).all()
+            ]
             
-            recent_orcamento_favor = len([v for v in recent_orcamento if v['voto'] == 'Favor'])
-            recent_orcamento_contra = len([v for v in recent_orcamento if v['voto'] == 'Contra'])
+            recent_orcamento_favor = recent_orcamento.count('Favor')
+            recent_orcamento_contra = recent_orcamento.count('Contra')
             
             # Calculate legislative effectiveness
             bills_initiated = 0
@@ -3477,7 +3663,7 @@ def get_partido_voting_analytics(partido_sigla):
                         alignment_rate = shared_legs / len(legislature_list) if legislature_list else 0
                         
                         # Get party name
-                        party_obj = session.query(Partido).filter_by(sigla=party_sigla_result).first()
+                        party_obj = party_by_sigla(party_sigla_result, session)
                         party_name = party_obj.nome if party_obj else party_sigla_result
                         
                         coalition_patterns.append({
@@ -3515,7 +3701,7 @@ def get_partido_voting_analytics(partido_sigla):
                     activity_rate = min(total_deps / 100, 1.0)  # Normalize to 0-1 scale
                     
                     # Get party name
-                    party_obj = session.query(Partido).filter_by(sigla=party_sigla_pos).first()
+                    party_obj = party_by_sigla(party_sigla_pos, session)
                     party_name = party_obj.nome if party_obj else party_sigla_pos
                     
                     all_parties_positioning.append({
@@ -3569,7 +3755,7 @@ def get_partido_voting_analytics(partido_sigla):
                         'tendencia_favor': round((recent_orcamento_favor / len(recent_orcamento) * 100) if recent_orcamento else 0, 1)
                     },
                     'parlamentar': {
-                        'total': len(recent_parlamentar)
+                        'total': parlamentar_counts['recentes']
                     }
                 },
                 # Add implemented analytical features
@@ -3607,18 +3793,16 @@ def get_coligacoes():
         include_components = request.args.get('include_components', 'false').lower() == 'true'
         
         with DatabaseSession() as session:
-            political_queries = PoliticalEntityQueries(session)
-            
-            # Get all coalitions
-            coalitions = session.query(Coligacao).order_by(Coligacao.sigla).all()
-            
-            # Filter by activity status using calculated property if needed
-            if not include_inactive:
-                coalitions = [c for c in coalitions if c.ativo]
+            political_queries = _political_entity_queries(session)
             
+            # Coalitions (ordered by sigla) with their materialized active flag, from the reference cache
             result = []
-            for coalition in coalitions:
-                coalition_info = political_queries._format_coalition_entity(coalition, include_components)
+            for coalition in reference_coalitions(session):
+                if not include_inactive and not coalition.ativo:
+                    continue
+                coalition_info = political_queries._format_coalition_entity(
+                    coalition, include_components, ativa=coalition.ativo
+                )
                 result.append(coalition_info)
             
             return jsonify({
@@ -3640,7 +3824,7 @@ def get_coligacao_details(coligacao_sigla):
         include_components = request.args.get('include_components', 'true').lower() == 'true'
         
         with DatabaseSession() as session:
-            political_queries = PoliticalEntityQueries(session)
+            political_queries = _political_entity_queries(session)
             
             coalition_info = political_queries.get_entity_by_sigla(
                 coligacao_sigla, 
@@ -3663,10 +3847,10 @@ def get_coligacao_details(coligacao_sigla):
 def get_coligacao_deputados(coligacao_sigla):
     """Retorna deputados de uma coligação para uma legislatura específica"""
     try:
-        legislatura = request.args.get('legislatura', 'XVII', type=str)
+        legislatura = request.args.get('legislatura', _current_legislatura_numero(), type=str)
         
         with DatabaseSession() as session:
-            political_queries = PoliticalEntityQueries(session)
+            political_queries = _political_entity_queries(session)
             
             # Verify coalition exists
             coalition_info = political_queries.get_entity_by_sigla(coligacao_sigla, include_components=False)
@@ -3707,7 +3891,7 @@ def get_coligacao_partidos(coligacao_sigla):
     """Retorna partidos componentes de uma coligação"""
     try:
         with DatabaseSession() as session:
-            political_queries = PoliticalEntityQueries(session)
+            political_queries = _political_entity_queries(session)
             
             coalition_info = political_queries.get_entity_by_sigla(
                 coligacao_sigla, 
@@ -3747,7 +3931,7 @@ def search_political_entities():
             return jsonify({'entidades': [], 'total': 0})
         
         with DatabaseSession() as session:
-            political_queries = PoliticalEntityQueries(session)
+            political_queries = _political_entity_queries(session)
             
             entities = political_queries.search_entities(
                 query=query_param,
@@ -3771,7 +3955,7 @@ def get_political_entities_statistics():
     """Estatísticas gerais sobre entidades políticas (coligações e partidos)"""
     try:
         with DatabaseSession() as session:
-            political_queries = PoliticalEntityQueries(session)
+            political_queries = _political_entity_queries(session)
             
             stats = political_queries.get_entity_statistics()
             
@@ -3797,6 +3981,19 @@ def get_deputados():
         search = request.args.get('search', '', type=str)
         legislatura = request.args.get('legislatura', None, type=str)  # Specific legislature filter
         active_only = request.args.get('active_only', 'true').lower() == 'true'  # Show only active deputies by default
+        # The order mixes per-person status flags with the legislature date and
+        # name, so this list pages by offset rather than by keyset cursor
+        offset = request.args.get('offset', None, type=int)
+
+        try:
+            fields = parse_fields(request.args.get('fields'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        if offset is None:
+            offset = (page - 1) * per_page
+        elif offset < 0:
+            return jsonify({'error': 'Invalid offset'}), 400
+        page = offset // per_page + 1
         
         with DatabaseSession() as session:
             if legislatura:
@@ -3830,7 +4027,7 @@ def get_deputados():
                 ).join(
                     DeputadoMandatoLegislativo, Deputado.id == DeputadoMandatoLegislativo.deputado_id
                 ).filter(
-                    DeputadoMandatoLegislativo.leg_des == 'XVII'  # Current active legislature
+                    _in_current_legislatura(DeputadoMandatoLegislativo.legislatura_id)  # Current active legislature
                 ).group_by(Deputado.id_cadastro).subquery()
 
                 # Then get the actual record with that created_at
@@ -3852,7 +4049,7 @@ def get_deputados():
                 ).join(
                     Legislatura, Deputado.legislatura_id == Legislatura.id
                 ).filter(
-                    Legislatura.numero == 'XVII'
+                    _in_current_legislatura(Legislatura.id)
                 ).subquery()
 
                 # For non-XVII deputies, get the most recent by legislature start date
@@ -3921,7 +4118,7 @@ def get_deputados():
             ).outerjoin(
                 DadosSituacaoDeputado, DadosSituacaoDeputado.deputado_situacao_id == DeputadoSituacao.id
             ).filter(
-                Legislatura.numero == 'XVII'
+                _in_current_legislatura(Legislatura.id)
             ).group_by(Deputado.id_cadastro).subquery()
 
             # Also create a simple subquery for XVII mandate existence
@@ -3931,7 +4128,7 @@ def get_deputados():
             ).join(
                 DeputadoMandatoLegislativo, DeputadoMandatoLegislativo.deputado_id == Deputado.id
             ).filter(
-                DeputadoMandatoLegislativo.leg_des == 'XVII'
+                _in_current_legislatura(DeputadoMandatoLegislativo.legislatura_id)
             ).group_by(Deputado.id_cadastro).subquery()
 
             # Join the main query with these subqueries
@@ -3952,7 +4149,6 @@ def get_deputados():
             total = query.count()
             
             # Apply pagination
-            offset = (page - 1) * per_page
             deputados = query.offset(offset).limit(per_page).all()
             
             # Get additional statistics for filters
@@ -3975,22 +4171,26 @@ def get_deputados():
             ).join(
                 DeputadoMandatoLegislativo, Deputado.id == DeputadoMandatoLegislativo.deputado_id
             ).filter(
-                DeputadoMandatoLegislativo.leg_des == 'XVII'  # Current active legislature
+                _in_current_legislatura(DeputadoMandatoLegislativo.legislatura_id)  # Current active legislature
             ).scalar()
 
             # Calculate seated deputies count (deputies with Efetivo* status in XVII)
             from app.utils.deputy_status import get_seated_deputies_count
-            seated_deputies_count = get_seated_deputies_count('XVII', session)
+            seated_deputies_count = get_seated_deputies_count(_current_legislatura_numero(), session)
 
-            return jsonify({
-                'deputados': [deputado_to_dict(d, session) for d in deputados],
+            has_next = offset + per_page < total
+
+            return json_response({
+                'deputados': [deputado_to_dict(d, session, fields) for d in deputados],
                 'pagination': {
                     'page': page,
                     'per_page': per_page,
                     'total': total,
                     'pages': (total + per_page - 1) // per_page,
-                    'has_next': offset + per_page < total,
-                    'has_prev': page > 1
+                    'has_next': has_next,
+                    'has_prev': offset > 0,
+                    'offset': offset,
+                    'next_offset': offset + per_page if has_next else None
                 },
                 'filters': {
                     'total_deputy_records': total_mandatos,
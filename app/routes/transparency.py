@@ -23,6 +23,7 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from database.connection import get_session
+from database.legislature_registry import get_legislature_registry
 from database.models import (
     AgendaParlamentar, IniciativaParlamentar, IniciativaEventoVotacao, 
     IniciativaEvento, Deputado, DeputadoMandatoLegislativo, Legislatura,
@@ -39,19 +40,19 @@ except ImportError:
     AtividadeDeputado = None
     IntervencaoParlamentar = None
 
+from app.utils.dashboard_aggregates import (
+    get_daily_dashboard_aggregate,
+    AGGREGATE_DEPUTY_PERFORMANCE,
+    AGGREGATE_ACCOUNTABILITY_METRICS,
+    AGGREGATE_CITIZEN_PARTICIPATION,
+)
+
 transparency_bp = Blueprint('transparency', __name__)
 logger = logging.getLogger(__name__)
 
 def get_current_legislature():
-    """Get current legislature (XVII)"""
-    session = get_session()
-    try:
-        current_leg = session.query(Legislatura).filter(
-            Legislatura.numero == 'XVII'
-        ).first()
-        return current_leg
-    finally:
-        session.close()
+    """Get current legislature (cached in the legislature registry)"""
+    return get_legislature_registry().current
 
 @transparency_bp.route('/transparency/live-activity', methods=['GET'])
 def get_live_parliamentary_activity():
@@ -465,6 +466,207 @@ def get_legislative_progress():
     finally:
         session.close()
 
+def compute_deputy_performance(session, current_leg):
+    """Compute the deputy performance scorecard payload for a legislature (also used by the aggregate refresh)"""
+    # 1. DEPUTY ATTENDANCE AND PARTICIPATION ANALYSIS
+    deputy_performance_query = text("""
+        SELECT 
+            d.id as deputy_id,
+            d.nome_completo as deputy_name,
+            d.nome as parliamentary_name,
+            dml.par_sigla as party,
+            dml.leg_des as legislature,
+            
+            -- Attendance metrics
+            AVG(CASE WHEN aa.attendance_rate IS NOT NULL THEN aa.attendance_rate ELSE 0 END) as avg_attendance_rate,
+            COUNT(DISTINCT aa.id) as attendance_records,
+            
+            -- Initiative metrics  
+            0 as initiatives_authored,  -- Cannot link without author field
+            0 as initiatives_approved,  -- Cannot link without author field
+            
+            -- Participation metrics
+            COUNT(DISTINCT ad.id) as parliamentary_activities,
+            0 as initiatives_participated,  -- Cannot link without participant field
+            0 as interventions_made,  -- Cannot link without deputy field
+            
+            -- Recent activity (last 90 days)
+            COUNT(DISTINCT CASE 
+                WHEN ad.created_at >= DATE_SUB(CURDATE(), INTERVAL 90 DAY) 
+                THEN ad.id 
+            END) as recent_activities,
+                
+            -- Use created_at as proxy for mandate duration
+            DATEDIFF(CURDATE(), dml.created_at) as days_since_mandate_created
+            
+        FROM deputados d
+        JOIN deputado_mandatos_legislativos dml ON d.id = dml.deputado_id
+        LEFT JOIN partidos p ON dml.par_sigla = p.sigla
+        LEFT JOIN attendance_analytics aa ON d.id = aa.deputado_id
+        LEFT JOIN atividade_deputados ad ON d.id = ad.deputado_id
+        WHERE dml.legislatura_id = :legislature_id  -- Current legislature
+        GROUP BY d.id, d.nome_completo, d.nome, dml.par_sigla, dml.leg_des, dml.created_at
+        HAVING days_since_mandate_created > 0
+        ORDER BY 
+            avg_attendance_rate DESC, 
+            parliamentary_activities DESC
+        LIMIT 50
+    """)
+    
+    deputy_results = session.execute(
+        deputy_performance_query,
+        {'legislature_id': current_leg.id}
+    ).fetchall()
+    
+    deputy_performance = []
+    total_deputies = 0
+    total_attendance = 0
+    total_initiatives = 0
+    
+    for row in deputy_results:
+        total_deputies += 1
+        attendance_rate = round(row.avg_attendance_rate or 0, 1)
+        total_attendance += attendance_rate
+        
+        initiatives_count = row.initiatives_authored or 0
+        total_initiatives += initiatives_count
+        
+        # Calculate performance scores
+        initiative_success_rate = round(
+            (row.initiatives_approved or 0) / max(initiatives_count, 1) * 100, 1
+        )
+        
+        activity_score = min(100, round(
+            ((row.parliamentary_activities or 0) * 0.4 + 
+             (row.initiatives_participated or 0) * 0.3 + 
+             (row.interventions_made or 0) * 0.2 +
+             (row.recent_activities or 0) * 0.1) * 2, 1
+        ))
+        
+        # Overall performance rating
+        overall_score = round(
+            (attendance_rate * 0.3 + 
+             activity_score * 0.4 + 
+             initiative_success_rate * 0.2 + 
+             min(initiatives_count * 5, 50) * 0.1), 1
+        )
+        
+        performance_rating = (
+            'excellent' if overall_score >= 80 else
+            'good' if overall_score >= 65 else
+            'average' if overall_score >= 50 else
+            'needs_improvement'
+        )
+        
+        deputy_performance.append({
+            'deputy_id': row.deputy_id,
+            'name': row.deputy_name,
+            'parliamentary_name': row.parliamentary_name,
+            'party': row.party,
+            'mandate_period': {
+                'legislature': row.legislature,
+                'days_since_created': row.days_since_mandate_created or 0
+            },
+            'attendance': {
+                'rate': attendance_rate,
+                'records_count': row.attendance_records or 0
+            },
+            'initiatives': {
+                'authored': initiatives_count,
+                'approved': row.initiatives_approved or 0,
+                'success_rate': initiative_success_rate,
+                'participated_in': row.initiatives_participated or 0
+            },
+            'participation': {
+                'total_activities': row.parliamentary_activities or 0,
+                'interventions': row.interventions_made or 0,
+                'recent_activities_90d': row.recent_activities or 0,
+                'activity_score': activity_score
+            },
+            'performance': {
+                'overall_score': overall_score,
+                'rating': performance_rating
+            }
+        })
+    
+    # 2. PARTY PERFORMANCE COMPARISON
+    party_performance_query = text("""
+        SELECT 
+            p.sigla as party_acronym,
+            p.designacao_completa as party_name,
+            COUNT(DISTINCT d.id) as total_deputies,
+            AVG(CASE WHEN aa.attendance_rate IS NOT NULL THEN aa.attendance_rate ELSE 0 END) as avg_party_attendance,
+            COUNT(DISTINCT ip.id) as total_party_initiatives,
+            COUNT(DISTINCT CASE WHEN iev.resultado LIKE '%aprovad%' THEN ip.id END) as approved_party_initiatives,
+            AVG(
+                CASE WHEN ad.created_at >= DATE_SUB(CURDATE(), INTERVAL 90 DAY) 
+                THEN 1 ELSE 0 END
+            ) as recent_activity_ratio
+        FROM partidos p
+        JOIN deputado_mandatos_legislativos dml ON p.sigla = dml.par_sigla
+        JOIN deputados d ON dml.deputado_id = d.id
+        LEFT JOIN attendance_analytics aa ON d.id = aa.deputado_id
+        LEFT JOIN iniciativas_detalhadas ip ON ip.legislatura_id = :legislature_id
+        LEFT JOIN iniciativas_eventos ie ON ip.id = ie.iniciativa_id
+        LEFT JOIN iniciativas_eventos_votacoes iev ON ie.id = iev.evento_id
+        LEFT JOIN atividade_deputados ad ON d.id = ad.deputado_id
+        WHERE dml.legislatura_id = :legislature_id  -- Current legislature
+        GROUP BY p.id, p.sigla, p.designacao_completa
+        HAVING total_deputies > 0
+        ORDER BY total_deputies DESC, avg_party_attendance DESC
+    """)
+    
+    party_results = session.execute(
+        party_performance_query,
+        {'legislature_id': current_leg.id}
+    ).fetchall()
+    
+    party_performance = []
+    for row in party_results:
+        initiative_success_rate = round(
+            (row.approved_party_initiatives or 0) / max(row.total_party_initiatives or 1, 1) * 100, 1
+        )
+        
+        party_performance.append({
+            'party_acronym': row.party_acronym,
+            'party_name': row.party_name,
+            'deputies_count': row.total_deputies or 0,
+            'avg_attendance': round(row.avg_party_attendance or 0, 1),
+            'initiatives': {
+                'total': row.total_party_initiatives or 0,
+                'approved': row.approved_party_initiatives or 0,
+                'success_rate': initiative_success_rate
+            },
+            'recent_activity_score': round((row.recent_activity_ratio or 0) * 100, 1)
+        })
+    
+    # 3. PERFORMANCE STATISTICS
+    avg_attendance = round(total_attendance / max(total_deputies, 1), 1)
+    avg_initiatives_per_deputy = round(total_initiatives / max(total_deputies, 1), 1)
+    
+    high_performers = len([d for d in deputy_performance if d['performance']['rating'] == 'excellent'])
+    active_deputies = len([d for d in deputy_performance if d['participation']['recent_activities_90d'] > 5])
+    
+    return {
+        'legislature': current_leg.numero,
+        'last_updated': datetime.now().isoformat(),
+        'analysis_period': {
+            'total_deputies_analyzed': total_deputies,
+            'avg_attendance_rate': avg_attendance,
+            'avg_initiatives_per_deputy': avg_initiatives_per_deputy
+        },
+        
+        'deputy_performance': deputy_performance,
+        'party_performance': party_performance,
+        
+        'summary_statistics': {
+            'high_performers': high_performers,
+            'active_deputies_90d': active_deputies,
+            'most_active_party': party_performance[0]['party_acronym'] if party_performance else None,
+            'highest_attendance_party': max(party_performance, key=lambda x: x['avg_attendance'])['party_acronym'] if party_performance else None
+        }
+    }
+
 @transparency_bp.route('/transparency/deputy-performance', methods=['GET'])
 def get_deputy_performance():
     """
@@ -474,220 +676,248 @@ def get_deputy_performance():
     Analyzes individual deputy performance including attendance, voting patterns,
     initiative submissions, and parliamentary participation
     """
-    session = get_session()
-    
     try:
         current_leg = get_current_legislature()
         if not current_leg:
             return jsonify({'error': 'Current legislature not found'}), 404
-            
-        # 1. DEPUTY ATTENDANCE AND PARTICIPATION ANALYSIS
-        deputy_performance_query = text("""
-            SELECT 
-                d.id as deputy_id,
-                d.nome_completo as deputy_name,
-                d.nome as parliamentary_name,
-                dml.par_sigla as party,
-                dml.leg_des as legislature,
-                
-                -- Attendance metrics
-                AVG(CASE WHEN aa.attendance_rate IS NOT NULL THEN aa.attendance_rate ELSE 0 END) as avg_attendance_rate,
-                COUNT(DISTINCT aa.id) as attendance_records,
-                
-                -- Initiative metrics  
-                0 as initiatives_authored,  -- Cannot link without author field
-                0 as initiatives_approved,  -- Cannot link without author field
-                
-                -- Participation metrics
-                COUNT(DISTINCT ad.id) as parliamentary_activities,
-                0 as initiatives_participated,  -- Cannot link without participant field
-                0 as interventions_made,  -- Cannot link without deputy field
-                
-                -- Recent activity (last 90 days)
-                COUNT(DISTINCT CASE 
-                    WHEN ad.created_at >= DATE_SUB(CURDATE(), INTERVAL 90 DAY) 
-                    THEN ad.id 
-                END) as recent_activities,
-                    
-                -- Use created_at as proxy for mandate duration
-                DATEDIFF(CURDATE(), dml.created_at) as days_since_mandate_created
-                
-            FROM deputados d
-            JOIN deputado_mandatos_legislativos dml ON d.id = dml.deputado_id
-            LEFT JOIN partidos p ON dml.par_sigla = p.sigla
-            LEFT JOIN attendance_analytics aa ON d.id = aa.deputado_id
-            LEFT JOIN atividade_deputados ad ON d.id = ad.deputado_id
-            WHERE dml.leg_des LIKE '%XVII%'  -- Current legislature
-            GROUP BY d.id, d.nome_completo, d.nome, dml.par_sigla, dml.leg_des, dml.created_at
-            HAVING days_since_mandate_created > 0
-            ORDER BY 
-                avg_attendance_rate DESC, 
-                parliamentary_activities DESC
-            LIMIT 50
-        """)
-        
-        deputy_results = session.execute(
-            deputy_performance_query
-        ).fetchall()
-        
-        deputy_performance = []
-        total_deputies = 0
-        total_attendance = 0
-        total_initiatives = 0
+
+        # Served from the summary table when computed today (its windows are relative to today)
+        return jsonify(get_daily_dashboard_aggregate(
+            AGGREGATE_DEPUTY_PERFORMANCE, current_leg.numero,
+            lambda session: compute_deputy_performance(session, current_leg)
+        ))
         
-        for row in deputy_results:
-            total_deputies += 1
-            attendance_rate = round(row.avg_attendance_rate or 0, 1)
-            total_attendance += attendance_rate
-            
-            initiatives_count = row.initiatives_authored or 0
-            total_initiatives += initiatives_count
-            
-            # Calculate performance scores
-            initiative_success_rate = round(
-                (row.initiatives_approved or 0) / max(initiatives_count, 1) * 100, 1
-            )
+    except Exception as e:
+        logger.error(f"Error in deputy performance: {str(e)}")
+        return jsonify({
+            'error': 'Internal server error',
+            'message': str(e)
+        }), 500
+
+def compute_accountability_metrics(session, current_leg):
+    """Compute the accountability metrics payload for a legislature (also used by the aggregate refresh)"""
+    today = date.today()
+    thirty_days_ago = today - timedelta(days=30)
+    legislature_start = current_leg.data_inicio or date(2024, 3, 1)
+    
+    # 1. OVERALL ACCOUNTABILITY SCORE CALCULATION
+    accountability_query = text("""
+        SELECT 
+            -- Government responsiveness metrics
+            COUNT(DISTINCT pr.id) as total_questions,
+            COUNT(DISTINCT prr.id) as answered_questions,
+            AVG(DATEDIFF(prr.data_resposta, pr.dt_entrada)) as avg_response_days,
             
-            activity_score = min(100, round(
-                ((row.parliamentary_activities or 0) * 0.4 + 
-                 (row.initiatives_participated or 0) * 0.3 + 
-                 (row.interventions_made or 0) * 0.2 +
-                 (row.recent_activities or 0) * 0.1) * 2, 1
-            ))
+            -- Legislative efficiency metrics
+            COUNT(DISTINCT ip.id) as total_initiatives,
+            COUNT(DISTINCT CASE WHEN iev.resultado LIKE '%aprovad%' THEN ip.id END) as approved_initiatives,
+            COUNT(DISTINCT CASE WHEN ip.updated_at >= :thirty_days_ago THEN ip.id END) as recent_initiatives,
             
-            # Overall performance rating
-            overall_score = round(
-                (attendance_rate * 0.3 + 
-                 activity_score * 0.4 + 
-                 initiative_success_rate * 0.2 + 
-                 min(initiatives_count * 5, 50) * 0.1), 1
-            )
+            -- Transparency metrics
+            COUNT(DISTINCT ap.id) as total_meetings,
+            COUNT(DISTINCT CASE WHEN ap.secao_nome LIKE '%público%' OR ap.tema_nome LIKE '%público%' THEN ap.id END) as public_meetings,
+            COUNT(DISTINCT CASE WHEN ap.data_evento >= :thirty_days_ago THEN ap.id END) as recent_meetings,
             
-            performance_rating = (
-                'excellent' if overall_score >= 80 else
-                'good' if overall_score >= 65 else
-                'average' if overall_score >= 50 else
-                'needs_improvement'
-            )
+            -- Citizen engagement metrics
+            COUNT(DISTINCT pp.id) as total_petitions,
+            COUNT(DISTINCT CASE WHEN pp.pet_situacao LIKE '%aprovad%' OR pp.pet_situacao LIKE '%aceite%' THEN pp.id END) as processed_petitions,
+            AVG(pp.pet_nr_assinaturas) as avg_petition_support
             
-            deputy_performance.append({
-                'deputy_id': row.deputy_id,
-                'name': row.deputy_name,
-                'parliamentary_name': row.parliamentary_name,
-                'party': row.party,
-                'mandate_period': {
-                    'legislature': row.legislature,
-                    'days_since_created': row.days_since_mandate_created or 0
-                },
-                'attendance': {
-                    'rate': attendance_rate,
-                    'records_count': row.attendance_records or 0
-                },
-                'initiatives': {
-                    'authored': initiatives_count,
-                    'approved': row.initiatives_approved or 0,
-                    'success_rate': initiative_success_rate,
-                    'participated_in': row.initiatives_participated or 0
-                },
-                'participation': {
-                    'total_activities': row.parliamentary_activities or 0,
-                    'interventions': row.interventions_made or 0,
-                    'recent_activities_90d': row.recent_activities or 0,
-                    'activity_score': activity_score
-                },
-                'performance': {
-                    'overall_score': overall_score,
-                    'rating': performance_rating
-                }
-            })
-        
-        # 2. PARTY PERFORMANCE COMPARISON
-        party_performance_query = text("""
-            SELECT 
-                p.sigla as party_acronym,
-                p.designacao_completa as party_name,
-                COUNT(DISTINCT d.id) as total_deputies,
-                AVG(CASE WHEN aa.attendance_rate IS NOT NULL THEN aa.attendance_rate ELSE 0 END) as avg_party_attendance,
-                COUNT(DISTINCT ip.id) as total_party_initiatives,
-                COUNT(DISTINCT CASE WHEN iev.resultado LIKE '%aprovad%' THEN ip.id END) as approved_party_initiatives,
-                AVG(
-                    CASE WHEN ad.created_at >= DATE_SUB(CURDATE(), INTERVAL 90 DAY) 
-                    THEN 1 ELSE 0 END
-                ) as recent_activity_ratio
-            FROM partidos p
-            JOIN deputado_mandatos_legislativos dml ON p.sigla = dml.par_sigla
-            JOIN deputados d ON dml.deputado_id = d.id
-            LEFT JOIN attendance_analytics aa ON d.id = aa.deputado_id
-            LEFT JOIN iniciativas_detalhadas ip ON ip.legislatura_id = :legislature_id
-            LEFT JOIN iniciativas_eventos ie ON ip.id = ie.iniciativa_id
-            LEFT JOIN iniciativas_eventos_votacoes iev ON ie.id = iev.evento_id
-            LEFT JOIN atividade_deputados ad ON d.id = ad.deputado_id
-            WHERE dml.leg_des LIKE '%XVII%'  -- Current legislature
-            GROUP BY p.id, p.sigla, p.designacao_completa
-            HAVING total_deputies > 0
-            ORDER BY total_deputies DESC, avg_party_attendance DESC
-        """)
-        
-        party_results = session.execute(
-            party_performance_query,
-            {'legislature_id': current_leg.id}
-        ).fetchall()
+        FROM legislaturas l
+        LEFT JOIN perguntas_requerimentos pr ON l.id = pr.legislatura_id
+        LEFT JOIN pergunta_requerimento_destinatarios prd ON pr.id = prd.pergunta_requerimento_id
+        LEFT JOIN pergunta_requerimento_respostas prr ON prd.id = prr.destinatario_id
+        LEFT JOIN iniciativas_detalhadas ip ON l.id = ip.legislatura_id
+        LEFT JOIN iniciativas_eventos ie ON ip.id = ie.iniciativa_id
+        LEFT JOIN iniciativas_eventos_votacoes iev ON ie.id = iev.evento_id
+        LEFT JOIN agenda_parlamentar ap ON l.id = ap.legislatura_id
+        LEFT JOIN peticoes_detalhadas pp ON l.id = pp.legislatura_id
+        WHERE l.id = :legislature_id
+        AND l.data_inicio >= :legislature_start
+    """)
+    
+    metrics_result = session.execute(
+        accountability_query,
+        {
+            'legislature_id': current_leg.id,
+            'thirty_days_ago': thirty_days_ago,
+            'legislature_start': legislature_start
+        }
+    ).fetchone()
+    
+    # Calculate core accountability metrics
+    response_rate = round(
+        (metrics_result.answered_questions or 0) / max(metrics_result.total_questions or 1, 1) * 100, 1
+    )
+    
+    approval_rate = round(
+        (metrics_result.approved_initiatives or 0) / max(metrics_result.total_initiatives or 1, 1) * 100, 1
+    )
+    
+    transparency_rate = round(
+        (metrics_result.public_meetings or 0) / max(metrics_result.total_meetings or 1, 1) * 100, 1
+    )
+    
+    petition_processing_rate = round(
+        (metrics_result.processed_petitions or 0) / max(metrics_result.total_petitions or 1, 1) * 100, 1
+    )
+    
+    # 2. ACCOUNTABILITY SCORE CALCULATION
+    # Weight different aspects: responsiveness (30%), efficiency (25%), transparency (25%), engagement (20%)
+    accountability_score = round(
+        (response_rate * 0.30 + 
+         approval_rate * 0.25 + 
+         transparency_rate * 0.25 + 
+         petition_processing_rate * 0.20), 1
+    )
+    
+    accountability_rating = (
+        'excellent' if accountability_score >= 80 else
+        'good' if accountability_score >= 65 else
+        'satisfactory' if accountability_score >= 50 else
+        'needs_improvement'
+    )
+    
+    # 3. TREND ANALYSIS - Compare with previous periods
+    trend_query = text("""
+        SELECT 
+            MONTH(ap.data_evento) as month_num,
+            YEAR(ap.data_evento) as year_num,
+            COUNT(DISTINCT ap.id) as monthly_meetings,
+            COUNT(DISTINCT CASE WHEN ap.secao_nome LIKE '%público%' OR ap.tema_nome LIKE '%público%' THEN ap.id END) as monthly_public_meetings,
+            COUNT(DISTINCT ip.id) as monthly_initiatives,
+            COUNT(DISTINCT pr.id) as monthly_questions
+        FROM agenda_parlamentar ap
+        LEFT JOIN iniciativas_detalhadas ip ON ap.legislatura_id = ip.legislatura_id 
+            AND MONTH(ip.updated_at) = MONTH(ap.data_evento) 
+            AND YEAR(ip.updated_at) = YEAR(ap.data_evento)
+        LEFT JOIN perguntas_requerimentos pr ON ap.legislatura_id = pr.legislatura_id 
+            AND MONTH(pr.dt_entrada) = MONTH(ap.data_evento) 
+            AND YEAR(pr.dt_entrada) = YEAR(ap.data_evento)
+        WHERE ap.legislatura_id = :legislature_id
+        AND ap.data_evento >= DATE_SUB(CURDATE(), INTERVAL 6 MONTH)
+        GROUP BY YEAR(ap.data_evento), MONTH(ap.data_evento)
+        ORDER BY year_num DESC, month_num DESC
+        LIMIT 6
+    """)
+    
+    trend_results = session.execute(
+        trend_query,
+        {'legislature_id': current_leg.id}
+    ).fetchall()
+    
+    monthly_trends = []
+    for row in trend_results:
+        monthly_transparency = round(
+            (row.monthly_public_meetings or 0) / max(row.monthly_meetings or 1, 1) * 100, 1
+        )
         
-        party_performance = []
-        for row in party_results:
-            initiative_success_rate = round(
-                (row.approved_party_initiatives or 0) / max(row.total_party_initiatives or 1, 1) * 100, 1
-            )
-            
-            party_performance.append({
-                'party_acronym': row.party_acronym,
-                'party_name': row.party_name,
-                'deputies_count': row.total_deputies or 0,
-                'avg_attendance': round(row.avg_party_attendance or 0, 1),
-                'initiatives': {
-                    'total': row.total_party_initiatives or 0,
-                    'approved': row.approved_party_initiatives or 0,
-                    'success_rate': initiative_success_rate
-                },
-                'recent_activity_score': round((row.recent_activity_ratio or 0) * 100, 1)
-            })
+        monthly_trends.append({
+            'month': f"{row.year_num}-{row.month_num:02d}",
+            'meetings': row.monthly_meetings or 0,
+            'public_meetings': row.monthly_public_meetings or 0,
+            'transparency_rate': monthly_transparency,
+            'initiatives': row.monthly_initiatives or 0,
+            'questions': row.monthly_questions or 0
+        })
+    
+    # 4. KEY PERFORMANCE INDICATORS
+    kpis = {
+        'government_responsiveness': {
+            'score': response_rate,
+            'rating': 'excellent' if response_rate > 80 else 'good' if response_rate > 60 else 'needs_improvement',
+            'avg_response_days': round(metrics_result.avg_response_days or 0, 1),
+            'benchmark': 'Target: >75% response rate, <20 days average'
+        },
+        'legislative_efficiency': {
+            'score': approval_rate,
+            'rating': 'excellent' if approval_rate > 60 else 'good' if approval_rate > 40 else 'needs_improvement',
+            'total_initiatives': metrics_result.total_initiatives or 0,
+            'recent_activity': metrics_result.recent_initiatives or 0,
+            'benchmark': 'Target: >50% approval rate, steady initiative flow'
+        },
+        'meeting_transparency': {
+            'score': transparency_rate,
+            'rating': 'excellent' if transparency_rate > 70 else 'good' if transparency_rate > 50 else 'needs_improvement',
+            'total_meetings': metrics_result.total_meetings or 0,
+            'recent_meetings': metrics_result.recent_meetings or 0,
+            'benchmark': 'Target: >60% public meetings'
+        },
+        'citizen_engagement': {
+            'score': petition_processing_rate,
+            'rating': 'excellent' if petition_processing_rate > 70 else 'good' if petition_processing_rate > 50 else 'needs_improvement',
+            'total_petitions': metrics_result.total_petitions or 0,
+            'avg_support': round(metrics_result.avg_petition_support or 0, 0),
+            'benchmark': 'Target: >60% petition processing rate'
+        }
+    }
+    
+    # 5. RECOMMENDATIONS BASED ON PERFORMANCE
+    recommendations = []
+    
+    if response_rate < 60:
+        recommendations.append({
+            'area': 'Government Responsiveness',
+            'priority': 'high',
+            'recommendation': 'Establish mandatory response timeframes for parliamentary questions',
+            'expected_impact': 'Improve government accountability and democratic dialogue'
+        })
         
-        # 3. PERFORMANCE STATISTICS
-        avg_attendance = round(total_attendance / max(total_deputies, 1), 1)
-        avg_initiatives_per_deputy = round(total_initiatives / max(total_deputies, 1), 1)
+    if approval_rate < 40:
+        recommendations.append({
+            'area': 'Legislative Efficiency',
+            'priority': 'medium',
+            'recommendation': 'Review legislative process bottlenecks and committee workflows',
+            'expected_impact': 'Increase successful completion rate of legislative initiatives'
+        })
         
-        high_performers = len([d for d in deputy_performance if d['performance']['rating'] == 'excellent'])
-        active_deputies = len([d for d in deputy_performance if d['participation']['recent_activities_90d'] > 5])
+    if transparency_rate < 50:
+        recommendations.append({
+            'area': 'Meeting Transparency',
+            'priority': 'high',
+            'recommendation': 'Increase public access to committee meetings and parliamentary sessions',
+            'expected_impact': 'Enhance democratic participation and public oversight'
+        })
         
-        return jsonify({
-            'legislature': current_leg.numero,
-            'last_updated': datetime.now().isoformat(),
-            'analysis_period': {
-                'total_deputies_analyzed': total_deputies,
-                'avg_attendance_rate': avg_attendance,
-                'avg_initiatives_per_deputy': avg_initiatives_per_deputy
-            },
-            
-            'deputy_performance': deputy_performance,
-            'party_performance': party_performance,
-            
-            'summary_statistics': {
-                'high_performers': high_performers,
-                'active_deputies_90d': active_deputies,
-                'most_active_party': party_performance[0]['party_acronym'] if party_performance else None,
-                'highest_attendance_party': max(party_performance, key=lambda x: x['avg_attendance'])['party_acronym'] if party_performance else None
-            }
+    if petition_processing_rate < 50:
+        recommendations.append({
+            'area': 'Citizen Engagement',
+            'priority': 'medium',
+            'recommendation': 'Streamline petition review process and provide regular status updates',
+            'expected_impact': 'Strengthen citizen participation in democratic processes'
         })
+    
+    return {
+        'legislature': current_leg.numero,
+        'assessment_date': today.isoformat(),
+        'analysis_period': {
+            'start': legislature_start.isoformat(),
+            'end': today.isoformat(),
+            'days_analyzed': (today - legislature_start).days
+        },
+        
+        'accountability_summary': {
+            'overall_score': accountability_score,
+            'overall_rating': accountability_rating,
+            'score_breakdown': {
+                'responsiveness_weight': 30,
+                'efficiency_weight': 25,
+                'transparency_weight': 25,
+                'engagement_weight': 20
+            }
+        },
         
-    except Exception as e:
-        logger.error(f"Error in deputy performance: {str(e)}")
-        return jsonify({
-            'error': 'Internal server error',
-            'message': str(e)
-        }), 500
+        'key_performance_indicators': kpis,
+        'monthly_trends': monthly_trends,
+        'improvement_recommendations': recommendations,
         
-    finally:
-        session.close()
+        'benchmark_comparison': {
+            'meets_international_standards': accountability_score >= 70,
+            'areas_above_benchmark': len([k for k in kpis.values() if k['score'] >= 60]),
+            'areas_needing_attention': len([k for k in kpis.values() if k['score'] < 50]),
+            'overall_democratic_health': 'strong' if accountability_score >= 75 else 'moderate' if accountability_score >= 60 else 'concerning'
+        }
+    }
 
 @transparency_bp.route('/transparency/accountability-metrics', methods=['GET'])
 def get_accountability_metrics():
@@ -698,235 +928,16 @@ def get_accountability_metrics():
     Provides comprehensive transparency metrics including government accountability,
     parliamentary efficiency, and citizen engagement indicators
     """
-    session = get_session()
-    
     try:
         current_leg = get_current_legislature()
         if not current_leg:
             return jsonify({'error': 'Current legislature not found'}), 404
-            
-        today = date.today()
-        thirty_days_ago = today - timedelta(days=30)
-        legislature_start = current_leg.data_inicio or date(2024, 3, 1)
-        
-        # 1. OVERALL ACCOUNTABILITY SCORE CALCULATION
-        accountability_query = text("""
-            SELECT 
-                -- Government responsiveness metrics
-                COUNT(DISTINCT pr.id) as total_questions,
-                COUNT(DISTINCT prr.id) as answered_questions,
-                AVG(DATEDIFF(prr.data_resposta, pr.dt_entrada)) as avg_response_days,
-                
-                -- Legislative efficiency metrics
-                COUNT(DISTINCT ip.id) as total_initiatives,
-                COUNT(DISTINCT CASE WHEN iev.resultado LIKE '%aprovad%' THEN ip.id END) as approved_initiatives,
-                COUNT(DISTINCT CASE WHEN ip.updated_at >= :thirty_days_ago THEN ip.id END) as recent_initiatives,
-                
-                -- Transparency metrics
-                COUNT(DISTINCT ap.id) as total_meetings,
-                COUNT(DISTINCT CASE WHEN ap.secao_nome LIKE '%público%' OR ap.tema_nome LIKE '%público%' THEN ap.id END) as public_meetings,
-                COUNT(DISTINCT CASE WHEN ap.data_evento >= :thirty_days_ago THEN ap.id END) as recent_meetings,
-                
-                -- Citizen engagement metrics
-                COUNT(DISTINCT pp.id) as total_petitions,
-                COUNT(DISTINCT CASE WHEN pp.pet_situacao LIKE '%aprovad%' OR pp.pet_situacao LIKE '%aceite%' THEN pp.id END) as processed_petitions,
-                AVG(pp.pet_nr_assinaturas) as avg_petition_support
-                
-            FROM legislaturas l
-            LEFT JOIN perguntas_requerimentos pr ON l.id = pr.legislatura_id
-            LEFT JOIN pergunta_requerimento_destinatarios prd ON pr.id = prd.pergunta_requerimento_id
-            LEFT JOIN pergunta_requerimento_respostas prr ON prd.id = prr.destinatario_id
-            LEFT JOIN iniciativas_detalhadas ip ON l.id = ip.legislatura_id
-            LEFT JOIN iniciativas_eventos ie ON ip.id = ie.iniciativa_id
-            LEFT JOIN iniciativas_eventos_votacoes iev ON ie.id = iev.evento_id
-            LEFT JOIN agenda_parlamentar ap ON l.id = ap.legislatura_id
-            LEFT JOIN peticoes_detalhadas pp ON l.id = pp.legislatura_id
-            WHERE l.id = :legislature_id
-            AND l.data_inicio >= :legislature_start
-        """)
-        
-        metrics_result = session.execute(
-            accountability_query,
-            {
-                'legislature_id': current_leg.id,
-                'thirty_days_ago': thirty_days_ago,
-                'legislature_start': legislature_start
-            }
-        ).fetchone()
-        
-        # Calculate core accountability metrics
-        response_rate = round(
-            (metrics_result.answered_questions or 0) / max(metrics_result.total_questions or 1, 1) * 100, 1
-        )
-        
-        approval_rate = round(
-            (metrics_result.approved_initiatives or 0) / max(metrics_result.total_initiatives or 1, 1) * 100, 1
-        )
-        
-        transparency_rate = round(
-            (metrics_result.public_meetings or 0) / max(metrics_result.total_meetings or 1, 1) * 100, 1
-        )
-        
-        petition_processing_rate = round(
-            (metrics_result.processed_petitions or 0) / max(metrics_result.total_petitions or 1, 1) * 100, 1
-        )
-        
-        # 2. ACCOUNTABILITY SCORE CALCULATION
-        # Weight different aspects: responsiveness (30%), efficiency (25%), transparency (25%), engagement (20%)
-        accountability_score = round(
-            (response_rate * 0.30 + 
-             approval_rate * 0.25 + 
-             transparency_rate * 0.25 + 
-             petition_processing_rate * 0.20), 1
-        )
-        
-        accountability_rating = (
-            'excellent' if accountability_score >= 80 else
-            'good' if accountability_score >= 65 else
-            'satisfactory' if accountability_score >= 50 else
-            'needs_improvement'
-        )
-        
-        # 3. TREND ANALYSIS - Compare with previous periods
-        trend_query = text("""
-            SELECT 
-                MONTH(ap.data_evento) as month_num,
-                YEAR(ap.data_evento) as year_num,
-                COUNT(DISTINCT ap.id) as monthly_meetings,
-                COUNT(DISTINCT CASE WHEN ap.secao_nome LIKE '%público%' OR ap.tema_nome LIKE '%público%' THEN ap.id END) as monthly_public_meetings,
-                COUNT(DISTINCT ip.id) as monthly_initiatives,
-                COUNT(DISTINCT pr.id) as monthly_questions
-            FROM agenda_parlamentar ap
-            LEFT JOIN iniciativas_detalhadas ip ON ap.legislatura_id = ip.legislatura_id 
-                AND MONTH(ip.updated_at) = MONTH(ap.data_evento) 
-                AND YEAR(ip.updated_at) = YEAR(ap.data_evento)
-            LEFT JOIN perguntas_requerimentos pr ON ap.legislatura_id = pr.legislatura_id 
-                AND MONTH(pr.dt_entrada) = MONTH(ap.data_evento) 
-                AND YEAR(pr.dt_entrada) = YEAR(ap.data_evento)
-            WHERE ap.legislatura_id = :legislature_id
-            AND ap.data_evento >= DATE_SUB(CURDATE(), INTERVAL 6 MONTH)
-            GROUP BY YEAR(ap.data_evento), MONTH(ap.data_evento)
-            ORDER BY year_num DESC, month_num DESC
-            LIMIT 6
-        """)
-        
-        trend_results = session.execute(
-            trend_query,
-            {'legislature_id': current_leg.id}
-        ).fetchall()
-        
-        monthly_trends = []
-        for row in trend_results:
-            monthly_transparency = round(
-                (row.monthly_public_meetings or 0) / max(row.monthly_meetings or 1, 1) * 100, 1
-            )
-            
-            monthly_trends.append({
-                'month': f"{row.year_num}-{row.month_num:02d}",
-                'meetings': row.monthly_meetings or 0,
-                'public_meetings': row.monthly_public_meetings or 0,
-                'transparency_rate': monthly_transparency,
-                'initiatives': row.monthly_initiatives or 0,
-                'questions': row.monthly_questions or 0
-            })
-        
-        # 4. KEY PERFORMANCE INDICATORS
-        kpis = {
-            'government_responsiveness': {
-                'score': response_rate,
-                'rating': 'excellent' if response_rate > 80 else 'good' if response_rate > 60 else 'needs_improvement',
-                'avg_response_days': round(metrics_result.avg_response_days or 0, 1),
-                'benchmark': 'Target: >75% response rate, <20 days average'
-            },
-            'legislative_efficiency': {
-                'score': approval_rate,
-                'rating': 'excellent' if approval_rate > 60 else 'good' if approval_rate > 40 else 'needs_improvement',
-                'total_initiatives': metrics_result.total_initiatives or 0,
-                'recent_activity': metrics_result.recent_initiatives or 0,
-                'benchmark': 'Target: >50% approval rate, steady initiative flow'
-            },
-            'meeting_transparency': {
-                'score': transparency_rate,
-                'rating': 'excellent' if transparency_rate > 70 else 'good' if transparency_rate > 50 else 'needs_improvement',
-                'total_meetings': metrics_result.total_meetings or 0,
-                'recent_meetings': metrics_result.recent_meetings or 0,
-                'benchmark': 'Target: >60% public meetings'
-            },
-            'citizen_engagement': {
-                'score': petition_processing_rate,
-                'rating': 'excellent' if petition_processing_rate > 70 else 'good' if petition_processing_rate > 50 else 'needs_improvement',
-                'total_petitions': metrics_result.total_petitions or 0,
-                'avg_support': round(metrics_result.avg_petition_support or 0, 0),
-                'benchmark': 'Target: >60% petition processing rate'
-            }
-        }
-        
-        # 5. RECOMMENDATIONS BASED ON PERFORMANCE
-        recommendations = []
-        
-        if response_rate < 60:
-            recommendations.append({
-                'area': 'Government Responsiveness',
-                'priority': 'high',
-                'recommendation': 'Establish mandatory response timeframes for parliamentary questions',
-                'expected_impact': 'Improve government accountability and democratic dialogue'
-            })
-            
-        if approval_rate < 40:
-            recommendations.append({
-                'area': 'Legislative Efficiency',
-                'priority': 'medium',
-                'recommendation': 'Review legislative process bottlenecks and committee workflows',
-                'expected_impact': 'Increase successful completion rate of legislative initiatives'
-            })
-            
-        if transparency_rate < 50:
-            recommendations.append({
-                'area': 'Meeting Transparency',
-                'priority': 'high',
-                'recommendation': 'Increase public access to committee meetings and parliamentary sessions',
-                'expected_impact': 'Enhance democratic participation and public oversight'
-            })
-            
-        if petition_processing_rate < 50:
-            recommendations.append({
-                'area': 'Citizen Engagement',
-                'priority': 'medium',
-                'recommendation': 'Streamline petition review process and provide regular status updates',
-                'expected_impact': 'Strengthen citizen participation in democratic processes'
-            })
-        
-        return jsonify({
-            'legislature': current_leg.numero,
-            'assessment_date': today.isoformat(),
-            'analysis_period': {
-                'start': legislature_start.isoformat(),
-                'end': today.isoformat(),
-                'days_analyzed': (today - legislature_start).days
-            },
-            
-            'accountability_summary': {
-                'overall_score': accountability_score,
-                'overall_rating': accountability_rating,
-                'score_breakdown': {
-                    'responsiveness_weight': 30,
-                    'efficiency_weight': 25,
-                    'transparency_weight': 25,
-                    'engagement_weight': 20
-                }
-            },
-            
-            'key_performance_indicators': kpis,
-            'monthly_trends': monthly_trends,
-            'improvement_recommendations': recommendations,
-            
-            'benchmark_comparison': {
-                'meets_international_standards': accountability_score >= 70,
-                'areas_above_benchmark': len([k for k in kpis.values() if k['score'] >= 60]),
-                'areas_needing_attention': len([k for k in kpis.values() if k['score'] < 50]),
-                'overall_democratic_health': 'strong' if accountability_score >= 75 else 'moderate' if accountability_score >= 60 else 'concerning'
-            }
-        })
+
+        # Served from the summary table when computed today (its windows are relative to today)
+        return jsonify(get_daily_dashboard_aggregate(
+            AGGREGATE_ACCOUNTABILITY_METRICS, current_leg.numero,
+            lambda session: compute_accountability_metrics(session, current_leg)
+        ))
         
     except Exception as e:
         logger.error(f"Error in accountability metrics: {str(e)}")
@@ -934,9 +945,206 @@ def get_accountability_metrics():
             'error': 'Internal server error',
             'message': str(e)
         }), 500
+
+def compute_citizen_participation(session, current_leg):
+    """Compute the citizen participation payload for a legislature (also used by the aggregate refresh)"""
+    today = date.today()
+    thirty_days_ago = today - timedelta(days=30)
+    ninety_days_ago = today - timedelta(days=90)
+    
+    # 1. PETITION ANALYSIS
+    petition_analysis_query = text("""
+        SELECT 
+            COUNT(DISTINCT pp.id) as total_petitions,
+            COUNT(DISTINCT CASE WHEN pp.pet_data_entrada >= :thirty_days_ago THEN pp.id END) as recent_petitions,
+            COUNT(DISTINCT CASE WHEN pp.pet_data_entrada >= :ninety_days_ago THEN pp.id END) as quarterly_petitions,
+            AVG(pp.pet_nr_assinaturas) as avg_subscribers,
+            COUNT(DISTINCT CASE WHEN pp.pet_nr_assinaturas > 500 THEN pp.id END) as high_support_petitions,
+            COUNT(DISTINCT CASE WHEN pp.pet_situacao LIKE '%aprovad%' OR pp.pet_situacao LIKE '%aceite%' THEN pp.id END) as accepted_petitions,
+            COUNT(DISTINCT CASE WHEN pp.pet_situacao LIKE '%rejeitad%' OR pp.pet_situacao LIKE '%recusad%' THEN pp.id END) as rejected_petitions,
+            COUNT(DISTINCT CASE WHEN pp.pet_situacao LIKE '%anális%' OR pp.pet_situacao LIKE '%processo%' THEN pp.id END) as processing_petitions
+        FROM peticoes_detalhadas pp
+        WHERE pp.legislatura_id = :legislature_id
+        AND pp.pet_data_entrada IS NOT NULL
+    """)
+    
+    petition_result = session.execute(
+        petition_analysis_query,
+        {
+            'legislature_id': current_leg.id,
+            'thirty_days_ago': thirty_days_ago,
+            'ninety_days_ago': ninety_days_ago
+        }
+    ).fetchone()
+    
+    # Calculate petition metrics
+    total_petitions = petition_result.total_petitions or 0
+    acceptance_rate = round(
+        (petition_result.accepted_petitions or 0) / max(total_petitions, 1) * 100, 1
+    ) if total_petitions > 0 else 0
+    
+    citizen_engagement_score = min(100, round(
+        ((petition_result.recent_petitions or 0) * 3 + 
+         (petition_result.high_support_petitions or 0) * 5 +
+         acceptance_rate * 0.5), 1
+    ))
+    
+    petition_data = {
+        'total_petitions': total_petitions,
+        'recent_activity': {
+            'last_30_days': petition_result.recent_petitions or 0,
+            'last_90_days': petition_result.quarterly_petitions or 0
+        },
+        'engagement_metrics': {
+            'avg_subscribers': round(petition_result.avg_subscribers or 0, 0),
+            'high_support_count': petition_result.high_support_petitions or 0,
+            'citizen_engagement_score': citizen_engagement_score
+        },
+        'processing_status': {
+            'accepted': petition_result.accepted_petitions or 0,
+            'rejected': petition_result.rejected_petitions or 0,
+            'processing': petition_result.processing_petitions or 0,
+            'acceptance_rate': acceptance_rate
+        }
+    }
+    
+    # 2. RECENT HIGH-IMPACT PETITIONS
+    recent_petitions_query = session.query(PeticaoParlamentar).filter(
+        PeticaoParlamentar.legislatura_id == current_leg.id,
+        PeticaoParlamentar.pet_data_entrada >= ninety_days_ago
+    ).order_by(
+        desc(PeticaoParlamentar.pet_nr_assinaturas)
+    ).limit(10).all()
+    
+    recent_petitions = []
+    for petition in recent_petitions_query:
+        # Determine impact level
+        subscribers = petition.pet_nr_assinaturas or 0
+        impact_level = (
+            'high' if subscribers > 1000 else
+            'medium' if subscribers > 200 else
+            'low'
+        )
         
-    finally:
-        session.close()
+        recent_petitions.append({
+            'id': petition.id,
+            'title': petition.pet_assunto,  # petition subject
+            'summary': petition.pet_assunto,  # use same for summary
+            'subscribers': subscribers,
+            'submission_date': petition.pet_data_entrada.isoformat() if petition.pet_data_entrada else None,
+            'status': petition.pet_situacao,
+            'impact_level': impact_level,
+            'main_petitioner': petition.pet_autor  # petition author
+        })
+    
+    # 3. PARLIAMENTARY OPENNESS INDICATORS
+    openness_query = text("""
+        SELECT 
+            -- Meeting transparency
+            COUNT(DISTINCT ap.id) as total_meetings,
+            COUNT(DISTINCT CASE WHEN ap.secao_nome LIKE '%público%' OR ap.tema_nome LIKE '%público%' THEN ap.id END) as public_meetings,
+            
+            -- Information accessibility  
+            COUNT(DISTINCT pr.id) as total_questions_to_govt,
+            COUNT(DISTINCT prr.id) as total_govt_responses,
+            
+            -- Recent parliamentary activity visibility
+            COUNT(DISTINCT CASE WHEN ap.data_evento >= :thirty_days_ago THEN ap.id END) as recent_meetings,
+            COUNT(DISTINCT CASE WHEN ap.data_evento >= :thirty_days_ago AND (ap.secao_nome LIKE '%público%' OR ap.tema_nome LIKE '%público%') THEN ap.id END) as recent_public_meetings
+            
+        FROM agenda_parlamentar ap
+        LEFT JOIN perguntas_requerimentos pr ON ap.legislatura_id = pr.legislatura_id
+        LEFT JOIN pergunta_requerimento_destinatarios prd ON pr.id = prd.pergunta_requerimento_id
+        LEFT JOIN pergunta_requerimento_respostas prr ON prd.id = prr.destinatario_id
+        WHERE ap.legislatura_id = :legislature_id
+        AND ap.data_evento >= :legislature_start
+    """)
+    
+    legislature_start = current_leg.data_inicio or date(2024, 3, 1)
+    
+    openness_result = session.execute(
+        openness_query,
+        {
+            'legislature_id': current_leg.id,
+            'thirty_days_ago': thirty_days_ago,
+            'legislature_start': legislature_start
+        }
+    ).fetchone()
+    
+    # Calculate openness metrics
+    public_meeting_rate = round(
+        (openness_result.public_meetings or 0) / max(openness_result.total_meetings or 1, 1) * 100, 1
+    )
+    
+    govt_response_rate = round(
+        (openness_result.total_govt_responses or 0) / max(openness_result.total_questions_to_govt or 1, 1) * 100, 1
+    )
+    
+    recent_transparency_score = round(
+        (openness_result.recent_public_meetings or 0) / max(openness_result.recent_meetings or 1, 1) * 100, 1
+    )
+    
+    openness_indicators = {
+        'meeting_transparency': {
+            'total_meetings': openness_result.total_meetings or 0,
+            'public_meetings': openness_result.public_meetings or 0,
+            'public_meeting_rate': public_meeting_rate
+        },
+        'information_accessibility': {
+            'questions_to_government': openness_result.total_questions_to_govt or 0,
+            'government_responses': openness_result.total_govt_responses or 0,
+            'response_rate': govt_response_rate
+        },
+        'recent_transparency': {
+            'meetings_last_30d': openness_result.recent_meetings or 0,
+            'public_meetings_last_30d': openness_result.recent_public_meetings or 0,
+            'recent_transparency_score': recent_transparency_score
+        }
+    }
+    
+    # 4. OVERALL PARTICIPATION ASSESSMENT
+    participation_rating = (
+        'excellent' if citizen_engagement_score > 75 and acceptance_rate > 60 else
+        'good' if citizen_engagement_score > 50 and acceptance_rate > 40 else
+        'moderate' if citizen_engagement_score > 25 or acceptance_rate > 20 else
+        'needs_improvement'
+    )
+    
+    # Filter None values from lists
+    key_strengths = [s for s in [
+        'High petition acceptance rate' if acceptance_rate > 50 else None,
+        'Strong citizen engagement' if citizen_engagement_score > 60 else None,
+        'Good government responsiveness' if govt_response_rate > 70 else None,
+        'High meeting transparency' if public_meeting_rate > 60 else None
+    ] if s is not None]
+    
+    improvement_areas = [a for a in [
+        'Petition processing speed' if acceptance_rate < 30 else None,
+        'Citizen engagement' if citizen_engagement_score < 40 else None,
+        'Government responsiveness' if govt_response_rate < 50 else None,
+        'Meeting accessibility' if public_meeting_rate < 40 else None
+    ] if a is not None]
+    
+    return {
+        'legislature': current_leg.numero,
+        'last_updated': datetime.now().isoformat(),
+        'analysis_period': {
+            'start_date': legislature_start.isoformat(),
+            'current_date': today.isoformat()
+        },
+        
+        'petition_data': petition_data,
+        'recent_high_impact_petitions': recent_petitions,
+        'openness_indicators': openness_indicators,
+        
+        'participation_summary': {
+            'overall_rating': participation_rating,
+            'citizen_engagement_score': citizen_engagement_score,
+            'transparency_score': round((public_meeting_rate + govt_response_rate) / 2, 1),
+            'key_strengths': key_strengths,
+            'improvement_areas': improvement_areas
+        }
+    }
 
 @transparency_bp.route('/transparency/citizen-participation', methods=['GET'])
 def get_citizen_participation():
@@ -947,217 +1155,20 @@ def get_citizen_participation():
     Tracks citizen engagement through petitions, public consultations,
     and parliamentary openness indicators
     """
-    session = get_session()
-    
     try:
         current_leg = get_current_legislature()
         if not current_leg:
             return jsonify({'error': 'Current legislature not found'}), 404
-            
-        today = date.today()
-        thirty_days_ago = today - timedelta(days=30)
-        ninety_days_ago = today - timedelta(days=90)
-        
-        # 1. PETITION ANALYSIS
-        petition_analysis_query = text("""
-            SELECT 
-                COUNT(DISTINCT pp.id) as total_petitions,
-                COUNT(DISTINCT CASE WHEN pp.pet_data_entrada >= :thirty_days_ago THEN pp.id END) as recent_petitions,
-                COUNT(DISTINCT CASE WHEN pp.pet_data_entrada >= :ninety_days_ago THEN pp.id END) as quarterly_petitions,
-                AVG(pp.pet_nr_assinaturas) as avg_subscribers,
-                COUNT(DISTINCT CASE WHEN pp.pet_nr_assinaturas > 500 THEN pp.id END) as high_support_petitions,
-                COUNT(DISTINCT CASE WHEN pp.pet_situacao LIKE '%aprovad%' OR pp.pet_situacao LIKE '%aceite%' THEN pp.id END) as accepted_petitions,
-                COUNT(DISTINCT CASE WHEN pp.pet_situacao LIKE '%rejeitad%' OR pp.pet_situacao LIKE '%recusad%' THEN pp.id END) as rejected_petitions,
-                COUNT(DISTINCT CASE WHEN pp.pet_situacao LIKE '%anális%' OR pp.pet_situacao LIKE '%processo%' THEN pp.id END) as processing_petitions
-            FROM peticoes_detalhadas pp
-            WHERE pp.legislatura_id = :legislature_id
-            AND pp.pet_data_entrada IS NOT NULL
-        """)
-        
-        petition_result = session.execute(
-            petition_analysis_query,
-            {
-                'legislature_id': current_leg.id,
-                'thirty_days_ago': thirty_days_ago,
-                'ninety_days_ago': ninety_days_ago
-            }
-        ).fetchone()
-        
-        # Calculate petition metrics
-        total_petitions = petition_result.total_petitions or 0
-        acceptance_rate = round(
-            (petition_result.accepted_petitions or 0) / max(total_petitions, 1) * 100, 1
-        ) if total_petitions > 0 else 0
-        
-        citizen_engagement_score = min(100, round(
-            ((petition_result.recent_petitions or 0) * 3 + 
-             (petition_result.high_support_petitions or 0) * 5 +
-             acceptance_rate * 0.5), 1
+
+        # Served from the summary table when computed today (its windows are relative to today)
+        return jsonify(get_daily_dashboard_aggregate(
+            AGGREGATE_CITIZEN_PARTICIPATION, current_leg.numero,
+            lambda session: compute_citizen_participation(session, current_leg)
         ))
         
-        petition_data = {
-            'total_petitions': total_petitions,
-            'recent_activity': {
-                'last_30_days': petition_result.recent_petitions or 0,
-                'last_90_days': petition_result.quarterly_petitions or 0
-            },
-            'engagement_metrics': {
-                'avg_subscribers': round(petition_result.avg_subscribers or 0, 0),
-                'high_support_count': petition_result.high_support_petitions or 0,
-                'citizen_engagement_score': citizen_engagement_score
-            },
-            'processing_status': {
-                'accepted': petition_result.accepted_petitions or 0,
-                'rejected': petition_result.rejected_petitions or 0,
-                'processing': petition_result.processing_petitions or 0,
-                'acceptance_rate': acceptance_rate
-            }
-        }
-        
-        # 2. RECENT HIGH-IMPACT PETITIONS
-        recent_petitions_query = session.query(PeticaoParlamentar).filter(
-            PeticaoParlamentar.legislatura_id == current_leg.id,
-            PeticaoParlamentar.pet_data_entrada >= ninety_days_ago
-        ).order_by(
-            desc(PeticaoParlamentar.pet_nr_assinaturas)
-        ).limit(10).all()
-        
-        recent_petitions = []
-        for petition in recent_petitions_query:
-            # Determine impact level
-            subscribers = petition.pet_nr_assinaturas or 0
-            impact_level = (
-                'high' if subscribers > 1000 else
-                'medium' if subscribers > 200 else
-                'low'
-            )
-            
-            recent_petitions.append({
-                'id': petition.id,
-                'title': petition.pet_assunto,  # petition subject
-                'summary': petition.pet_assunto,  # use same for summary
-                'subscribers': subscribers,
-                'submission_date': petition.pet_data_entrada.isoformat() if petition.pet_data_entrada else None,
-                'status': petition.pet_situacao,
-                'impact_level': impact_level,
-                'main_petitioner': petition.pet_autor  # petition author
-            })
-        
-        # 3. PARLIAMENTARY OPENNESS INDICATORS
-        openness_query = text("""
-            SELECT 
-                -- Meeting transparency
-                COUNT(DISTINCT ap.id) as total_meetings,
-                COUNT(DISTINCT CASE WHEN ap.secao_nome LIKE '%público%' OR ap.tema_nome LIKE '%público%' THEN ap.id END) as public_meetings,
-                
-                -- Information accessibility  
-                COUNT(DISTINCT pr.id) as total_questions_to_govt,
-                COUNT(DISTINCT prr.id) as total_govt_responses,
-                
-                -- Recent parliamentary activity visibility
-                COUNT(DISTINCT CASE WHEN ap.data_evento >= :thirty_days_ago THEN ap.id END) as recent_meetings,
-                COUNT(DISTINCT CASE WHEN ap.data_evento >= :thirty_days_ago AND (ap.secao_nome LIKE '%público%' OR ap.tema_nome LIKE '%público%') THEN ap.id END) as recent_public_meetings
-                
-            FROM agenda_parlamentar ap
-            LEFT JOIN perguntas_requerimentos pr ON ap.legislatura_id = pr.legislatura_id
-            LEFT JOIN pergunta_requerimento_destinatarios prd ON pr.id = prd.pergunta_requerimento_id
-            LEFT JOIN pergunta_requerimento_respostas prr ON prd.id = prr.destinatario_id
-            WHERE ap.legislatura_id = :legislature_id
-            AND ap.data_evento >= :legislature_start
-        """)
-        
-        legislature_start = current_leg.data_inicio or date(2024, 3, 1)
-        
-        openness_result = session.execute(
-            openness_query,
-            {
-                'legislature_id': current_leg.id,
-                'thirty_days_ago': thirty_days_ago,
-                'legislature_start': legislature_start
-            }
-        ).fetchone()
-        
-        # Calculate openness metrics
-        public_meeting_rate = round(
-            (openness_result.public_meetings or 0) / max(openness_result.total_meetings or 1, 1) * 100, 1
-        )
-        
-        govt_response_rate = round(
-            (openness_result.total_govt_responses or 0) / max(openness_result.total_questions_to_govt or 1, 1) * 100, 1
-        )
-        
-        recent_transparency_score = round(
-            (openness_result.recent_public_meetings or 0) / max(openness_result.recent_meetings or 1, 1) * 100, 1
-        )
-        
-        openness_indicators = {
-            'meeting_transparency': {
-                'total_meetings': openness_result.total_meetings or 0,
-                'public_meetings': openness_result.public_meetings or 0,
-                'public_meeting_rate': public_meeting_rate
-            },
-            'information_accessibility': {
-                'questions_to_government': openness_result.total_questions_to_govt or 0,
-                'government_responses': openness_result.total_govt_responses or 0,
-                'response_rate': govt_response_rate
-            },
-            'recent_transparency': {
-                'meetings_last_30d': openness_result.recent_meetings or 0,
-                'public_meetings_last_30d': openness_result.recent_public_meetings or 0,
-                'recent_transparency_score': recent_transparency_score
-            }
-        }
-        
-        # 4. OVERALL PARTICIPATION ASSESSMENT
-        participation_rating = (
-            'excellent' if citizen_engagement_score > 75 and acceptance_rate > 60 else
-            'good' if citizen_engagement_score > 50 and acceptance_rate > 40 else
-            'moderate' if citizen_engagement_score > 25 or acceptance_rate > 20 else
-            'needs_improvement'
-        )
-        
-        # Filter None values from lists
-        key_strengths = [s for s in [
-            'High petition acceptance rate' if acceptance_rate > 50 else None,
-            'Strong citizen engagement' if citizen_engagement_score > 60 else None,
-            'Good government responsiveness' if govt_response_rate > 70 else None,
-            'High meeting transparency' if public_meeting_rate > 60 else None
-        ] if s is not None]
-        
-        improvement_areas = [a for a in [
-            'Petition processing speed' if acceptance_rate < 30 else None,
-            'Citizen engagement' if citizen_engagement_score < 40 else None,
-            'Government responsiveness' if govt_response_rate < 50 else None,
-            'Meeting accessibility' if public_meeting_rate < 40 else None
-        ] if a is not None]
-        
-        return jsonify({
-            'legislature': current_leg.numero,
-            'last_updated': datetime.now().isoformat(),
-            'analysis_period': {
-                'start_date': legislature_start.isoformat(),
-                'current_date': today.isoformat()
-            },
-            
-            'petition_data': petition_data,
-            'recent_high_impact_petitions': recent_petitions,
-            'openness_indicators': openness_indicators,
-            
-            'participation_summary': {
-                'overall_rating': participation_rating,
-                'citizen_engagement_score': citizen_engagement_score,
-                'transparency_score': round((public_meeting_rate + govt_response_rate) / 2, 1),
-                'key_strengths': key_strengths,
-                'improvement_areas': improvement_areas
-            }
-        })
-        
     except Exception as e:
         logger.error(f"Error in citizen participation: {str(e)}")
         return jsonify({
             'error': 'Internal server error',
             'message': str(e)
         }), 500
-        
-    finally:
-        session.close()
\ No newline at end of file
@@ -0,0 +1,218 @@
+"""
+Dashboard Aggregates
+====================
+
+Precomputed payloads for the statistics and transparency dashboards.
+
+The /estatisticas and /transparency/* endpoints run several COUNT(DISTINCT ...)
+scans and multi-table joins per request. Their results only change when new
+data is imported, so they are computed once per legislature after each import
+run and stored in the dashboard_aggregates summary table. Endpoints read a
+single row and fall back to live computation when no aggregate exists yet.
+
+Usage:
+    from app.utils.dashboard_aggregates import get_dashboard_aggregate, AGGREGATE_ESTATISTICAS
+
+    payload = get_dashboard_aggregate(AGGREGATE_ESTATISTICAS, 'XVII')
+    if payload is None:
+        payload = compute_live(...)
+
+Dashboards with windows relative to today (last 30 days, days analyzed)
+are only served from a row computed today; the first request of a day
+recomputes and stores it:
+    payload = get_daily_dashboard_aggregate(AGGREGATE_CITIZEN_PARTICIPATION, 'XVII', compute)
+
+Refresh (called automatically when an import run completes, it also bumps
+the reference data version so API workers reload their cached reference
+tables):
+    from app.utils.dashboard_aggregates import refresh_dashboard_aggregates
+    refresh_dashboard_aggregates()
+"""
+
+import json
+import logging
+import time
+import uuid
+from datetime import date, datetime
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from database.connection import DatabaseSession
+from database.models import DashboardAggregate, Legislatura
+from database.reference_cache import bump_reference_data_version
+from app.utils.json_response import json_default
+
+logger = logging.getLogger(__name__)
+
+# Aggregate keys
+AGGREGATE_ESTATISTICAS = 'estatisticas'
+AGGREGATE_DEPUTY_PERFORMANCE = 'transparency_deputy_performance'
+AGGREGATE_ACCOUNTABILITY_METRICS = 'transparency_accountability_metrics'
+AGGREGATE_CITIZEN_PARTICIPATION = 'transparency_citizen_participation'
+
+
+def get_dashboard_aggregate(aggregate_key: str, legislatura_numero: str,
+                            refreshed_since: datetime = None) -> Optional[dict]:
+    """
+    Read a precomputed dashboard payload.
+
+    Args:
+        aggregate_key: One of the AGGREGATE_* keys
+        legislatura_numero: Legislature designation (e.g., 'XVII')
+        refreshed_since: Optional oldest acceptable refresh time
+
+    Returns:
+        The stored payload, or None if it has not been computed yet (or before refreshed_since)
+    """
+    try:
+        with DatabaseSession() as session:
+            row = session.query(DashboardAggregate.payload, DashboardAggregate.refreshed_at).filter(
+                DashboardAggregate.aggregate_key == aggregate_key,
+                DashboardAggregate.legislatura_numero == legislatura_numero
+            ).first()
+    except Exception as e:
+        # Table may not exist yet (migration not applied) - use live queries
+        logger.debug(f"Dashboard aggregate {aggregate_key}/{legislatura_numero} unavailable: {e}")
+        return None
+
+    if row is None or not row.payload:
+        return None
+    if refreshed_since is not None and (row.refreshed_at is None or row.refreshed_at < refreshed_since):
+        return None
+    return json.loads(row.payload)
+
+
+def get_daily_dashboard_aggregate(aggregate_key: str, legislatura_numero: str, compute) -> dict:
+    """
+    Payload of a dashboard whose windows are relative to today.
+
+    The stored aggregate is served only when it was computed today. Otherwise
+    the payload is computed with compute(session) and stored, so later
+    requests of the day read it. No connection is checked out on a hit
+    beyond the aggregate read.
+    """
+    today = datetime.combine(date.today(), datetime.min.time())
+    payload = get_dashboard_aggregate(aggregate_key, legislatura_numero, refreshed_since=today)
+    if payload is not None:
+        return payload
+
+    started = time.perf_counter()
+    with DatabaseSession() as session:
+        payload = compute(session)
+        if payload is not None:
+            try:
+                store_dashboard_aggregate(
+                    session, aggregate_key, legislatura_numero, payload,
+                    duration_seconds=time.perf_counter() - started
+                )
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.debug(f"Could not store dashboard aggregate {aggregate_key}/{legislatura_numero}: {e}")
+    return payload
+
+
+def store_dashboard_aggregate(session, aggregate_key: str, legislatura_numero: str,
+                              payload: dict, duration_seconds: float = None):
+    """Insert or replace a dashboard payload (caller commits)"""
+    stmt = pg_insert(DashboardAggregate).values(
+        id=uuid.uuid4(),
+        aggregate_key=aggregate_key,
+        legislatura_numero=legislatura_numero,
+        payload=json.dumps(payload, default=json_default),
+        refresh_duration_seconds=duration_seconds,
+        refreshed_at=datetime.now(),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['aggregate_key', 'legislatura_numero'],  # uq_dashboard_aggregate_key_legislatura
+        set_={
+            'payload': stmt.excluded.payload,
+            'refresh_duration_seconds': stmt.excluded.refresh_duration_seconds,
+            'refreshed_at': stmt.excluded.refreshed_at,
+        }
+    )
+    session.execute(stmt)
+
+
+def _refresh_one(aggregate_key: str, legislatura_numero: str, compute) -> bool:
+    """Compute and store a single aggregate in its own session"""
+    started = time.perf_counter()
+    try:
+        with DatabaseSession() as session:
+            payload = compute(session)
+            if payload is None:
+                return False
+            store_dashboard_aggregate(
+                session, aggregate_key, legislatura_numero, payload,
+                duration_seconds=time.perf_counter() - started
+            )
+            session.commit()
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to refresh dashboard aggregate {aggregate_key}/{legislatura_numero}: {e}")
+        return False
+
+
+def refresh_dashboard_aggregates(legislaturas: Iterable[str] = None) -> Dict[str, int]:
+    """
+    Recompute dashboard aggregates.
+
+    The reference data version is bumped first, so the aggregates and every
+    API worker see the legislatures and parties of the import.
+
+    Statistics are computed for every legislature (or only the given ones) so
+    historical pages are served from the summary table too. Transparency
+    dashboards only cover the current legislature.
+
+    Args:
+        legislaturas: Optional legislature designations to refresh
+
+    Returns:
+        Dictionary with 'refreshed' and 'failed' counts
+    """
+    # Route modules are imported lazily - they are heavy and only needed here
+    from app.routes.parlamento import compute_estatisticas
+    from app.routes.transparency import (
+        get_current_legislature,
+        compute_deputy_performance,
+        compute_accountability_metrics,
+        compute_citizen_participation,
+    )
+
+    started = time.perf_counter()
+    stats = {'refreshed': 0, 'failed': 0}
+
+    bump_reference_data_version()
+
+    def record(success: bool):
+        stats['refreshed' if success else 'failed'] += 1
+
+    if legislaturas is None:
+        with DatabaseSession() as session:
+            legislaturas = [numero for (numero,) in session.query(Legislatura.numero).all()]
+
+    for numero in legislaturas:
+        record(_refresh_one(
+            AGGREGATE_ESTATISTICAS, numero,
+            lambda session, numero=numero: compute_estatisticas(session, numero)
+        ))
+
+    current_leg = get_current_legislature()
+    if current_leg is not None:
+        transparency_aggregates = [
+            (AGGREGATE_DEPUTY_PERFORMANCE, compute_deputy_performance),
+            (AGGREGATE_ACCOUNTABILITY_METRICS, compute_accountability_metrics),
+            (AGGREGATE_CITIZEN_PARTICIPATION, compute_citizen_participation),
+        ]
+        for aggregate_key, compute in transparency_aggregates:
+            record(_refresh_one(
+                aggregate_key, current_leg.numero,
+                lambda session, compute=compute: compute(session, current_leg)
+            ))
+
+    logger.info(
+        f"Dashboard aggregates refreshed: {stats['refreshed']} ok, {stats['failed']} failed "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+    return stats
@@ -0,0 +1,73 @@
+"""
+HTML Text Sanitizer
+===================
+
+Converts the HTML-encoded rich text of agenda events (Subtitle,
+InternetText) into plain text with line breaks.
+
+The text is often encoded twice or three times (&amp;lt;br&amp;gt;), carries
+embedded <style>/<script>/<head> blocks and inline CSS. Sanitizing it
+takes several unescape and regex passes, so the agenda mapper does it once
+at import time and stores the result next to the raw HTML
+(subtitulo_texto, descricao_texto); the agenda endpoints read the stored
+text. rebuild_agenda_text.py backfills rows imported before that.
+
+Usage:
+    from app.utils.html_text import clean_html_content
+
+    clean_html_content('Audição&amp;lt;br /&amp;gt;Sala 2')   # 'Audição\\nSala 2'
+"""
+
+import html
+import re
+from typing import Optional
+
+# Maximum unescape passes for multiply-encoded entities
+MAX_UNESCAPE_PASSES = 5
+
+# Blocks removed with their content, in this order
+_BLOCK_RES = tuple(
+    re.compile(rf'<{tag}[^>]*>.*?</{tag}>', re.IGNORECASE | re.DOTALL)
+    for tag in ('style', 'script', 'head')
+)
+_LINE_BREAK_RE = re.compile(r'<br\s*/?>|</p>|</li>', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_NBSP_RE = re.compile(r'&nbsp;?', re.IGNORECASE)
+_CSS_RE = re.compile(r'\{[^}]*\}')
+_SPACES_RE = re.compile(r'[ \t]+')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n+')
+_LEADING_SPACES_RE = re.compile(r'^\s+', re.MULTILINE)
+
+
+def clean_html_content(content: Optional[str]) -> Optional[str]:
+    """
+    Plain text of HTML content, with <br>, </p> and </li> as line breaks.
+
+    Decodes double/triple-encoded entities (&amp;lt; -> &lt; -> <) and drops
+    <style>, <script> and <head> blocks with their content.
+    """
+    if not content:
+        return content
+
+    # Decode HTML entities until stable to handle double/triple encoding
+    decoded = content
+    for _ in range(MAX_UNESCAPE_PASSES):
+        unescaped = html.unescape(decoded)
+        if unescaped == decoded:
+            break
+        decoded = unescaped
+
+    for block_re in _BLOCK_RES:
+        decoded = block_re.sub('', decoded)
+    with_breaks = _LINE_BREAK_RE.sub('\n', decoded)
+    clean_text = _TAG_RE.sub('', with_breaks)
+
+    # &nbsp; left over (or decoded) and CSS-like content that leaked through
+    clean_text = _NBSP_RE.sub(' ', clean_text.replace('\xa0', ' '))
+    clean_text = _CSS_RE.sub('', clean_text)
+
+    # Normalize horizontal whitespace and blank lines, drop leading spaces per line
+    clean_text = _SPACES_RE.sub(' ', clean_text)
+    clean_text = _BLANK_LINES_RE.sub('\n\n', clean_text)
+    clean_text = _LEADING_SPACES_RE.sub('', clean_text)
+    return clean_text.strip()
@@ -0,0 +1,234 @@
+"""
+JSON Response Pipeline
+======================
+
+Fast, compressed and field-selectable JSON responses for list endpoints.
+
+List endpoints such as /deputados or /votacoes return hundreds of nested
+records. This module replaces ``jsonify`` for those endpoints with:
+
+- A fast encoder: orjson when installed, stdlib json otherwise. Both produce
+  the same values as Flask's default provider (dates as HTTP dates, Decimal
+  and UUID as strings, sorted keys).
+- Content negotiation: brotli (when the ``brotli`` module is installed) or
+  gzip, chosen from the Accept-Encoding header for payloads large enough to
+  benefit.
+- Sparse fieldsets: ``?fields=nome,partido_sigla,career_info.total_mandates``
+  selects which keys of each list item are returned. Route serializers check
+  the selection before running the queries behind optional fields, so
+  pruning saves work and not just bytes. The ``id`` key is always kept.
+
+Usage:
+    from app.utils.json_response import json_response, parse_fields, wants
+
+    fields = parse_fields(request.args.get('fields'))
+    items = [serialize(row, fields) for row in rows]
+    return json_response({'items': items})
+"""
+
+import decimal
+import gzip
+import json
+import re
+import uuid
+from datetime import date
+from typing import Dict, Iterable, Optional
+
+from flask import Response, request
+from werkzeug.http import http_date
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on environment
+    brotli = None
+
+# Responses smaller than this are sent uncompressed (headers dominate)
+MIN_COMPRESS_BYTES = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# Keys always returned regardless of the requested fieldset
+ALWAYS_INCLUDED_FIELDS = frozenset({'id'})
+
+FIELD_PATH_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*$')
+MAX_FIELDS = 50
+
+
+def json_default(value):
+    """Serialize values the same way Flask's default JSON provider does"""
+    if isinstance(value, date):
+        return http_date(value)
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(payload) -> bytes:
+    """Encode a payload to compact UTF-8 JSON with sorted keys"""
+    if orjson is not None:
+        return orjson.dumps(
+            payload,
+            default=json_default,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+    return json.dumps(
+        payload, default=json_default, sort_keys=True,
+        ensure_ascii=False, separators=(',', ':')
+    ).encode('utf-8')
+
+
+class FieldSelector:
+    """
+    Parsed sparse fieldset.
+
+    Holds a tree of requested field paths; a node with no children selects the
+    whole value at that key.
+    """
+
+    def __init__(self, paths: Iterable[str]):
+        self.tree: Dict[str, dict] = {}
+        for path in paths:
+            node = self.tree
+            parts = path.split('.')
+            for i, part in enumerate(parts):
+                if part in node and not node[part]:
+                    break  # Whole value already selected
+                if i == len(parts) - 1:
+                    node[part] = {}
+                else:
+                    node = node.setdefault(part, {})
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.tree or name in ALWAYS_INCLUDED_FIELDS
+
+    def child(self, name: str) -> Optional['FieldSelector']:
+        """Selector for a nested object, or None if the whole value is selected"""
+        subtree = self.tree.get(name)
+        if not subtree:
+            return None
+        selector = FieldSelector(())
+        selector.tree = subtree
+        return selector
+
+    def apply(self, item: dict) -> dict:
+        """Return a copy of item containing only the selected keys"""
+        result = {}
+        for key, value in item.items():
+            if key not in self:
+                continue
+            nested = self.child(key)
+            if nested is not None and isinstance(value, dict):
+                value = nested.apply(value)
+            elif nested is not None and isinstance(value, list):
+                value = [nested.apply(v) if isinstance(v, dict) else v for v in value]
+            result[key] = value
+        return result
+
+
+def parse_fields(raw: Optional[str]) -> Optional[FieldSelector]:
+    """
+    Parse a ``fields`` query parameter.
+
+    Args:
+        raw: Comma-separated field paths (dotted for nested keys), or None
+
+    Returns:
+        FieldSelector, or None when all fields are requested
+
+    Raises:
+        ValueError: If a field path is malformed or too many are given
+    """
+    if not raw:
+        return None
+    paths = [path.strip() for path in raw.split(',') if path.strip()]
+    if not paths:
+        return None
+    if len(paths) > MAX_FIELDS:
+        raise ValueError(f'Too many fields requested (max {MAX_FIELDS})')
+    for path in paths:
+        if not FIELD_PATH_PATTERN.match(path):
+            raise ValueError(f'Invalid field name: {path}')
+    return FieldSelector(paths)
+
+
+def wants(fields: Optional[FieldSelector], *names: str) -> bool:
+    """True if any of the given top-level fields is selected (or no selection was made)"""
+    return fields is None or any(name in fields for name in names)
+
+
+def select_fields(item: dict, fields: Optional[FieldSelector]) -> dict:
+    """Apply a field selection to a serialized item"""
+    return item if fields is None else fields.apply(item)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Choose a content coding from an Accept-Encoding header.
+
+    Returns:
+        'br', 'gzip' or None (identity)
+    """
+    if not accept_encoding:
+        return None
+
+    accepted = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding] = quality
+
+    def acceptable(coding):
+        return accepted.get(coding, accepted.get('*', 0.0)) > 0
+
+    if brotli is not None and acceptable('br'):
+        return 'br'
+    if acceptable('gzip'):
+        return 'gzip'
+    return None
+
+
+def compress(body: bytes, encoding: Optional[str]) -> bytes:
+    """Compress a body with the given content coding"""
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    return body
+
+
+def json_response(payload, status: int = 200) -> Response:
+    """
+    Build a JSON response, compressed when the client accepts it.
+
+    Args:
+        payload: JSON-serializable object
+        status: HTTP status code
+
+    Returns:
+        Flask Response
+    """
+    body = dumps(payload)
+    response = Response(status=status, mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+
+    encoding = None
+    if len(body) >= MIN_COMPRESS_BYTES:
+        encoding = negotiate_encoding(request.headers.get('Accept-Encoding'))
+    if encoding:
+        body = compress(body, encoding)
+        response.headers['Content-Encoding'] = encoding
+
+    response.set_data(body)
+    return response
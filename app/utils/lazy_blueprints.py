@@ -0,0 +1,100 @@
+"""
+Lazy Blueprints
+===============
+
+Startup-optimized blueprint registration for the API.
+
+Importing the route modules pulls in database/models.py (200+ mapped
+classes) and several thousand lines of route code, and the first query then
+configures all mappers. In the default (eager) mode every worker pays for
+this before it can even import the app. With API_LAZY_BLUEPRINTS=1 the app
+only records which blueprints to register:
+
+- a background thread starts importing the route modules and configuring
+  the mappers as soon as the app is created
+- a WSGI wrapper registers the blueprints just before the first request is
+  dispatched (waiting for the background import if it is still running)
+
+Flask does not allow registering blueprints once a request was handled, so
+all blueprints are registered together on the first request.
+
+Usage:
+    from app.utils.lazy_blueprints import LazyBlueprints
+
+    blueprints = LazyBlueprints(app, [('app.routes.agenda', 'agenda_bp')], url_prefix='/api')
+    blueprints.preload_in_background()
+"""
+
+import importlib
+import logging
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def configure_models() -> None:
+    """Import the models and configure all mappers (otherwise done by the first query)"""
+    from sqlalchemy.orm import configure_mappers
+    import database.models  # noqa: F401
+
+    configure_mappers()
+
+
+class LazyBlueprints:
+    """WSGI wrapper registering blueprints right before the first request"""
+
+    def __init__(self, app, blueprints: Iterable[Tuple[str, str]], url_prefix: str = None):
+        """
+        Args:
+            app: Flask app; its wsgi_app is wrapped
+            blueprints: (module name, blueprint attribute) pairs, in registration order
+            url_prefix: URL prefix of every blueprint
+        """
+        self.app = app
+        self.blueprints: List[Tuple[str, str]] = list(blueprints)
+        self.url_prefix = url_prefix
+        self.loaded = False
+        self.load_seconds: Optional[float] = None
+        self._lock = threading.Lock()
+        self._wsgi_app = app.wsgi_app
+        app.wsgi_app = self
+
+    def _import_modules(self) -> list:
+        return [getattr(importlib.import_module(module), attr) for module, attr in self.blueprints]
+
+    def preload_in_background(self) -> threading.Thread:
+        """Import the route modules and configure the mappers in a daemon thread"""
+        def preload():
+            started = time.perf_counter()
+            try:
+                self._import_modules()
+                configure_models()
+                logger.info(f"Preloaded {len(self.blueprints)} blueprints in {time.perf_counter() - started:.2f}s")
+            except Exception as e:
+                # load() imports again on the first request and surfaces the error there
+                logger.warning(f"Blueprint preload failed: {e}")
+
+        thread = threading.Thread(target=preload, name='blueprint-preload', daemon=True)
+        thread.start()
+        return thread
+
+    def load(self) -> None:
+        """Import (if needed) and register the blueprints; idempotent"""
+        if self.loaded:
+            return
+        with self._lock:
+            if self.loaded:
+                return
+            started = time.perf_counter()
+            for blueprint in self._import_modules():
+                self.app.register_blueprint(blueprint, url_prefix=self.url_prefix)
+            self.load_seconds = time.perf_counter() - started
+            self.loaded = True
+            logger.info(f"Registered {len(self.blueprints)} blueprints in {self.load_seconds:.2f}s")
+
+    def __call__(self, environ, start_response):
+        if not self.loaded:
+            self.load()
+        return self._wsgi_app(environ, start_response)
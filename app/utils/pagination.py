@@ -0,0 +1,198 @@
+"""
+Cursor Pagination
+=================
+
+Opaque cursors and keyset pagination for list endpoints.
+
+A cursor is URL-safe base64 of a small JSON object describing where the next
+page starts. Clients must treat it as an opaque token: pass ``next_cursor``
+from one response as ``?cursor=`` on the next request.
+
+Keyset pagination orders rows by (sort column DESC NULLS LAST, id DESC) -
+typically a date and the row UUID - and continues after the last key seen
+instead of using OFFSET, so every page costs the same as the first one when
+a matching composite index exists (see the ``*_keyset`` indexes in
+database/models.py).
+
+Usage:
+    from app.utils.pagination import keyset_page
+
+    page = keyset_page(query, Votacao.data_votacao, Votacao.id,
+                       request.args.get('cursor'), limit)
+    items = [serialize(row) for row in page.items]
+    return {'items': items, 'next_cursor': page.next_cursor}
+"""
+
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, List, Optional
+
+from sqlalchemy import and_, or_, tuple_
+
+# Cursors are short; reject anything suspiciously large before decoding
+MAX_CURSOR_LENGTH = 512
+
+
+def encode_cursor(state: dict) -> str:
+    """Encode pagination state into an opaque cursor string"""
+    raw = json.dumps(state, separators=(',', ':'), sort_keys=True).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode('ascii')
+
+
+def decode_cursor(cursor: Optional[str]) -> dict:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string, or None/empty for the first page
+
+    Returns:
+        Pagination state dictionary ({} for the first page)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return {}
+    if len(cursor) > MAX_CURSOR_LENGTH:
+        raise ValueError('Invalid cursor')
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError('Invalid cursor')
+    if not isinstance(state, dict):
+        raise ValueError('Invalid cursor')
+    return state
+
+
+@dataclass
+class KeysetPage:
+    """One page of keyset-paginated rows"""
+    items: List[Any]
+    next_cursor: Optional[str]
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def _encode_key_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _decode_key_value(value, sort_column):
+    """Convert a cursor key back to the sort column's Python type"""
+    if value is None:
+        return None
+    python_type = sort_column.type.python_type
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is date:
+            return date.fromisoformat(value)
+        if python_type is int and isinstance(value, int) and not isinstance(value, bool):
+            return value
+        if python_type is str and isinstance(value, str):
+            return value
+    except (TypeError, ValueError):
+        pass
+    raise ValueError('Invalid cursor')
+
+
+def keyset_cursor(sort_value, row_id) -> str:
+    """Cursor pointing just after the row with the given key"""
+    return encode_cursor({'k': _encode_key_value(sort_value), 'i': str(row_id)})
+
+
+def keyset_sort_key(sort_value, row_id):
+    """
+    Python sort key matching the SQL keyset order when used with reverse=True.
+
+    Used to merge pages from several tables sharing the same key domain.
+    """
+    return (sort_value is not None, sort_value, row_id)
+
+
+def decode_keyset_cursor(cursor: Optional[str], sort_column):
+    """
+    Decode a keyset cursor.
+
+    Returns:
+        (sort_value, row_id) tuple, or None for the first page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    state = decode_cursor(cursor)
+    if not state:
+        return None
+    if 'i' not in state or 'k' not in state:
+        raise ValueError('Invalid cursor')
+    try:
+        row_id = uuid.UUID(state['i'])
+    except (AttributeError, TypeError, ValueError):
+        raise ValueError('Invalid cursor')
+    return _decode_key_value(state['k'], sort_column), row_id
+
+
+def apply_keyset(query, sort_column, id_column, after=None):
+    """
+    Order a query by the keyset and continue after a decoded cursor key.
+
+    Rows with a NULL sort value come last, ordered by id.
+
+    Args:
+        query: SQLAlchemy query
+        sort_column: Column to sort by (typically a date)
+        id_column: Unique tie-breaker column (the row UUID)
+        after: (sort_value, row_id) from decode_keyset_cursor, or None
+
+    Returns:
+        Ordered (and filtered) query
+    """
+    if after is not None:
+        sort_value, row_id = after
+        if sort_value is None:
+            query = query.filter(and_(sort_column.is_(None), id_column < row_id))
+        else:
+            query = query.filter(or_(
+                tuple_(sort_column, id_column) < tuple_(sort_value, row_id),
+                sort_column.is_(None)
+            ))
+    return query.order_by(sort_column.desc().nulls_last(), id_column.desc())
+
+
+def keyset_page(query, sort_column, id_column, cursor: Optional[str], limit: int) -> KeysetPage:
+    """
+    Fetch one page of a query using keyset pagination.
+
+    Args:
+        query: SQLAlchemy query returning entities (or rows) that expose the
+               sort and id columns as attributes
+        sort_column: Column to sort by (typically a date)
+        id_column: Unique tie-breaker column (the row UUID)
+        cursor: Cursor from a previous page, or None for the first page
+        limit: Page size
+
+    Returns:
+        KeysetPage with the rows and the cursor for the next page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    after = decode_keyset_cursor(cursor, sort_column)
+    rows = apply_keyset(query, sort_column, id_column, after).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = keyset_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+    return KeysetPage(items=rows, next_cursor=next_cursor)
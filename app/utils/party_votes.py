@@ -0,0 +1,65 @@
+"""
+Party Vote Queries
+==================
+
+Set-based queries behind /partidos/<sigla>/voting-analytics.
+
+A party's parliamentary-activity votes are the votes of activities in which
+any deputy who ever held a mandate for the party took part. They used to be
+collected with one join query per deputy and de-duplicated in Python; they
+are now one EXISTS over intervencao_deputados (served by
+idx_intervencao_deputados_cadastro) aggregated server-side.
+
+Usage:
+    from app.utils.party_votes import party_deputies, party_activity_vote_counts
+
+    deputados = party_deputies(session, 'PS')
+    counts = party_activity_vote_counts(session, [d.id_cadastro for d in deputados], since)
+"""
+
+from datetime import date
+from typing import Dict, Iterable, List
+
+from sqlalchemy import exists, func, select
+
+from database.models import AtividadeParlamentarVotacao, Deputado, DeputadoMandatoLegislativo, IntervencaoDeputado
+
+
+def party_mandate_criterion(session, sigla: str):
+    """Mandates of the party: exact sigla, or sigla substring (coalitions) when none match exactly"""
+    exact = DeputadoMandatoLegislativo.par_sigla == sigla
+    if session.query(exists().where(exact)).scalar():
+        return exact
+    return DeputadoMandatoLegislativo.par_sigla.like(f'%{sigla}%')
+
+
+def party_deputies(session, sigla: str) -> List[Deputado]:
+    """Every deputados row with a mandate for the party (historical analysis)"""
+    deputado_ids = select(DeputadoMandatoLegislativo.deputado_id).where(party_mandate_criterion(session, sigla))
+    return session.query(Deputado).filter(Deputado.id.in_(deputado_ids)).all()
+
+
+def party_activity_votes_clause(id_cadastros: Iterable[int]):
+    """EXISTS: a deputy among id_cadastros took part in the vote's activity"""
+    return exists().where(
+        IntervencaoDeputado.intervencao_id == AtividadeParlamentarVotacao.atividade_id,
+        IntervencaoDeputado.id_cadastro.in_(list(id_cadastros)),
+    )
+
+
+def party_activity_vote_counts(session, id_cadastros: Iterable[int], since: date) -> Dict[str, int]:
+    """
+    Distinct activity votes of the deputies, counted in one query.
+
+    Returns:
+        Dictionary with 'total', 'unanimes' and 'recentes' (data >= since)
+    """
+    id_cadastros = [id_cadastro for id_cadastro in id_cadastros if id_cadastro is not None]
+    if not id_cadastros:
+        return {'total': 0, 'unanimes': 0, 'recentes': 0}
+    total, unanimes, recentes = session.query(
+        func.count(AtividadeParlamentarVotacao.id),
+        func.count(AtividadeParlamentarVotacao.id).filter(AtividadeParlamentarVotacao.unanime.is_(True)),
+        func.count(AtividadeParlamentarVotacao.id).filter(AtividadeParlamentarVotacao.data >= since),
+    ).filter(party_activity_votes_clause(id_cadastros)).one()
+    return {'total': total, 'unanimes': unanimes, 'recentes': recentes}
@@ -5,15 +5,15 @@ Supports both PostgreSQL (production) and SQLite (development) with Lambda-compa
 
 import os
 import json
-import boto3
 import logging
 from urllib.parse import quote_plus
 import os
 import threading
+import time
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import DisconnectionError
-from sqlalchemy.pool import Pool
+from sqlalchemy.pool import Pool, QueuePool
 from typing import Optional
 from dotenv import load_dotenv
 
@@ -38,10 +38,94 @@ PG_SSLMODE = os.getenv('PG_SSLMODE', 'require')  # 'require' for production, 'di
 # AWS Secrets Manager for production
 DATABASE_SECRET_ARN = os.getenv('DATABASE_SECRET_ARN', '')
 
+# Resolved Secrets Manager credentials are reused for this many seconds
+CREDENTIALS_CACHE_TTL = int(os.getenv('DB_CREDENTIALS_CACHE_TTL', '3600'))
+# Optional file (mode 0600) sharing resolved credentials between processes on the same host.
+# Credentials are never written to the process environment: it is inherited by every
+# subprocess and readable in /proc/<pid>/environ and environment dumps.
+CREDENTIALS_CACHE_FILE = os.getenv('DB_CREDENTIALS_CACHE_FILE', '')
+
+# Connections opened in the background at app start (see prewarm_pool)
+POOL_PREWARM_CONNECTIONS = int(os.getenv('DB_POOL_PREWARM', '0'))
+
+_credentials_cache: Optional[dict] = None
+_credentials_lock = threading.Lock()
+
+
+def _read_cached_credentials() -> Optional[dict]:
+    """First unexpired cache entry for the current secret: process, then file"""
+    entries = [_credentials_cache]
+    if CREDENTIALS_CACHE_FILE and os.path.exists(CREDENTIALS_CACHE_FILE):
+        try:
+            with open(CREDENTIALS_CACHE_FILE) as f:
+                entries.append(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable credentials cache {CREDENTIALS_CACHE_FILE}: {e}")
+
+    now = time.time()
+    for entry in entries:
+        if entry and entry.get('secret_arn') == DATABASE_SECRET_ARN and entry.get('expires_at', 0) > now:
+            return entry
+    return None
+
+
+def _store_cached_credentials(credentials: dict) -> dict:
+    """Build the cache entry and (if configured) write it to the cache file"""
+    entry = {
+        'secret_arn': DATABASE_SECRET_ARN,
+        'expires_at': time.time() + CREDENTIALS_CACHE_TTL,
+        'credentials': credentials,
+    }
+    if CREDENTIALS_CACHE_FILE:
+        try:
+            tmp_path = f"{CREDENTIALS_CACHE_FILE}.{os.getpid()}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, CREDENTIALS_CACHE_FILE)
+        except OSError as e:
+            logger.warning(f"Could not write credentials cache {CREDENTIALS_CACHE_FILE}: {e}")
+    return entry
+
+
+def clear_credentials_cache() -> None:
+    """Forget cached credentials (e.g. after a secret rotation)"""
+    global _credentials_cache
+    with _credentials_lock:
+        _credentials_cache = None
+        if CREDENTIALS_CACHE_FILE and os.path.exists(CREDENTIALS_CACHE_FILE):
+            try:
+                os.remove(CREDENTIALS_CACHE_FILE)
+            except OSError:
+                pass
+
 
 def get_database_credentials():
-    """Get database credentials from AWS Secrets Manager if running in Lambda."""
+    """
+    Get database credentials from AWS Secrets Manager.
+
+    Credentials are resolved once and cached for CREDENTIALS_CACHE_TTL
+    seconds in a module-level variable (guarded by a lock) and optionally
+    in CREDENTIALS_CACHE_FILE, so cold starts and import worker processes
+    do not each pay for a Secrets Manager round trip.
+    """
+    global _credentials_cache
+    if not DATABASE_SECRET_ARN:
+        raise RuntimeError("DATABASE_SECRET_ARN is required but not set")
+
+    with _credentials_lock:
+        entry = _read_cached_credentials()
+        if entry is None:
+            entry = _store_cached_credentials(_fetch_database_credentials())
+        _credentials_cache = entry
+        return entry['credentials']
+
+
+def _fetch_database_credentials():
+    """Fetch database credentials from AWS Secrets Manager (boto3 is imported only here)."""
     if DATABASE_SECRET_ARN:
+        import boto3
+
         try:
             # Get AWS region from environment or default to eu-west-1
             region = os.getenv('AWS_DEFAULT_REGION', os.getenv('AWS_REGION', 'eu-west-1'))
@@ -184,6 +268,35 @@ def get_database_url() -> str:
     )
 
 
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool that records how long checkouts wait for a connection.
+
+    The wait includes blocking on a full pool and opening new connections,
+    which is what callers experience; reported by get_pool_status().
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._wait_lock = threading.Lock()
+        self.checkout_count = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+        self.checkout_wait_last = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - started
+            with self._wait_lock:
+                self.checkout_count += 1
+                self.checkout_wait_total += waited
+                self.checkout_wait_max = max(self.checkout_wait_max, waited)
+                self.checkout_wait_last = waited
+
+
 def create_database_engine(echo: bool = False):
     """Create and return a PostgreSQL database engine with connection pooling."""
     url = get_database_url()
@@ -192,6 +305,7 @@ def create_database_engine(echo: bool = False):
     # Supports concurrent downloads (5) + parallel imports (8) + overhead
     engine_kwargs = {
         'echo': echo,
+        'poolclass': TimedQueuePool,  # Checkout wait times for /health
         'pool_pre_ping': True,  # Verify connections before use
         'pool_size': 8,  # Increased for parallel processing
         'max_overflow': 12,  # Allow overflow connections (20 total)
@@ -211,6 +325,7 @@ def create_database_engine(echo: bool = False):
 # Global engine and session factory
 _engine: Optional[object] = None
 _SessionLocal: Optional[sessionmaker] = None
+_engine_lock = threading.Lock()
 
 
 def _validate_connection_on_checkout(dbapi_conn, connection_record, connection_proxy):
@@ -260,16 +375,88 @@ def get_engine():
     """Get the global database engine, creating it if necessary."""
     global _engine
     if _engine is None:
-        _engine = create_database_engine()
-        # Register connection pool event listeners for diagnostics
-        event.listen(_engine, "checkout", _validate_connection_on_checkout)
-        event.listen(_engine, "checkin", _on_connection_checkin)
-        event.listen(_engine, "invalidate", _on_connection_invalidate)
-        pid = os.getpid()
-        logger.info(f"[POOL] Registered connection pool event listeners (pid={pid})")
+        # The pool pre-warm thread and the first request may race to create it
+        with _engine_lock:
+            if _engine is None:
+                engine = create_database_engine()
+                # Register connection pool event listeners for diagnostics
+                event.listen(engine, "checkout", _validate_connection_on_checkout)
+                event.listen(engine, "checkin", _on_connection_checkin)
+                event.listen(engine, "invalidate", _on_connection_invalidate)
+                pid = os.getpid()
+                logger.info(f"[POOL] Registered connection pool event listeners (pid={pid})")
+                _engine = engine
     return _engine
 
 
+def prewarm_pool(connections: int = None) -> Optional[threading.Thread]:
+    """
+    Open pool connections in a background thread.
+
+    Resolves credentials, creates the engine and opens `connections`
+    connections (default DB_POOL_PREWARM) that are returned to the pool, so
+    the first requests after a cold start do not pay for them. Failures are
+    only logged; requests will retry normally.
+
+    Returns:
+        The started thread, or None when pre-warming is disabled
+    """
+    if connections is None:
+        connections = POOL_PREWARM_CONNECTIONS
+    if connections <= 0:
+        return None
+
+    def warm():
+        started = time.perf_counter()
+        try:
+            engine = get_engine()
+            opened = [engine.connect() for _ in range(min(connections, engine.pool.size()))]
+            for conn in opened:
+                conn.close()
+            logger.info(f"[POOL] Pre-warmed {len(opened)} connections in {time.perf_counter() - started:.2f}s")
+        except Exception as e:
+            logger.warning(f"[POOL] Pool pre-warm failed: {e}")
+
+    thread = threading.Thread(target=warm, name='db-pool-prewarm', daemon=True)
+    thread.start()
+    return thread
+
+
+def get_pool_status() -> Optional[dict]:
+    """
+    Occupancy and checkout wait times of the global engine's pool.
+
+    Returns None if the engine has not been created yet (no connection is
+    opened to answer).
+    """
+    if _engine is None:
+        return None
+    pool = _engine.pool
+    if not isinstance(pool, QueuePool):
+        return {'class': type(pool).__name__}
+
+    capacity = pool.size() + pool._max_overflow
+    checked_out = pool.checkedout()
+    status = {
+        'size': pool.size(),
+        'checked_in': pool.checkedin(),
+        'checked_out': checked_out,
+        'overflow': max(pool.overflow(), 0),
+        'max_overflow': pool._max_overflow,
+        'occupancy': round(checked_out / capacity, 3) if capacity > 0 else None,
+    }
+    if isinstance(pool, TimedQueuePool):
+        with pool._wait_lock:
+            count = pool.checkout_count
+            status['checkout_wait_ms'] = {
+                'count': count,
+                'avg': round(pool.checkout_wait_total / count * 1000, 2) if count else 0.0,
+                'max': round(pool.checkout_wait_max * 1000, 2),
+                'last': round(pool.checkout_wait_last * 1000, 2),
+            }
+    return status
+
+
 def get_session_factory():
     """Get the global session factory, creating it if necessary."""
     global _SessionLocal
@@ -309,7 +496,7 @@ class DatabaseSession:
 
 def get_database_info() -> dict:
     """Get information about the current database configuration."""
-    credentials = get_database_credentials()
+    credentials = get_database_credentials() if DATABASE_SECRET_ARN else None
     if credentials:
         return {
             'type': 'postgresql',
@@ -0,0 +1,194 @@
+"""
+Legislature Registry
+====================
+
+Process-wide cache of the legislaturas table.
+
+Current-legislature logic used to be spread over the code as string matches
+(leg_des == 'XVII', Legislatura.numero == 'XVII', LIKE '%XVII%') and a
+get_current_legislature() query per request. The registry loads the handful
+of legislature rows once and resolves them by numero (including the
+designations found in mandate data: 'IA', 'IB', 'Cons', ...), by ordinal,
+by id and by date, and knows which one is current.
+
+It is reloaded after LEGISLATURE_REGISTRY_TTL seconds and dropped by
+invalidate_legislature_registry(), which the importer calls when it creates
+legislatures.
+
+Usage:
+    from database.legislature_registry import get_legislature_registry
+
+    current = get_legislature_registry().current
+    query.filter(DeputadoMandatoLegislativo.legislatura_id == current.id)
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds before the registry is reloaded from the database
+LEGISLATURE_REGISTRY_TTL = float(os.getenv('LEGISLATURE_REGISTRY_TTL', '300'))
+
+# Ordinal of each legislature designation (the Constituent Assembly is 0)
+LEGISLATURE_ORDINALS = {
+    'CONSTITUINTE': 0, 'I': 1, 'II': 2, 'III': 3, 'IV': 4, 'V': 5, 'VI': 6, 'VII': 7, 'VIII': 8,
+    'IX': 9, 'X': 10, 'XI': 11, 'XII': 12, 'XIII': 13, 'XIV': 14, 'XV': 15, 'XVI': 16, 'XVII': 17,
+    'XVIII': 18, 'XIX': 19, 'XX': 20,
+}
+
+# Designations used in source data for the canonical numero
+LEGISLATURE_ALIASES = {
+    'CONSTITUENTE': 'CONSTITUINTE', 'CONS': 'CONSTITUINTE', 'CONST': 'CONSTITUINTE',
+    'IA': 'I', 'IB': 'I',
+}
+
+
+def canonical_numero(designation: Optional[str]) -> Optional[str]:
+    """Canonical legislature numero of a designation ('ib ' -> 'I', 'Cons' -> 'CONSTITUINTE')"""
+    if not designation:
+        return None
+    numero = designation.strip().upper()
+    return LEGISLATURE_ALIASES.get(numero, numero) or None
+
+
+def legislature_ordinal(designation: Optional[str]) -> Optional[int]:
+    """Ordinal of a legislature designation ('XVII' -> 17, 'IB' -> 1; None if unknown)"""
+    return LEGISLATURE_ORDINALS.get(canonical_numero(designation))
+
+
+@dataclass(frozen=True)
+class LegislatureInfo:
+    """Detached snapshot of a legislaturas row"""
+    id: object
+    numero: str
+    designacao: str
+    data_inicio: Optional[date] = None
+    data_fim: Optional[date] = None
+
+    @property
+    def ordinal(self) -> Optional[int]:
+        return legislature_ordinal(self.numero)
+
+    def contains(self, day: date) -> bool:
+        """Whether day falls within the legislature's dates (open-ended while data_fim is unset)"""
+        if self.data_inicio is None or day < self.data_inicio:
+            return False
+        return self.data_fim is None or day <= self.data_fim
+
+
+class LegislatureRegistry:
+    """Legislatures indexed by numero, id and ordinal"""
+
+    def __init__(self, legislatures: Iterable[LegislatureInfo]):
+        self.legislatures: List[LegislatureInfo] = sorted(
+            legislatures, key=lambda leg: (leg.ordinal is None, leg.ordinal or 0, leg.numero)
+        )
+        self._by_numero: Dict[str, LegislatureInfo] = {leg.numero: leg for leg in self.legislatures}
+        self._by_id: Dict[object, LegislatureInfo] = {leg.id: leg for leg in self.legislatures}
+        self._by_ordinal: Dict[int, LegislatureInfo] = {
+            leg.ordinal: leg for leg in self.legislatures if leg.ordinal is not None
+        }
+        self.current: Optional[LegislatureInfo] = self._resolve_current()
+
+    def _resolve_current(self) -> Optional[LegislatureInfo]:
+        """The latest legislature that has not ended (the latest one if all have an end date)"""
+        numbered = [leg for leg in self.legislatures if leg.ordinal is not None]
+        if not numbered:
+            return None
+        today = date.today()
+        running = [leg for leg in numbered if leg.data_fim is None or leg.data_fim >= today]
+        return (running or numbered)[-1]
+
+    def get(self, numero: Optional[str]) -> Optional[LegislatureInfo]:
+        """Legislature by numero or source designation"""
+        return self._by_numero.get(canonical_numero(numero))
+
+    def by_id(self, legislatura_id) -> Optional[LegislatureInfo]:
+        return self._by_id.get(legislatura_id)
+
+    def by_ordinal(self, ordinal: int) -> Optional[LegislatureInfo]:
+        return self._by_ordinal.get(ordinal)
+
+    def for_date(self, day: date) -> Optional[LegislatureInfo]:
+        """Legislature running on a date (the later one on a changeover day)"""
+        matches = [leg for leg in self.legislatures if leg.contains(day)]
+        return matches[-1] if matches else None
+
+    def id_of(self, numero: Optional[str]):
+        """Id of a legislature by numero or designation (None if unknown)"""
+        leg = self.get(numero)
+        return leg.id if leg else None
+
+    def is_current(self, numero: Optional[str]) -> bool:
+        return self.current is not None and canonical_numero(numero) == self.current.numero
+
+    def __len__(self) -> int:
+        return len(self.legislatures)
+
+
+def load_legislature_registry(session) -> LegislatureRegistry:
+    """Build a registry from the legislaturas table"""
+    from database.models import Legislatura
+
+    rows = session.query(
+        Legislatura.id, Legislatura.numero, Legislatura.designacao,
+        Legislatura.data_inicio, Legislatura.data_fim,
+    ).all()
+    return LegislatureRegistry(LegislatureInfo(*row) for row in rows)
+
+
+_registry: Optional[LegislatureRegistry] = None
+_registry_loaded_at = 0.0
+_registry_lock = threading.Lock()
+
+
+def get_legislature_registry(session=None) -> LegislatureRegistry:
+    """
+    The process-wide registry, loaded on first use and after the TTL.
+
+    Args:
+        session: Optional session to load with (a short-lived one is opened otherwise)
+    """
+    global _registry, _registry_loaded_at
+
+    registry = _registry
+    if registry is not None and time.monotonic() - _registry_loaded_at < LEGISLATURE_REGISTRY_TTL:
+        return registry
+
+    with _registry_lock:
+        if _registry is not None and time.monotonic() - _registry_loaded_at < LEGISLATURE_REGISTRY_TTL:
+            return _registry
+        if session is not None:
+            registry = load_legislature_registry(session)
+        else:
+            from database.connection import DatabaseSession
+            with DatabaseSession() as own_session:
+                registry = load_legislature_registry(own_session)
+        set_legislature_registry(registry)
+        logger.debug(f"Legislature registry loaded: {len(registry)} legislatures, "
+                     f"current {registry.current.numero if registry.current else None}")
+        return registry
+
+
+def set_legislature_registry(registry: LegislatureRegistry) -> None:
+    """Install a registry (e.g. one built from known rows)"""
+    global _registry, _registry_loaded_at
+    _registry = registry
+    _registry_loaded_at = time.monotonic()
+
+
+def invalidate_legislature_registry() -> None:
+    """Drop the cached registry; the next access reloads it"""
+    global _registry
+    _registry = None
+
+
+def get_current_legislature(session=None) -> Optional[LegislatureInfo]:
+    """The current legislature (None when no legislature is loaded)"""
+    return get_legislature_registry(session).current
@@ -0,0 +1,33 @@
+"""Add phase_profile to import_status
+
+Revision ID: a1b2c3d4e5f7
+Revises: f0a1b2c3d4e5
+Create Date: 2026-10-18
+
+Stores the per-phase profile (wall/CPU time, peak RSS, SQL statements and
+rows written) of each file's last import.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1b2c3d4e5f7'
+down_revision: Union[str, Sequence[str], None] = 'f0a1b2c3d4e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('import_status', sa.Column(
+        'phase_profile', sa.Text(), nullable=True,
+        comment='JSON per-phase profile of the last import (see import_profiler)',
+    ))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('import_status', 'phase_profile')
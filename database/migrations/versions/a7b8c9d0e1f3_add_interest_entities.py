@@ -0,0 +1,89 @@
+"""Add interest registry entity tables
+
+Revision ID: a7b8c9d0e1f3
+Revises: f6a7b8c9d0e2
+Create Date: 2026-10-18
+
+Organizations named in interest declarations resolved to shared entities
+(by NIPC or normalized name), the declaration item -> entity links and the
+deputy co-occurrence index. The tables are derived data: after upgrading,
+run scripts/data_processing/interest_entities.py to backfill them.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7b8c9d0e1f3'
+down_revision: Union[str, Sequence[str], None] = 'f6a7b8c9d0e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'interest_entities',
+        sa.Column('id', sa.Uuid(), nullable=False, comment='Deterministic: md5 of chave'),
+        sa.Column('chave', sa.String(length=520), nullable=False,
+                  comment="'nipc:<nipc>' or 'nome:<normalized name>'"),
+        sa.Column('nipc', sa.String(length=9), nullable=True, comment='NIPC quoted in the declarations, when any'),
+        sa.Column('nome', sa.String(length=500), nullable=False, comment='Most frequent declared spelling'),
+        sa.Column('nome_normalizado', sa.String(length=500), nullable=False,
+                  comment='Accent, case and legal-form insensitive name'),
+        sa.Column('declaration_count', sa.Integer(), nullable=False, comment='Declarations naming the entity'),
+        sa.Column('deputy_count', sa.Integer(), nullable=False,
+                  comment='Distinct deputies (id_cadastro) naming the entity'),
+        sa.Column('refreshed_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('chave', name='uq_interest_entities_chave'),
+    )
+    op.create_index('idx_interest_entities_nome_normalizado', 'interest_entities', ['nome_normalizado'], unique=False)
+    op.create_index('idx_interest_entities_nipc', 'interest_entities', ['nipc'], unique=False)
+
+    op.create_table(
+        'interest_entity_links',
+        sa.Column('id', sa.Uuid(), nullable=False, comment='Deterministic: md5 of source table and item'),
+        sa.Column('entity_id', sa.Uuid(), nullable=False),
+        sa.Column('registo_id', sa.Uuid(), nullable=False),
+        sa.Column('legislatura_id', sa.Uuid(), nullable=False),
+        sa.Column('id_cadastro', sa.Integer(), nullable=False, comment='Declaring deputy'),
+        sa.Column('source_table', sa.String(length=60), nullable=False, comment='Table holding the declaration item'),
+        sa.Column('source_id', sa.Uuid(), nullable=False, comment='Primary key of the declaration item'),
+        sa.Column('declared_name', sa.String(length=500), nullable=True, comment='Entity as written in the declaration'),
+        sa.ForeignKeyConstraint(['entity_id'], ['interest_entities.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['registo_id'], ['registo_interesses_unified.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['legislatura_id'], ['legislaturas.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('idx_interest_entity_links_entity', 'interest_entity_links', ['entity_id', 'id_cadastro'], unique=False)
+    op.create_index('idx_interest_entity_links_deputy', 'interest_entity_links', ['id_cadastro', 'entity_id'], unique=False)
+    op.create_index('idx_interest_entity_links_legislatura', 'interest_entity_links', ['legislatura_id'], unique=False)
+
+    op.create_table(
+        'interest_entity_cooccurrences',
+        sa.Column('id', sa.Uuid(), nullable=False, comment='Deterministic: md5 of entity and both deputies'),
+        sa.Column('entity_id', sa.Uuid(), nullable=False),
+        sa.Column('id_cadastro', sa.Integer(), nullable=False),
+        sa.Column('other_id_cadastro', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['entity_id'], ['interest_entities.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('id_cadastro', 'other_id_cadastro', 'entity_id',
+                            name='uq_interest_entity_cooccurrences_pair'),
+    )
+    op.create_index('idx_interest_entity_cooccurrences_entity', 'interest_entity_cooccurrences', ['entity_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_interest_entity_cooccurrences_entity', table_name='interest_entity_cooccurrences')
+    op.drop_table('interest_entity_cooccurrences')
+    op.drop_index('idx_interest_entity_links_legislatura', table_name='interest_entity_links')
+    op.drop_index('idx_interest_entity_links_deputy', table_name='interest_entity_links')
+    op.drop_index('idx_interest_entity_links_entity', table_name='interest_entity_links')
+    op.drop_table('interest_entity_links')
+    op.drop_index('idx_interest_entities_nipc', table_name='interest_entities')
+    op.drop_index('idx_interest_entities_nome_normalizado', table_name='interest_entities')
+    op.drop_table('interest_entities')
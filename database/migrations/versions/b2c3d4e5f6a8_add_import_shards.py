@@ -0,0 +1,44 @@
+"""Add import_shards for sharded import of very large files
+
+Revision ID: b2c3d4e5f6a8
+Revises: a1b2c3d4e5f7
+Create Date: 2026-10-18
+
+Tracks the chunks of a file mapped in parallel until the import is
+completed or rolled back.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2c3d4e5f6a8'
+down_revision: Union[str, Sequence[str], None] = 'a1b2c3d4e5f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'import_shards',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('import_status_id', sa.Uuid(), nullable=False, comment='File the chunk belongs to'),
+        sa.Column('shard_index', sa.Integer(), nullable=False, comment='Position of the chunk in the file'),
+        sa.Column('record_keys', sa.Text(), nullable=False, comment='JSON list of the natural XML ids in the chunk'),
+        sa.Column('status', sa.String(length=20), nullable=False, comment='mapped or failed'),
+        sa.Column('records_imported', sa.Integer(), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('duration_seconds', sa.Float(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['import_status_id'], ['import_status.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('import_status_id', 'shard_index', name='uq_import_shards_shard'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('import_shards')
@@ -0,0 +1,80 @@
+"""Add budget party x votacao matrix
+
+Revision ID: b8c9d0e1f2a4
+Revises: a7b8c9d0e1f3
+Create Date: 2026-10-18
+
+Budget votes store each parliamentary group's position in
+orcamento_estado_votacoes.votos_partidos (JSONB, GIN indexed) together with
+their legislature, and per-party totals in
+orcamento_estado_partido_voto_stats. After upgrading, run
+scripts/data_processing/budget_votes.py to backfill both.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8c9d0e1f2a4'
+down_revision: Union[str, Sequence[str], None] = 'a7b8c9d0e1f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'orcamento_estado_votacoes',
+        sa.Column('legislatura_id', sa.Uuid(), nullable=True,
+                  comment='Legislature of the budget item or proposal voted'),
+    )
+    op.add_column(
+        'orcamento_estado_votacoes',
+        sa.Column('votos_partidos', postgresql.JSONB(astext_type=sa.Text()), nullable=True,
+                  comment='Position of each parliamentary group: {sigla: Favor|Contra|Abstenção|...}'),
+    )
+    op.create_foreign_key(
+        'fk_oe_votacoes_legislatura_id', 'orcamento_estado_votacoes', 'legislaturas',
+        ['legislatura_id'], ['id'],
+    )
+    op.create_index(
+        'idx_oe_votacoes_votos_partidos', 'orcamento_estado_votacoes', ['votos_partidos'],
+        unique=False, postgresql_using='gin',
+    )
+    op.create_index('idx_oe_votacoes_legislatura', 'orcamento_estado_votacoes', ['legislatura_id'], unique=False)
+    op.create_index('idx_oe_votacoes_item', 'orcamento_estado_votacoes', ['item_id'], unique=False)
+    op.create_index('idx_oe_votacoes_proposta', 'orcamento_estado_votacoes', ['proposta_id'], unique=False)
+
+    op.create_table(
+        'orcamento_estado_partido_voto_stats',
+        sa.Column('id', sa.Uuid(), nullable=False, comment='Deterministic: md5 of legislature and group'),
+        sa.Column('legislatura_id', sa.Uuid(), nullable=False),
+        sa.Column('grupo_parlamentar', sa.String(length=200), nullable=False,
+                  comment='Party sigla (key of votos_partidos)'),
+        sa.Column('favor', sa.Integer(), nullable=False),
+        sa.Column('contra', sa.Integer(), nullable=False),
+        sa.Column('abstencao', sa.Integer(), nullable=False),
+        sa.Column('outros', sa.Integer(), nullable=False, comment='Any other recorded position (e.g. Ausente)'),
+        sa.Column('total', sa.Integer(), nullable=False),
+        sa.Column('primeira_votacao', sa.Date(), nullable=True),
+        sa.Column('ultima_votacao', sa.Date(), nullable=True),
+        sa.Column('refreshed_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['legislatura_id'], ['legislaturas.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('grupo_parlamentar', 'legislatura_id', name='uq_oe_partido_voto_stats_grupo'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('orcamento_estado_partido_voto_stats')
+    op.drop_index('idx_oe_votacoes_proposta', table_name='orcamento_estado_votacoes')
+    op.drop_index('idx_oe_votacoes_item', table_name='orcamento_estado_votacoes')
+    op.drop_index('idx_oe_votacoes_legislatura', table_name='orcamento_estado_votacoes')
+    op.drop_index('idx_oe_votacoes_votos_partidos', table_name='orcamento_estado_votacoes')
+    op.drop_constraint('fk_oe_votacoes_legislatura_id', 'orcamento_estado_votacoes', type_='foreignkey')
+    op.drop_column('orcamento_estado_votacoes', 'votos_partidos')
+    op.drop_column('orcamento_estado_votacoes', 'legislatura_id')
@@ -0,0 +1,74 @@
+"""Add active_entities flags for parties, coalitions and deputies
+
+Revision ID: c3d4e5f6a7b9
+Revises: b2c3d4e5f6a8
+Create Date: 2026-10-18
+
+Materialized (entity, legislature) pairs backing Partido/Coligacao/Deputado
+is_active. The table is backfilled from the mandates with the same rule as
+scripts/data_processing/active_entities.py, so existing entities do not
+read as inactive until the next import run.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d4e5f6a7b9'
+down_revision: Union[str, Sequence[str], None] = 'b2c3d4e5f6a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Entity type -> SELECT (entity_id, legislatura_numero) over the mandates,
+# as in active_entities.ACTIVE_ENTITY_SOURCES
+ACTIVE_ENTITY_MANDATES = {
+    'deputado': """
+        SELECT DISTINCT m.deputado_id AS entity_id, m.leg_des AS legislatura_numero
+        FROM deputado_mandatos_legislativos m
+        WHERE m.leg_des IS NOT NULL
+    """,
+    'partido': """
+        SELECT DISTINCT p.id AS entity_id, m.leg_des AS legislatura_numero
+        FROM partidos p
+        JOIN deputado_mandatos_legislativos m ON m.par_sigla = p.sigla
+        WHERE m.leg_des IS NOT NULL
+    """,
+    'coligacao': """
+        SELECT DISTINCT c.id AS entity_id, m.leg_des AS legislatura_numero
+        FROM coligacoes c
+        JOIN deputado_mandatos_legislativos m ON m.coligacao_id = c.id OR m.par_sigla = c.sigla
+        WHERE m.leg_des IS NOT NULL
+    """,
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'active_entities',
+        sa.Column('id', sa.Uuid(), nullable=False, comment='Deterministic: md5 of type, entity and legislature'),
+        sa.Column('entity_type', sa.String(length=20), nullable=False, comment='partido, coligacao or deputado'),
+        sa.Column('entity_id', sa.Uuid(), nullable=False, comment='Primary key of the party, coalition or deputy'),
+        sa.Column('legislatura_numero', sa.String(length=20), nullable=False,
+                  comment='Legislature of the mandates (leg_des)'),
+        sa.Column('refreshed_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('entity_type', 'legislatura_numero', 'entity_id', name='uq_active_entities_entity'),
+    )
+    op.create_index('idx_active_entities_entity', 'active_entities', ['entity_id'], unique=False)
+
+    for entity_type, mandates in ACTIVE_ENTITY_MANDATES.items():
+        op.execute(f"""
+            INSERT INTO active_entities (id, entity_type, entity_id, legislatura_numero)
+            SELECT md5(concat('{entity_type}', ':', CAST(entity_id AS VARCHAR), ':', legislatura_numero))::uuid,
+                   '{entity_type}', entity_id, legislatura_numero
+            FROM ({mandates}) AS active
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_active_entities_entity', table_name='active_entities')
+    op.drop_table('active_entities')
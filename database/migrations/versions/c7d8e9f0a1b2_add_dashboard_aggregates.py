@@ -0,0 +1,44 @@
+"""Add dashboard_aggregates summary table
+
+Revision ID: c7d8e9f0a1b2
+Revises: b5c6d7e8f9a0
+Create Date: 2026-10-18
+
+Stores precomputed JSON payloads for /estatisticas and the /transparency/*
+dashboards, refreshed after each import run.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d8e9f0a1b2'
+down_revision: Union[str, Sequence[str], None] = 'b5c6d7e8f9a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'dashboard_aggregates',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('aggregate_key', sa.String(length=50), nullable=False,
+                  comment="Aggregate identifier (e.g., 'estatisticas')"),
+        sa.Column('legislatura_numero', sa.String(length=20), nullable=False,
+                  comment='Legislature the aggregate was computed for'),
+        sa.Column('payload', sa.Text(), nullable=False, comment='JSON response payload'),
+        sa.Column('refresh_duration_seconds', sa.Float(), nullable=True,
+                  comment='Time taken to compute the payload'),
+        sa.Column('refreshed_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('aggregate_key', 'legislatura_numero',
+                            name='uq_dashboard_aggregate_key_legislatura'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('dashboard_aggregates')
@@ -0,0 +1,38 @@
+"""Add indexes for set-based party vote analytics
+
+Revision ID: c9d0e1f2a3b5
+Revises: b8c9d0e1f2a4
+Create Date: 2026-10-18
+
+/partidos/<sigla>/voting-analytics counts a party's activity votes with one
+EXISTS probing intervencao_deputados by (id_cadastro, intervencao_id) for
+each atividade_parlamentar_votacoes row, instead of a join per deputy.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9d0e1f2a3b5'
+down_revision: Union[str, Sequence[str], None] = 'b8c9d0e1f2a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_intervencao_deputados_cadastro', 'intervencao_deputados',
+        ['id_cadastro', 'intervencao_id'], unique=False,
+    )
+    op.create_index(
+        'idx_atividade_votacoes_atividade', 'atividade_parlamentar_votacoes',
+        ['atividade_id'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_atividade_votacoes_atividade', table_name='atividade_parlamentar_votacoes')
+    op.drop_index('idx_intervencao_deputados_cadastro', table_name='intervencao_deputados')
@@ -0,0 +1,39 @@
+"""Add cache version counters
+
+Revision ID: d0e1f2a3b4c6
+Revises: c9d0e1f2a3b5
+Create Date: 2026-10-18
+
+API workers cache the reference tables (legislaturas, partidos,
+circulos_eleitorais, coligacoes) in memory and reload them when the
+'reference_data' counter in cache_versions is incremented at the end of an
+import run.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd0e1f2a3b4c6'
+down_revision: Union[str, Sequence[str], None] = 'c9d0e1f2a3b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'cache_versions',
+        sa.Column('cache_key', sa.String(length=50), nullable=False,
+                  comment="Cache identifier (e.g., 'reference_data')"),
+        sa.Column('version', sa.Integer(), nullable=False, comment='Incremented on every invalidation'),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('cache_key'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('cache_versions')
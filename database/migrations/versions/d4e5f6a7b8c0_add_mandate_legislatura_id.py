@@ -0,0 +1,58 @@
+"""Add legislatura_id to deputado_mandatos_legislativos
+
+Revision ID: d4e5f6a7b8c0
+Revises: c3d4e5f6a7b9
+Create Date: 2026-10-18
+
+Mandates were filtered by their leg_des text. The new indexed foreign key
+is backfilled from leg_des, mapping the source designations (IA, IB, Cons)
+to the canonical legislature numero.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e5f6a7b8c0'
+down_revision: Union[str, Sequence[str], None] = 'c3d4e5f6a7b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'deputado_mandatos_legislativos',
+        sa.Column('legislatura_id', sa.Uuid(), nullable=True,
+                  comment='Legislature of the mandate (resolved from leg_des)'),
+    )
+    op.create_foreign_key(
+        'fk_mandatos_legislatura_id', 'deputado_mandatos_legislativos', 'legislaturas',
+        ['legislatura_id'], ['id'],
+    )
+    op.execute("""
+        UPDATE deputado_mandatos_legislativos m
+        SET legislatura_id = l.id
+        FROM legislaturas l
+        WHERE l.numero = CASE upper(trim(m.leg_des))
+            WHEN 'IA' THEN 'I'
+            WHEN 'IB' THEN 'I'
+            WHEN 'CONS' THEN 'CONSTITUINTE'
+            WHEN 'CONST' THEN 'CONSTITUINTE'
+            WHEN 'CONSTITUENTE' THEN 'CONSTITUINTE'
+            ELSE upper(trim(m.leg_des))
+        END
+    """)
+    op.create_index(
+        'idx_mandatos_legislatura_id', 'deputado_mandatos_legislativos',
+        ['legislatura_id', 'deputado_id'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_mandatos_legislatura_id', table_name='deputado_mandatos_legislativos')
+    op.drop_constraint('fk_mandatos_legislatura_id', 'deputado_mandatos_legislativos', type_='foreignkey')
+    op.drop_column('deputado_mandatos_legislativos', 'legislatura_id')
@@ -0,0 +1,48 @@
+"""Add composite indexes for keyset pagination
+
+Revision ID: d8e9f0a1b2c3
+Revises: c7d8e9f0a1b2
+Create Date: 2026-10-18
+
+History endpoints page by (date DESC NULLS LAST, id DESC). These indexes
+match that order so every page is an index range scan.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8e9f0a1b2c3'
+down_revision: Union[str, Sequence[str], None] = 'c7d8e9f0a1b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+KEYSET_INDEXES = [
+    ('idx_intervencao_legislatura_data_keyset', 'intervencao_parlamentar',
+     ['legislatura_id', sa.text('data_reuniao_plenaria DESC NULLS LAST'), sa.text('id DESC')]),
+    ('idx_iniciativas_legislatura_nr_keyset', 'iniciativas_detalhadas',
+     ['legislatura_id', sa.text('ini_nr DESC NULLS LAST'), sa.text('id DESC')]),
+    ('idx_votacoes_data_votacao_keyset', 'iniciativas_eventos_votacoes',
+     [sa.text('data_votacao DESC NULLS LAST'), sa.text('id DESC')]),
+    ('idx_oe_votacoes_data_keyset', 'orcamento_estado_votacoes',
+     [sa.text('data_votacao DESC NULLS LAST'), sa.text('id DESC')]),
+    ('idx_atividade_votacoes_data_keyset', 'atividade_parlamentar_votacoes',
+     [sa.text('data DESC NULLS LAST'), sa.text('id DESC')]),
+    ('idx_meeting_attendances_deputy_date_keyset', 'meeting_attendances',
+     ['dep_nome_parlamentar', sa.text('dt_reuniao DESC NULLS LAST'), sa.text('id DESC')]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in KEYSET_INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(KEYSET_INDEXES):
+        op.drop_index(name, table_name=table)
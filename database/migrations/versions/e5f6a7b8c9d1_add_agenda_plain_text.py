@@ -0,0 +1,42 @@
+"""Add sanitized plain-text columns to agenda_parlamentar
+
+Revision ID: e5f6a7b8c9d1
+Revises: d4e5f6a7b8c0
+Create Date: 2026-10-18
+
+The agenda endpoints sanitized the HTML of subtitulo/descricao on every
+request. The mapper now stores the plain text at import time; existing
+rows are backfilled with scripts/data_processing/rebuild_agenda_text.py
+(the endpoints sanitize on the fly until then).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f6a7b8c9d1'
+down_revision: Union[str, Sequence[str], None] = 'd4e5f6a7b8c0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'agenda_parlamentar',
+        sa.Column('subtitulo_texto', sa.Text(), nullable=True,
+                  comment='Plain text of subtitulo (sanitized at import, see html_text.py)'),
+    )
+    op.add_column(
+        'agenda_parlamentar',
+        sa.Column('descricao_texto', sa.Text(), nullable=True,
+                  comment='Plain text of descricao (sanitized at import, see html_text.py)'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('agenda_parlamentar', 'descricao_texto')
+    op.drop_column('agenda_parlamentar', 'subtitulo_texto')
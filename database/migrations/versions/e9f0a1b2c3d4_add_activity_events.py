@@ -0,0 +1,67 @@
+"""Add activity_events timeline table
+
+Revision ID: e9f0a1b2c3d4
+Revises: d8e9f0a1b2c3
+Create Date: 2026-10-18
+
+Denormalized activity timeline backing /feed/atividades and the deputy
+activity views. The table is derived data: after upgrading, run
+scripts/data_processing/rebuild_activity_events.py to backfill it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9f0a1b2c3d4'
+down_revision: Union[str, Sequence[str], None] = 'd8e9f0a1b2c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'activity_events',
+        sa.Column('id', sa.Uuid(), nullable=False, comment='Deterministic: md5 of source and person'),
+        sa.Column('id_cadastro', sa.Integer(), nullable=True,
+                  comment='Participating deputy (NULL for events without deputies)'),
+        sa.Column('event_type', sa.String(length=30), nullable=False,
+                  comment='iniciativa, intervencao, pergunta, requerimento, atividade, peticao, delegacao'),
+        sa.Column('event_date', sa.Date(), nullable=True, comment='Date the activity took place'),
+        sa.Column('title', sa.Text(), nullable=True, comment='Subject/title of the activity'),
+        sa.Column('source_table', sa.String(length=60), nullable=False, comment='Table holding the source record'),
+        sa.Column('source_id', sa.Uuid(), nullable=False, comment='Primary key of the source record'),
+        sa.Column('legislatura_id', sa.Uuid(), nullable=False),
+        sa.Column('is_feed_entry', sa.Boolean(), nullable=False,
+                  comment='True on exactly one row per source record'),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['legislatura_id'], ['legislaturas.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'idx_activity_events_deputy_keyset', 'activity_events',
+        ['id_cadastro', sa.text('event_date DESC NULLS LAST'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'idx_activity_events_feed_keyset', 'activity_events',
+        ['legislatura_id', sa.text('event_date DESC NULLS LAST'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_feed_entry'),
+    )
+    op.create_index(
+        'idx_activity_events_source', 'activity_events',
+        ['source_table', 'legislatura_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_activity_events_source', table_name='activity_events')
+    op.drop_index('idx_activity_events_feed_keyset', table_name='activity_events')
+    op.drop_index('idx_activity_events_deputy_keyset', table_name='activity_events')
+    op.drop_table('activity_events')
@@ -0,0 +1,40 @@
+"""Add import_record_fingerprints for differential re-import
+
+Revision ID: f0a1b2c3d4e5
+Revises: e9f0a1b2c3d4
+Create Date: 2026-10-18
+
+Stores a content fingerprint per imported record (keyed by its natural XML
+id) so changed files can be re-imported record by record.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f0a1b2c3d4e5'
+down_revision: Union[str, Sequence[str], None] = 'e9f0a1b2c3d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'import_record_fingerprints',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('import_status_id', sa.Uuid(), nullable=False, comment='File the record was imported from'),
+        sa.Column('record_key', sa.String(length=100), nullable=False, comment='Natural XML id of the record'),
+        sa.Column('fingerprint', sa.String(length=32), nullable=False, comment='BLAKE2b-128 of the record XML'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['import_status_id'], ['import_status.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('import_status_id', 'record_key', name='uq_import_record_fingerprints_record'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('import_record_fingerprints')
@@ -0,0 +1,46 @@
+"""Add spouse_deputado_id to registo_interesses_unified
+
+Revision ID: f6a7b8c9d0e2
+Revises: e5f6a7b8c9d1
+Create Date: 2026-10-18
+
+Spouses were looked up with a leading-wildcard LIKE over deputados on every
+conflicts-of-interest request. The resolved deputy is now stored as a
+foreign key; existing declarations are linked by running
+scripts/data_processing/interest_links.py.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a7b8c9d0e2'
+down_revision: Union[str, Sequence[str], None] = 'e5f6a7b8c9d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'registo_interesses_unified',
+        sa.Column('spouse_deputado_id', sa.Uuid(), nullable=True,
+                  comment='Deputy matching spouse_name (latest legislature record of that person)'),
+    )
+    op.create_foreign_key(
+        'fk_registo_interesses_spouse_deputado_id', 'registo_interesses_unified', 'deputados',
+        ['spouse_deputado_id'], ['id'], ondelete='SET NULL',
+    )
+    op.create_index(
+        op.f('ix_registo_interesses_unified_spouse_deputado_id'),
+        'registo_interesses_unified', ['spouse_deputado_id'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_registo_interesses_unified_spouse_deputado_id'), table_name='registo_interesses_unified')
+    op.drop_constraint('fk_registo_interesses_spouse_deputado_id', 'registo_interesses_unified', type_='foreignkey')
+    op.drop_column('registo_interesses_unified', 'spouse_deputado_id')
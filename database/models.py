@@ -21,19 +21,58 @@ from sqlalchemy import (
     ForeignKeyConstraint,
     Index,
     Integer,
+    JSON,
     String,
     Text,
     UniqueConstraint,
+    exists,
 )
 from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import object_session, relationship
 from sqlalchemy.sql import func
 
 from database.types import GUID
 
 Base = declarative_base()
 
+def _current_legislatura_numero():
+    """Numero of the current legislature, from the process-wide legislature registry"""
+    from database.legislature_registry import get_current_legislature
+    current = get_current_legislature()
+    return current.numero if current else None
+
+
+def active_entity_clause(entity_type: str, entity_id, legislatura_numero: str = None):
+    """
+    EXISTS clause: entity_id (a column or a value) is flagged active in a
+    legislature (the current one by default)
+    """
+    if legislatura_numero is None:
+        legislatura_numero = _current_legislatura_numero()
+    return exists().where(
+        ActiveEntity.entity_type == entity_type,
+        ActiveEntity.legislatura_numero == legislatura_numero,
+        ActiveEntity.entity_id == entity_id,
+    )
+
+
+def _is_active_entity(instance, entity_type: str) -> bool:
+    """Active flag of a loaded instance, read through its own session when it has one"""
+    clause = active_entity_clause(entity_type, instance.id)
+    session = object_session(instance)
+    if session is not None:
+        return session.query(clause).scalar()
+
+    from database.connection import get_session
+    session = get_session()
+    try:
+        return session.query(clause).scalar()
+    finally:
+        session.close()
+
 
 # =====================================================
 # MAIN ENTITIES
@@ -128,21 +167,14 @@ class Partido(Base):
     # Relationships
     coligacao_pai = relationship("Coligacao", foreign_keys=[coligacao_pai_id])
 
-    @property
+    @hybrid_property
     def is_active(self):
-        """Runtime calculation: Party is active if it has deputies in current legislature XVII"""
-        from database.connection import get_session
-        from sqlalchemy import exists
-        session = get_session()
-        try:
-            return session.query(
-                exists().where(
-                    DeputadoMandatoLegislativo.par_sigla == self.sigla,
-                    DeputadoMandatoLegislativo.leg_des.like('%XVII%')
-                )
-            ).scalar()
-        finally:
-            session.close()
+        """Party has deputies in the current legislature (materialized in active_entities)"""
+        return _is_active_entity(self, 'partido')
+
+    @is_active.expression
+    def is_active(cls):
+        return active_entity_clause('partido', cls.id)
 
 
 class Coligacao(Base):
@@ -218,33 +250,18 @@ class Coligacao(Base):
         back_populates="coligacao_pai"
     )
     
-    @property
+    @hybrid_property
     def is_active(self):
         """
-        Runtime calculation: Coalition is active if it has deputies in current legislature XVII
-        Uses coalition ID and party sigla matching for detection
+        Coalition has deputies in the current legislature, by coalition id or
+        sigla of their mandates (materialized in active_entities)
         """
-        from database.connection import get_session
-        from sqlalchemy import exists, or_, and_
-        session = get_session()
-        try:
-            # Check if coalition has deputies in current legislature using coalition ID or party sigla match
-            return session.query(
-                exists().where(
-                    and_(
-                        or_(
-                            # Coalition ID match (for mandates with coalition context)
-                            DeputadoMandatoLegislativo.coligacao_id == self.id,
-                            # Party sigla match (for direct coalition siglas like "CDU", "AD")
-                            DeputadoMandatoLegislativo.par_sigla == self.sigla
-                        ),
-                        DeputadoMandatoLegislativo.leg_des.like('%XVII%')
-                    )
-                )
-            ).scalar()
-        finally:
-            session.close()
-    
+        return _is_active_entity(self, 'coligacao')
+
+    @is_active.expression
+    def is_active(cls):
+        return active_entity_clause('coligacao', cls.id)
+
     @property
     def ativo(self):
         """Alias for is_active to maintain API compatibility"""
@@ -505,21 +522,14 @@ class Deputado(Base):
         "DeputySituation", back_populates="deputado", cascade="all, delete-orphan"
     )
 
-    @property
+    @hybrid_property
     def is_active(self):
-        """Runtime calculation: Deputy is active if they have a mandate in current legislature XVII"""
-        from database.connection import get_session
-        from sqlalchemy import exists
-        session = get_session()
-        try:
-            return session.query(
-                exists().where(
-                    DeputadoMandatoLegislativo.deputado_id == self.id,
-                    DeputadoMandatoLegislativo.leg_des.like('%XVII%')
-                )
-            ).scalar()
-        finally:
-            session.close()
+        """Deputy has a mandate in the current legislature (materialized in active_entities)"""
+        return _is_active_entity(self, 'deputado')
+
+    @is_active.expression
+    def is_active(cls):
+        return active_entity_clause('deputado', cls.id)
 
     @property
     def mandate_status(self):
@@ -545,8 +555,8 @@ class Deputado(Base):
         from app.utils.deputy_status import get_deputy_status_by_cadastro
         session = get_session()
         try:
-            # Get status in current legislature XVII using cadastro ID
-            return get_deputy_status_by_cadastro(self.id_cadastro, 'XVII', session)
+            # Get status in current legislature using cadastro ID
+            return get_deputy_status_by_cadastro(self.id_cadastro, _current_legislatura_numero(), session)
         finally:
             session.close()
 
@@ -1001,6 +1011,13 @@ class AgendaParlamentar(Base):
         Text,
         comment="HTML encoded descriptive text (InternetText) - detailed event information",
     )
+    # Sanitized plain text of subtitulo/descricao, rendered at import time
+    subtitulo_texto = Column(
+        Text, comment="Plain text of subtitulo (sanitized at import, see html_text.py)"
+    )
+    descricao_texto = Column(
+        Text, comment="Plain text of descricao (sanitized at import, see html_text.py)"
+    )
     local_evento = Column(
         Text, comment="Event location (Local) - where the event takes place"
     )
@@ -1573,6 +1590,16 @@ class MeetingAttendance(Base):
     # Relationships
     meeting = relationship("OrganMeeting", back_populates="attendances")
 
+    # Keyset pagination index for attendance timelines (newest first)
+    __table_args__ = (
+        Index(
+            "idx_meeting_attendances_deputy_date_keyset",
+            "dep_nome_parlamentar",
+            dt_reuniao.desc().nulls_last(),
+            id.desc(),
+        ),
+    )
+
 
 class DeputyVideo(Base):
     """Deputy video data - stores video links associated with deputies"""
@@ -2198,6 +2225,7 @@ class ImportStatus(Base):
     error_message = Column(Text)
     records_imported = Column(Integer, default=0)
     processing_duration_seconds = Column(Float, comment="Time taken to process the file in seconds")
+    phase_profile = Column(Text, comment="JSON per-phase profile of the last import (see import_profiler)")
 
     # Error tracking and retry counters
     recrawl_count = Column(Integer, default=0, comment="Number of times URL has been recrawled")
@@ -2223,6 +2251,71 @@ class ImportStatus(Base):
     )
 
 
+
+class ImportRecordFingerprint(Base):
+    """
+    Per-record content fingerprint of an imported file
+
+    One row per record of a file imported in differential mode, keyed by the
+    record's natural XML id (e.g. IniId, DepCadId). On re-import the stored
+    fingerprints are diffed against the new file so only added, changed and
+    removed records are written (see scripts/data_processing/differential_import.py).
+    """
+
+    __tablename__ = "import_record_fingerprints"
+
+    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    import_status_id = Column(
+        GUID(),
+        ForeignKey("import_status.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="File the record was imported from",
+    )
+    record_key = Column(String(100), nullable=False, comment="Natural XML id of the record")
+    fingerprint = Column(String(32), nullable=False, comment="BLAKE2b-128 of the record XML")
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint(
+            "import_status_id", "record_key",
+            name="uq_import_record_fingerprints_record"
+        ),
+    )
+
+
+class ImportShard(Base):
+    """
+    Staged chunk of a file imported in sharded mode
+
+    A very large file is split into chunks of records mapped in parallel
+    processes, each committing on its own. One row per chunk tracks its
+    records and outcome until the coordinator either completes the
+    ImportStatus and drops the rows, or deletes the chunks' records again
+    (see scripts/data_processing/sharded_import.py).
+    """
+
+    __tablename__ = "import_shards"
+
+    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    import_status_id = Column(
+        GUID(),
+        ForeignKey("import_status.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="File the chunk belongs to",
+    )
+    shard_index = Column(Integer, nullable=False, comment="Position of the chunk in the file")
+    record_keys = Column(Text, nullable=False, comment="JSON list of the natural XML ids in the chunk")
+    status = Column(String(20), nullable=False, comment="mapped or failed")
+    records_imported = Column(Integer, default=0)
+    error_message = Column(Text)
+    duration_seconds = Column(Float)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("import_status_id", "shard_index", name="uq_import_shards_shard"),
+    )
+
+
 # AtividadeDeputado Models for Deputy Activity Data
 
 
@@ -3597,6 +3690,12 @@ class AtividadeParlamentarVotacao(Base):
 
     atividade = relationship("AtividadeParlamentar", back_populates="votacoes")
 
+    # Keyset pagination index (newest first, see app.utils.pagination)
+    __table_args__ = (
+        Index("idx_atividade_votacoes_data_keyset", data.desc().nulls_last(), id.desc()),
+        Index("idx_atividade_votacoes_atividade", "atividade_id"),
+    )
+
 
 class AtividadeParlamentarEleito(Base):
     __tablename__ = "atividade_parlamentar_eleitos"
@@ -4407,6 +4506,16 @@ class IniciativaParlamentar(Base):
         "IniciativaOriginada", back_populates="iniciativa", cascade="all, delete-orphan"
     )
 
+    # Keyset pagination index (highest number first, see app.utils.pagination)
+    __table_args__ = (
+        Index(
+            "idx_iniciativas_legislatura_nr_keyset",
+            "legislatura_id",
+            ini_nr.desc().nulls_last(),
+            id.desc(),
+        ),
+    )
+
 
 class IniciativaAutorOutro(Base):
     __tablename__ = "iniciativas_autores_outros"
@@ -4646,6 +4755,7 @@ class IniciativaEventoVotacao(Base):
     __table_args__ = (
         Index("idx_votacoes_data_votacao", "data_votacao"),
         Index("idx_votacoes_evento_id", "evento_id"),
+        Index("idx_votacoes_data_votacao_keyset", data_votacao.desc().nulls_last(), id.desc()),
     )
 
 
@@ -5869,6 +5979,16 @@ class IntervencaoParlamentar(Base):
         doc="Audiovisual materials related to intervention",
     )
 
+    # Keyset pagination index (newest first, see app.utils.pagination)
+    __table_args__ = (
+        Index(
+            "idx_intervencao_legislatura_data_keyset",
+            "legislatura_id",
+            data_reuniao_plenaria.desc().nulls_last(),
+            id.desc(),
+        ),
+    )
+
 
 class IntervencaoPublicacao(Base):
     __tablename__ = "intervencao_publicacoes"
@@ -5911,6 +6031,11 @@ class IntervencaoDeputado(Base):
     intervencao = relationship("IntervencaoParlamentar", back_populates="deputados")
     deputado = relationship("Deputado", backref="intervencoes_parlamentares")
 
+    # Party vote analytics probe (id_cadastro IN ..., intervencao_id) pairs
+    __table_args__ = (
+        Index("idx_intervencao_deputados_cadastro", "id_cadastro", "intervencao_id"),
+    )
+
 
 class IntervencaoMembroGoverno(Base):
     __tablename__ = "intervencao_membros_governo"
@@ -7170,6 +7295,12 @@ class DeputadoMandatoLegislativo(Base):
         comment="Confidence score for coalition detection (0.0-1.0)"
     )
 
+    legislatura_id = Column(
+        GUID(),
+        ForeignKey("legislaturas.id"),
+        comment="Legislature of the mandate (resolved from leg_des)"
+    )
+
     created_at = Column(DateTime, default=func.now())
 
     # Data provenance tracking
@@ -7184,6 +7315,7 @@ class DeputadoMandatoLegislativo(Base):
     # Relationships
     deputado = relationship("Deputado", back_populates="mandatos_legislativos")
     coligacao = relationship("Coligacao", foreign_keys=[coligacao_id])
+    legislatura = relationship("Legislatura")
 
     # Indexes for performance optimization
     __table_args__ = (
@@ -7191,6 +7323,7 @@ class DeputadoMandatoLegislativo(Base):
         Index("idx_mandatos_leg_des", "leg_des"),
         Index("idx_mandatos_par_sigla", "par_sigla"),
         Index("idx_mandatos_legislatura_composite", "deputado_id", "leg_des"),
+        Index("idx_mandatos_legislatura_id", "legislatura_id", "deputado_id"),
     )
 
 
@@ -7289,6 +7422,14 @@ class RegistoInteressesUnified(Base):
     marital_status_code = Column(String(10))
     marital_status_desc = Column(String(50))
     spouse_name = Column(String(200))
+    # Deputy named as spouse (resolved by name, see interest_links.py)
+    spouse_deputado_id = Column(
+        GUID(),
+        ForeignKey("deputados.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+        comment="Deputy matching spouse_name (latest legislature record of that person)",
+    )
     matrimonial_regime = Column(String(100))
     professional_activity = Column(Text)
 
@@ -7313,7 +7454,8 @@ class RegistoInteressesUnified(Base):
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
     # Relationships
-    deputado = relationship("Deputado")
+    deputado = relationship("Deputado", foreign_keys=[deputado_id])
+    spouse_deputado = relationship("Deputado", foreign_keys=[spouse_deputado_id])
     legislatura = relationship("Legislatura")
     atividades = relationship(
         "RegistoInteressesAtividadeUnified",
@@ -7539,6 +7681,90 @@ class RegistoInteressesApoioUnified(Base):
     registo = relationship("RegistoInteressesUnified", back_populates="apoios")
 
 
+class InterestEntity(Base):
+    """
+    Organizations named in interest declarations, resolved across deputies
+
+    Activities, shareholdings, social positions and benefits name the same
+    organization in many spellings ('Banco X, S.A.', 'BANCO X SA'). Each
+    distinct organization is one row keyed by its NIPC when the declaration
+    quotes one, by its normalized name otherwise. Derived from the
+    declarations by scripts.data_processing.interest_entities.
+    """
+
+    __tablename__ = "interest_entities"
+
+    id = Column(GUID(), primary_key=True, comment="Deterministic: md5 of chave")
+    chave = Column(String(520), nullable=False, comment="'nipc:<nipc>' or 'nome:<normalized name>'")
+    nipc = Column(String(9), comment="NIPC quoted in the declarations, when any")
+    nome = Column(String(500), nullable=False, comment="Most frequent declared spelling")
+    nome_normalizado = Column(String(500), nullable=False, comment="Accent, case and legal-form insensitive name")
+    declaration_count = Column(Integer, nullable=False, default=0, comment="Declarations naming the entity")
+    deputy_count = Column(Integer, nullable=False, default=0, comment="Distinct deputies (id_cadastro) naming the entity")
+    refreshed_at = Column(DateTime, server_default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("chave", name="uq_interest_entities_chave"),
+        Index("idx_interest_entities_nome_normalizado", "nome_normalizado"),
+        Index("idx_interest_entities_nipc", "nipc"),
+    )
+
+
+class InterestEntityLink(Base):
+    """
+    Declaration item -> interest entity
+
+    One row per activity, shareholding, social position or benefit whose
+    entity resolved to an InterestEntity, carrying the declarant's
+    id_cadastro so per-deputy and per-entity lookups are single index scans.
+    """
+
+    __tablename__ = "interest_entity_links"
+
+    id = Column(GUID(), primary_key=True, comment="Deterministic: md5 of source table and item")
+    entity_id = Column(GUID(), ForeignKey("interest_entities.id", ondelete="CASCADE"), nullable=False)
+    registo_id = Column(
+        GUID(), ForeignKey("registo_interesses_unified.id", ondelete="CASCADE"), nullable=False
+    )
+    legislatura_id = Column(GUID(), ForeignKey("legislaturas.id"), nullable=False)
+    id_cadastro = Column(Integer, nullable=False, comment="Declaring deputy")
+    source_table = Column(String(60), nullable=False, comment="Table holding the declaration item")
+    source_id = Column(GUID(), nullable=False, comment="Primary key of the declaration item")
+    declared_name = Column(String(500), comment="Entity as written in the declaration")
+
+    __table_args__ = (
+        Index("idx_interest_entity_links_entity", "entity_id", "id_cadastro"),
+        Index("idx_interest_entity_links_deputy", "id_cadastro", "entity_id"),
+        Index("idx_interest_entity_links_legislatura", "legislatura_id"),
+    )
+
+
+class InterestEntityCooccurrence(Base):
+    """
+    Pairs of deputies declaring the same interest entity
+
+    Stored in both directions so the entities a deputy shares with others
+    are one range scan on id_cadastro. Entities declared by more than
+    interest_entities.MAX_COOCCURRENCE_DEPUTIES deputies (public bodies,
+    large parties) are left out.
+    """
+
+    __tablename__ = "interest_entity_cooccurrences"
+
+    id = Column(GUID(), primary_key=True, comment="Deterministic: md5 of entity and both deputies")
+    entity_id = Column(GUID(), ForeignKey("interest_entities.id", ondelete="CASCADE"), nullable=False)
+    id_cadastro = Column(Integer, nullable=False)
+    other_id_cadastro = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "id_cadastro", "other_id_cadastro", "entity_id",
+            name="uq_interest_entity_cooccurrences_pair"
+        ),
+        Index("idx_interest_entity_cooccurrences_entity", "entity_id"),
+    )
+
+
 # =====================================================
 # PHASE 3: ANALYTICS MODELS - Database-Driven Parliamentary Analytics
 # =====================================================
@@ -7828,6 +8054,138 @@ class DataQualityMetrics(Base):
     created_at = Column(DateTime, server_default=func.now())
 
 
+class DashboardAggregate(Base):
+    """
+    Precomputed dashboard payloads for statistics and transparency endpoints
+
+    One row per (aggregate_key, legislatura_numero) holding the serialized JSON
+    response of an expensive dashboard query. Rows are rebuilt by
+    app.utils.dashboard_aggregates.refresh_dashboard_aggregates after imports
+    complete, so endpoints read a single indexed row instead of re-running
+    COUNT(DISTINCT ...) scans and multi-table joins per request.
+    """
+
+    __tablename__ = "dashboard_aggregates"
+    __table_args__ = (
+        UniqueConstraint(
+            "aggregate_key",
+            "legislatura_numero",
+            name="uq_dashboard_aggregate_key_legislatura",
+        ),
+    )
+
+    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    aggregate_key = Column(
+        String(50), nullable=False, comment="Aggregate identifier (e.g., 'estatisticas')"
+    )
+    legislatura_numero = Column(
+        String(20), nullable=False, comment="Legislature the aggregate was computed for"
+    )
+    payload = Column(Text, nullable=False, comment="JSON response payload")
+    refresh_duration_seconds = Column(Float, comment="Time taken to compute the payload")
+    refreshed_at = Column(DateTime, server_default=func.now())
+
+
+class CacheVersion(Base):
+    """
+    Version counters of process-wide caches
+
+    One row per cache. The counter is incremented when the cached tables
+    change (database.reference_cache.bump_reference_data_version runs when
+    an import completes); API workers poll it and reload their copy when it
+    moved, so every worker drops stale reference data without a restart.
+    """
+
+    __tablename__ = "cache_versions"
+
+    cache_key = Column(String(50), primary_key=True, comment="Cache identifier (e.g., 'reference_data')")
+    version = Column(Integer, nullable=False, default=1, comment="Incremented on every invalidation")
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+
+class ActiveEntity(Base):
+    """
+    Materialized active flags of parties, coalitions and deputies
+
+    One row per (entity, legislature) in which the entity has a mandate: a
+    deputy through deputado_id, a party through par_sigla and a coalition
+    through coligacao_id or par_sigla of deputado_mandatos_legislativos.
+    Rebuilt from the mandates by scripts.data_processing.active_entities
+    when an import run completes, so is_active and list filters
+    are one indexed EXISTS or join (see active_entity_clause) instead of a
+    leading-wildcard LIKE scan per entity.
+    """
+
+    __tablename__ = "active_entities"
+
+    id = Column(GUID(), primary_key=True, comment="Deterministic: md5 of type, entity and legislature")
+    entity_type = Column(String(20), nullable=False, comment="partido, coligacao or deputado")
+    entity_id = Column(GUID(), nullable=False, comment="Primary key of the party, coalition or deputy")
+    legislatura_numero = Column(String(20), nullable=False, comment="Legislature of the mandates (leg_des)")
+    refreshed_at = Column(DateTime, server_default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint(
+            "entity_type", "legislatura_numero", "entity_id",
+            name="uq_active_entities_entity"
+        ),
+        Index("idx_active_entities_entity", "entity_id"),
+    )
+
+
+class ActivityEvent(Base):
+    """
+    Denormalized parliamentary activity timeline
+
+    One row per (source record, participating deputy) for initiatives,
+    interventions, questions/requests, activities, petitions and delegations.
+    Rows are derived from the source tables by
+    scripts.data_processing.activity_events - mappers refresh their
+    legislature after each import and
+    scripts/data_processing/rebuild_activity_events.py backfills.
+
+    Exactly one row per source record has is_feed_entry set, so the global
+    feed reads each event once while per-deputy timelines read every row for
+    an id_cadastro. Both are single range scans on the keyset indexes.
+    """
+
+    __tablename__ = "activity_events"
+
+    id = Column(GUID(), primary_key=True, comment="Deterministic: md5 of source and person")
+    id_cadastro = Column(Integer, comment="Participating deputy (NULL for events without deputies)")
+    event_type = Column(
+        String(30), nullable=False,
+        comment="iniciativa, intervencao, pergunta, requerimento, atividade, peticao, delegacao"
+    )
+    event_date = Column(Date, comment="Date the activity took place")
+    title = Column(Text, comment="Subject/title of the activity")
+    source_table = Column(String(60), nullable=False, comment="Table holding the source record")
+    source_id = Column(GUID(), nullable=False, comment="Primary key of the source record")
+    legislatura_id = Column(GUID(), ForeignKey("legislaturas.id"), nullable=False)
+    is_feed_entry = Column(
+        Boolean, nullable=False, default=False,
+        comment="True on exactly one row per source record"
+    )
+    created_at = Column(DateTime, server_default=func.now())
+
+    __table_args__ = (
+        Index(
+            "idx_activity_events_deputy_keyset",
+            "id_cadastro",
+            event_date.desc().nulls_last(),
+            id.desc(),
+        ),
+        Index(
+            "idx_activity_events_feed_keyset",
+            "legislatura_id",
+            event_date.desc().nulls_last(),
+            id.desc(),
+            postgresql_where=is_feed_entry,
+        ),
+        Index("idx_activity_events_source", "source_table", "legislatura_id"),
+    )
+
+
 # Parliamentary Friendship Groups (Standalone Data) Models
 # ========================================================
 
@@ -8297,6 +8655,15 @@ class OrcamentoEstadoVotacao(Base):
         Text
     )  # XML: GruposParlamentares (JSON-like storage)
 
+    # Party x votacao matrix (see scripts.data_processing.budget_votes)
+    legislatura_id = Column(
+        GUID(), ForeignKey("legislaturas.id"), nullable=True,
+        comment="Legislature of the budget item or proposal voted"
+    )
+    votos_partidos = Column(
+        JSONB().with_variant(JSON(), "sqlite"), comment="Position of each parliamentary group: {sigla: Favor|Contra|Abstenção|...}"
+    )
+
     # Metadata
     created_at = Column(DateTime, default=func.now())
 
@@ -8316,10 +8683,49 @@ class OrcamentoEstadoVotacao(Base):
         cascade="all, delete-orphan",
     )
 
+    # Keyset pagination index (newest first, see app.utils.pagination);
+    # party histories read the GIN index on votos_partidos
+    __table_args__ = (
+        Index("idx_oe_votacoes_data_keyset", data_votacao.desc().nulls_last(), id.desc()),
+        Index("idx_oe_votacoes_votos_partidos", votos_partidos, postgresql_using="gin"),
+        Index("idx_oe_votacoes_legislatura", "legislatura_id"),
+        Index("idx_oe_votacoes_item", "item_id"),
+        Index("idx_oe_votacoes_proposta", "proposta_id"),
+    )
+
     def __repr__(self):
         return f"<OrcamentoEstadoVotacao(data='{self.data_votacao}', resultado='{self.resultado[:50] if self.resultado else ''}...')>"
 
 
+class OrcamentoEstadoPartidoVotoStats(Base):
+    """
+    Budget vote totals per parliamentary group and legislature
+
+    Precomputed from orcamento_estado_votacoes.votos_partidos by
+    scripts.data_processing.budget_votes after each OE import.
+    """
+
+    __tablename__ = "orcamento_estado_partido_voto_stats"
+
+    id = Column(GUID(), primary_key=True, comment="Deterministic: md5 of legislature and group")
+    legislatura_id = Column(GUID(), ForeignKey("legislaturas.id"), nullable=False)
+    grupo_parlamentar = Column(String(200), nullable=False, comment="Party sigla (key of votos_partidos)")
+    favor = Column(Integer, nullable=False, default=0)
+    contra = Column(Integer, nullable=False, default=0)
+    abstencao = Column(Integer, nullable=False, default=0)
+    outros = Column(Integer, nullable=False, default=0, comment="Any other recorded position (e.g. Ausente)")
+    total = Column(Integer, nullable=False, default=0)
+    primeira_votacao = Column(Date)
+    ultima_votacao = Column(Date)
+    refreshed_at = Column(DateTime, server_default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint(
+            "grupo_parlamentar", "legislatura_id", name="uq_oe_partido_voto_stats_grupo"
+        ),
+    )
+
+
 class OrcamentoEstadoArtigo(Base):
     """
     State Budget Article Model
@@ -0,0 +1,401 @@
+"""
+Reference Data Cache
+====================
+
+Process-wide cache of the small reference tables: legislaturas, partidos,
+circulos_eleitorais and coligacoes.
+
+/legislaturas, /partidos, /circulos and /coligacoes read these tables on
+every request and serializers re-query a Legislatura or Partido per row
+(deputado_to_dict resolves the legislature of each deputy in a list). The
+tables hold a few hundred rows and only change when data is imported, so
+each worker keeps a detached snapshot of them and serves lookups from
+dictionaries.
+
+Invalidation is versioned: bump_reference_data_version() increments the
+'reference_data' counter in cache_versions when an import run completes.
+Workers compare their snapshot's version with the counter at most every
+REFERENCE_CACHE_CHECK_INTERVAL seconds and reload when it moved; without
+the counter (migration not applied) they reload after REFERENCE_CACHE_TTL.
+Snapshots are immutable and swapped under a lock, so threaded WSGI workers
+share one copy and never see a half-loaded one. reference_cache_stats()
+reports lookups and the hit rate (exposed by /health).
+
+Usage:
+    from database.reference_cache import legislature_by_numero, party_by_sigla
+
+    leg = legislature_by_numero('XVII', session)
+    nome = party_by_sigla('PS', session).nome
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+from database.legislature_registry import (
+    LegislatureInfo, LegislatureRegistry, invalidate_legislature_registry, load_legislature_registry,
+    set_legislature_registry,
+)
+
+logger = logging.getLogger(__name__)
+
+# cache_versions row of the reference tables
+REFERENCE_CACHE_KEY = 'reference_data'
+
+# Seconds between checks of the version counter
+REFERENCE_CACHE_CHECK_INTERVAL = float(os.getenv('REFERENCE_CACHE_CHECK_INTERVAL', '30'))
+
+# Seconds before a snapshot is reloaded when the version counter is unavailable
+REFERENCE_CACHE_TTL = float(os.getenv('REFERENCE_CACHE_TTL', '300'))
+
+
+@dataclass(frozen=True)
+class PartyInfo:
+    """Detached snapshot of a partidos row"""
+    id: object
+    sigla: str
+    nome: str
+    designacao_completa: Optional[str] = None
+    cor_hex: Optional[str] = None
+    data_fundacao: Optional[date] = None
+    tipo_entidade: str = 'partido'
+    coligacao_pai_id: object = None
+
+
+@dataclass(frozen=True)
+class CircleInfo:
+    """Detached snapshot of a circulos_eleitorais row"""
+    id: object
+    designacao: str
+    codigo: Optional[str] = None
+    regiao: Optional[str] = None
+    distrito: Optional[str] = None
+    num_deputados: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class CoalitionInfo:
+    """Detached snapshot of a coligacoes row and its active flag at load time"""
+    id: object
+    sigla: str
+    nome: str
+    nome_eleitoral: Optional[str] = None
+    tipo_coligacao: Optional[str] = None
+    espectro_politico: Optional[str] = None
+    data_formacao: Optional[date] = None
+    data_dissolucao: Optional[date] = None
+    ativo: bool = False
+
+
+def _circle_key(designacao: Optional[str]) -> Optional[str]:
+    return ' '.join(designacao.split()).casefold() if designacao else None
+
+
+class ReferenceData:
+    """Immutable snapshot of the reference tables, indexed for lookups"""
+
+    def __init__(self, legislatures: LegislatureRegistry, parties: Iterable[PartyInfo] = (),
+                 circles: Iterable[CircleInfo] = (), coalitions: Iterable[CoalitionInfo] = (),
+                 version: Optional[int] = None):
+        self.legislatures = legislatures
+        self.parties: List[PartyInfo] = sorted(parties, key=lambda party: party.sigla)
+        self.circles: List[CircleInfo] = sorted(circles, key=lambda circle: circle.designacao)
+        self.coalitions: List[CoalitionInfo] = sorted(coalitions, key=lambda coalition: coalition.sigla)
+        self.version = version
+
+        self._parties_by_sigla: Dict[str, PartyInfo] = {party.sigla: party for party in self.parties}
+        self._parties_by_id: Dict[object, PartyInfo] = {party.id: party for party in self.parties}
+        self._circles_by_id: Dict[object, CircleInfo] = {circle.id: circle for circle in self.circles}
+        self._circles_by_designacao: Dict[str, CircleInfo] = {
+            _circle_key(circle.designacao): circle for circle in self.circles
+        }
+        self._coalitions_by_sigla: Dict[str, CoalitionInfo] = {
+            coalition.sigla: coalition for coalition in self.coalitions
+        }
+        self._coalitions_by_id: Dict[object, CoalitionInfo] = {
+            coalition.id: coalition for coalition in self.coalitions
+        }
+
+    def party_by_sigla(self, sigla: Optional[str]) -> Optional[PartyInfo]:
+        return self._parties_by_sigla.get(sigla.strip()) if sigla else None
+
+    def party_by_id(self, partido_id) -> Optional[PartyInfo]:
+        return self._parties_by_id.get(partido_id)
+
+    def circle_by_id(self, circulo_id) -> Optional[CircleInfo]:
+        return self._circles_by_id.get(circulo_id)
+
+    def circle_by_designacao(self, designacao: Optional[str]) -> Optional[CircleInfo]:
+        """Circle by designation, ignoring case and spacing ('  lisboa' -> Lisboa)"""
+        return self._circles_by_designacao.get(_circle_key(designacao))
+
+    def coalition_by_sigla(self, sigla: Optional[str]) -> Optional[CoalitionInfo]:
+        return self._coalitions_by_sigla.get(sigla.strip()) if sigla else None
+
+    def coalition_by_id(self, coligacao_id) -> Optional[CoalitionInfo]:
+        return self._coalitions_by_id.get(coligacao_id)
+
+    def sizes(self) -> Dict[str, int]:
+        return {
+            'legislaturas': len(self.legislatures),
+            'partidos': len(self.parties),
+            'circulos': len(self.circles),
+            'coligacoes': len(self.coalitions),
+        }
+
+
+def load_reference_data(session, version: Optional[int] = None) -> ReferenceData:
+    """Build a snapshot from the reference tables"""
+    from database.models import CirculoEleitoral, Coligacao, Partido, active_entity_clause
+
+    legislatures = load_legislature_registry(session)
+    parties = session.query(
+        Partido.id, Partido.sigla, Partido.nome, Partido.designacao_completa, Partido.cor_hex,
+        Partido.data_fundacao, Partido.tipo_entidade, Partido.coligacao_pai_id,
+    ).all()
+    circles = session.query(
+        CirculoEleitoral.id, CirculoEleitoral.designacao, CirculoEleitoral.codigo,
+        CirculoEleitoral.regiao, CirculoEleitoral.distrito, CirculoEleitoral.num_deputados,
+    ).all()
+    # Active flags of the snapshot's own current legislature (not the registry's cached one)
+    current_numero = legislatures.current.numero if legislatures.current else None
+    coalitions = session.query(
+        Coligacao.id, Coligacao.sigla, Coligacao.nome, Coligacao.nome_eleitoral, Coligacao.tipo_coligacao,
+        Coligacao.espectro_politico, Coligacao.data_formacao, Coligacao.data_dissolucao,
+        active_entity_clause('coligacao', Coligacao.id, current_numero),
+    ).all()
+    return ReferenceData(
+        legislatures,
+        parties=(PartyInfo(*row) for row in parties),
+        circles=(CircleInfo(*row) for row in circles),
+        coalitions=(CoalitionInfo(*row[:-1], ativo=bool(row[-1])) for row in coalitions),
+        version=version,
+    )
+
+
+def read_reference_data_version(bind) -> Optional[int]:
+    """
+    Current version counter (0 before the first bump).
+
+    Reads on its own connection of bind so a missing table cannot abort the
+    caller's transaction.
+
+    Returns:
+        The version, or None when cache_versions is unavailable
+    """
+    from sqlalchemy import select
+    from database.models import CacheVersion
+
+    try:
+        with bind.connect() as conn:
+            version = conn.execute(
+                select(CacheVersion.version).where(CacheVersion.cache_key == REFERENCE_CACHE_KEY)
+            ).scalar()
+        return version or 0
+    except Exception as e:
+        logger.debug(f"Reference data version unavailable: {e}")
+        return None
+
+
+_reference: Optional[ReferenceData] = None
+_loaded_at = 0.0
+_checked_at = 0.0
+_lock = threading.Lock()
+
+_stats = {'hits': 0, 'misses': 0, 'version_checks': 0}
+_stats_lock = threading.Lock()
+
+
+def _record(counter: str) -> None:
+    with _stats_lock:
+        _stats[counter] += 1
+
+
+def _is_fresh(data: Optional[ReferenceData], now: float) -> bool:
+    return data is not None and now - _checked_at < REFERENCE_CACHE_CHECK_INTERVAL
+
+
+def get_reference_data(session=None) -> ReferenceData:
+    """
+    The process-wide snapshot, reloaded when the version counter moved.
+
+    Args:
+        session: Optional session to load with (a short-lived one is opened otherwise)
+    """
+    global _checked_at
+
+    data = _reference
+    if _is_fresh(data, time.monotonic()):
+        _record('hits')
+        return data
+
+    with _lock:
+        data = _reference
+        now = time.monotonic()
+        if _is_fresh(data, now):
+            _record('hits')
+            return data
+
+        if session is not None:
+            bind = session.get_bind()
+        else:
+            from database.connection import get_engine
+            bind = get_engine()
+        version = read_reference_data_version(bind)
+        _record('version_checks')
+
+        if data is not None:
+            unchanged = version == data.version if version is not None else now - _loaded_at < REFERENCE_CACHE_TTL
+            if unchanged:
+                _checked_at = now
+                _record('hits')
+                return data
+
+        if session is not None:
+            data = load_reference_data(session, version)
+        else:
+            from database.connection import DatabaseSession
+            with DatabaseSession() as own_session:
+                data = load_reference_data(own_session, version)
+        set_reference_data(data)
+        _record('misses')
+        logger.debug(f"Reference data loaded (version {version}): {data.sizes()}")
+        return data
+
+
+def set_reference_data(data: ReferenceData) -> None:
+    """Install a snapshot (e.g. one built from known rows) and its legislature registry"""
+    global _reference, _loaded_at, _checked_at
+    set_legislature_registry(data.legislatures)
+    _loaded_at = _checked_at = time.monotonic()
+    _reference = data
+
+
+def invalidate_reference_data() -> None:
+    """Drop this worker's snapshot; the next access reloads it"""
+    global _reference
+    _reference = None
+    invalidate_legislature_registry()
+
+
+def _increment_version(session) -> int:
+    from sqlalchemy import update
+    from database.models import CacheVersion
+
+    result = session.execute(
+        update(CacheVersion).where(CacheVersion.cache_key == REFERENCE_CACHE_KEY)
+        .values(version=CacheVersion.version + 1)
+    )
+    if result.rowcount == 0:
+        session.add(CacheVersion(cache_key=REFERENCE_CACHE_KEY, version=1))
+        session.flush()
+    return session.query(CacheVersion.version).filter(CacheVersion.cache_key == REFERENCE_CACHE_KEY).scalar()
+
+
+def bump_reference_data_version(session=None) -> Optional[int]:
+    """
+    Make every worker reload the reference tables (called when an import run completes).
+
+    Args:
+        session: Optional session to write with (the caller commits); a
+                 short-lived one is opened and committed otherwise
+
+    Returns:
+        The new version, or None when cache_versions is unavailable
+    """
+    if session is not None:
+        version = _increment_version(session)
+    else:
+        try:
+            from database.connection import DatabaseSession
+            with DatabaseSession() as own_session:
+                version = _increment_version(own_session)
+                own_session.commit()
+        except Exception as e:
+            logger.warning(f"Failed to bump the reference data version: {e}")
+            version = None
+    invalidate_reference_data()
+    return version
+
+
+def reference_cache_stats() -> Dict:
+    """Snapshot version and size, lookups and hit rate of this worker"""
+    data = _reference
+    with _stats_lock:
+        hits, misses, version_checks = _stats['hits'], _stats['misses'], _stats['version_checks']
+    lookups = hits + misses
+    return {
+        'version': data.version if data else None,
+        'age_seconds': round(time.monotonic() - _loaded_at, 1) if data else None,
+        'entries': data.sizes() if data else None,
+        'lookups': lookups,
+        'hits': hits,
+        'misses': misses,
+        'version_checks': version_checks,
+        'hit_rate': round(hits / lookups, 3) if lookups else 0.0,
+    }
+
+
+def reset_reference_cache_stats() -> None:
+    with _stats_lock:
+        for counter in _stats:
+            _stats[counter] = 0
+
+
+# Typed accessors
+
+def reference_legislatures(session=None) -> List[LegislatureInfo]:
+    """Legislatures ordered by ordinal"""
+    return get_reference_data(session).legislatures.legislatures
+
+
+def legislature_by_numero(numero: Optional[str], session=None) -> Optional[LegislatureInfo]:
+    """Legislature by numero or source designation ('XVII', 'IB')"""
+    return get_reference_data(session).legislatures.get(numero)
+
+
+def legislature_by_id(legislatura_id, session=None) -> Optional[LegislatureInfo]:
+    return get_reference_data(session).legislatures.by_id(legislatura_id)
+
+
+def reference_parties(session=None) -> List[PartyInfo]:
+    """Parties ordered by sigla"""
+    return get_reference_data(session).parties
+
+
+def party_by_sigla(sigla: Optional[str], session=None) -> Optional[PartyInfo]:
+    return get_reference_data(session).party_by_sigla(sigla)
+
+
+def party_by_id(partido_id, session=None) -> Optional[PartyInfo]:
+    return get_reference_data(session).party_by_id(partido_id)
+
+
+def reference_circles(session=None) -> List[CircleInfo]:
+    """Electoral circles ordered by designation"""
+    return get_reference_data(session).circles
+
+
+def circle_by_id(circulo_id, session=None) -> Optional[CircleInfo]:
+    return get_reference_data(session).circle_by_id(circulo_id)
+
+
+def circle_by_designacao(designacao: Optional[str], session=None) -> Optional[CircleInfo]:
+    return get_reference_data(session).circle_by_designacao(designacao)
+
+
+def reference_coalitions(session=None) -> List[CoalitionInfo]:
+    """Coalitions ordered by sigla"""
+    return get_reference_data(session).coalitions
+
+
+def coalition_by_sigla(sigla: Optional[str], session=None) -> Optional[CoalitionInfo]:
+    return get_reference_data(session).coalition_by_sigla(sigla)
+
+
+def coalition_by_id(coligacao_id, session=None) -> Optional[CoalitionInfo]:
+    return get_reference_data(session).coalition_by_id(coligacao_id)
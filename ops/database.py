@@ -36,8 +36,21 @@ def get_terraform_output(terraform_dir: Path, output_name: str) -> str:
     return ""
 
 
+# (terraform_dir, profile, region) -> (db_url, info); one terraform/Secrets Manager lookup per process
+_production_db_urls: dict = {}
+
+
 def get_production_db_url(config) -> tuple[str, dict]:
-    """Get database URL from AWS Secrets Manager for production."""
+    """Get database URL from AWS Secrets Manager for production (memoized per process)."""
+    key = (str(config.terraform_dir), config.aws.profile, config.aws.region)
+    if key not in _production_db_urls:
+        _production_db_urls[key] = _fetch_production_db_url(config)
+    db_url, info = _production_db_urls[key]
+    return db_url, dict(info)
+
+
+def _fetch_production_db_url(config) -> tuple[str, dict]:
+    """Resolve the secret ARN from terraform and read the credentials from Secrets Manager."""
     import boto3
 
     # Get secret ARN from terraform
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Dashboard Aggregates Refresh
+
+Rebuilds the precomputed payloads served by /estatisticas and /transparency/*.
+Runs automatically when an import run completes; use this script to backfill
+after applying the migration or to refresh specific legislatures by hand.
+
+Usage:
+    python refresh_dashboard_aggregates.py                      # All legislatures
+    python refresh_dashboard_aggregates.py --legislatura XVII   # Specific legislature(s)
+"""
+
+import sys
+import os
+import argparse
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from app.utils.dashboard_aggregates import refresh_dashboard_aggregates
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Refresh precomputed dashboard aggregates',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--legislatura', action='append',
+                        help='Legislature designation to refresh (repeatable, e.g. XVII)')
+    args = parser.parse_args()
+
+    stats = refresh_dashboard_aggregates(args.legislatura)
+    print(f"Refreshed {stats['refreshed']} aggregates ({stats['failed']} failed)")
+    sys.exit(0 if stats['failed'] == 0 else 1)
+
+
+if __name__ == '__main__':
+    main()
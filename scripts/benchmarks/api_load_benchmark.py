@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+API Load Benchmark
+
+Drives the main read endpoints with concurrent clients and reports, per
+endpoint, p50/p95/p99 latency, throughput, SQL queries per request and
+response size.
+
+The database is the one configured for the app (DATABASE_URL / PG_*).
+With --seed it is first filled with a multi-legislature dataset imported
+through the real mappers from the synthetic corpus (import_corpus.py) -
+use a scratch database. Path parameters (deputy ids, party acronyms, search
+terms) are sampled from the database so every request hits existing data.
+
+By default the app is driven in-process through Flask test clients, one per
+client thread, which also allows counting queries per request. With
+--base-url a running server is load-tested over HTTP instead (no query
+counts).
+
+Results include the git commit, so JSON outputs of different commits can be
+compared with --compare.
+
+Usage:
+    python api_load_benchmark.py --seed --scale 300               # Seed, then benchmark
+    python api_load_benchmark.py --clients 8 --requests 200       # Per endpoint
+    python api_load_benchmark.py --endpoint search --endpoint deputados
+    python api_load_benchmark.py --base-url http://localhost:5000
+    python api_load_benchmark.py --json after.json --compare before.json
+"""
+
+import sys
+import os
+import argparse
+import json
+import logging
+import math
+import random
+import subprocess
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+# Add project root to path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from sqlalchemy import event, select
+
+from database.connection import DatabaseSession, get_engine
+from database.models import Deputado, Legislatura, Partido
+from scripts.benchmarks.import_corpus import CORPUS_SPECS, CorpusGenerator
+
+# Seeding order: deputies first so later files can reference them
+SEED_CATEGORIES = (
+    'registo_biografico', 'atividade_deputados', 'intervencoes', 'iniciativas',
+    'peticoes', 'registo_interesses', 'agenda_parlamentar',
+)
+
+# name -> path template; {cad_id}, {sigla} and {term} are sampled per request
+ENDPOINTS: Dict[str, str] = {
+    'deputados': '/api/deputados',
+    'deputado_detalhes': '/api/deputados/{cad_id}/detalhes',
+    'deputado_voting_analytics': '/api/deputados/{cad_id}/voting-analytics',
+    'partido_deputados': '/api/partidos/{sigla}/deputados',
+    'estatisticas': '/api/estatisticas',
+    'search': '/api/search?q={term}',
+    'transparency_live_activity': '/api/transparency/live-activity',
+    'transparency_legislative_progress': '/api/transparency/legislative-progress',
+    'transparency_deputy_performance': '/api/transparency/deputy-performance',
+    'transparency_accountability_metrics': '/api/transparency/accountability-metrics',
+    'transparency_citizen_participation': '/api/transparency/citizen-participation',
+}
+
+
+def seed_database(legislaturas: List[str], records: int, seed: int) -> None:
+    """Import a synthetic corpus for each legislature through the real mappers"""
+    for legislatura in legislaturas:
+        for category in SEED_CATEGORIES:
+            file_name, content = CorpusGenerator(category, seed, legislatura).generate(records)
+            started = time.perf_counter()
+            with DatabaseSession() as session:
+                mapper = CORPUS_SPECS[category].mapper(session)
+                results = mapper.validate_and_map(
+                    ET.fromstring(content),
+                    {'file_path': file_name, 'file_type': category, 'skip_video_processing': True},
+                )
+                session.commit()
+            print(f"  seeded {file_name:<32}{results.get('records_imported', 0):>8} records "
+                  f"({time.perf_counter() - started:.1f}s)")
+
+
+def sample_parameters(rng: random.Random, limit: int = 200) -> Dict[str, List[str]]:
+    """Path parameter values that exist in the database"""
+    with DatabaseSession() as session:
+        deputies = session.execute(
+            select(Deputado.id_cadastro, Deputado.nome_completo).join(
+                Legislatura, Deputado.legislatura_id == Legislatura.id
+            ).where(Deputado.id_cadastro.isnot(None)).limit(limit)
+        ).all()
+        siglas = session.execute(select(Partido.sigla).where(Partido.sigla.isnot(None))).scalars().all()
+    if not deputies:
+        raise SystemExit("No deputies in the database - run with --seed first")
+    terms = sorted({name.split()[0] for _, name in deputies if name})
+    return {
+        'cad_id': [str(cad_id) for cad_id, _ in deputies],
+        'sigla': siglas or ['PS'],
+        'term': terms or ['Silva'],
+    }
+
+
+class QueryCounter:
+    """Counts SQL statements per thread on the app's engine"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._local = threading.local()
+        event.listen(engine, 'after_cursor_execute', self._count)
+
+    def _count(self, *args):
+        self._local.count = getattr(self._local, 'count', 0) + 1
+
+    def reset(self) -> None:
+        self._local.count = 0
+
+    @property
+    def count(self) -> int:
+        return getattr(self._local, 'count', 0)
+
+    def close(self) -> None:
+        event.remove(self.engine, 'after_cursor_execute', self._count)
+
+
+def percentile(values: List[float], p: float) -> float:
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def make_client(base_url: Optional[str]) -> Callable[[str], tuple]:
+    """A per-thread client returning (status, body bytes) for a path"""
+    if base_url:
+        import requests
+        http = requests.Session()
+        return lambda path: _http_get(http, base_url + path)
+
+    from app.main import app
+    client = app.test_client()
+
+    def get(path):
+        response = client.get(path)
+        return response.status_code, response.get_data()
+    return get
+
+
+def _http_get(http, url):
+    response = http.get(url, timeout=120)
+    return response.status_code, response.content
+
+
+def run_endpoint(path_template: str, params: Dict[str, List[str]], clients: int, requests_count: int,
+                 base_url: Optional[str], counter: Optional[QueryCounter], seed: int) -> Dict:
+    """Issue requests_count requests over `clients` threads; returns the endpoint's statistics"""
+    local = threading.local()
+    rng_lock = threading.Lock()
+    rng = random.Random(seed)
+
+    def one_request(_):
+        if not hasattr(local, 'get'):
+            local.get = make_client(base_url)
+        with rng_lock:
+            path = path_template.format(**{k: rng.choice(v) for k, v in params.items()})
+        if counter:
+            counter.reset()
+        started = time.perf_counter()
+        status, body = local.get(path)
+        elapsed = time.perf_counter() - started
+        return elapsed, status, len(body), counter.count if counter else None
+
+    # Warm up caches and connections (not measured)
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        list(pool.map(one_request, range(clients)))
+        started = time.perf_counter()
+        samples = list(pool.map(one_request, range(requests_count)))
+        wall = time.perf_counter() - started
+
+    latencies = [s[0] * 1000 for s in samples]
+    queries = [s[3] for s in samples if s[3] is not None]
+    return {
+        'requests': len(samples),
+        'errors': sum(1 for s in samples if s[1] >= 400),
+        'p50_ms': round(percentile(latencies, 50), 1),
+        'p95_ms': round(percentile(latencies, 95), 1),
+        'p99_ms': round(percentile(latencies, 99), 1),
+        'requests_per_sec': round(len(samples) / wall, 1),
+        'queries_per_request': round(sum(queries) / len(queries), 1) if queries else None,
+        'avg_response_kb': round(sum(s[2] for s in samples) / len(samples) / 1024, 1),
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(
+        description='Load-test the API endpoints against a seeded database',
+        epilog=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--seed', action='store_true', help='Seed the database with a synthetic corpus first')
+    parser.add_argument('--scale', type=int, default=200, help='Records per seeded file')
+    parser.add_argument('--legislaturas', default='XV,XVI,XVII', help='Legislatures to seed (comma-separated)')
+    parser.add_argument('--endpoint', choices=sorted(ENDPOINTS), action='append',
+                        help='Endpoint to benchmark (repeatable, default: all)')
+    parser.add_argument('--clients', type=int, default=4, help='Concurrent clients')
+    parser.add_argument('--requests', type=int, default=100, help='Requests per endpoint')
+    parser.add_argument('--random-seed', type=int, default=42, help='Random seed (corpus and parameters)')
+    parser.add_argument('--base-url', help='Benchmark a running server over HTTP instead of in-process')
+    parser.add_argument('--json', dest='json_path', help='Write results to this JSON file')
+    parser.add_argument('--compare', help='Earlier JSON results to compare p95 latency against')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    if args.seed:
+        print("Seeding database...")
+        seed_database(args.legislaturas.split(','), args.scale, args.random_seed)
+
+    params = sample_parameters(random.Random(args.random_seed))
+    counter = None if args.base_url else QueryCounter(get_engine())
+
+    results = {}
+    print(f"{args.clients} clients, {args.requests} requests per endpoint")
+    print(f"{'Endpoint':<38}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}{'queries':>9}{'KB':>8}{'err':>5}")
+    for name in args.endpoint or list(ENDPOINTS):
+        result = run_endpoint(ENDPOINTS[name], params, args.clients, args.requests,
+                              args.base_url, counter, args.random_seed)
+        results[name] = result
+        queries = '-' if result['queries_per_request'] is None else f"{result['queries_per_request']:.1f}"
+        print(f"{name:<38}{result['p50_ms']:>9.1f}{result['p95_ms']:>9.1f}{result['p99_ms']:>9.1f}"
+              f"{result['requests_per_sec']:>9.1f}{queries:>9}{result['avg_response_kb']:>8.1f}{result['errors']:>5}")
+
+    if counter:
+        counter.close()
+
+    output = {
+        'commit': git_commit(),
+        'clients': args.clients,
+        'requests': args.requests,
+        'mode': 'http' if args.base_url else 'in-process',
+        'endpoints': results,
+    }
+
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+        print(f"p95 latency vs {previous.get('commit') or args.compare}:")
+        for name, result in results.items():
+            before = previous.get('endpoints', {}).get(name)
+            if before:
+                change = (result['p95_ms'] - before['p95_ms']) / before['p95_ms'] if before['p95_ms'] else 0.0
+                print(f"  {name:<38}{before['p95_ms']:>9.1f} -> {result['p95_ms']:>9.1f} ms ({change:+.0%})")
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(output, f, indent=2)
+        print(f"Results written to {args.json_path}")
+
+
+if __name__ == '__main__':
+    main()
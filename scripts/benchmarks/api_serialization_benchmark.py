@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+API Serialization Benchmark
+
+Tracks payload size and serialization time for the large list endpoints.
+For each endpoint a synthetic page shaped like its real response is encoded
+with stock jsonify and with the app.utils.json_response pipeline, with and
+without a typical sparse fieldset, and compressed with gzip/brotli.
+
+No database is needed, so results are comparable between runs and machines.
+
+Usage:
+    python api_serialization_benchmark.py                  # Default sizes
+    python api_serialization_benchmark.py --items 500      # Items per page
+    python api_serialization_benchmark.py --json out.json  # Save results
+"""
+
+import sys
+import os
+import argparse
+import json
+import time
+import uuid
+from datetime import date
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from flask import Flask
+
+from app.utils.json_response import (
+    compress, dumps, parse_fields, select_fields, brotli, orjson
+)
+
+
+def deputado_item(i):
+    """Item shaped like deputado_to_dict output"""
+    deputado_id = str(uuid.uuid4())
+    return {
+        'deputado_id': deputado_id,
+        'id': deputado_id,
+        'id_cadastro': 1000 + i,
+        'nome': f'Deputado {i}',
+        'nome_completo': f'Deputado Número {i} da Silva Gonçalves',
+        'data_nascimento': date(1960 + i % 40, 1 + i % 12, 1 + i % 28).isoformat(),
+        'naturalidade': 'Lisboa',
+        'profissao': 'Jurista',
+        'legislatura_id': str(uuid.uuid4()),
+        'foto_url': None,
+        'picture_url': f'https://app.parlamento.pt/webutils/getimage.aspx?id={1000 + i}&type=deputado',
+        'sexo': 'F' if i % 2 else 'M',
+        'ativo': True,
+        'is_seated': True,
+        'mandate_status': 'Efetivo',
+        'partido_sigla': ('PS', 'PSD', 'CH', 'IL', 'L', 'PCP')[i % 6],
+        'circulo': 'Porto',
+        'legislatura_nome': 'XVII Legislatura',
+        'legislatura_numero': 'XVII',
+        'mandato_ativo': True,
+        'ultima_legislatura': 'XVII',
+        'career_info': {
+            'is_currently_active': True,
+            'is_seated': True,
+            'mandate_status': 'Efetivo',
+            'is_multi_term': False,
+            'total_mandates': 1,
+            'first_mandate': 'XVII',
+            'latest_mandate': 'XVII',
+            'parties_served': ['PS'],
+        },
+    }
+
+
+def votacao_item(i):
+    """Item shaped like a /votacoes budget vote"""
+    return {
+        'id': i,
+        'tipo': 'orcamento',
+        'data': date(2025, 1 + i % 12, 1 + i % 28).isoformat(),
+        'descricao': f'Proposta de alteração {i} ao artigo {i % 200} do Orçamento do Estado',
+        'resultado': 'Rejeitado' if i % 3 else 'Aprovado',
+        'votos_partidos': [
+            {'partido': sigla, 'voto': ('Favor', 'Contra', 'Abstenção')[(i + n) % 3]}
+            for n, sigla in enumerate(('PS', 'PSD', 'CH', 'IL', 'L', 'PCP', 'BE', 'PAN', 'JPP'))
+        ],
+        'total_partidos': 9,
+    }
+
+
+def intervencao_item(i):
+    """Item shaped like a /deputados/<cad_id>/atividades intervention"""
+    return {
+        'id': 50000 + i,
+        'tipo': 'Intervenção',
+        'qualidade': 'Deputado',
+        'sessao_numero': 1 + i % 4,
+        'data': date(2025, 1 + i % 12, 1 + i % 28).isoformat(),
+        'assunto': f'Debate de urgência sobre a matéria {i}',
+        'resumo': 'Resumo da intervenção ' * 10,
+        'sumario': 'Sumário da reunião plenária ' * 20,
+        'fase_sessao': 'Período da Ordem do Dia',
+        'publicacao': {
+            'pub_tipo': 'DAR I série', 'pub_data': '2025-03-01', 'pub_numero': str(i),
+            'paginas': '12-14', 'url_diario': f'https://debates.parlamento.pt/catalogo/r3/dar/01/15/01/{i:03d}',
+        },
+        'url_video': None,
+        'thumbnail_url': None,
+        'duracao_video': None,
+    }
+
+
+# endpoint -> (item factory, list key, typical list-view fieldset)
+ENDPOINTS = {
+    '/deputados': (deputado_item, 'deputados', 'nome,partido_sigla,circulo,picture_url,id_cadastro'),
+    '/partidos/<sigla>/deputados': (deputado_item, 'deputados', 'nome,mandato_ativo,picture_url,id_cadastro'),
+    '/votacoes': (votacao_item, 'votacoes', 'data,descricao,resultado'),
+    '/deputados/<cad_id>/atividades': (intervencao_item, 'intervencoes', 'tipo,data,assunto'),
+    '/feed/atividades': (intervencao_item, 'atividades', 'tipo,data,assunto'),
+}
+
+
+def time_call(func, repeat):
+    """Best-of-N wall time in milliseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def benchmark_endpoint(app, name, items_per_page, repeat):
+    """Measure one endpoint"""
+    factory, list_key, field_list = ENDPOINTS[name]
+    items = [factory(i) for i in range(items_per_page)]
+    fields = parse_fields(field_list)
+
+    full_payload = {list_key: items, 'total': len(items)}
+    sparse_payload = {list_key: [select_fields(item, fields) for item in items], 'total': len(items)}
+
+    with app.app_context():
+        baseline_body = app.json.response(full_payload).get_data()
+        baseline_ms = time_call(lambda: app.json.response(full_payload), repeat)
+
+    full_body = dumps(full_payload)
+    sparse_body = dumps(sparse_payload)
+
+    result = {
+        'endpoint': name,
+        'items': items_per_page,
+        'jsonify_bytes': len(baseline_body),
+        'jsonify_ms': round(baseline_ms, 3),
+        'encoder_bytes': len(full_body),
+        'encoder_ms': round(time_call(lambda: dumps(full_payload), repeat), 3),
+        'fields_bytes': len(sparse_body),
+        'fields_ms': round(time_call(
+            lambda: dumps({list_key: [select_fields(item, fields) for item in items]}), repeat
+        ), 3),
+        'gzip_bytes': len(compress(full_body, 'gzip')),
+        'gzip_ms': round(time_call(lambda: compress(full_body, 'gzip'), repeat), 3),
+        'fields_gzip_bytes': len(compress(sparse_body, 'gzip')),
+    }
+    if brotli is not None:
+        result['br_bytes'] = len(compress(full_body, 'br'))
+        result['br_ms'] = round(time_call(lambda: compress(full_body, 'br'), repeat), 3)
+    return result
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark list endpoint serialization',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--items', type=int, default=100, help='Items per page (default: 100)')
+    parser.add_argument('--repeat', type=int, default=20, help='Timing repetitions (default: 20)')
+    parser.add_argument('--json', dest='json_path', help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    results = [benchmark_endpoint(app, name, args.items, args.repeat) for name in ENDPOINTS]
+
+    print(f"Encoder: {'orjson' if orjson else 'stdlib json'}, "
+          f"brotli: {'available' if brotli else 'not installed'}, items/page: {args.items}")
+    print(f"{'Endpoint':<34}{'jsonify':>16}{'encoder':>16}{'fields':>16}{'gzip':>10}{'fields+gz':>11}")
+    for r in results:
+        print(
+            f"{r['endpoint']:<34}"
+            f"{r['jsonify_bytes']:>8}B {r['jsonify_ms']:>5.1f}ms"
+            f"{r['encoder_bytes']:>8}B {r['encoder_ms']:>5.1f}ms"
+            f"{r['fields_bytes']:>8}B {r['fields_ms']:>5.1f}ms"
+            f"{r['gzip_bytes']:>9}B"
+            f"{r['fields_gzip_bytes']:>10}B"
+        )
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.json_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Coalition Detection Benchmark
+
+Measures CoalitionDetector.detect (scripts/data_processing/mappers/
+coalition_detector.py) against the per-rule re.match loop it replaced,
+over a stream of party/coalition siglas shaped like an import run: every
+historical sigla, repeated per mandate with a skew towards the large
+parties, in the case and spacing variants found in the files.
+
+Siglas come from the database (distinct deputado_mandatos_legislativos.
+par_sigla and coligacoes.sigla) with --from-db, or from the built-in list
+of historical siglas otherwise. Three timings are reported: the original
+loop, the compiled classifier with a cold memo and with a warm memo.
+
+Usage:
+    python coalition_benchmark.py                  # Built-in siglas
+    python coalition_benchmark.py --from-db        # Siglas in the database
+    python coalition_benchmark.py --json out.json  # Save results
+"""
+
+import sys
+import os
+import argparse
+import json
+import random
+import re
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from scripts.data_processing.mappers.coalition_detector import CoalitionDetection, CoalitionDetector
+
+# Parties, coalitions and groups that held seats since the Constituent Assembly
+HISTORICAL_SIGLAS = (
+    'PS', 'PPD', 'PSD', 'PPD/PSD', 'CDS', 'CDS-PP', 'PCP', 'PEV', 'MDP/CDE', 'UDP', 'PPM',
+    'ASDI', 'UEDS', 'PRD', 'PSN', 'APU', 'CDU', 'AD', 'FRS', 'PAF', 'BE', 'PAN', 'L', 'LIVRE',
+    'IL', 'CH', 'JPP', 'PPD/PSD.CDS-PP', 'PPD/PSD.CDS-PP.PPM', 'PSD.CDS-PP', 'PSD-M', 'ID',
+    'INDEP', 'NINSC', 'PCTP/MRPP', 'PSR', 'POL-XXI', 'MDP', 'CDE', 'FEPU', 'UEDS/ASDI',
+)
+
+# Mandates per sigla are heavily skewed towards the governing parties
+HEAVY_SIGLAS = ('PS', 'PSD', 'PPD/PSD', 'CDS-PP', 'PCP', 'BE', 'CH')
+
+
+def loop_detect(detector, sigla):
+    """Original detection: known coalitions, then re.match per uncompiled rule"""
+    if not sigla or not sigla.strip():
+        return detector._create_negative_detection(sigla, "empty_sigla")
+    sigla = sigla.strip().upper()
+    if sigla in detector.known_coalitions:
+        return detector._detect_known_coalition(sigla)
+    for rule in detector.pattern_rules:
+        if re.match(rule["pattern"], sigla):
+            return CoalitionDetection(
+                is_coalition=True,
+                confidence=rule["confidence"],
+                coalition_sigla=sigla,
+                coalition_name=f"Coligação {sigla}",
+                component_parties=detector._extract_components_from_pattern(sigla, rule),
+                detection_method=f"pattern_match: {rule['description']}"
+            )
+    return detector._create_negative_detection(sigla, "individual_party")
+
+
+def database_siglas():
+    """Distinct siglas of mandates and coalitions in the database"""
+    from sqlalchemy import text
+    from database.connection import DatabaseSession
+
+    with DatabaseSession() as session:
+        rows = session.execute(text(
+            "SELECT DISTINCT par_sigla FROM deputado_mandatos_legislativos WHERE par_sigla IS NOT NULL "
+            "UNION SELECT sigla FROM coligacoes"
+        )).scalars().all()
+    return tuple(rows)
+
+
+def sigla_stream(siglas, count, seed):
+    """Lookups as mappers issue them: skewed, with case and spacing variants"""
+    rng = random.Random(seed)
+    weights = [20 if sigla in HEAVY_SIGLAS else 1 for sigla in siglas]
+    variants = (str, str.lower, lambda s: f' {s} ')
+    return [rng.choice(variants)(rng.choices(siglas, weights)[0]) for _ in range(count)]
+
+
+def time_call(func, repeat):
+    """Best-of-N wall time in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(
+        description='Benchmark the compiled coalition classifier',
+        epilog=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--lookups', type=int, default=200000, help='Detections per run')
+    parser.add_argument('--from-db', action='store_true', help='Use the siglas in the database')
+    parser.add_argument('--repeat', type=int, default=3, help='Repetitions (best time is kept)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    parser.add_argument('--json', dest='json_path', help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    siglas = database_siglas() if args.from_db else HISTORICAL_SIGLAS
+    stream = sigla_stream(siglas, args.lookups, args.seed)
+    detector = CoalitionDetector()
+
+    # Both paths must classify every sigla identically
+    mismatches = [s for s in set(stream) if loop_detect(detector, s) != detector._detect_sigla(s.strip().upper())]
+    if mismatches:
+        raise SystemExit(f"Classifier differs from the original loop for: {sorted(mismatches)}")
+
+    def cold():
+        detector.clear_memo()
+        for sigla in stream:
+            detector.detect(sigla)
+
+    results = {
+        'lookups': args.lookups,
+        'distinct_siglas': len(siglas),
+        'loop': time_call(lambda: [loop_detect(detector, s) for s in stream], args.repeat),
+        'compiled_cold': time_call(cold, args.repeat),
+    }
+    results['compiled_warm'] = time_call(lambda: [detector.detect(s) for s in stream], args.repeat)
+    info = detector.memo_info()
+    results['memo_hit_rate'] = round(info.hits / max(info.hits + info.misses, 1), 4)
+
+    print(f"{args.lookups:,} lookups over {len(siglas):,} distinct siglas")
+    print(f"{'Classifier':<16}{'time (s)':>12}{'ns/lookup':>12}{'speedup':>10}")
+    for key in ('loop', 'compiled_cold', 'compiled_warm'):
+        elapsed = results[key]
+        speedup = f"{results['loop'] / elapsed:>9.1f}x" if key != 'loop' and elapsed else ''
+        print(f"{key:<16}{elapsed:>12.4f}{elapsed / args.lookups * 1e9:>12.0f}{speedup:>10}")
+    print(f"Detection memo hit rate: {results['memo_hit_rate']:.1%}")
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.json_path}")
+
+
+if __name__ == '__main__':
+    main()
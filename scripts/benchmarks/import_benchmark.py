@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Import Benchmark
+
+Measures mapper throughput end-to-end (XML parse, validate_and_map, commit)
+on the synthetic corpus of import_corpus.py, per category:
+
+- records/sec over the best of N runs
+- SQL statements per record (counted with the import profiler)
+- peak Python memory of one run (tracemalloc, measured in a separate run so
+  it does not slow the timed ones); --no-intern disables the per-file string
+  table to compare memory with and without interning
+
+Runs against an in-memory SQLite stand-in by default, or a local PostgreSQL
+given with --database-url (a migrated schema is expected). Every run happens
+inside an outer transaction that is rolled back, so the database is left
+untouched; mapper commits only release savepoints.
+
+Some mappers rely on PostgreSQL coercing date strings and are skipped on
+SQLite (see SQLITE_UNSUPPORTED).
+
+Results can be saved as a baseline and later runs compared against it; the
+script exits with status 1 when a category's records/sec drops, or its
+statements/record grows, by more than --threshold.
+
+Usage:
+    python import_benchmark.py                                   # All categories, SQLite
+    python import_benchmark.py --category intervencoes --records 2000
+    python import_benchmark.py --no-intern                       # Without string interning
+    python import_benchmark.py --database-url postgresql://localhost/parliament_bench
+    python import_benchmark.py --save-baseline baseline.json     # Record a baseline
+    python import_benchmark.py --baseline baseline.json          # Fail on regressions
+"""
+
+import sys
+import os
+import argparse
+import gc
+import json
+import logging
+import tracemalloc
+import xml.etree.ElementTree as ET
+from typing import Dict, List
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import MetaData, create_engine
+from sqlalchemy.orm import Session
+
+from database.models import Base
+from scripts.benchmarks.import_corpus import CORPUS_SPECS, CorpusGenerator
+from scripts.data_processing.import_profiler import ImportProfiler, profile_phase
+from scripts.data_processing.mappers.enhanced_base_mapper import EnhancedSchemaMapper
+
+# Mappers that pass date strings to Date columns (accepted by PostgreSQL only)
+SQLITE_UNSUPPORTED = frozenset(('iniciativas', 'peticoes'))
+
+
+def create_sqlite_engine(url: str = 'sqlite://'):
+    """In-memory (or file) SQLite with the models' tables (PostgreSQL-only indexes left out)"""
+    engine = create_engine(url)
+    metadata = MetaData()
+    for table in Base.metadata.sorted_tables:
+        table.to_metadata(metadata).indexes.clear()
+    metadata.create_all(engine)
+    return engine
+
+
+def import_file(engine, category: str, file_name: str, content: bytes, profiler: ImportProfiler = None) -> Dict:
+    """Parse and map one file in a rolled-back transaction; returns the mapper results"""
+    mapper_class = CORPUS_SPECS[category].mapper
+    file_info = {'file_path': file_name, 'file_type': category, 'skip_video_processing': True}
+    with engine.connect() as conn:
+        outer = conn.begin()
+        session = Session(bind=conn, join_transaction_mode='create_savepoint')
+        try:
+            with profile_phase(profiler, 'parse'):
+                xml_root = ET.fromstring(content)
+            mapper = mapper_class(session, import_status_record=None)
+            mapper.profiler = profiler
+            with profile_phase(profiler, 'intern'):
+                mapper.intern_tree(xml_root)
+            with profile_phase(profiler, 'mapper'):
+                results = mapper.validate_and_map(xml_root, file_info, False)
+            with profile_phase(profiler, 'commit'):
+                session.commit()
+        finally:
+            session.close()
+            outer.rollback()
+    return results
+
+
+def benchmark_category(engine, category: str, records: int, seed: int, repeat: int) -> Dict:
+    """Best-of-N throughput, statements/record and peak memory of one category"""
+    file_name, content = CorpusGenerator(category, seed).generate(records)
+
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        profiler = ImportProfiler(engine)
+        with profiler:
+            results = import_file(engine, category, file_name, content, profiler)
+        if results.get('errors'):
+            raise RuntimeError(f"{category}: {results['errors'][0][:200]}")
+        profile = profiler.to_dict()
+        if best is None or profile['wall_seconds'] < best[1]['wall_seconds']:
+            best = (results, profile)
+    results, profile = best
+
+    gc.collect()
+    tracemalloc.start()
+    import_file(engine, category, file_name, content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    processed = results.get('records_processed') or records
+    return {
+        'records': processed,
+        'file_kb': round(len(content) / 1024, 1),
+        'seconds': profile['wall_seconds'],
+        'records_per_sec': round(processed / profile['wall_seconds'], 1),
+        'statements_per_record': round(profile['sql_statements'] / processed, 2),
+        'rows_written': profile['rows_written'],
+        'peak_memory_mb': round(peak / 1024 / 1024, 1),
+        'phases': {name: p['wall_seconds'] for name, p in profile['phases'].items()},
+    }
+
+
+def compare_to_baseline(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """
+    Regressions of results against a baseline.
+
+    Returns:
+        One message per category whose records/sec dropped, or whose
+        statements/record grew, by more than threshold (a fraction)
+    """
+    regressions = []
+    for category, current in results.items():
+        previous = baseline.get(category)
+        if not previous or 'error' in current or 'error' in previous:
+            continue
+        if current['records_per_sec'] < previous['records_per_sec'] * (1 - threshold):
+            regressions.append(
+                f"{category}: records/sec {previous['records_per_sec']:.0f} -> {current['records_per_sec']:.0f}"
+            )
+        if current['statements_per_record'] > previous['statements_per_record'] * (1 + threshold):
+            regressions.append(
+                f"{category}: statements/record {previous['statements_per_record']:.2f} -> "
+                f"{current['statements_per_record']:.2f}"
+            )
+    return regressions
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(
+        description='Benchmark mapper import throughput on a synthetic corpus',
+        epilog=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--category', choices=sorted(CORPUS_SPECS), action='append',
+                        help='Category to benchmark (repeatable, default: all)')
+    parser.add_argument('--records', type=int, default=500, help='Records per file')
+    parser.add_argument('--repeat', type=int, default=3, help='Repetitions (best time is kept)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    parser.add_argument('--database-url', help='PostgreSQL URL (default: in-memory SQLite)')
+    parser.add_argument('--no-intern', action='store_true', help='Disable the per-file string table')
+    parser.add_argument('--json', dest='json_path', help='Write results to this JSON file')
+    parser.add_argument('--save-baseline', help='Write results as a baseline to this JSON file')
+    parser.add_argument('--baseline', help='Compare against this baseline and exit 1 on regressions')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Allowed regression as a fraction (default: 0.2)')
+    args = parser.parse_args()
+
+    # Mappers log every record; keep the output clean
+    logging.disable(logging.WARNING)
+
+    if args.no_intern:
+        EnhancedSchemaMapper.INTERN_STRINGS = False
+
+    engine = create_engine(args.database_url) if args.database_url else create_sqlite_engine()
+    on_sqlite = engine.dialect.name == 'sqlite'
+
+    results = {}
+    print(f"{args.records:,} records per file, {engine.dialect.name}")
+    print(f"{'Category':<22}{'rec/s':>10}{'stmt/rec':>10}{'peak MB':>10}{'seconds':>10}")
+    for category in args.category or sorted(CORPUS_SPECS):
+        if on_sqlite and category in SQLITE_UNSUPPORTED:
+            print(f"{category:<22}{'(needs PostgreSQL)':>40}")
+            continue
+        try:
+            result = benchmark_category(engine, category, args.records, args.seed, args.repeat)
+        except Exception as e:
+            results[category] = {'error': str(e)}
+            print(f"{category:<22}  ERROR: {str(e)[:120]}")
+            continue
+        results[category] = result
+        print(f"{category:<22}{result['records_per_sec']:>10,.0f}{result['statements_per_record']:>10.2f}"
+              f"{result['peak_memory_mb']:>10.1f}{result['seconds']:>10.3f}")
+
+    for path in (args.json_path, args.save_baseline):
+        if path:
+            with open(path, 'w') as f:
+                json.dump(results, f, indent=2)
+            print(f"Results written to {path}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        if regressions:
+            print(f"Regressions beyond {args.threshold:.0%}:")
+            for message in regressions:
+                print(f"  {message}")
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Synthetic Import Corpus
+
+Seeded, scalable XML files for the import benchmark. The shape of each file
+is derived from its mapper's get_expected_fields(): the dotted paths are
+turned into an element tree, the record element (the root's child) is
+repeated `records` times and list elements inside a record are repeated a
+few times each. Because only expected paths are generated, every file
+passes schema coverage validation.
+
+Leaf values are synthesized from the field name (ids, dates, flags, party
+acronyms, names) so mappers exercise their real conversion paths. Schema
+versions that a mapper treats as alternatives (e.g. RegistoInteressesV1/V2
+/V3/V5) are reduced to one via the spec's `drop` prefixes.
+
+Usage:
+    python import_corpus.py --category intervencoes --records 500 --out /tmp/corpus
+"""
+
+import sys
+import os
+import argparse
+import random
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from scripts.data_processing.mappers import (
+    AgendaParlamentarMapper,
+    AtividadeDeputadosMapper,
+    InitiativasMapper,
+    IntervencoesMapper,
+    PeticoesMapper,
+    RegistoBiograficoMapper,
+    RegistoInteressesMapper,
+)
+
+LEGISLATURA = 'XV'  # Default legislature of generated files
+PARTIES = ('PS', 'PSD', 'CH', 'IL', 'BE', 'PCP', 'L', 'PAN', 'CDS-PP')
+FIRST_NAMES = ('Ana', 'João', 'Maria', 'Pedro', 'Inês', 'Rui', 'Sofia', 'Miguel', 'Catarina', 'José')
+LAST_NAMES = ('Silva', 'Santos', 'Ferreira', 'Pereira', 'Costa', 'Oliveira', 'Gonçalves', 'Martins')
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """How to generate files for one mapper category"""
+    mapper: type
+    file_name: str  # Template with {legislatura}; the mapper reads the legislature from the name
+    drop: Tuple[str, ...] = ()  # Path prefixes not generated (alternative schema versions)
+    list_size: int = 3  # Repetitions of each repeatable element inside a record
+    values: Dict[str, str] = field(default_factory=dict)  # Leaf tag -> fixed value
+
+
+CORPUS_SPECS: Dict[str, CorpusSpec] = {
+    'intervencoes': CorpusSpec(IntervencoesMapper, 'Intervencoes{legislatura}.xml'),
+    'agenda_parlamentar': CorpusSpec(AgendaParlamentarMapper, 'AgendaParlamentar{legislatura}.xml'),
+    'atividade_deputados': CorpusSpec(AtividadeDeputadosMapper, 'AtividadeDeputado{legislatura}.xml'),
+    'iniciativas': CorpusSpec(InitiativasMapper, 'Iniciativas{legislatura}.xml'),
+    'peticoes': CorpusSpec(
+        PeticoesMapper, 'Peticoes{legislatura}.xml',
+        drop=('Peticoes_DetalhePesquisaPeticoesOut',),
+    ),
+    'registo_biografico': CorpusSpec(RegistoBiograficoMapper, 'RegistoBiografico{legislatura}.xml'),
+    'registo_interesses': CorpusSpec(
+        RegistoInteressesMapper, 'RegistoInteresses{legislatura}.xml',
+        drop=tuple(f'ArrayOfRegistoInteresses.RegistoInteresses.RegistoInteresses{v}' for v in ('V1', 'V2', 'V5')),
+    ),
+}
+
+
+class _Node:
+    __slots__ = ('tag', 'children')
+
+    def __init__(self, tag: str):
+        self.tag = tag
+        self.children: Dict[str, '_Node'] = {}
+
+
+def schema_tree(expected_fields, drop: Tuple[str, ...] = ()) -> Optional[_Node]:
+    """Element tree of the dotted paths in expected_fields (None if they are not dotted paths)"""
+    paths = sorted(p for p in expected_fields if not any(p == d or p.startswith(d + '.') for d in drop))
+    roots: Dict[str, _Node] = {}
+    for path in paths:
+        parts = path.split('.')
+        node = roots.setdefault(parts[0], _Node(parts[0]))
+        for part in parts[1:]:
+            node = node.children.setdefault(part, _Node(part))
+    if not roots:
+        return None
+    # Several roots: pick the deepest (others are legacy layouts)
+    return max(roots.values(), key=_depth)
+
+
+def _depth(node: _Node) -> int:
+    return 1 + max((_depth(child) for child in node.children.values()), default=0)
+
+
+def _is_list(node: _Node) -> bool:
+    """Wrapper elements holding one record type (e.g. <Autores><pt_..._AutoresOut>)"""
+    return len(node.children) == 1 and next(iter(node.children.values())).children != {}
+
+
+class CorpusGenerator:
+    """Seeded generator of one category's files"""
+
+    def __init__(self, category: str, seed: int = 42, legislatura: str = LEGISLATURA):
+        self.category = category
+        self.legislatura = legislatura
+        self.spec = CORPUS_SPECS[category]
+        self.rng = random.Random(seed)
+        self._sequence = 0
+        mapper = self.spec.mapper.__new__(self.spec.mapper)
+        self.root = schema_tree(mapper.get_expected_fields(), self.spec.drop)
+        if self.root is None or not self.root.children:
+            raise ValueError(f"Mapper for {category} has no dotted expected fields")
+
+    def _next_id(self) -> int:
+        self._sequence += 1
+        return self._sequence
+
+    def _value(self, tag: str) -> str:
+        """Plausible text for a leaf, chosen from its name"""
+        if tag in self.spec.values:
+            return self.spec.values[tag]
+        rng = self.rng
+        lower = tag.lower()
+        if lower.endswith(('id', 'cod', 'nr', 'numero', 'num')) or lower.startswith(('id', 'nr', 'num')):
+            return str(self._next_id())
+        if 'data' in lower or 'date' in lower or lower.startswith('dt') or 'dt' in lower[:5]:
+            return (date(2022, 3, 29) + timedelta(days=rng.randint(0, 900))).isoformat()
+        if 'url' in lower or 'link' in lower:
+            return f'https://www.parlamento.pt/synthetic/{self._next_id()}'
+        if 'hora' in lower or 'time' in lower:
+            return f'{rng.randint(9, 20):02d}:{rng.choice((0, 15, 30, 45)):02d}:00'
+        if 'sigla' in lower or 'partido' in lower or 'gp' == lower[-2:]:
+            return rng.choice(PARTIES)
+        if 'sexo' in lower or 'gender' in lower:
+            return rng.choice(('M', 'F'))
+        if 'nome' in lower or 'name' in lower:
+            return f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {rng.choice(LAST_NAMES)}'
+        if 'leg' == lower[-3:] or 'legislatura' in lower:
+            return self.legislatura
+        if lower.startswith(('is', 'flag')) or lower.endswith(('flag', 'ativo')):
+            return rng.choice(('true', 'false'))
+        return f'{tag} {rng.randint(1, 999)}'
+
+    def _build(self, node: _Node, parent: ET.Element) -> None:
+        element = ET.SubElement(parent, node.tag)
+        if not node.children:
+            element.text = self._value(node.tag)
+            return
+        repeat = self.rng.randint(1, self.spec.list_size) if _is_list(node) else 1
+        for _ in range(repeat):
+            for child in node.children.values():
+                self._build(child, element)
+
+    def generate(self, records: int) -> Tuple[str, bytes]:
+        """
+        Build one file.
+
+        Returns:
+            (file name, UTF-8 XML bytes)
+        """
+        root = ET.Element(self.root.tag)
+        record_nodes = list(self.root.children.values())
+        for _ in range(records):
+            for node in record_nodes:
+                self._build(node, root)
+        file_name = self.spec.file_name.format(legislatura=self.legislatura)
+        return file_name, ET.tostring(root, encoding='utf-8', xml_declaration=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic import corpus')
+    parser.add_argument('--category', choices=sorted(CORPUS_SPECS), action='append',
+                        help='Category to generate (repeatable, default: all)')
+    parser.add_argument('--records', type=int, default=200, help='Records per file')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    parser.add_argument('--legislatura', default=LEGISLATURA, help='Legislature of the files')
+    parser.add_argument('--out', required=True, help='Output directory')
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    for category in args.category or sorted(CORPUS_SPECS):
+        file_name, content = CorpusGenerator(category, args.seed, args.legislatura).generate(args.records)
+        path = os.path.join(args.out, file_name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        print(f"{category:<22}{len(content) / 1024:>10.0f} KB  {path}")
+
+
+if __name__ == '__main__':
+    main()
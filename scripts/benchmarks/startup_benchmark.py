@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+
+Measures cold-start latency of the API: each run starts a fresh Python
+process that imports the app and serves its first requests through a Flask
+test client, timing
+
+- import: `from app.main import app` (modules, blueprints, models)
+- first response: the first request to each --path, in order
+
+With the defaults, /api/ping shows when the app can answer at all and
+/api/health when the first database round trip (credentials, engine, pool
+connection) is done. Runs against the database configured for the app.
+
+The child environment is the current one, so the effect of the bootstrap
+settings can be compared, e.g. DB_POOL_PREWARM=2 (background pool pre-warm),
+DB_CREDENTIALS_CACHE_FILE (credentials reused across processes) or
+API_LAZY_BLUEPRINTS=1 (blueprints and models loaded in the background).
+
+--check-import-budget compares the cumulative `python -X importtime` cost
+of app.main with API_LAZY_BLUEPRINTS=1 and =0 (best of --runs each) and
+exits with status 1 when the lazy import exceeds --import-budget seconds
+or IMPORT_BUDGET_FRACTION of the eager one.
+
+Usage:
+    python startup_benchmark.py                                  # 5 runs, /api/ping then /api/health
+    python startup_benchmark.py --runs 10 --path /api/ready
+    DB_POOL_PREWARM=2 python startup_benchmark.py --json prewarm.json
+    API_LAZY_BLUEPRINTS=1 python startup_benchmark.py --json lazy.json
+    python startup_benchmark.py --check-import-budget            # Fail when the lazy import is too slow
+"""
+
+import sys
+import os
+import argparse
+import json
+import re
+import statistics
+import subprocess
+from typing import Dict, List
+
+# Add project root to path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+# Cumulative import time allowed for `import app.main` with API_LAZY_BLUEPRINTS=1
+IMPORT_BUDGET_SECONDS = float(os.getenv('STARTUP_IMPORT_BUDGET_SECONDS', '2.0'))
+# ... and as a fraction of the eager import measured on the same machine
+IMPORT_BUDGET_FRACTION = 0.7
+
+# Runs in the child process; prints one JSON line of timings in milliseconds
+CHILD_SCRIPT = '''
+import json, logging, sys, time
+started = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+from app.main import app
+logging.disable(logging.WARNING)
+timings = {'import': (time.perf_counter() - started) * 1000}
+client = app.test_client()
+for path in sys.argv[2:]:
+    status = client.get(path).status_code
+    timings[path] = (time.perf_counter() - started) * 1000
+    timings[path + ' status'] = status
+print(json.dumps(timings))
+'''
+
+
+def run_once(paths: List[str]) -> Dict:
+    """Start a fresh interpreter and return its timings (ms since process start of the script)"""
+    result = subprocess.run(
+        [sys.executable, '-c', CHILD_SCRIPT, os.path.abspath(PROJECT_ROOT or '.'), *paths],
+        capture_output=True, text=True, cwd=PROJECT_ROOT or None,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'child failed')
+    # The app prints during import; the timings are the last line
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def import_seconds(lazy: bool) -> float:
+    """Cumulative `python -X importtime` cost of app.main in a fresh interpreter"""
+    env = dict(os.environ, API_LAZY_BLUEPRINTS='1' if lazy else '0', PYTHONDONTWRITEBYTECODE='1')
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app.main'],
+        capture_output=True, text=True, cwd=os.path.abspath(PROJECT_ROOT or '.'), env=env,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'child failed')
+    match = re.search(r'^import time:\s+\d+ \|\s+(\d+) \| app\.main$', result.stderr, re.MULTILINE)
+    return int(match.group(1)) / 1e6
+
+
+def check_import_budget(runs: int, budget: float) -> bool:
+    """Whether the lazy import of app.main is within budget (best of runs, lazy and eager)"""
+    lazy = min(import_seconds(True) for _ in range(runs))
+    eager = min(import_seconds(False) for _ in range(runs))
+    within = lazy < budget and lazy < eager * IMPORT_BUDGET_FRACTION
+    print(f"Import of app.main: lazy {lazy:.2f}s, eager {eager:.2f}s "
+          f"(budget {budget:.2f}s and {IMPORT_BUDGET_FRACTION:.0%} of eager): {'ok' if within else 'OVER BUDGET'}")
+    return within
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(
+        description='Benchmark API import-to-first-response latency',
+        epilog=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--runs', type=int, default=5, help='Fresh processes to start')
+    parser.add_argument('--path', action='append',
+                        help='Request path, in order (repeatable, default: /api/ping and /api/health)')
+    parser.add_argument('--json', dest='json_path', help='Write results to this JSON file')
+    parser.add_argument('--check-import-budget', action='store_true',
+                        help='Only check the lazy import cost against the budget (exit 1 when over)')
+    parser.add_argument('--import-budget', type=float, default=IMPORT_BUDGET_SECONDS,
+                        help='Seconds allowed for the lazy import (default: %(default)s)')
+    args = parser.parse_args()
+
+    if args.check_import_budget:
+        sys.exit(0 if check_import_budget(args.runs, args.import_budget) else 1)
+
+    paths = args.path or ['/api/ping', '/api/health']
+    runs = [run_once(paths) for _ in range(args.runs)]
+
+    results = {}
+    print(f"{args.runs} cold starts")
+    print(f"{'Milestone':<28}{'best ms':>10}{'median ms':>11}{'worst ms':>10}{'status':>8}")
+    for milestone in ['import'] + paths:
+        values = [run[milestone] for run in runs]
+        statuses = sorted({run.get(milestone + ' status') for run in runs} - {None})
+        results[milestone] = {
+            'best_ms': round(min(values), 1),
+            'median_ms': round(statistics.median(values), 1),
+            'worst_ms': round(max(values), 1),
+            'status': statuses,
+        }
+        status = ','.join(str(s) for s in statuses) or '-'
+        print(f"{milestone:<28}{min(values):>10.1f}{statistics.median(values):>11.1f}{max(values):>10.1f}{status:>8}")
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump({'runs': args.runs, 'milestones': results}, f, indent=2)
+        print(f"Results written to {args.json_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+Active Entity Flags
+===================
+
+Materializes which parties, coalitions and deputies have mandates in each
+legislature into the active_entities table.
+
+Partido.is_active, Coligacao.is_active and Deputado.is_active used to open a
+session per instance and scan deputado_mandatos_legislativos with
+leg_des LIKE '%XVII%', which no index can serve. The flags only change when
+mandates are imported, so they are derived once with one INSERT ... SELECT
+per entity type and read through active_entity_clause() - an indexed EXISTS
+that also works as a filter or column in set-based queries:
+
+    session.query(Coligacao).filter(Coligacao.is_active)
+    session.query(Coligacao, Coligacao.is_active)
+
+The flags span all legislatures while biographical files of different
+legislatures are imported in parallel, so they are rebuilt once when an
+import run completes (post_import.refresh_after_import_run) rather than per
+file; rebuild() also backfills by hand.
+
+Usage:
+    python scripts/data_processing/active_entities.py
+"""
+
+import logging
+import os
+import sys
+from typing import Callable, Dict, Iterable
+
+from sqlalchemy import String, Uuid, cast, delete, func, insert, literal, or_, select
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from database.models import ActiveEntity, Coligacao, DeputadoMandatoLegislativo, Partido
+
+logger = logging.getLogger(__name__)
+
+
+def _deputy_mandates():
+    return select(
+        DeputadoMandatoLegislativo.deputado_id.label('entity_id'),
+        DeputadoMandatoLegislativo.leg_des.label('legislatura_numero'),
+    )
+
+
+def _party_mandates():
+    return select(
+        Partido.id.label('entity_id'),
+        DeputadoMandatoLegislativo.leg_des.label('legislatura_numero'),
+    ).join(DeputadoMandatoLegislativo, DeputadoMandatoLegislativo.par_sigla == Partido.sigla)
+
+
+def _coalition_mandates():
+    return select(
+        Coligacao.id.label('entity_id'),
+        DeputadoMandatoLegislativo.leg_des.label('legislatura_numero'),
+    ).join(DeputadoMandatoLegislativo, or_(
+        DeputadoMandatoLegislativo.coligacao_id == Coligacao.id,
+        DeputadoMandatoLegislativo.par_sigla == Coligacao.sigla,
+    ))
+
+
+# Entity type -> () -> select(entity_id, legislatura_numero) over the mandates
+ACTIVE_ENTITY_SOURCES: Dict[str, Callable] = {
+    'deputado': _deputy_mandates,
+    'partido': _party_mandates,
+    'coligacao': _coalition_mandates,
+}
+
+
+def active_entities_select(entity_type: str):
+    """SELECT producing the active_entities rows of one entity type"""
+    mandates = ACTIVE_ENTITY_SOURCES[entity_type]()
+    mandates = mandates.where(DeputadoMandatoLegislativo.leg_des.isnot(None)).distinct().subquery()
+    row_id = cast(func.md5(func.concat(
+        entity_type, ':', cast(mandates.c.entity_id, String), ':', mandates.c.legislatura_numero
+    )), Uuid)
+    return select(
+        row_id.label('id'),
+        literal(entity_type).label('entity_type'),
+        mandates.c.entity_id,
+        mandates.c.legislatura_numero,
+    )
+
+
+def sync_active_entities(session, entity_types: Iterable[str] = None) -> Dict[str, int]:
+    """
+    Replace the active flags derived from the mandates.
+
+    Runs in the caller's transaction (the caller commits). Pending ORM changes
+    are flushed first so mandates added during the current import count.
+
+    Args:
+        session: SQLAlchemy session
+        entity_types: Keys of ACTIVE_ENTITY_SOURCES to refresh (all when empty)
+
+    Returns:
+        Dictionary of entity type -> rows inserted
+    """
+    session.flush()
+    counts = {}
+    for entity_type in entity_types or ACTIVE_ENTITY_SOURCES:
+        session.execute(delete(ActiveEntity).where(ActiveEntity.entity_type == entity_type))
+        result = session.execute(insert(ActiveEntity).from_select(
+            ['id', 'entity_type', 'entity_id', 'legislatura_numero'],
+            active_entities_select(entity_type),
+        ))
+        counts[entity_type] = result.rowcount
+        logger.debug(f"Active flags for {entity_type}: {result.rowcount} rows")
+    return counts
+
+
+def rebuild() -> Dict[str, int]:
+    """Rebuild every active flag and commit"""
+    from database.connection import DatabaseSession
+
+    with DatabaseSession() as session:
+        counts = sync_active_entities(session)
+        session.commit()
+    return counts
+
+
+if __name__ == "__main__":
+    for entity_type, count in rebuild().items():
+        print(f"  {entity_type:<12} {count:>8,} active flags")
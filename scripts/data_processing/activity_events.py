@@ -0,0 +1,216 @@
+"""
+Activity Event Builder
+======================
+
+Derives the denormalized activity_events timeline from the source tables.
+
+Each source (initiatives, interventions, questions/requests, activities,
+petitions, delegations) is described by an ActivitySource and turned into a
+single INSERT ... SELECT, so a legislature is refreshed with one statement per
+source instead of row-by-row inserts. Event ids are an md5 of
+(source table, source id, id_cadastro), which keeps them - and the keyset
+cursors built from them - stable across rebuilds.
+
+Mappers call sync_activity_events() for their own sources at the end of each
+file (inside the import transaction); the rebuild script backfills everything.
+
+Usage:
+    from scripts.data_processing.activity_events import rebuild_activity_events
+
+    with DatabaseSession() as session:
+        counts = rebuild_activity_events(session)
+        session.commit()
+"""
+
+import logging
+import os
+import sys
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional
+
+from sqlalchemy import Integer, String, Uuid, case, cast, delete, func, insert, literal, null, select, true
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from database.models import (
+    ActivityEvent, AtividadeParlamentar, DelegacaoEventual, DelegacaoEventualParticipante,
+    Deputado, IniciativaAutorDeputado, IniciativaEvento, IniciativaParlamentar,
+    IntervencaoDeputado, IntervencaoParlamentar, PerguntaRequerimento,
+    PerguntaRequerimentoAutor, PeticaoParlamentar,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ActivitySource:
+    """How to derive activity events from one source table"""
+    model: type
+    event_type: Callable  # () -> SQL expression for event_type
+    event_date: Optional[Callable]  # () -> SQL expression for event_date
+    title: Callable  # () -> SQL expression for title
+    authors: Optional[Callable] = None  # () -> select(source_id, id_cadastro)
+    date_subquery: Optional[Callable] = None  # () -> subquery(source_id, event_date), replaces event_date
+
+    @property
+    def table_name(self) -> str:
+        return self.model.__tablename__
+
+
+def _initiative_dates():
+    """First event date of each initiative (initiatives carry no date of their own)"""
+    return select(
+        IniciativaEvento.iniciativa_id.label('source_id'),
+        func.min(IniciativaEvento.data_fase).label('event_date')
+    ).group_by(IniciativaEvento.iniciativa_id).subquery()
+
+
+ACTIVITY_SOURCES: Dict[str, ActivitySource] = {
+    'iniciativa': ActivitySource(
+        model=IniciativaParlamentar,
+        event_type=lambda: literal('iniciativa'),
+        event_date=None,
+        date_subquery=_initiative_dates,
+        title=lambda: IniciativaParlamentar.ini_titulo,
+        authors=lambda: select(
+            IniciativaAutorDeputado.iniciativa_id.label('source_id'),
+            IniciativaAutorDeputado.id_cadastro.label('id_cadastro')
+        ),
+    ),
+    'intervencao': ActivitySource(
+        model=IntervencaoParlamentar,
+        event_type=lambda: literal('intervencao'),
+        event_date=lambda: IntervencaoParlamentar.data_reuniao_plenaria,
+        title=lambda: func.coalesce(IntervencaoParlamentar.debate, IntervencaoParlamentar.tipo_intervencao),
+        authors=lambda: select(
+            IntervencaoDeputado.intervencao_id.label('source_id'),
+            IntervencaoDeputado.id_cadastro.label('id_cadastro')
+        ),
+    ),
+    'pergunta_requerimento': ActivitySource(
+        model=PerguntaRequerimento,
+        event_type=lambda: case(
+            (PerguntaRequerimento.tipo.ilike('pergunta%'), 'pergunta'),
+            else_='requerimento'
+        ),
+        event_date=lambda: PerguntaRequerimento.dt_entrada,
+        title=lambda: PerguntaRequerimento.assunto,
+        authors=lambda: select(
+            PerguntaRequerimentoAutor.pergunta_requerimento_id.label('source_id'),
+            PerguntaRequerimentoAutor.id_cadastro.label('id_cadastro')
+        ),
+    ),
+    'atividade': ActivitySource(
+        model=AtividadeParlamentar,
+        event_type=lambda: literal('atividade'),
+        event_date=lambda: AtividadeParlamentar.data_atividade,
+        title=lambda: func.coalesce(AtividadeParlamentar.assunto, AtividadeParlamentar.desc_tipo),
+    ),
+    'peticao': ActivitySource(
+        model=PeticaoParlamentar,
+        event_type=lambda: literal('peticao'),
+        event_date=lambda: PeticaoParlamentar.pet_data_entrada,
+        title=lambda: PeticaoParlamentar.pet_assunto,
+    ),
+    'delegacao': ActivitySource(
+        model=DelegacaoEventual,
+        event_type=lambda: literal('delegacao'),
+        event_date=lambda: DelegacaoEventual.data_inicio,
+        title=lambda: DelegacaoEventual.nome,
+        authors=lambda: select(
+            DelegacaoEventualParticipante.delegacao_id.label('source_id'),
+            Deputado.id_cadastro.label('id_cadastro')
+        ).join(Deputado, DelegacaoEventualParticipante.deputado_id == Deputado.id),
+    ),
+}
+
+
+def activity_events_select(source: ActivitySource, legislatura_id=None):
+    """
+    Build the SELECT producing activity_events rows for a source.
+
+    Sources with authors yield one row per distinct deputy (or a single row
+    with NULL id_cadastro when nobody is linked); the first row per source
+    record is flagged as the feed entry.
+    """
+    model = source.model
+    joined = model.__table__
+
+    if source.authors is not None:
+        authors = source.authors()
+        # Authors known only by name cannot be linked to a person
+        authors = authors.where(authors.selected_columns.id_cadastro.isnot(None)).distinct().subquery()
+        joined = joined.outerjoin(authors, authors.c.source_id == model.id)
+        id_cadastro = authors.c.id_cadastro
+        is_feed_entry = func.row_number().over(
+            partition_by=model.id, order_by=id_cadastro.asc().nulls_first()
+        ) == 1
+    else:
+        id_cadastro = cast(null(), Integer)
+        is_feed_entry = true()
+
+    if source.date_subquery is not None:
+        dates = source.date_subquery()
+        joined = joined.outerjoin(dates, dates.c.source_id == model.id)
+        event_date = dates.c.event_date
+    else:
+        event_date = source.event_date()
+
+    event_id = cast(func.md5(func.concat(
+        source.table_name, ':', cast(model.id, String), ':',
+        func.coalesce(cast(id_cadastro, String), '')
+    )), Uuid)
+
+    query = select(
+        event_id.label('id'),
+        id_cadastro.label('id_cadastro'),
+        source.event_type().label('event_type'),
+        event_date.label('event_date'),
+        source.title().label('title'),
+        literal(source.table_name).label('source_table'),
+        model.id.label('source_id'),
+        model.legislatura_id.label('legislatura_id'),
+        is_feed_entry.label('is_feed_entry'),
+    ).select_from(joined)
+
+    if legislatura_id is not None:
+        query = query.where(model.legislatura_id == legislatura_id)
+    return query
+
+
+def sync_activity_events(session, source_keys: Iterable[str], legislatura_id=None) -> Dict[str, int]:
+    """
+    Replace the activity events derived from the given sources.
+
+    Runs in the caller's transaction (the caller commits). Pending ORM changes
+    are flushed first so rows added during the current import are included.
+
+    Args:
+        session: SQLAlchemy session
+        source_keys: Keys of ACTIVITY_SOURCES to refresh
+        legislatura_id: Optional legislature to scope the refresh to
+
+    Returns:
+        Dictionary of source key -> rows inserted
+    """
+    session.flush()
+    counts = {}
+    for key in source_keys:
+        source = ACTIVITY_SOURCES[key]
+        stmt = delete(ActivityEvent).where(ActivityEvent.source_table == source.table_name)
+        if legislatura_id is not None:
+            stmt = stmt.where(ActivityEvent.legislatura_id == legislatura_id)
+        session.execute(stmt)
+
+        columns = ['id', 'id_cadastro', 'event_type', 'event_date', 'title',
+                   'source_table', 'source_id', 'legislatura_id', 'is_feed_entry']
+        result = session.execute(
+            insert(ActivityEvent).from_select(columns, activity_events_select(source, legislatura_id))
+        )
+        counts[key] = result.rowcount
+        logger.debug(f"Activity events for {key}: {result.rowcount} rows")
+    return counts
+
+
+def rebuild_activity_events(session, source_keys: Iterable[str] = None, legislatura_id=None) -> Dict[str, int]:
+    """Rebuild the timeline for all (or the given) sources (caller commits)"""
+    return sync_activity_events(session, source_keys or list(ACTIVITY_SOURCES), legislatura_id)
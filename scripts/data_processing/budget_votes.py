@@ -0,0 +1,237 @@
+"""
+State Budget Vote Matrix
+========================
+
+Party x votacao matrix of the Orçamento do Estado votes.
+
+Each orcamento_estado_votacoes row stores the position of every
+parliamentary group in votos_partidos (JSONB, {sigla: voto}, GIN indexed)
+and its legislature, so a party's budget vote history is one indexed read
+(votos_partidos ? 'PS') instead of a query per vote. Per-party totals are
+precomputed into orcamento_estado_partido_voto_stats.
+
+The OE mapper fills the matrix from the GruposParlamentares element, whose
+GrupoParlamentar and Voto children alternate, and refreshes the legislature's
+stats after each file. rebuild() backfills votes imported before the matrix
+existed from grupos_parlamentares_texto ('PS; PSD; Voto: Favor; Voto: Contra').
+
+Usage:
+    python scripts/data_processing/budget_votes.py
+    python scripts/data_processing/budget_votes.py --legislatura XVI
+"""
+
+import logging
+import os
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import String, Uuid, bindparam, cast, delete, func, insert, select, update
+from sqlalchemy.orm import aliased
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from database.models import (
+    OrcamentoEstadoItem, OrcamentoEstadoPartidoVotoStats, OrcamentoEstadoPropostaAlteracao,
+    OrcamentoEstadoVotacao, Partido,
+)
+from scripts.data_processing.name_normalization import fold
+from scripts.data_processing.rebuild_cli import rebuild_for_legislature, rebuild_main
+
+logger = logging.getLogger(__name__)
+
+# Canonical positions (accent/case-insensitive spelling -> stored value)
+BUDGET_VOTE_VALUES = {
+    'favor': 'Favor',
+    'a favor': 'Favor',
+    'contra': 'Contra',
+    'abstencao': 'Abstenção',
+    'ausente': 'Ausente',
+    'ausencia': 'Ausente',
+}
+
+# Rows per backfill UPDATE
+BACKFILL_BATCH_SIZE = 1000
+
+_VOTE_PREFIX = 'Voto:'
+
+
+def normalize_budget_vote(voto: Optional[str]) -> Optional[str]:
+    """Canonical spelling of a position ('abstenção ' -> 'Abstenção'); unknown values are kept stripped"""
+    if not voto or not voto.strip():
+        return None
+    return BUDGET_VOTE_VALUES.get(fold(voto), voto.strip())
+
+
+def parse_grupos_element(grupos_elem) -> List[Tuple[str, str]]:
+    """(group, vote) pairs of a GruposParlamentares element, in document order"""
+    if grupos_elem is None:
+        return []
+    pairs = []
+    grupo = None
+    for child in grupos_elem:
+        text = child.text.strip() if child.text else None
+        if child.tag == 'GrupoParlamentar':
+            grupo = text
+        elif child.tag == 'Voto' and grupo:
+            pairs.append((grupo, text))
+            grupo = None
+    return pairs
+
+
+def parse_grupos_texto(texto: Optional[str]) -> List[Tuple[str, str]]:
+    """(group, vote) pairs of grupos_parlamentares_texto as flattened by the mapper"""
+    if not texto:
+        return []
+    parts = [part.strip() for part in texto.split(';') if part.strip()]
+    grupos = [part for part in parts if not part.startswith(_VOTE_PREFIX)]
+    votos = [part[len(_VOTE_PREFIX):].strip() for part in parts if part.startswith(_VOTE_PREFIX)]
+    if not votos or len(grupos) != len(votos):
+        return []
+    return list(zip(grupos, votos))
+
+
+class GroupSiglaResolver:
+    """Parliamentary group name or sigla as written in the files -> party sigla"""
+
+    def __init__(self, parties: Iterable[Tuple[str, Optional[str]]] = ()):
+        """
+        Args:
+            parties: (sigla, nome) of known parties
+        """
+        self._siglas: Dict[str, str] = {}
+        for sigla, nome in parties:
+            if not sigla:
+                continue
+            self._siglas.setdefault(fold(sigla), sigla.strip())
+            if nome:
+                self._siglas.setdefault(fold(nome), sigla.strip())
+
+    def resolve(self, grupo: str) -> str:
+        return self._siglas.get(fold(grupo), grupo.strip())
+
+    def matrix(self, pairs: Iterable[Tuple[str, Optional[str]]]) -> Optional[Dict[str, str]]:
+        """votos_partidos value of one votacao (None when no group voted)"""
+        votes = {}
+        for grupo, voto in pairs:
+            voto = normalize_budget_vote(voto)
+            if grupo and voto:
+                votes[self.resolve(grupo)] = voto
+        return votes or None
+
+
+def load_group_resolver(session) -> GroupSiglaResolver:
+    return GroupSiglaResolver(session.execute(select(Partido.sigla, Partido.nome)).all())
+
+
+def votacao_legislatura_id():
+    """Legislature of a votacao through its budget item or amendment proposal"""
+    item = aliased(OrcamentoEstadoItem)
+    proposta = aliased(OrcamentoEstadoPropostaAlteracao)
+    return func.coalesce(
+        select(item.legislatura_id).where(item.id == OrcamentoEstadoVotacao.item_id).scalar_subquery(),
+        select(proposta.legislatura_id).where(proposta.id == OrcamentoEstadoVotacao.proposta_id).scalar_subquery(),
+    )
+
+
+def party_vote_stats_select(legislatura_id=None):
+    """SELECT producing orcamento_estado_partido_voto_stats rows from the matrix"""
+    position = func.jsonb_each_text(OrcamentoEstadoVotacao.votos_partidos).table_valued('key', 'value')
+    grupo, voto = position.c.key, position.c.value
+    row_id = cast(func.md5(func.concat(
+        cast(OrcamentoEstadoVotacao.legislatura_id, String), ':', grupo
+    )), Uuid)
+    query = select(
+        row_id.label('id'),
+        OrcamentoEstadoVotacao.legislatura_id,
+        grupo.label('grupo_parlamentar'),
+        func.count().filter(voto == 'Favor').label('favor'),
+        func.count().filter(voto == 'Contra').label('contra'),
+        func.count().filter(voto == 'Abstenção').label('abstencao'),
+        func.count().filter(voto.notin_(['Favor', 'Contra', 'Abstenção'])).label('outros'),
+        func.count().label('total'),
+        func.min(OrcamentoEstadoVotacao.data_votacao).label('primeira_votacao'),
+        func.max(OrcamentoEstadoVotacao.data_votacao).label('ultima_votacao'),
+    ).select_from(OrcamentoEstadoVotacao, position).where(
+        OrcamentoEstadoVotacao.votos_partidos.isnot(None),
+        OrcamentoEstadoVotacao.legislatura_id.isnot(None),
+    ).group_by(OrcamentoEstadoVotacao.legislatura_id, grupo)
+    if legislatura_id is not None:
+        query = query.where(OrcamentoEstadoVotacao.legislatura_id == legislatura_id)
+    return query
+
+
+def sync_party_vote_stats(session, legislatura_id=None) -> int:
+    """
+    Recompute the per-party budget vote totals (of one legislature).
+
+    Runs in the caller's transaction (the caller commits).
+
+    Returns:
+        Number of (party, legislature) rows written
+    """
+    session.flush()
+    stale = delete(OrcamentoEstadoPartidoVotoStats)
+    if legislatura_id is not None:
+        stale = stale.where(OrcamentoEstadoPartidoVotoStats.legislatura_id == legislatura_id)
+    session.execute(stale)
+    result = session.execute(insert(OrcamentoEstadoPartidoVotoStats).from_select(
+        ['id', 'legislatura_id', 'grupo_parlamentar', 'favor', 'contra', 'abstencao', 'outros', 'total',
+         'primeira_votacao', 'ultima_votacao'],
+        party_vote_stats_select(legislatura_id),
+    ))
+    logger.debug(f"Budget party vote stats: {result.rowcount} rows")
+    return result.rowcount
+
+
+def backfill_matrix(session, rebuild_all: bool = False) -> int:
+    """
+    Fill votos_partidos and legislatura_id of votes imported before the matrix.
+
+    Returns:
+        Number of votacoes updated
+    """
+    session.flush()
+    session.execute(
+        update(OrcamentoEstadoVotacao).where(OrcamentoEstadoVotacao.legislatura_id.is_(None))
+        .values(legislatura_id=votacao_legislatura_id())
+    )
+
+    query = select(OrcamentoEstadoVotacao.id, OrcamentoEstadoVotacao.grupos_parlamentares_texto).where(
+        OrcamentoEstadoVotacao.grupos_parlamentares_texto.isnot(None)
+    )
+    if not rebuild_all:
+        query = query.where(OrcamentoEstadoVotacao.votos_partidos.is_(None))
+
+    resolver = load_group_resolver(session)
+    changes = []
+    for votacao_id, texto in session.execute(query):
+        matrix = resolver.matrix(parse_grupos_texto(texto))
+        if matrix:
+            changes.append({'votacao_id': votacao_id, 'votos_partidos': matrix})
+
+    table = OrcamentoEstadoVotacao.__table__
+    statement = update(table).where(table.c.id == bindparam('votacao_id')).values(
+        votos_partidos=bindparam('votos_partidos')
+    )
+    for start in range(0, len(changes), BACKFILL_BATCH_SIZE):
+        session.connection().execute(statement, changes[start:start + BACKFILL_BATCH_SIZE])
+    return len(changes)
+
+
+def rebuild(legislatura: str = None, rebuild_all: bool = False) -> Optional[Dict[str, int]]:
+    """Backfill the matrix, recompute the stats (of one legislature) and commit"""
+    return rebuild_for_legislature(legislatura, lambda session, legislatura_id: {
+        'votacoes': backfill_matrix(session, rebuild_all),
+        'stats': sync_party_vote_stats(session, legislatura_id),
+    })
+
+
+if __name__ == "__main__":
+    rebuild_main(
+        "Backfill the budget party x votacao matrix and its stats", rebuild,
+        lambda counts: f"  {counts['votacoes']:>8,} votacoes backfilled, {counts['stats']:,} party stats rows",
+        legislatura_help="Only recompute this legislature's stats (e.g. XVI)",
+        add_arguments=lambda parser: parser.add_argument(
+            "--all", dest="rebuild_all", action="store_true",
+            help="Re-parse every vote, not only those without a matrix",
+        ),
+    )
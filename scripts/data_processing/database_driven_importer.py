@@ -58,6 +58,10 @@ from scripts.data_processing.mappers import (
 )
 from scripts.data_processing.mappers.enhanced_base_mapper import SchemaError
 from scripts.data_processing.file_type_resolver import FileTypeResolver
+from scripts.data_processing.encoding_detection import get_encoding_detector
+from scripts.data_processing.differential_import import DifferentialImport
+from scripts.data_processing.import_profiler import ImportProfiler
+from scripts.data_processing.sharded_import import ShardedImport
 
 # Configure logging with Unicode-safe console handler
 from utils.unicode_safe_logging import UnicodeSafeHandler
@@ -205,13 +209,22 @@ class DatabaseDrivenImporter:
         "reunioes_visitas",
     ]
     
-    def __init__(self, allowed_file_types: List[str] = None, quiet: bool = False, orchestrator_mode: bool = False):
+    def __init__(self, allowed_file_types: List[str] = None, quiet: bool = False, orchestrator_mode: bool = False,
+                 differential: bool = False, profile_dir: str = None, profile_slow_seconds: float = None,
+                 shards: int = None):
         self.file_type_resolver = FileTypeResolver()
         self.change_detection = ChangeDetectionService()
+        self.encoding_detector = get_encoding_detector()
         self.allowed_file_types = allowed_file_types or ['XML']  # Default to XML only
         self.shutdown_requested = False
         self.quiet = quiet  # Suppress console output when True
         self.orchestrator_mode = orchestrator_mode  # Modify behavior for orchestrator integration
+        self.differential = differential  # Re-import only changed records (see differential_import)
+        # cProfile dumps of slow files (see import_profiler); env vars reach pool worker processes
+        self.profile_dir = profile_dir or os.environ.get('IMPORT_PROFILE_DIR')
+        self.profile_slow_seconds = profile_slow_seconds or float(os.environ.get('IMPORT_PROFILE_SLOW_SECONDS', 30))
+        # Parallel chunks per very large file (see sharded_import); 1 disables sharding
+        self.shards = shards or int(os.environ.get('IMPORT_SHARDS', 1))
         
         # Configure logging for standalone mode
         if not self.orchestrator_mode and not self.quiet:
@@ -505,9 +518,29 @@ class DatabaseDrivenImporter:
         self._print(f"   Total records imported: {stats['total_records']}")
         
         logger.info(f"Processing complete: {stats['succeeded']} succeeded, {stats['failed']} failed, {stats['total_records']} total records imported")
+
+        if stats['succeeded'] > 0:
+            self._refresh_dashboard_aggregates()
+
+        encoding_stats = self.encoding_detector.get_statistics()
+        for method, method_stats in encoding_stats['by_method'].items():
+            logger.info(
+                f"Encoding detection ({method}): {method_stats['files']} files, "
+                f"{method_stats['total_seconds']:.2f}s total"
+            )
         
         return stats
 
+    def _refresh_dashboard_aggregates(self):
+        """Rebuild run-wide derived data and dashboard aggregates after new data was imported"""
+        try:
+            from scripts.data_processing.post_import import refresh_after_import_run
+
+            self._print("   Refreshing derived data and dashboard aggregates...")
+            refresh_after_import_run()
+        except Exception as e:
+            logger.warning(f"Dashboard aggregate refresh failed: {e}")
+
     def _import_single_file_with_retry(
         self, record_id, file_name: str, strict_mode: bool, stats: Dict
     ) -> bool:
@@ -603,7 +636,20 @@ class DatabaseDrivenImporter:
         return False
 
     def _process_single_import(self, db_session, import_record: ImportStatus, strict_mode: bool = False) -> bool:
-        """Process a single import record"""
+        """Process a single import record, profiling its phases (stored in phase_profile)"""
+        file_name = import_record.file_name
+        profiler = ImportProfiler(
+            db_session.get_bind(), profile_dir=self.profile_dir, slow_seconds=self.profile_slow_seconds
+        )
+        profiler.start()
+        try:
+            return self._run_single_import(db_session, import_record, strict_mode, profiler)
+        finally:
+            profiler.stop(file_name)
+
+    def _run_single_import(self, db_session, import_record: ImportStatus, strict_mode: bool,
+                           profiler: ImportProfiler) -> bool:
+        """Import one file: download, parse, map and commit"""
         try:
             # Check for shutdown request before starting
             if self.shutdown_requested:
@@ -631,7 +677,8 @@ class DatabaseDrivenImporter:
             if not self._has_file_content(import_record):
                 self._print(f"     Downloading file...")
                 logger.info(f"Downloading file: {import_record.file_name}")
-                success = self._download_file(import_record)
+                with profiler.phase('download'):
+                    success = self._download_file(import_record)
                 if not success:
                     logger.error(f"Failed to download file: {import_record.file_name}")
                     return False
@@ -689,8 +736,13 @@ class DatabaseDrivenImporter:
 
             # Parse XML content
             try:
-                xml_content = self._get_file_content(import_record)
-                xml_root = self._parse_xml_with_bom_handling(xml_content)
+                with profiler.phase('parse'):
+                    xml_content = self._get_file_content(import_record)
+                    xml_root = self._parse_xml_with_bom_handling(
+                        xml_content,
+                        source_url=import_record.file_url,
+                        file_name=import_record.file_name,
+                    )
                 
                 file_info = {
                     "file_path": import_record.file_name,  # Use file name since we don't have local path
@@ -725,11 +777,57 @@ class DatabaseDrivenImporter:
                 mapper_class = self.schema_mappers[mapper_key]
                 # Pass import_record to mapper for data provenance tracking
                 mapper = mapper_class(db_session, import_status_record=import_record)
+                mapper.profiler = profiler
+
+                # Sharded mode: chunks of a very large file are mapped in parallel processes
+                sharded = None
+                if ShardedImport.supports(mapper_key):
+                    with profiler.phase('shard'):
+                        if self.shards > 1:
+                            sharded = ShardedImport.plan(xml_root, mapper_key, self.shards)
+                        if not sharded and ShardedImport.has_leftovers(db_session, import_record):
+                            # Records of an interrupted sharded import of this file
+                            ShardedImport.discard_leftovers(import_record, mapper_key)
+
+                # Differential mode: diff record fingerprints and hand the mapper only what changed
+                differential = None
+                if DifferentialImport.supports(mapper_key):
+                    with profiler.phase('differential'):
+                        if self.differential and not sharded:
+                            differential = DifferentialImport(db_session, import_record, mapper_key)
+                            xml_root = differential.prepare(xml_root)
+                        else:
+                            # A full import makes stored fingerprints stale
+                            DifferentialImport.clear(db_session, import_record)
 
                 # Log transaction state before mapper
                 logger.debug(f"[MAPPER] Before mapper for {import_record.file_name}: session.is_active={db_session.is_active}")
 
-                results = mapper.validate_and_map(xml_root, file_info, strict_mode)
+                mapper_started = time.perf_counter()
+                if sharded:
+                    with profiler.phase('mapper'):
+                        results = sharded.run(db_session, import_record, mapper_class, file_info, strict_mode)
+                    shards = results['shards']
+                    self._print(
+                        f"     Sharded: {shards['count']} shards in {shards['wall_seconds']:.1f}s "
+                        f"(slowest {shards['max_shard_seconds']:.1f}s)"
+                    )
+                else:
+                    with profiler.phase('intern'):
+                        mapper.intern_tree(xml_root)
+                    with profiler.phase('mapper'):
+                        results = mapper.validate_and_map(xml_root, file_info, strict_mode)
+
+                if differential:
+                    with profiler.phase('differential'):
+                        differential.finish(results, time.perf_counter() - mapper_started)
+                    if results.get('differential'):
+                        diff = results['differential']
+                        self._print(
+                            f"     Differential: {diff['added']} added, {diff['changed']} changed, "
+                            f"{diff['removed']} removed, {diff['unchanged']} unchanged "
+                            f"(~{diff['estimated_seconds_saved']:.1f}s saved)"
+                        )
 
                 # CRITICAL: Check if the transaction is still valid after mapper processing
                 # Mappers may catch exceptions internally without re-raising, which can leave
@@ -762,6 +860,12 @@ class DatabaseDrivenImporter:
                 import_record.updated_at = datetime.now()
                 
                 # Commit the entire transaction (mapper data + import status) together
+                with profiler.phase('commit'):
+                    db_session.commit()
+
+                # The profile includes the commit, so it is stored in a second (one-row) commit
+                profiler.stop(import_record.file_name)
+                import_record.phase_profile = profiler.to_json()
                 db_session.commit()
                 # Refresh object after commit to keep it attached to session
                 db_session.refresh(import_record)
@@ -979,139 +1083,19 @@ class DatabaseDrivenImporter:
         response.raise_for_status()
         return response.content
     
-    def _parse_xml_with_bom_handling(self, content: bytes) -> ET.Element:
-        """Parse XML content with intelligent Portuguese-aware encoding detection"""
-        import re
-        
-        # Remove BOM if present
-        original_content = content
-        if content.startswith(b'\xef\xbb\xbf'):
-            content = content[3:]
-        elif content.startswith(b'\xfe\xff'):
-            content = content[2:]
-        elif content.startswith(b'\xff\xfe'):
-            content = content[2:]
-        
-        # Remove non-ASCII characters before '<'
-        while content and content[0:1] != b'<' and content[0] > 127:
-            content = content[1:]
-        
-        # Portuguese character patterns for validation
-        portuguese_chars = ['ã', 'ç', 'é', 'í', 'ó', 'ú', 'à', 'è', 'ò', 'â', 'ê', 'ô', 'õ', 'ñ']
-        portuguese_names = ['joão', 'josé', 'maria', 'antónio', 'gonçalves', 'fernandes', 'rodrigues', 'pereira']
-        
-        def _validate_portuguese_text(text: str) -> float:
-            """Score text quality based on Portuguese patterns (0.0-1.0)"""
-            if not text:
-                return 0.0
-                
-            text_lower = text.lower()
-            score = 0.0
-            
-            # Check for proper Portuguese characters (positive score)
-            portuguese_count = sum(1 for char in portuguese_chars if char in text_lower)
-            score += min(portuguese_count * 0.1, 0.5)
-            
-            # Check for common Portuguese names/words (positive score) 
-            name_count = sum(1 for name in portuguese_names if name in text_lower)
-            score += min(name_count * 0.1, 0.3)
-            
-            # Penalize corruption patterns (negative score)
-            corruption_patterns = [
-                r'[a-zA-Z]��[a-zA-Z]',  # Double-encoding corruption like Jo��o
-                r'\?\?+',                # Multiple question marks
-                r'[a-zA-Z]\?[a-zA-Z]',  # Single corruption like Jo?o  
-            ]
-            
-            for pattern in corruption_patterns:
-                corruption_count = len(re.findall(pattern, text))
-                score -= corruption_count * 0.2
-            
-            return max(0.0, min(1.0, score))
-        
-        def _detect_double_encoding(content_bytes: bytes) -> bytes:
-            """Detect and fix common double-encoding issues"""
-            # Try to detect UTF-8 bytes incorrectly decoded as Windows-1252 then re-encoded
-            try:
-                # Decode as UTF-8 first
-                utf8_text = content_bytes.decode('utf-8')
-                
-                # Check if this looks like double-encoded UTF-8
-                # Common pattern: UTF-8 → Windows-1252 → UTF-8
-                if '��' in utf8_text:  # Common double-encoding signature
-                    # Try reverse: UTF-8 → Latin-1 → UTF-8 (fix double encoding)
-                    try:
-                        # Get the original UTF-8 bytes
-                        latin1_bytes = utf8_text.encode('latin-1') 
-                        fixed_text = latin1_bytes.decode('utf-8')
-                        
-                        # Validate this looks more like Portuguese
-                        if _validate_portuguese_text(fixed_text) > _validate_portuguese_text(utf8_text):
-                            logger.info("Detected and corrected double-encoding corruption")
-                            return latin1_bytes
-                    except (UnicodeDecodeError, UnicodeEncodeError):
-                        pass
-                        
-                return content_bytes
-            except UnicodeDecodeError:
-                return content_bytes
-        
-        # Fix double-encoding if detected
-        content = _detect_double_encoding(content)
-        
-        # Encoding strategies with Portuguese validation
-        encoding_strategies = [
-            ('utf-8', 'UTF-8 with Portuguese validation'),
-            ('windows-1252', 'Windows-1252 (Portuguese legacy)'),
-            ('iso-8859-1', 'ISO-8859-1 (Latin-1)'),
-            ('iso-8859-15', 'ISO-8859-15 (Latin-9)'),
-            ('utf-16', 'UTF-16'),
-        ]
-        
-        best_result = None
-        best_score = -1.0
-        
-        for encoding, description in encoding_strategies:
-            try:
-                decoded_content = content.decode(encoding)
-                
-                # Parse XML to ensure it's valid
-                xml_root = ET.fromstring(decoded_content)
-                
-                # Get a sample of text for Portuguese validation
-                sample_text = decoded_content[:2000]  # First 2KB for quick validation
-                portuguese_score = _validate_portuguese_text(sample_text)
-                
-                logger.debug(f"Encoding {encoding}: Portuguese score = {portuguese_score:.2f}")
-                
-                if portuguese_score > best_score:
-                    best_result = xml_root
-                    best_score = portuguese_score
-                    best_encoding = encoding
-                    
-                # If we get a very high score, use it immediately
-                if portuguese_score > 0.8:
-                    logger.info(f"High-confidence encoding detected: {encoding} (score: {portuguese_score:.2f})")
-                    return xml_root
-                    
-            except (UnicodeDecodeError, ET.ParseError) as e:
-                logger.debug(f"Encoding {encoding} failed: {e}")
-                continue
-        
-        # Use the best result found
-        if best_result is not None:
-            logger.info(f"Selected encoding: {best_encoding} (Portuguese score: {best_score:.2f})")
-            return best_result
-        
-        # Fallback - force decode with errors='replace' if nothing worked
-        logger.warning("All encoding strategies failed, using UTF-8 with error replacement")
-        try:
-            decoded_content = content.decode('utf-8', errors='replace')
-            return ET.fromstring(decoded_content)
-        except ET.ParseError:
-            # Last resort - try latin-1 which can decode any byte sequence
-            decoded_content = content.decode('latin-1')
-            return ET.fromstring(decoded_content)
+    def _parse_xml_with_bom_handling(self, content: bytes, source_url: str = None, file_name: str = None) -> ET.Element:
+        """Parse XML content with intelligent Portuguese-aware encoding detection.
+
+        Clean UTF-8 files take the detector's fast path; the Portuguese scoring
+        heuristics only run when strict UTF-8 decoding is not conclusive.
+        """
+        result = self.encoding_detector.detect(content, source_url=source_url, file_name=file_name)
+        if result.method != 'fast_path':
+            logger.debug(
+                f"Encoding heuristics used for {file_name or 'content'}: {result.encoding} "
+                f"({result.duration_seconds:.3f}s)"
+            )
+        return result.root
     
     def _get_category_pattern(self, file_type_filter: str) -> Optional[str]:
         """Map file type filter to category pattern.
@@ -1427,6 +1411,14 @@ def main():
                        help='Force reimport of completed files')
     parser.add_argument('--strict-mode', action='store_true',
                        help='Exit on first error')
+    parser.add_argument('--differential', action='store_true',
+                       help='Re-import only records that changed since the last import (supported file types)')
+    parser.add_argument('--profile-dir', type=str,
+                       help='Write a cProfile dump of each slow file to this directory (see --profile-slow-seconds)')
+    parser.add_argument('--profile-slow-seconds', type=float, default=30.0,
+                       help='Import time above which a file is profiled with --profile-dir (default: 30)')
+    parser.add_argument('--shards', type=int,
+                       help='Map very large files in this many parallel chunks (supported file types, default: 1)')
     parser.add_argument('--watch', action='store_true',
                        help='Continuous mode: wait for new files instead of exiting')
     parser.add_argument('--watch-interval', type=int, default=10,
@@ -1461,7 +1453,13 @@ def main():
         handler.setLevel(log_level)
     
     # Create and run importer with file type filter
-    importer = DatabaseDrivenImporter(allowed_file_types=allowed_file_types)
+    importer = DatabaseDrivenImporter(
+        allowed_file_types=allowed_file_types,
+        differential=args.differential,
+        profile_dir=args.profile_dir,
+        profile_slow_seconds=args.profile_slow_seconds,
+        shards=args.shards,
+    )
     
     # Handle status, cleanup, and full-cleanup commands
     if args.status:
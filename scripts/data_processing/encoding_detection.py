@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Encoding Detection for Parliament XML Files
+===========================================
+
+Detects the text encoding of downloaded parliament XML files and parses them.
+Extracted from DatabaseDrivenImporter._parse_xml_with_bom_handling.
+
+Most files published by the parliament are clean UTF-8, so detection uses a
+fast path first:
+
+1. Strict UTF-8 decode of the whole file
+2. One precompiled byte-level scan for mojibake signatures (double-encoded
+   UTF-8 such as ``Ã£`` or runs of U+FFFD replacement characters)
+3. A cheap check on the 2KB validation sample proving that none of the legacy
+   encodings would score better than UTF-8
+
+Only when any of these checks fails does detection fall back to the original
+Portuguese-aware heuristics, which decode and parse the file once per candidate
+encoding. Both paths always select the same encoding for the same input.
+
+The detected encoding is cached per source URL pattern (legislature numbers
+and years removed), so files known to need the heuristics skip the fast path.
+"""
+
+import logging
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Byte order marks stripped before decoding (same order as the original importer)
+BYTE_ORDER_MARKS = (b'\xef\xbb\xbf', b'\xfe\xff', b'\xff\xfe')
+
+# Leading non-ASCII bytes before the XML declaration are garbage
+NON_ASCII_BYTES = bytes(range(128, 256))
+
+# Number of characters used for Portuguese text validation
+VALIDATION_SAMPLE_CHARS = 2000
+
+# Score above which an encoding is accepted immediately
+HIGH_CONFIDENCE_SCORE = 0.8
+
+# Encoding strategies in priority order
+ENCODING_STRATEGIES = [
+    ('utf-8', 'UTF-8 with Portuguese validation'),
+    ('windows-1252', 'Windows-1252 (Portuguese legacy)'),
+    ('iso-8859-1', 'ISO-8859-1 (Latin-1)'),
+    ('iso-8859-15', 'ISO-8859-15 (Latin-9)'),
+    ('utf-16', 'UTF-16'),
+]
+
+# Portuguese character patterns for validation
+PORTUGUESE_CHARS = ('ã', 'ç', 'é', 'í', 'ó', 'ú', 'à', 'è', 'ò', 'â', 'ê', 'ô', 'õ', 'ñ')
+PORTUGUESE_NAMES = ('joão', 'josé', 'maria', 'antónio', 'gonçalves', 'fernandes', 'rodrigues', 'pereira')
+
+# Corruption patterns penalised by the validator
+CORRUPTION_PATTERNS = (
+    re.compile('[a-zA-Z]\ufffd\ufffd[a-zA-Z]'),  # Double-encoding corruption like Jo\ufffd\ufffdo
+    re.compile(r'\?\?+'),                          # Multiple question marks
+    re.compile(r'[a-zA-Z]\?[a-zA-Z]'),             # Single corruption like Jo?o
+)
+
+# Common double-encoding signature in decoded text
+DOUBLE_ENCODING_SIGNATURE = '\ufffd\ufffd'
+
+# Byte-level mojibake signatures, merged into a single scan:
+# - two consecutive U+FFFD replacement characters (EF BF BD EF BF BD)
+# - UTF-8 text decoded as Windows-1252 and re-encoded as UTF-8, which turns
+#   'ã' (C3 A3) into 'Ã£' (C3 83 C2 A3)
+MOJIBAKE_SIGNATURES = re.compile(
+    rb'\xef\xbf\xbd\xef\xbf\xbd|\xc3[\x82\x83]\xc2[\x80-\xbf]'
+)
+
+# Legislature roman numerals and numbers vary between otherwise identical URLs
+URL_VARIABLE_PARTS = re.compile(r'\d+|(?<![A-Z])[IVXL]+(?![A-Za-z])')
+
+
+def validate_portuguese_text(text: str) -> float:
+    """Score text quality based on Portuguese patterns (0.0-1.0)"""
+    if not text:
+        return 0.0
+
+    text_lower = text.lower()
+    score = 0.0
+
+    # Check for proper Portuguese characters (positive score)
+    portuguese_count = sum(1 for char in PORTUGUESE_CHARS if char in text_lower)
+    score += min(portuguese_count * 0.1, 0.5)
+
+    # Check for common Portuguese names/words (positive score)
+    name_count = sum(1 for name in PORTUGUESE_NAMES if name in text_lower)
+    score += min(name_count * 0.1, 0.3)
+
+    # Penalize corruption patterns (negative score)
+    for pattern in CORRUPTION_PATTERNS:
+        corruption_count = len(pattern.findall(text))
+        score -= corruption_count * 0.2
+
+    return max(0.0, min(1.0, score))
+
+
+def strip_byte_order_mark(content: bytes) -> bytes:
+    """Remove BOM and any leading non-ASCII garbage before the first '<'"""
+    for bom in BYTE_ORDER_MARKS:
+        if content.startswith(bom):
+            content = content[len(bom):]
+            break
+
+    return content.lstrip(NON_ASCII_BYTES)
+
+
+def source_url_pattern(source_url: Optional[str]) -> Optional[str]:
+    """Normalize a source URL into a cache key shared by all legislatures/years"""
+    if not source_url:
+        return None
+    return URL_VARIABLE_PARTS.sub('#', source_url)
+
+
+@dataclass
+class EncodingDetectionResult:
+    """Outcome of encoding detection for a single file"""
+
+    root: ET.Element
+    encoding: str
+    method: str  # 'fast_path', 'heuristic' or 'fallback'
+    score: float
+    duration_seconds: float
+    file_name: Optional[str] = None
+    source_pattern: Optional[str] = None
+
+
+class EncodingDetector:
+    """Detects encodings of parliament XML files and parses them.
+
+    Thread-safe: the encoding cache and timings are guarded by a lock, so a
+    single detector can be shared by the parallel import workers.
+    """
+
+    # Keep timings for the most recent files only
+    MAX_TIMINGS = 1000
+
+    def __init__(self):
+        self._encoding_cache: Dict[str, str] = {}
+        self._timings: List[Dict] = []
+        self._lock = threading.Lock()
+
+    def parse(self, content: bytes, source_url: str = None, file_name: str = None) -> ET.Element:
+        """Detect the encoding of content and return the parsed XML root"""
+        return self.detect(content, source_url=source_url, file_name=file_name).root
+
+    def detect(self, content: bytes, source_url: str = None, file_name: str = None,
+               use_fast_path: bool = True) -> EncodingDetectionResult:
+        """Detect the encoding of content, parse it and record timings"""
+        started = time.perf_counter()
+        pattern = source_url_pattern(source_url)
+        content = strip_byte_order_mark(content)
+
+        with self._lock:
+            cached_encoding = self._encoding_cache.get(pattern) if pattern else None
+
+        outcome = None
+        # Files whose source is known to need a legacy encoding skip the fast path
+        if use_fast_path and cached_encoding in (None, 'utf-8'):
+            outcome = self._detect_fast_path(content)
+        if outcome is None:
+            outcome = self._detect_with_heuristics(content)
+
+        root, encoding, method, score = outcome
+        result = EncodingDetectionResult(
+            root=root,
+            encoding=encoding,
+            method=method,
+            score=score,
+            duration_seconds=time.perf_counter() - started,
+            file_name=file_name,
+            source_pattern=pattern,
+        )
+
+        timing = {
+            'file_name': file_name,
+            'encoding': encoding,
+            'method': method,
+            'duration_seconds': result.duration_seconds,
+        }
+        with self._lock:
+            if pattern:
+                self._encoding_cache[pattern] = encoding
+            self._timings.append(timing)
+            if len(self._timings) > self.MAX_TIMINGS:
+                del self._timings[:-self.MAX_TIMINGS]
+
+        logger.debug(
+            f"Encoding detection for {file_name or 'content'}: {encoding} via {method} "
+            f"in {result.duration_seconds * 1000:.1f}ms"
+        )
+        return result
+
+    def get_timings(self) -> List[Dict]:
+        """Per-file detection timings, most recent last"""
+        with self._lock:
+            return [dict(timing) for timing in self._timings]
+
+    def get_statistics(self) -> Dict:
+        """Aggregate detection statistics by method"""
+        with self._lock:
+            stats = {
+                'files': len(self._timings),
+                'cached_patterns': len(self._encoding_cache),
+                'by_method': {},
+            }
+            for timing in self._timings:
+                method_stats = stats['by_method'].setdefault(
+                    timing['method'], {'files': 0, 'total_seconds': 0.0}
+                )
+                method_stats['files'] += 1
+                method_stats['total_seconds'] += timing['duration_seconds']
+            return stats
+
+    def _detect_fast_path(self, content: bytes) -> Optional[Tuple[ET.Element, str, str, float]]:
+        """Accept strict UTF-8 when the heuristics provably would pick it too.
+
+        Returns None whenever the heuristics are needed.
+        """
+        if MOJIBAKE_SIGNATURES.search(content):
+            return None
+
+        try:
+            decoded_content = content.decode('utf-8')
+        except UnicodeDecodeError:
+            return None
+
+        utf8_score = validate_portuguese_text(decoded_content[:VALIDATION_SAMPLE_CHARS])
+        if utf8_score <= HIGH_CONFIDENCE_SCORE and self._legacy_encoding_may_win(content, utf8_score):
+            return None
+
+        try:
+            xml_root = ET.fromstring(decoded_content)
+        except ET.ParseError:
+            return None
+
+        return xml_root, 'utf-8', 'fast_path', utf8_score
+
+    @staticmethod
+    def _legacy_encoding_may_win(content: bytes, utf8_score: float) -> bool:
+        """Check whether any later strategy could score strictly above UTF-8.
+
+        Only the validation sample is decoded, which is enough to compute the
+        exact score the heuristics would assign. Inconclusive samples count as
+        possible winners so the heuristics stay authoritative.
+        """
+        for encoding, _ in ENCODING_STRATEGIES[1:]:
+            try:
+                if encoding == 'utf-16':
+                    # Surrogate pairs need up to 4 bytes per character
+                    sample = content[:VALIDATION_SAMPLE_CHARS * 4].decode(encoding)
+                else:
+                    sample = content[:VALIDATION_SAMPLE_CHARS].decode(encoding)
+            except UnicodeDecodeError:
+                if encoding == 'utf-16':
+                    return True
+                # Single-byte codecs failing on the sample fail on the full file
+                continue
+
+            if validate_portuguese_text(sample[:VALIDATION_SAMPLE_CHARS]) > utf8_score:
+                return True
+
+        return False
+
+    def _detect_with_heuristics(self, content: bytes) -> Tuple[ET.Element, str, str, float]:
+        """Original Portuguese-aware detection: try every encoding and keep the best"""
+        # Fix double-encoding if detected
+        content = self._fix_double_encoding(content)
+
+        best_result = None
+        best_score = -1.0
+        best_encoding = None
+
+        for encoding, description in ENCODING_STRATEGIES:
+            try:
+                decoded_content = content.decode(encoding)
+
+                # Parse XML to ensure it's valid
+                xml_root = ET.fromstring(decoded_content)
+
+                # Get a sample of text for Portuguese validation
+                sample_text = decoded_content[:VALIDATION_SAMPLE_CHARS]
+                portuguese_score = validate_portuguese_text(sample_text)
+
+                logger.debug(f"Encoding {encoding}: Portuguese score = {portuguese_score:.2f}")
+
+                if portuguese_score > best_score:
+                    best_result = xml_root
+                    best_score = portuguese_score
+                    best_encoding = encoding
+
+                # If we get a very high score, use it immediately
+                if portuguese_score > HIGH_CONFIDENCE_SCORE:
+                    logger.info(f"High-confidence encoding detected: {encoding} (score: {portuguese_score:.2f})")
+                    return xml_root, encoding, 'heuristic', portuguese_score
+
+            except (UnicodeDecodeError, ET.ParseError) as e:
+                logger.debug(f"Encoding {encoding} failed: {e}")
+                continue
+
+        # Use the best result found
+        if best_result is not None:
+            logger.info(f"Selected encoding: {best_encoding} (Portuguese score: {best_score:.2f})")
+            return best_result, best_encoding, 'heuristic', best_score
+
+        # Fallback - force decode with errors='replace' if nothing worked
+        logger.warning("All encoding strategies failed, using UTF-8 with error replacement")
+        try:
+            decoded_content = content.decode('utf-8', errors='replace')
+            return ET.fromstring(decoded_content), 'utf-8', 'fallback', 0.0
+        except ET.ParseError:
+            # Last resort - try latin-1 which can decode any byte sequence
+            decoded_content = content.decode('latin-1')
+            return ET.fromstring(decoded_content), 'iso-8859-1', 'fallback', 0.0
+
+    @staticmethod
+    def _fix_double_encoding(content_bytes: bytes) -> bytes:
+        """Detect and fix common double-encoding issues"""
+        # Try to detect UTF-8 bytes incorrectly decoded as Windows-1252 then re-encoded
+        try:
+            # Decode as UTF-8 first
+            utf8_text = content_bytes.decode('utf-8')
+
+            # Check if this looks like double-encoded UTF-8
+            # Common pattern: UTF-8 → Windows-1252 → UTF-8
+            if DOUBLE_ENCODING_SIGNATURE in utf8_text:
+                # Try reverse: UTF-8 → Latin-1 → UTF-8 (fix double encoding)
+                try:
+                    # Get the original UTF-8 bytes
+                    latin1_bytes = utf8_text.encode('latin-1')
+                    fixed_text = latin1_bytes.decode('utf-8')
+
+                    # Validate this looks more like Portuguese
+                    if validate_portuguese_text(fixed_text) > validate_portuguese_text(utf8_text):
+                        logger.info("Detected and corrected double-encoding corruption")
+                        return latin1_bytes
+                except (UnicodeDecodeError, UnicodeEncodeError):
+                    pass
+
+            return content_bytes
+        except UnicodeDecodeError:
+            return content_bytes
+
+
+# Process-wide detector so the encoding cache and timings survive across the
+# per-file importer instances created by ParallelImportProcessor workers
+_detector: Optional[EncodingDetector] = None
+_detector_lock = threading.Lock()
+
+
+def get_encoding_detector() -> EncodingDetector:
+    """Get the process-wide encoding detector, creating it if necessary"""
+    global _detector
+    if _detector is None:
+        with _detector_lock:
+            if _detector is None:
+                _detector = EncodingDetector()
+    return _detector
@@ -0,0 +1,242 @@
+"""
+Import Profiler
+===============
+
+Per-file phase breakdown of an import.
+
+The importer wraps each stage of a file (download, parse, differential,
+mapper, commit) in a profiler phase, and mappers add their own phases
+(schema coverage, flushes, activity timeline). For every phase the profiler
+records:
+
+- wall time and CPU time of the importing thread
+- peak RSS of the process at the end of the phase
+- SQL statements executed and rows written (INSERT/UPDATE/DELETE rowcount)
+
+Nested phases are recorded as "outer/inner" and re-entered phases are
+accumulated, so a mapper's hundreds of flushes show up as one
+"mapper/flush" entry with a call count. The result is stored as JSON in
+ImportStatus.phase_profile.
+
+Optionally a cProfile dump is written for files slower than a threshold:
+
+    profiler = ImportProfiler(engine, profile_dir='profiles', slow_seconds=30)
+    with profiler:
+        with profiler.phase('parse'):
+            ...
+    import_record.phase_profile = profiler.to_json()
+"""
+
+import cProfile
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+WRITE_STATEMENT = re.compile(r'\s*(INSERT|UPDATE|DELETE)\b', re.IGNORECASE)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of the process in MB (None where unsupported)"""
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def slowest_phase(profile: Optional[Dict]) -> Optional[str]:
+    """Name of the top-level phase with the largest wall time"""
+    if not profile or not profile.get('phases'):
+        return None
+    top_level = {name: p for name, p in profile['phases'].items() if '/' not in name}
+    if not top_level:
+        return None
+    return max(top_level, key=lambda name: top_level[name]['wall_seconds'])
+
+
+def summarize_profiles(files: List[Tuple[str, Dict]], slowest: int = 10) -> Dict:
+    """
+    Aggregate stored profiles.
+
+    Args:
+        files: (file_name, profile dict) pairs
+        slowest: Number of slowest files to list
+
+    Returns:
+        {'files', 'phases': {phase: totals and averages}, 'slowest_files'}
+    """
+    phases: Dict[str, Dict] = {}
+    for _, profile in files:
+        for name, entry in profile.get('phases', {}).items():
+            total = phases.setdefault(name, {
+                'files': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'sql_statements': 0, 'rows_written': 0,
+            })
+            total['files'] += 1
+            for key in ('wall_seconds', 'cpu_seconds', 'sql_statements', 'rows_written'):
+                total[key] += entry.get(key) or 0
+    for total in phases.values():
+        total['avg_wall_seconds'] = round(total['wall_seconds'] / total['files'], 4)
+        total['wall_seconds'] = round(total['wall_seconds'], 2)
+        total['cpu_seconds'] = round(total['cpu_seconds'], 2)
+
+    ranked = sorted(files, key=lambda item: item[1].get('wall_seconds', 0), reverse=True)[:slowest]
+    return {
+        'files': len(files),
+        'phases': phases,
+        'slowest_files': [
+            {
+                'file_name': file_name,
+                'wall_seconds': profile.get('wall_seconds'),
+                'slowest_phase': slowest_phase(profile),
+                'sql_statements': profile.get('sql_statements'),
+                'peak_rss_mb': profile.get('peak_rss_mb'),
+            }
+            for file_name, profile in ranked
+        ],
+    }
+
+
+class ImportProfiler:
+    """Phase profiler for the import of one file, in one thread"""
+
+    def __init__(self, engine=None, profile_dir: str = None, slow_seconds: float = 30.0):
+        """
+        Args:
+            engine: Engine whose statements are counted (None: no SQL counters)
+            profile_dir: Directory for cProfile dumps of slow files (None: disabled)
+            slow_seconds: Total wall time above which a dump is written
+        """
+        self.engine = engine
+        self.profile_dir = profile_dir
+        self.slow_seconds = slow_seconds
+        self.phases: Dict[str, Dict] = {}
+        self.profile_path: Optional[str] = None
+        self._stack: List[str] = []
+        self._thread_id = threading.get_ident()
+        self._statements = 0
+        self._rows_written = 0
+        self._started = None
+        self._wall_seconds = 0.0
+        self._cprofile = None
+
+    # SQL counters -----------------------------------------------------
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # The engine is shared by every import thread; count only ours
+        if threading.get_ident() != self._thread_id:
+            return
+        self._statements += 1
+        if WRITE_STATEMENT.match(statement):
+            rowcount = cursor.rowcount
+            if rowcount is None or rowcount < 0:
+                rowcount = len(parameters) if executemany else 0
+            self._rows_written += rowcount
+
+    def start(self) -> None:
+        """Attach the SQL listener and start the optional cProfile"""
+        self._thread_id = threading.get_ident()
+        self._started = time.perf_counter()
+        if self.engine is not None:
+            event.listen(self.engine, 'after_cursor_execute', self._after_cursor_execute)
+        if self.profile_dir:
+            self._cprofile = cProfile.Profile()
+            try:
+                self._cprofile.enable()
+            except ValueError:
+                # Only one profiler can be active at a time (Python 3.12+)
+                logger.debug("cProfile already active in another thread; not profiling this file")
+                self._cprofile = None
+
+    def stop(self, name: str = 'import') -> None:
+        """Detach the listener and dump the cProfile if the file was slow"""
+        if self._started is None:
+            return
+        self._wall_seconds = time.perf_counter() - self._started
+        self._started = None
+        if self.engine is not None:
+            event.remove(self.engine, 'after_cursor_execute', self._after_cursor_execute)
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            if self._wall_seconds >= self.slow_seconds:
+                os.makedirs(self.profile_dir, exist_ok=True)
+                safe_name = re.sub(r'[^\w.-]+', '_', name)
+                self.profile_path = os.path.join(self.profile_dir, f"{safe_name}.{int(time.time())}.prof")
+                self._cprofile.dump_stats(self.profile_path)
+                logger.info(f"Slow import ({self._wall_seconds:.1f}s) profiled to {self.profile_path}")
+            self._cprofile = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+    # Phases -----------------------------------------------------------
+
+    @contextmanager
+    def phase(self, name: str):
+        """Measure a phase; nested phases are named 'outer/inner'"""
+        key = '/'.join(self._stack + [name])
+        self._stack.append(name)
+        wall, cpu = time.perf_counter(), time.thread_time()
+        statements, rows = self._statements, self._rows_written
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            entry = self.phases.setdefault(key, {
+                'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0,
+                'sql_statements': 0, 'rows_written': 0, 'peak_rss_mb': None,
+            })
+            entry['calls'] += 1
+            entry['wall_seconds'] += time.perf_counter() - wall
+            entry['cpu_seconds'] += time.thread_time() - cpu
+            entry['sql_statements'] += self._statements - statements
+            entry['rows_written'] += self._rows_written - rows
+            entry['peak_rss_mb'] = peak_rss_mb()
+
+    def to_dict(self) -> Dict:
+        """Profile as a JSON-serializable dict"""
+        wall_seconds = self._wall_seconds
+        if self._started is not None:
+            wall_seconds = time.perf_counter() - self._started
+        phases = {
+            name: dict(entry, wall_seconds=round(entry['wall_seconds'], 4),
+                       cpu_seconds=round(entry['cpu_seconds'], 4))
+            for name, entry in self.phases.items()
+        }
+        profile = {
+            'wall_seconds': round(wall_seconds, 4),
+            'sql_statements': self._statements,
+            'rows_written': self._rows_written,
+            'peak_rss_mb': peak_rss_mb(),
+            'phases': phases,
+        }
+        if self.profile_path:
+            profile['cprofile'] = self.profile_path
+        return profile
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+
+def profile_phase(profiler: Optional[ImportProfiler], name: str):
+    """profiler.phase(name), or a no-op when there is no profiler"""
+    if profiler is None:
+        return nullcontext()
+    return profiler.phase(name)
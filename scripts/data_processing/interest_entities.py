@@ -0,0 +1,325 @@
+"""
+Interest Registry Entities
+==========================
+
+Resolves the organizations named in interest declarations (activities,
+shareholdings, social positions and benefits) to shared entities and
+precomputes which deputies declare the same entity.
+
+Entity names are free text, so "which deputies declare ties to the same
+company" used to mean comparing every declaration item with every other.
+Items are now resolved once into three derived tables:
+
+- interest_entities: one row per organization, keyed by the NIPC quoted in
+  the declaration when there is a valid one, by its normalized name
+  otherwise (accents, case, punctuation, particles and trailing legal forms
+  such as Lda./S.A./SGPS dropped). A name-keyed item whose normalized name
+  belongs to exactly one NIPC is merged into that NIPC's entity.
+- interest_entity_links: declaration item -> entity, with the declarant's
+  id_cadastro
+- interest_entity_cooccurrences: (deputy, other deputy, entity), both
+  directions, for entities declared by at most MAX_COOCCURRENCE_DEPUTIES
+  deputies
+
+The registo de interesses mapper refreshes its legislature's links after
+each file. Entity counts, orphan entities and the co-occurrence index span
+every legislature, and interest files are imported in parallel, so they are
+refreshed once when the import run completes (refresh_entity_stats, see
+post_import.py). rebuild() re-resolves every declaration (needed to merge
+name-keyed entities of earlier legislatures into NIPCs seen later).
+
+Usage:
+    python scripts/data_processing/interest_entities.py
+    python scripts/data_processing/interest_entities.py --legislatura XVII
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sys
+import uuid
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import String, Uuid, and_, cast, delete, distinct, exists, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import aliased
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from database.models import (
+    Deputado, InterestEntity, InterestEntityCooccurrence, InterestEntityLink,
+    RegistoInteressesApoioUnified, RegistoInteressesAtividadeUnified,
+    RegistoInteressesSocialPositionUnified, RegistoInteressesSociedadeUnified, RegistoInteressesUnified,
+)
+from scripts.data_processing.name_normalization import name_tokens
+from scripts.data_processing.rebuild_cli import rebuild_for_legislature, rebuild_main
+
+logger = logging.getLogger(__name__)
+
+# Declaration item tables naming an organization in their entity column
+ENTITY_SOURCES = (
+    RegistoInteressesAtividadeUnified,
+    RegistoInteressesSociedadeUnified,
+    RegistoInteressesSocialPositionUnified,
+    RegistoInteressesApoioUnified,
+)
+
+# Entities declared by more deputies are public bodies or parties, not conflicts
+MAX_COOCCURRENCE_DEPUTIES = 50
+
+# Rows per bulk statement
+WRITE_BATCH_SIZE = 1000
+
+# Legal-form suffixes ('Banco X, S.A.' == 'Banco X')
+LEGAL_FORM_TOKENS = frozenset({
+    'lda', 'limitada', 'sa', 'unipessoal', 'sgps', 'crl', 'sarl', 'ace', 'ipss', 'epe', 'ltd', 'inc',
+})
+_LEGAL_FORM_PAIRS = (('s', 'a'), ('s', 'l'), ('c', 'r', 'l'))
+
+# Normalized placeholders that name no organization
+IGNORED_NAMES = frozenset({
+    'nao aplicavel', 'nao aplica', 'n a', 'na', 'nada', 'nada a declarar', 'nenhum', 'nenhuma',
+    'nao', 'sem', 'outro', 'outros', 'varios', 'diversos', 'conta propria', 'propria',
+})
+
+_NIPC_RE = re.compile(r"\b(?:NIPC|NIF|NIPC/NIF)\b\D{0,10}?(\d{3}[ .]?\d{3}[ .]?\d{3})(?!\d)", re.IGNORECASE)
+
+
+def valid_nipc(digits: str) -> bool:
+    """Whether a 9-digit string passes the NIF/NIPC mod-11 check digit"""
+    if len(digits) != 9 or not digits.isdigit() or digits[0] == '0':
+        return False
+    total = sum(int(digit) * weight for digit, weight in zip(digits[:8], range(9, 1, -1)))
+    check = 11 - total % 11
+    return (0 if check >= 10 else check) == int(digits[8])
+
+
+def extract_nipc(text: Optional[str]) -> Optional[str]:
+    """First valid NIPC/NIF quoted in text, e.g. 'Empresa X (NIPC 500 000 000)'"""
+    if not text:
+        return None
+    for match in _NIPC_RE.finditer(text):
+        digits = re.sub(r"\D", "", match.group(1))
+        if valid_nipc(digits):
+            return digits
+    return None
+
+
+def normalize_organization_name(name: Optional[str]) -> Optional[str]:
+    """Accent-, case-, punctuation- and legal-form-insensitive organization name (None if empty)"""
+    if not name:
+        return None
+    tokens = name_tokens(_NIPC_RE.sub(' ', name))
+    while tokens:
+        if tokens[-1] in LEGAL_FORM_TOKENS:
+            tokens.pop()
+            continue
+        pair = next((p for p in _LEGAL_FORM_PAIRS if tuple(tokens[-len(p):]) == p), None)
+        if pair is None:
+            break
+        del tokens[-len(pair):]
+    normalized = ' '.join(tokens)
+    if len(normalized) < 2 or normalized in IGNORED_NAMES:
+        return None
+    return normalized
+
+
+def _md5_uuid(key: str) -> uuid.UUID:
+    return uuid.UUID(hashlib.md5(key.encode('utf-8')).hexdigest())
+
+
+class EntityResolver:
+    """Groups declaration items into entities (by NIPC, then normalized name)"""
+
+    def __init__(self, known_nipcs: Iterable[Tuple[str, str]] = ()):
+        """
+        Args:
+            known_nipcs: (nome_normalizado, nipc) of NIPC-keyed entities already stored
+        """
+        self._items: List[tuple] = []
+        self._nipcs_by_name: Dict[str, set] = {}
+        for normalized, nipc in known_nipcs:
+            self._nipcs_by_name.setdefault(normalized, set()).add(nipc)
+
+    def add(self, source_table: str, source_id, registo_id, legislatura_id, id_cadastro, declared: str) -> bool:
+        """Queue a declaration item; False when its entity names no organization"""
+        nipc = extract_nipc(declared)
+        normalized = normalize_organization_name(declared)
+        if normalized is None and nipc is None:
+            return False
+        normalized = normalized or nipc
+        if nipc:
+            self._nipcs_by_name.setdefault(normalized, set()).add(nipc)
+        self._items.append((source_table, source_id, registo_id, legislatura_id, id_cadastro, declared.strip(), nipc, normalized))
+        return True
+
+    def _key(self, nipc: Optional[str], normalized: str) -> Tuple[str, Optional[str]]:
+        if nipc is None:
+            nipcs = self._nipcs_by_name.get(normalized, ())
+            if len(nipcs) == 1:
+                nipc = next(iter(nipcs))
+        return (f'nipc:{nipc}', nipc) if nipc else (f'nome:{normalized}', None)
+
+    def resolve(self) -> Tuple[List[dict], List[dict]]:
+        """(interest_entities rows, interest_entity_links rows) of the queued items"""
+        entities: Dict[str, dict] = {}
+        spellings: Dict[str, Counter] = {}
+        links = []
+        for source_table, source_id, registo_id, legislatura_id, id_cadastro, declared, nipc, normalized in self._items:
+            key, nipc = self._key(nipc, normalized)
+            entity = entities.get(key)
+            if entity is None:
+                entity = entities[key] = {
+                    'id': _md5_uuid(key), 'chave': key, 'nipc': nipc, 'nome_normalizado': normalized[:500],
+                }
+                spellings[key] = Counter()
+            spellings[key][declared[:500]] += 1
+            links.append({
+                'id': _md5_uuid(f'{source_table}:{source_id}'),
+                'entity_id': entity['id'],
+                'registo_id': registo_id,
+                'legislatura_id': legislatura_id,
+                'id_cadastro': id_cadastro,
+                'source_table': source_table,
+                'source_id': source_id,
+                'declared_name': declared[:500],
+            })
+        for key, entity in entities.items():
+            entity['nome'] = spellings[key].most_common(1)[0][0]
+        return list(entities.values()), links
+
+
+def _batches(rows: List[dict]):
+    for start in range(0, len(rows), WRITE_BATCH_SIZE):
+        yield rows[start:start + WRITE_BATCH_SIZE]
+
+
+def entity_items_query(model, legislatura_id=None):
+    """(id, registo_id, legislatura_id, id_cadastro, entity) of one declaration item table"""
+    query = select(
+        model.id, model.registo_id, RegistoInteressesUnified.legislatura_id, Deputado.id_cadastro, model.entity,
+    ).join(
+        RegistoInteressesUnified, model.registo_id == RegistoInteressesUnified.id
+    ).join(
+        Deputado, RegistoInteressesUnified.deputado_id == Deputado.id
+    ).where(model.entity.isnot(None), Deputado.id_cadastro.isnot(None))
+    if legislatura_id is not None:
+        query = query.where(RegistoInteressesUnified.legislatura_id == legislatura_id)
+    return query
+
+
+def cooccurrences_select(max_deputies: int = MAX_COOCCURRENCE_DEPUTIES):
+    """SELECT producing interest_entity_cooccurrences from the links"""
+    members = select(InterestEntityLink.entity_id, InterestEntityLink.id_cadastro).join(
+        InterestEntity, InterestEntity.id == InterestEntityLink.entity_id
+    ).where(InterestEntity.deputy_count.between(2, max_deputies)).distinct().subquery()
+    other = aliased(members)
+    row_id = cast(func.md5(func.concat(
+        cast(members.c.entity_id, String), ':', members.c.id_cadastro, ':', other.c.id_cadastro
+    )), Uuid)
+    return select(
+        row_id.label('id'),
+        members.c.entity_id,
+        members.c.id_cadastro,
+        other.c.id_cadastro.label('other_id_cadastro'),
+    ).join(other, and_(
+        other.c.entity_id == members.c.entity_id,
+        other.c.id_cadastro != members.c.id_cadastro,
+    ))
+
+
+def sync_interest_entities(session, legislatura_id=None) -> Dict[str, int]:
+    """
+    Re-resolve the entities of interest declarations (of one legislature).
+
+    Runs in the caller's transaction (the caller commits). The scope's links
+    are replaced and new entities inserted; existing entity rows are not
+    touched, so files of different legislatures can be imported concurrently.
+    Counts, orphans and co-occurrences are left to refresh_entity_stats().
+
+    Args:
+        session: SQLAlchemy session
+        legislatura_id: Only resolve this legislature's declarations (all when None)
+
+    Returns:
+        Dictionary with 'items' and 'links' counts
+    """
+    session.flush()
+    resolver = EntityResolver(session.execute(
+        select(InterestEntity.nome_normalizado, InterestEntity.nipc).where(InterestEntity.nipc.isnot(None))
+    ).all())
+
+    counts = {'items': 0}
+    for model in ENTITY_SOURCES:
+        for source_id, registo_id, leg_id, id_cadastro, declared in session.execute(entity_items_query(model, legislatura_id)):
+            counts['items'] += 1
+            resolver.add(model.__tablename__, source_id, registo_id, leg_id, id_cadastro, declared)
+    entities, links = resolver.resolve()
+
+    stale_links = delete(InterestEntityLink)
+    if legislatura_id is not None:
+        stale_links = stale_links.where(InterestEntityLink.legislatura_id == legislatura_id)
+    session.execute(stale_links)
+    for batch in _batches(entities):
+        session.execute(pg_insert(InterestEntity).values(batch).on_conflict_do_nothing(index_elements=['id']))
+    for batch in _batches(links):
+        session.execute(insert(InterestEntityLink), batch)
+    counts['links'] = len(links)
+    logger.debug(f"Interest entity links: {counts}")
+    return counts
+
+
+def refresh_entity_stats(session) -> Dict[str, int]:
+    """
+    Refresh entity counts, drop orphan entities and rebuild the co-occurrence
+    index, set-based over every link.
+
+    Rewrites rows of every legislature: run it once per import run (or from
+    rebuild()), not per file. Runs in the caller's transaction.
+
+    Returns:
+        Dictionary with 'entities' and 'cooccurrences' counts
+    """
+    counts = {}
+    stats = select(
+        InterestEntityLink.entity_id,
+        func.count(distinct(InterestEntityLink.registo_id)).label('declarations'),
+        func.count(distinct(InterestEntityLink.id_cadastro)).label('deputies'),
+    ).group_by(InterestEntityLink.entity_id).subquery()
+    session.execute(
+        update(InterestEntity).where(InterestEntity.id == stats.c.entity_id).values(
+            declaration_count=stats.c.declarations, deputy_count=stats.c.deputies, refreshed_at=func.now(),
+        )
+    )
+    session.execute(delete(InterestEntity).where(
+        ~exists().where(InterestEntityLink.entity_id == InterestEntity.id)
+    ))
+    counts['entities'] = session.execute(select(func.count()).select_from(InterestEntity)).scalar()
+
+    session.execute(delete(InterestEntityCooccurrence))
+    result = session.execute(insert(InterestEntityCooccurrence).from_select(
+        ['id', 'entity_id', 'id_cadastro', 'other_id_cadastro'], cooccurrences_select()
+    ))
+    counts['cooccurrences'] = result.rowcount
+    logger.debug(f"Interest entity stats: {counts}")
+    return counts
+
+
+def _resolve_all(session, legislatura_id) -> Dict[str, int]:
+    counts = sync_interest_entities(session, legislatura_id)
+    counts.update(refresh_entity_stats(session))
+    return counts
+
+
+def rebuild(legislatura: str = None) -> Optional[Dict[str, int]]:
+    """Re-resolve the interest entities (of one legislature), refresh counts and co-occurrences, and commit"""
+    return rebuild_for_legislature(legislatura, _resolve_all)
+
+
+if __name__ == "__main__":
+    rebuild_main(
+        "Resolve interest registry entities and their co-occurrences", rebuild,
+        lambda counts: f"  {counts['items']:>8,} declaration items, {counts['links']:,} linked to "
+                       f"{counts['entities']:,} entities, {counts['cooccurrences']:,} co-occurrences",
+    )
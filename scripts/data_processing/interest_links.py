@@ -0,0 +1,179 @@
+"""
+Interest Registry Person Links
+==============================
+
+Resolves the persons named in interest declarations to deputies and stores
+the links as foreign keys (registo_interesses_unified.spouse_deputado_id).
+
+The conflicts-of-interest endpoint used to find a declarant's spouse with
+lower(nome_completo) LIKE '%<spouse>%' - a scan of deputados on every
+request - followed by a query for the spouse's mandate. Names are now
+matched once against an in-memory index of normalized deputy names:
+
+- normalization drops accents, case, punctuation and the particles
+  de/da/do/das/dos/e, so 'MARIA DA CONCEIÇÃO SILVA' == 'Maria Conceicao Silva'
+- an exact full-name match wins; otherwise every token of the declared
+  name must appear in one of a person's names (full or parliamentary)
+- a name matching several persons, or only the declarant, is left unlinked
+
+Each person is linked through their deputados row of the latest
+legislature. The registo de interesses mapper resolves the links of the
+records it imports; rebuild() re-resolves every link after biographical
+data changes.
+
+Usage:
+    python scripts/data_processing/interest_links.py
+    python scripts/data_processing/interest_links.py --legislatura XVII
+"""
+
+import logging
+import os
+import sys
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import bindparam, select, update
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from database.legislature_registry import legislature_ordinal
+from database.models import Deputado, Legislatura, RegistoInteressesUnified
+from scripts.data_processing.name_normalization import name_tokens
+from scripts.data_processing.rebuild_cli import rebuild_for_legislature, rebuild_main
+
+logger = logging.getLogger(__name__)
+
+# Declared names with fewer tokens are too ambiguous to link
+MIN_NAME_TOKENS = 2
+
+
+def normalize_person_name(name: Optional[str]) -> Optional[str]:
+    """Accent-, case- and particle-insensitive form of a person's name (None if empty)"""
+    if not name:
+        return None
+    return ' '.join(name_tokens(name, letters_only=True)) or None
+
+
+class DeputyNameIndex:
+    """Normalized deputy names -> person, with a token index for partial names"""
+
+    def __init__(self, rows: Iterable[Tuple]):
+        """
+        Args:
+            rows: (deputado_id, id_cadastro, nome_completo, nome, legislatura_numero) per deputados row
+        """
+        # Person (id_cadastro) -> (ordinal, deputado_id) of their latest legislature row
+        self._latest: Dict[object, Tuple[int, object]] = {}
+        self._by_name: Dict[str, Set[object]] = {}
+        self._entries: List[Tuple[object, frozenset]] = []
+        self._by_token: Dict[str, Set[int]] = {}
+
+        seen = set()
+        for deputado_id, id_cadastro, nome_completo, nome, legislatura_numero in rows:
+            person = id_cadastro if id_cadastro is not None else deputado_id
+            ordinal = legislature_ordinal(legislatura_numero) or 0
+            if person not in self._latest or ordinal > self._latest[person][0]:
+                self._latest[person] = (ordinal, deputado_id)
+            for raw in (nome_completo, nome):
+                normalized = normalize_person_name(raw)
+                if not normalized or (person, normalized) in seen:
+                    continue
+                seen.add((person, normalized))
+                self._by_name.setdefault(normalized, set()).add(person)
+                entry = len(self._entries)
+                tokens = frozenset(normalized.split())
+                self._entries.append((person, tokens))
+                for token in tokens:
+                    self._by_token.setdefault(token, set()).add(entry)
+
+    def persons(self, name: Optional[str]) -> Set[object]:
+        """Persons whose name matches (exact full name first, then all-tokens match)"""
+        normalized = normalize_person_name(name)
+        if not normalized:
+            return set()
+        exact = self._by_name.get(normalized)
+        if exact:
+            return set(exact)
+        tokens = normalized.split()
+        if len(tokens) < MIN_NAME_TOKENS:
+            return set()
+        postings = sorted((self._by_token.get(token, set()) for token in set(tokens)), key=len)
+        entries = set.intersection(*postings) if postings else set()
+        return {self._entries[entry][0] for entry in entries}
+
+    def resolve(self, name: Optional[str], exclude_person=None):
+        """deputado_id of the one person matching name (None if none or ambiguous)"""
+        matches = self.persons(name) - {exclude_person}
+        if len(matches) != 1:
+            return None
+        return self._latest[matches.pop()][1]
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+
+def load_deputy_name_index(session) -> DeputyNameIndex:
+    """Index of every deputados row"""
+    rows = session.execute(
+        select(Deputado.id, Deputado.id_cadastro, Deputado.nome_completo, Deputado.nome, Legislatura.numero)
+        .join(Legislatura, Deputado.legislatura_id == Legislatura.id)
+    ).all()
+    return DeputyNameIndex(rows)
+
+
+def resolve_spouse_links(session, legislatura_id=None, index: DeputyNameIndex = None) -> Dict[str, int]:
+    """
+    Set spouse_deputado_id of interest declarations from spouse_name.
+
+    Runs in the caller's transaction (the caller commits). Only rows whose
+    link changes are updated.
+
+    Args:
+        session: SQLAlchemy session
+        legislatura_id: Only resolve this legislature's declarations (all when None)
+        index: Deputy name index to reuse (loaded when None)
+
+    Returns:
+        Dictionary with 'declarations', 'linked' and 'changed' counts
+    """
+    session.flush()
+    index = index if index is not None else load_deputy_name_index(session)
+
+    query = select(
+        RegistoInteressesUnified.id, RegistoInteressesUnified.spouse_name,
+        RegistoInteressesUnified.spouse_deputado_id, Deputado.id_cadastro,
+    ).join(Deputado, RegistoInteressesUnified.deputado_id == Deputado.id)
+    if legislatura_id is not None:
+        query = query.where(RegistoInteressesUnified.legislatura_id == legislatura_id)
+
+    counts = {'declarations': 0, 'linked': 0, 'changed': 0}
+    changes = []
+    for registo_id, spouse_name, current, declarant in session.execute(query):
+        counts['declarations'] += 1
+        spouse_id = index.resolve(spouse_name, exclude_person=declarant) if spouse_name else None
+        if spouse_id is not None:
+            counts['linked'] += 1
+        if spouse_id != current:
+            changes.append({'registo_id': registo_id, 'spouse_deputado_id': spouse_id})
+
+    if changes:
+        table = RegistoInteressesUnified.__table__
+        session.connection().execute(
+            update(table).where(table.c.id == bindparam('registo_id'))
+            .values(spouse_deputado_id=bindparam('spouse_deputado_id')),
+            changes,
+        )
+    counts['changed'] = len(changes)
+    logger.debug(f"Spouse links: {counts}")
+    return counts
+
+
+def rebuild(legislatura: str = None) -> Optional[Dict[str, int]]:
+    """Re-resolve the spouse links (of one legislature) and commit"""
+    return rebuild_for_legislature(legislatura, resolve_spouse_links)
+
+
+if __name__ == "__main__":
+    rebuild_main(
+        "Re-resolve interest registry links to deputies", rebuild,
+        lambda counts: f"  {counts['declarations']:>8,} declarations, {counts['linked']:,} spouses linked, "
+                       f"{counts['changed']:,} links changed",
+    )
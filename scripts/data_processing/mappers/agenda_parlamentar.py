@@ -47,17 +47,19 @@ Uses SQLAlchemy ORM models for clean, type-safe database operations.
 import xml.etree.ElementTree as ET
 import os
 import re
-import uuid
 from datetime import datetime, date
 from typing import Dict, Optional, Set
 import logging
 
+from sqlalchemy import select
+
 from .enhanced_base_mapper import SchemaMapper, SchemaError
 
 # Import our models
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 from database.models import AgendaParlamentar, AgendaParlamentarAnexo, Legislatura
+from app.utils.html_text import clean_html_content
 
 logger = logging.getLogger(__name__)
 
@@ -149,6 +151,20 @@ class AgendaParlamentarMapper(SchemaMapper):
         legislatura = self._get_or_create_legislatura(legislatura_sigla)
         legislatura_id = legislatura.id
         
+        # Existing agenda items and annexes of the legislature are loaded once and
+        # written with batched upserts instead of one existence query per record
+        self._agendas = self._upsert_buffer(
+            AgendaParlamentar, ('id_externo', 'legislatura_id'),
+            AgendaParlamentar.legislatura_id == legislatura_id,
+        )
+        self._anexos = self._upsert_buffer(
+            AgendaParlamentarAnexo, ('agenda_id', 'id_field', 'tipo_anexo'),
+            AgendaParlamentarAnexo.agenda_id.in_(
+                select(AgendaParlamentar.id).where(AgendaParlamentar.legislatura_id == legislatura_id)
+            ),
+            depends_on=[self._agendas],
+        )
+        
         # Process each agenda item
         for agenda_item in xml_root.findall('.//AgendaParlamentar'):
             try:
@@ -162,6 +178,11 @@ class AgendaParlamentarMapper(SchemaMapper):
                 results['errors'].append(error_msg)
                 results['records_processed'] += 1
         
+        with self._profile_phase('flush'):
+            self._anexos.flush()
+        logger.info(f"Agenda upserts: {self._agendas.inserted} new, {self._agendas.updated} updated items; "
+                    f"{self._anexos.inserted} new, {self._anexos.updated} updated annexes")
+        
         return results
     
     
@@ -210,65 +231,36 @@ class AgendaParlamentarMapper(SchemaMapper):
             if not titulo:
                 raise ValueError("Missing required Title field. Data integrity violation - cannot generate artificial titles")
             
-            # Check if record already exists using SQLAlchemy ORM
-            existing_agenda = self.session.query(AgendaParlamentar).filter_by(
-                id_externo=id_externo, 
-                legislatura_id=legislatura_id
-            ).first()
-            
-            if existing_agenda:
-                # Update existing record
-                existing_agenda.secao_id = secao_id
-                existing_agenda.secao_nome = secao_nome
-                existing_agenda.tema_id = tema_id
-                existing_agenda.tema_nome = tema_nome
-                existing_agenda.order_value = order_value
-                existing_agenda.grupo_parlamentar = grupo_parlamentar
-                existing_agenda.legislatura_designacao = legislatura_designacao
-                existing_agenda.orgao_designacao = orgao_designacao
-                existing_agenda.reuniao_numero = reuniao_numero
-                existing_agenda.sessao_numero = sessao_numero
-                existing_agenda.data_evento = data_evento
-                existing_agenda.hora_inicio = hora_inicio
-                existing_agenda.hora_fim = hora_fim
-                existing_agenda.evento_dia_inteiro = all_day_event
-                existing_agenda.titulo = titulo
-                existing_agenda.subtitulo = subtitulo
-                existing_agenda.descricao = descricao
-                existing_agenda.local_evento = local_evento
-                existing_agenda.link_externo = link_externo
-                existing_agenda.pos_plenario = pos_plenario
-            else:
-                # Create new record - explicit UUID for immediate availability
-                new_agenda = AgendaParlamentar(
-                    id=uuid.uuid4(),
-                    id_externo=id_externo,
-                    legislatura_id=legislatura_id,
-                    secao_id=secao_id,
-                    secao_nome=secao_nome,
-                    tema_id=tema_id,
-                    tema_nome=tema_nome,
-                    order_value=order_value,
-                    grupo_parlamentar=grupo_parlamentar,
-                    legislatura_designacao=legislatura_designacao,
-                    orgao_designacao=orgao_designacao,
-                    reuniao_numero=reuniao_numero,
-                    sessao_numero=sessao_numero,
-                    data_evento=data_evento,
-                    hora_inicio=hora_inicio,
-                    hora_fim=hora_fim,
-                    evento_dia_inteiro=all_day_event,
-                    titulo=titulo,
-                    subtitulo=subtitulo,
-                    descricao=descricao,
-                    local_evento=local_evento,
-                    link_externo=link_externo,
-                    pos_plenario=pos_plenario
-                )
-                self._add_with_tracking(new_agenda)
+            # Insert or update through the preloaded buffer
+            agenda_id = self._agendas.upsert({
+                'id_externo': id_externo,
+                'legislatura_id': legislatura_id,
+                'secao_id': secao_id,
+                'secao_nome': secao_nome,
+                'tema_id': tema_id,
+                'tema_nome': tema_nome,
+                'order_value': order_value,
+                'grupo_parlamentar': grupo_parlamentar,
+                'legislatura_designacao': legislatura_designacao,
+                'orgao_designacao': orgao_designacao,
+                'reuniao_numero': reuniao_numero,
+                'sessao_numero': sessao_numero,
+                'data_evento': data_evento,
+                'hora_inicio': hora_inicio,
+                'hora_fim': hora_fim,
+                'evento_dia_inteiro': all_day_event,
+                'titulo': titulo,
+                'subtitulo': subtitulo,
+                'descricao': descricao,
+                'subtitulo_texto': clean_html_content(subtitulo),
+                'descricao_texto': clean_html_content(descricao),
+                'local_evento': local_evento,
+                'link_externo': link_externo,
+                'pos_plenario': pos_plenario,
+            })
             
             # Process attachments (AnexoEventos structures)
-            self._process_agenda_anexos(agenda_item, new_agenda if 'new_agenda' in locals() else existing_agenda)
+            self._process_agenda_anexos(agenda_item, agenda_id)
             
             return True
             
@@ -328,27 +320,27 @@ class AgendaParlamentarMapper(SchemaMapper):
         
         return None
     
-    def _process_agenda_anexos(self, agenda_item: ET.Element, agenda_record) -> bool:
+    def _process_agenda_anexos(self, agenda_item: ET.Element, agenda_id) -> bool:
         """Process agenda attachments (AnexoEventos structures)"""
         try:
             # Process Permanent Committee attachments
             anexos_comissao = agenda_item.find('AnexosComissaoPermanente')
             if anexos_comissao is not None:
-                logger.debug(f"Processing AnexosComissaoPermanente for agenda {agenda_record.id}")
-                self._process_anexo_eventos(anexos_comissao, agenda_record.id, 'comissao_permanente')
+                logger.debug(f"Processing AnexosComissaoPermanente for agenda {agenda_id}")
+                self._process_anexo_eventos(anexos_comissao, agenda_id, 'comissao_permanente')
             
             # Process Plenary attachments
             anexos_plenario = agenda_item.find('AnexosPlenario')
             if anexos_plenario is not None:
-                logger.debug(f"Processing AnexosPlenario for agenda {agenda_record.id}")
-                self._process_anexo_eventos(anexos_plenario, agenda_record.id, 'plenario')
+                logger.debug(f"Processing AnexosPlenario for agenda {agenda_id}")
+                self._process_anexo_eventos(anexos_plenario, agenda_id, 'plenario')
             
             return True
         except Exception as e:
             logger.error(f"Error processing agenda attachments: {e}")
             return False
     
-    def _process_anexo_eventos(self, anexos_container: ET.Element, agenda_id: int, tipo_anexo: str) -> bool:
+    def _process_anexo_eventos(self, anexos_container: ET.Element, agenda_id, tipo_anexo: str) -> bool:
         """Process individual AnexoEventos structures"""
         try:
             for anexo in anexos_container.findall('.//AnexoEventos'):
@@ -360,30 +352,15 @@ class AgendaParlamentarMapper(SchemaMapper):
                 if not titulo:  # At minimum require titulo for data integrity
                     continue
                 
-                # Check if anexo already exists
-                existing_anexo = self.session.query(AgendaParlamentarAnexo).filter_by(
-                    agenda_id=agenda_id,
-                    id_field=id_field,
-                    tipo_anexo=tipo_anexo
-                ).first()
-                
-                if existing_anexo:
-                    # Update existing record
-                    existing_anexo.tipo_documento_field = tipo_documento
-                    existing_anexo.titulo_field = titulo
-                    existing_anexo.url_field = url
-                else:
-                    # Create new attachment record - explicit UUID for immediate availability
-                    anexo_record = AgendaParlamentarAnexo(
-                        id=uuid.uuid4(),
-                        agenda_id=agenda_id,
-                        id_field=id_field,
-                        tipo_documento_field=tipo_documento,
-                        titulo_field=titulo,
-                        url_field=url,
-                        tipo_anexo=tipo_anexo
-                    )
-                    self._add_with_tracking(anexo_record)
+                # Insert or update through the preloaded buffer (flushes agenda items first)
+                self._anexos.upsert({
+                    'agenda_id': agenda_id,
+                    'id_field': id_field,
+                    'tipo_anexo': tipo_anexo,
+                    'tipo_documento_field': tipo_documento,
+                    'titulo_field': titulo,
+                    'url_field': url,
+                })
                 
                 logger.debug(f"Processed anexo: {titulo} ({tipo_documento})")
             
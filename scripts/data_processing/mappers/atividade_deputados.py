@@ -48,6 +48,7 @@ import xml.etree.ElementTree as ET
 from typing import Dict, List, Optional, Set
 
 from .enhanced_base_mapper import EnhancedSchemaMapper, SchemaError
+from .value_parsers import parse_date_formats
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 from database.models import (  # IX Legislature models; I Legislature models
@@ -2031,21 +2032,15 @@ class AtividadeDeputadosMapper(EnhancedSchemaMapper):
         if not datetime_str:
             return None
 
-        try:
-            from datetime import datetime
-
-            # Try ISO format with time: 2004-12-09 00:00:00.0
-            if re.match(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", datetime_str):
-                # Remove milliseconds if present
-                clean_str = datetime_str.split(".")[0]
-                return datetime.strptime(clean_str, "%Y-%m-%d %H:%M:%S")
-
-            # Try date-only format
-            if re.match(r"\d{4}-\d{2}-\d{2}", datetime_str):
-                return datetime.strptime(datetime_str, "%Y-%m-%d")
+        # Try ISO format with time: 2004-12-09 00:00:00.0
+        if re.match(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", datetime_str):
+            # Remove milliseconds if present
+            clean_str = datetime_str.split(".")[0]
+            return parse_date_formats(clean_str, ("%Y-%m-%d %H:%M:%S",))
 
-        except (ValueError, IndexError) as e:
-            logger.warning(f"Could not parse datetime: {datetime_str} - {e}")
+        # Try date-only format
+        if re.match(r"\d{4}-\d{2}-\d{2}", datetime_str):
+            return parse_date_formats(datetime_str, ("%Y-%m-%d",))
 
         return None
 
@@ -2061,26 +2056,9 @@ class AtividadeDeputadosMapper(EnhancedSchemaMapper):
         if not date_str:
             return None
 
-        try:
-            from datetime import datetime
-
-            # Try ISO format first
-            if re.match(r"\d{4}-\d{2}-\d{2}", date_str):
-                return datetime.strptime(date_str, "%Y-%m-%d").date()
-
-            # Try DD/MM/YYYY format
-            if "/" in date_str:
-                parts = date_str.split("/")
-                if len(parts) == 3:
-                    day, month, year = parts
-                    return datetime.strptime(
-                        f"{year}-{month.zfill(2)}-{day.zfill(2)}", "%Y-%m-%d"
-                    ).date()
-
-        except (ValueError, IndexError) as e:
-            logger.warning(f"Could not parse date: {date_str} - {e}")
-
-        return None
+        # ISO format first, then DD/MM/YYYY (single-digit day/month allowed)
+        parsed = parse_date_formats(date_str, ("%Y-%m-%d", "%d/%m/%Y"))
+        return parsed.date() if parsed else None
 
     def _process_dep_cargo(self, deputado_elem: ET.Element, deputado_id: int):
         """Process DepCargo (deputy positions) using SQLAlchemy ORM"""
@@ -64,6 +64,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Set
 
 from .enhanced_base_mapper import SchemaError, SchemaMapper
+from .value_parsers import parse_date_formats
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 from database.models import (
@@ -98,6 +99,8 @@ class AtividadesMapper(SchemaMapper):
     with proper translator integration for coded field values.
     """
 
+    ACTIVITY_SOURCES = ['atividade']
+
     def __init__(self, session, import_status_record=None):
         # Accept SQLAlchemy session directly (passed by unified importer)
         super().__init__(session, import_status_record=import_status_record)
@@ -640,7 +643,8 @@ class AtividadesMapper(SchemaMapper):
                     )
                     raise
 
-            # Commit all changes
+            # Refresh the activity timeline before the importer commits
+            self._sync_activity_events(legislatura)
             return results
 
         except Exception as e:
@@ -1048,26 +1052,9 @@ class AtividadesMapper(SchemaMapper):
         if not date_str:
             return None
 
-        try:
-            from datetime import datetime
-
-            # Try ISO format first
-            if re.match(r"\d{4}-\d{2}-\d{2}", date_str):
-                return datetime.strptime(date_str, "%Y-%m-%d").date()
-
-            # Try DD/MM/YYYY format
-            if "/" in date_str:
-                parts = date_str.split("/")
-                if len(parts) == 3:
-                    day, month, year = parts
-                    return datetime.strptime(
-                        f"{year}-{month.zfill(2)}-{day.zfill(2)}", "%Y-%m-%d"
-                    ).date()
-
-        except (ValueError, IndexError) as e:
-            logger.warning(f"Could not parse date: {date_str} - {e}")
-
-        return None
+        # ISO format first, then DD/MM/YYYY (single-digit day/month allowed)
+        parsed = parse_date_formats(date_str, ("%Y-%m-%d", "%d/%m/%Y"))
+        return parsed.date() if parsed else None
 
     # NOTE: _get_or_create_legislatura is inherited from EnhancedSchemaMapper (with caching)
     # NOTE: Roman numeral conversion uses ROMAN_TO_NUMBER from LegislatureHandlerMixin
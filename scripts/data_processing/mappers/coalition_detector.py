@@ -9,16 +9,28 @@ Based on Portuguese political analysis:
 - Coalitions use separators: "/" (main), "." (secondary), "-" (within party names)
 - Known historical coalitions and their component parties
 - Confidence scoring for automatic detection accuracy
+
+Detection runs once per mandate and parliamentary group during imports, over
+a few hundred distinct siglas. The pattern rules are compiled into a single
+alternation (one named group per rule, tried in rule order), and results are
+memoized per sigla in an LRU cache. shared_coalition_detector() returns one
+detector per process, so the memo is shared by every mapper of an import
+run. Memoized CoalitionDetection objects are shared: treat them as read-only.
 """
 
 import re
 import logging
+import threading
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Distinct siglas memoized per detector
+DETECTION_MEMO_SIZE = 4096
+
 
 @dataclass
 class CoalitionDetection:
@@ -43,9 +55,16 @@ class CoalitionDetector:
     3. Political context and historical data
     """
     
-    def __init__(self):
+    def __init__(self, memo_size: int = DETECTION_MEMO_SIZE):
         self.known_coalitions = self._initialize_known_coalitions()
         self.pattern_rules = self._initialize_pattern_rules()
+        self._pattern_re = self._compile_pattern_rules(self.pattern_rules)
+        self._detect_memo = lru_cache(maxsize=memo_size)(self._detect_sigla)
+
+    @staticmethod
+    def _compile_pattern_rules(rules: List[Dict]) -> "re.Pattern":
+        """One alternation over all rules; group r<i> matches rule i (first matching rule wins)"""
+        return re.compile("|".join(f"(?P<r{i}>{rule['pattern']})" for i, rule in enumerate(rules)))
         
     def _initialize_known_coalitions(self) -> Dict[str, Dict]:
         """Initialize database of known Portuguese coalitions with metadata
@@ -258,6 +277,22 @@ class CoalitionDetector:
         
         sigla = sigla.strip().upper()
         
+        # Without context the result only depends on the sigla
+        if not context:
+            return self._detect_memo(sigla)
+        
+        detection = self._detect_sigla(sigla)
+        if detection.is_coalition:
+            return detection
+        
+        # Step 3: Contextual analysis
+        context_result = self._detect_by_context(sigla, context)
+        if context_result.is_coalition:
+            return context_result
+        return detection
+    
+    def _detect_sigla(self, sigla: str) -> CoalitionDetection:
+        """Known coalitions and patterns for a normalized sigla"""
         # Step 1: Check known coalitions database (highest confidence)
         if sigla in self.known_coalitions:
             return self._detect_known_coalition(sigla)
@@ -267,15 +302,16 @@ class CoalitionDetector:
         if pattern_result.is_coalition:
             return pattern_result
         
-        # Step 3: Contextual analysis (if context provided)
-        if context:
-            context_result = self._detect_by_context(sigla, context)
-            if context_result.is_coalition:
-                return context_result
-        
         # Default: treat as individual party
         return self._create_negative_detection(sigla, "individual_party")
     
+    def memo_info(self):
+        """Hits, misses and size of the detection memo"""
+        return self._detect_memo.cache_info()
+    
+    def clear_memo(self) -> None:
+        self._detect_memo.cache_clear()
+    
     def _detect_known_coalition(self, sigla: str) -> CoalitionDetection:
         """Detect from known coalitions database"""
         coalition_data = self.known_coalitions[sigla]
@@ -297,18 +333,19 @@ class CoalitionDetector:
     
     def _detect_by_patterns(self, sigla: str) -> CoalitionDetection:
         """Detect coalitions using pattern matching"""
-        for rule in self.pattern_rules:
-            if re.match(rule["pattern"], sigla):
-                components = self._extract_components_from_pattern(sigla, rule)
-                
-                return CoalitionDetection(
-                    is_coalition=True,
-                    confidence=rule["confidence"],
-                    coalition_sigla=sigla,
-                    coalition_name=f"Coligação {sigla}",  # Generic name
-                    component_parties=components,
-                    detection_method=f"pattern_match: {rule['description']}"
-                )
+        match = self._pattern_re.match(sigla)
+        if match:
+            rule = self.pattern_rules[int(match.lastgroup[1:])]
+            components = self._extract_components_from_pattern(sigla, rule)
+            
+            return CoalitionDetection(
+                is_coalition=True,
+                confidence=rule["confidence"],
+                coalition_sigla=sigla,
+                coalition_name=f"Coligação {sigla}",  # Generic name
+                component_parties=components,
+                detection_method=f"pattern_match: {rule['description']}"
+            )
         
         return self._create_negative_detection(sigla, "no_pattern_match")
     
@@ -427,6 +464,20 @@ class CoalitionDetector:
         return stats
 
 
+_shared_detector: Optional[CoalitionDetector] = None
+_shared_detector_lock = threading.Lock()
+
+
+def shared_coalition_detector() -> CoalitionDetector:
+    """The process-wide detector (and detection memo) used by the mappers"""
+    global _shared_detector
+    if _shared_detector is None:
+        with _shared_detector_lock:
+            if _shared_detector is None:
+                _shared_detector = CoalitionDetector()
+    return _shared_detector
+
+
 def test_coalition_detector():
     """Test the coalition detection system with known examples"""
     detector = CoalitionDetector()
@@ -12,6 +12,8 @@ from datetime import datetime
 from typing import Optional, Dict, Any, List
 import logging
 
+from .value_parsers import DATE_FORMATS, parse_date_formats, parse_float, parse_int
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,20 +34,8 @@ class ParliamentConstants:
         12: 'XII', 13: 'XIII', 14: 'XIV', 15: 'XV', 16: 'XVI', 17: 'XVII'
     }
     
-    # Common date formats found in Parliament XML files
-    DATE_FORMATS = [
-        "%Y-%m-%d",     # 2023-12-25
-        "%d-%m-%Y",     # 25-12-2023
-        "%Y/%m/%d",     # 2023/12/25
-        "%d/%m/%Y",     # 25/12/2023
-        "%Y-%m-%dT%H:%M:%S",  # 2023-12-25T14:30:00
-        "%d-%m-%Y %H:%M:%S",  # 25-12-2023 14:30:00
-        "%d/%m/%Y %H:%M:%S",  # 18/11/2004 00:00:00
-        "%Y/%m/%d %H:%M:%S",  # 2004/11/18 00:00:00
-        "%d/%m/%Y",     # Single digit support: 1/1/2023
-        "%Y-%m",        # 2014-08 (year-month)
-        "%Y",           # 2008 (year-only)
-    ]
+    # Common date formats found in Parliament XML files (see value_parsers)
+    DATE_FORMATS = DATE_FORMATS
     
     # Common regex patterns
     LEGISLATURE_PATTERN = r'(XVII|XVI|XV|XIV|XIII|XII|XI|IX|VIII|VII|VI|IV|III|II|IB|IA|CONSTITUINTE|X|V|I)'
@@ -67,55 +57,18 @@ class DataValidationUtils:
     
     @staticmethod
     def parse_date_flexible(date_str: Optional[str]) -> Optional[datetime]:
-        """Parse date with flexible format detection"""
-        if not date_str:
-            return None
-        
-        date_str = date_str.strip()
-        if not date_str:
-            return None
-        
-        for date_format in ParliamentConstants.DATE_FORMATS:
-            try:
-                return datetime.strptime(date_str, date_format)
-            except ValueError:
-                continue
-        
-        logger.warning(f"Could not parse date: {date_str}")
-        return None
+        """Parse date with flexible format detection (shape-sniffed and memoized)"""
+        return parse_date_formats(date_str)
     
     @staticmethod
     def safe_int_convert(value: Optional[str]) -> Optional[int]:
         """Safely convert string to integer, handling float strings like '211.0'"""
-        if not value:
-            return None
-        
-        try:
-            # First try direct int conversion
-            return int(value.strip())
-        except ValueError:
-            try:
-                # If that fails, try float conversion then int (handles "211.0" -> 211)
-                float_val = float(value.strip())
-                # Check for infinity and NaN
-                if float_val == float('inf') or float_val == float('-inf') or float_val != float_val:
-                    return None
-                return int(float_val)
-            except (ValueError, AttributeError, OverflowError):
-                return None
-        except AttributeError:
-            return None
+        return parse_int(value)
     
     @staticmethod
     def safe_float_convert(value: Optional[str]) -> Optional[float]:
         """Safely convert string to float"""
-        if not value:
-            return None
-        
-        try:
-            return float(value.strip())
-        except (ValueError, AttributeError):
-            return None
+        return parse_float(value)
     
     @staticmethod
     def validate_required_fields(data: Dict[str, Any], required_fields: List[str]) -> List[str]:
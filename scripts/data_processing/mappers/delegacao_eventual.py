@@ -74,6 +74,8 @@ class DelegacaoEventualMapper(SchemaMapper):
     Based on official Parliament documentation identical across IX-XIII legislatures.
     """
 
+    ACTIVITY_SOURCES = ['delegacao']
+
     def __init__(self, session, import_status_record=None):
         # Accept SQLAlchemy session directly (passed by unified importer)
         super().__init__(session, import_status_record=import_status_record)
@@ -136,7 +138,8 @@ class DelegacaoEventualMapper(SchemaMapper):
                         raise SchemaError(f"Delegation event processing failed in strict mode: {e}")
                     continue
             
-            # Commit all changes
+            # Refresh the activity timeline before the importer commits
+            self._sync_activity_events(legislatura)
             return results
             
         except Exception as e:
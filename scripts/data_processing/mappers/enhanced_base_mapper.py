@@ -10,6 +10,7 @@ XML processing, and error handling.
 import logging
 import os
 import re
+import threading
 import uuid
 
 # Import models
@@ -19,16 +20,25 @@ import xml.etree.ElementTree as ET
 # SQLAlchemy session handling (sessions passed from unified importer)
 from abc import ABC, abstractmethod
 from datetime import datetime
+from sqlalchemy import text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from .common_utilities import DataValidationUtils
-from typing import Any, Dict, List, Optional, Set
+from .value_parsers import parse_bool, parse_date_formats
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+from database.legislature_registry import invalidate_legislature_registry
 from database.models import Legislatura, Deputado, DeputyIdentityMapping, Coligacao, ColigacaoPartido
-from .coalition_detector import CoalitionDetector
+from .coalition_detector import shared_coalition_detector
+from .string_table import StringTable
+from .upsert_buffer import UpsertBuffer
+from scripts.data_processing.import_profiler import profile_phase
 
 logger = logging.getLogger(__name__)
 
+# Advisory lock namespace of deputy creation in sharded imports
+DEPUTADO_LOCK_NAMESPACE = 7201
+
 
 class CacheMixin:
     """
@@ -69,7 +79,8 @@ class CacheMixin:
         """
         self._pending_count += 1
         if force or self._pending_count >= self.BATCH_SIZE:
-            self.session.flush()
+            with profile_phase(getattr(self, 'profiler', None), 'flush'):
+                self.session.flush()
             self._pending_count = 0
 
     def _preload_shared_caches(self, legislatura: 'Legislatura' = None) -> None:
@@ -153,12 +164,47 @@ class CacheMixin:
             self._deputado_cache[f"cadastro_{deputado.id_cadastro}"] = deputado
 
 
+# Process-wide sigla -> (coalition id, linked component siglas) of committed
+# coalitions, loaded once per import process (see CoalitionDetectionMixin)
+_coalition_map: Optional[Dict[str, Tuple[uuid.UUID, FrozenSet[str]]]] = None
+_coalition_map_lock = threading.Lock()
+
+
+def load_coalition_map(session) -> Dict[str, Tuple[uuid.UUID, FrozenSet[str]]]:
+    """Coligacao ids and their ColigacaoPartido component siglas, by coalition sigla"""
+    components: Dict[uuid.UUID, Set[str]] = {}
+    for coligacao_id, partido_sigla in session.query(ColigacaoPartido.coligacao_id, ColigacaoPartido.partido_sigla):
+        components.setdefault(coligacao_id, set()).add(partido_sigla)
+    return {
+        sigla: (coligacao_id, frozenset(components.get(coligacao_id, ())))
+        for coligacao_id, sigla in session.query(Coligacao.id, Coligacao.sigla)
+    }
+
+
+def get_coalition_map(session) -> Dict[str, Tuple[uuid.UUID, FrozenSet[str]]]:
+    """The process-wide coalition map, loaded with session on first use"""
+    global _coalition_map
+    if _coalition_map is None:
+        with _coalition_map_lock:
+            if _coalition_map is None:
+                _coalition_map = load_coalition_map(session)
+                logger.debug(f"Coalition map loaded: {len(_coalition_map)} coalitions")
+    return _coalition_map
+
+
+def invalidate_coalition_map() -> None:
+    """Drop the coalition map; the next lookup reloads it"""
+    global _coalition_map
+    _coalition_map = None
+
+
 class CoalitionDetectionMixin:
     """Mixin providing coalition detection capabilities to mappers"""
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.coalition_detector = CoalitionDetector()
+        # Shared per process: compiled rules and the sigla -> detection memo
+        self.coalition_detector = shared_coalition_detector()
         self._coalition_cache = {}  # Cache detection results
         self._created_coalitions = {}  # Cache created Coligacao objects by sigla
     
@@ -208,6 +254,16 @@ class CoalitionDetectionMixin:
         if sigla in self._created_coalitions:
             return self._created_coalitions[sigla]
 
+        # Committed coalitions with all their components linked need no upsert
+        known = get_coalition_map(self.session).get(sigla)
+        component_siglas = {component["sigla"] for component in coalition_info.get("component_parties", [])}
+        if known and component_siglas <= known[1]:
+            coalition = self.session.get(Coligacao, known[0])
+            if coalition is not None:
+                self._created_coalitions[sigla] = coalition
+                return coalition
+            invalidate_coalition_map()  # Deleted since the map was loaded
+
         # Use PostgreSQL upsert for parallel-safe coalition creation
         # This prevents UniqueViolation when multiple workers try to create the same coalition
         new_id = uuid.uuid4()
@@ -598,6 +654,7 @@ class LegislatureHandlerMixin:
 
             if str(legislatura_id) == str(new_id):
                 logger.info(f"Created new legislatura: {target_legislature} (ID: {legislatura.id})")
+                invalidate_legislature_registry()
             else:
                 logger.debug(f"Found existing legislatura '{target_legislature}' (ID: {legislatura.id}) via upsert")
 
@@ -728,11 +785,15 @@ class LegislatureHandlerMixin:
             legislatura_id=legislatura_id
         )
 
-        self.session.add(deputado)
-        # Flush is required here because PostgreSQL checks FK constraints immediately.
-        # Child records (atividades, intervencoes, etc.) will reference this deputado_id,
-        # and the parent row must exist in the DB before INSERT of children.
-        self.session.flush()
+        shared = self._create_shared_deputado(deputado)
+        if shared is not None:
+            deputado = shared
+        else:
+            self.session.add(deputado)
+            # Flush is required here because PostgreSQL checks FK constraints immediately.
+            # Child records (atividades, intervencoes, etc.) will reference this deputado_id,
+            # and the parent row must exist in the DB before INSERT of children.
+            self.session.flush()
 
         # Cache for future lookups
         if hasattr(self, '_deputado_cache'):
@@ -743,10 +804,64 @@ class LegislatureHandlerMixin:
         logger.debug(f"Created deputy record: ID={deputado.id}, xml_source_id={record_id}, cadastro={id_cadastro}, name={nome}")
         return deputado
 
+    def _create_shared_deputado(self, deputado: Deputado) -> Optional[Deputado]:
+        """
+        Commit a new deputy in a short transaction of its own (sharded imports).
+
+        Chunks of one file mapped concurrently may meet the same deputy. The
+        per-deputy advisory lock is the only lock taken in that transaction
+        and is released at its commit, so chunk transactions never wait on
+        each other (and cannot deadlock) over deputies; a chunk that lost the
+        race reuses the committed row.
+
+        Returns:
+            The deputy loaded in the mapper's session, or None when the caller
+            creates it in the import transaction (not sharded, not PostgreSQL,
+            or its legislature is not committed yet)
+        """
+        if (not getattr(self, 'shared_entity_locks', False) or deputado.xml_source_id is None
+                or self.session.get_bind().dialect.name != 'postgresql'):
+            return None
+
+        from sqlalchemy.orm import Session
+
+        with Session(bind=self.session.get_bind()) as session:
+            # A legislature created by this chunk is only visible to its own transaction
+            if session.get(Legislatura, deputado.legislatura_id) is None:
+                return None
+            session.execute(
+                text("SELECT pg_advisory_xact_lock(:namespace, :key)"),
+                {'namespace': DEPUTADO_LOCK_NAMESPACE, 'key': int(deputado.xml_source_id) % 2**31},
+            )
+            deputado_id = session.query(Deputado.id).filter_by(xml_source_id=deputado.xml_source_id).scalar()
+            if deputado_id is None:
+                deputado_id = deputado.id
+                session.add(deputado)
+            session.commit()
+        return self.session.get(Deputado, deputado_id)
 
 
 class XMLProcessingMixin:
-    """Mixin providing common XML processing utilities"""
+    """
+    Mixin providing common XML processing utilities
+
+    When the mapper has a `string_table` (see string_table.StringTable), text
+    of code and designation tags is returned as one shared object per
+    distinct value.
+    """
+
+    string_table: Optional[StringTable] = None
+
+    def _intern_text(self, tag: str, text: Optional[str]) -> Optional[str]:
+        """Canonical object for the text of a tag (text itself without a string table)"""
+        if self.string_table is None:
+            return text
+        return self.string_table.intern(text, tag)
+
+    def intern_tree(self, xml_root: ET.Element) -> None:
+        """Intern repeated element texts of a parsed file before mapping it"""
+        if self.string_table is not None:
+            self.string_table.intern_tree(xml_root)
 
     @staticmethod
     def safe_text_extract(element: Optional[ET.Element], default: str = "") -> str:
@@ -771,16 +886,10 @@ class XMLProcessingMixin:
     ) -> Optional[datetime]:
         """Safely extract date from XML element"""
         if element is not None and element.text:
-            try:
-                return datetime.strptime(element.text.strip(), format_str)
-            except ValueError:
-                # Try alternative formats
-                alt_formats = ["%d-%m-%Y", "%Y/%m/%d", "%d/%m/%Y"]
-                for alt_format in alt_formats:
-                    try:
-                        return datetime.strptime(element.text.strip(), alt_format)
-                    except ValueError:
-                        continue
+            # Requested format first, then the alternative formats
+            return parse_date_formats(
+                element.text, (format_str, "%d-%m-%Y", "%Y/%m/%d", "%d/%m/%Y"), warn=False
+            )
         return None
 
     def _collect_field_names(
@@ -834,7 +943,7 @@ class XMLProcessingMixin:
 
         element = parent.find(full_tag)
         if element is not None and element.text:
-            return element.text.strip()
+            return self._intern_text(tag, element.text.strip())
         return None
 
     def _get_namespaced_element(
@@ -861,8 +970,7 @@ class XMLProcessingMixin:
         try:
             element = parent.find(tag_name)
             if element is not None and element.text:
-                text = element.text.strip()
-                return text
+                return self._intern_text(tag_name, element.text.strip())
             return None
         except AttributeError:
             logger.warning(f"Error accessing element with tag '{tag_name}' from parent")
@@ -900,14 +1008,10 @@ class XMLProcessingMixin:
         if text_value is None:
             return None
         
-        value_lower = text_value.lower().strip()
-        
-        # True values (English and Portuguese)
-        if value_lower in ('true', '1', 'yes', 'sim', 's'):
-            return True
-        # False values (English and Portuguese) 
-        elif value_lower in ('false', '0', 'no', 'não', 'nao', 'n'):
-            return False
+        # English and Portuguese spellings (see value_parsers.TRUE_VALUES/FALSE_VALUES)
+        value = parse_bool(text_value)
+        if value is not None:
+            return value
         
         # Log warning for unrecognized values
         logger.warning(f"Unrecognized boolean value '{text_value}' for tag '{tag_name}', returning None")
@@ -961,19 +1065,51 @@ class EnhancedSchemaMapper(
     Child classes can declare import order dependencies by overriding:
         IMPORT_DEPENDENCIES = ['dependency1', 'dependency2']
 
+    Mappers whose records appear in the activity timeline declare their
+    sources (keys of activity_events.ACTIVITY_SOURCES) and call
+    _sync_activity_events(legislatura) once a file has been mapped:
+        ACTIVITY_SOURCES = ['intervencao']
+
     Cache is session-scoped and automatically initialized. Call _clear_caches()
     when switching between processing runs or legislatures.
+
+    The importer sets `profiler` (see import_profiler.ImportProfiler); schema
+    coverage, batch flushes and the activity timeline refresh are recorded as
+    phases of the mapper. Further phases can be added with:
+        with self._profile_phase('deputies'):
+            ...
     """
 
+    # Activity timeline sources fed by this mapper (see activity_events.ACTIVITY_SOURCES)
+    ACTIVITY_SOURCES: List[str] = []
+
+    # Phase profiler of the current import (set by the importer, None otherwise)
+    profiler = None
+
+    # Intern repeated code/designation strings per file (see string_table.py)
+    INTERN_STRINGS = True
+
+    # Set when chunks of one file are mapped concurrently (see sharded_import.py)
+    shared_entity_locks = False
+
+    # Leave the activity timeline to the caller (sharded chunks: synced once by the coordinator)
+    defer_activity_events = False
+
     def __init__(self, session, import_status_record=None):
         DatabaseSessionMixin.__init__(self, session)
         CoalitionDetectionMixin.__init__(self)
         # Initialize entity caches from CacheMixin
         self._init_caches()
+        # One string table per mapper instance, i.e. per file
+        self.string_table = StringTable() if self.INTERN_STRINGS else None
         # Store import status record for data provenance tracking
         self._import_status_record = import_status_record
         self._import_status_id = import_status_record.id if import_status_record else None
 
+    def _profile_phase(self, name: str):
+        """Context manager recording a phase in the import profile (no-op without profiler)"""
+        return profile_phase(self.profiler, name)
+
     def _attach_import_source(self, record):
         """
         Attach import source tracking to a record before adding to session.
@@ -1004,6 +1140,92 @@ class EnhancedSchemaMapper(
         self.session.add(record)
         return record
 
+    def _upsert_buffer(self, model, key_columns, *criteria, depends_on=()) -> UpsertBuffer:
+        """
+        Preload-and-upsert buffer of a model (see upsert_buffer.py).
+
+        Replaces a per-record existence query: the natural keys of the rows
+        matching criteria (e.g. the legislature's) are loaded once, and rows
+        are written as batched INSERT ... ON CONFLICT DO UPDATE statements
+        tagged with this import's import_status_id. The caller flushes the
+        buffer at the end of the file.
+
+        Args:
+            model: SQLAlchemy model with an id primary key
+            key_columns: Natural key column names
+            criteria: Filters selecting the existing rows to preload
+            depends_on: Parent buffers flushed before this one
+        """
+        buffer = UpsertBuffer(self.session, model, key_columns, depends_on=depends_on,
+                              import_status_id=self._import_status_id)
+        with self._profile_phase('preload'):
+            buffer.preload(*criteria)
+        return buffer
+
+    def _run_derived_sync(self, phase_name: str, description: str, sync: Callable[[], Any]) -> Any:
+        """
+        Refresh data derived from the mapped records.
+
+        Runs sync() in a savepoint of the import transaction, so the derived
+        rows are committed together with the records they come from. A
+        failure (e.g. the derived table's migration not applied yet) only
+        rolls back the savepoint and is logged; the derived data can be
+        rebuilt later with its module's rebuild script.
+
+        Returns:
+            What sync() returned, or None when it failed
+        """
+        try:
+            with self._profile_phase(phase_name), self.session.begin_nested():
+                result = sync()
+        except Exception as e:
+            logger.warning(f"Could not refresh {description}: {e}")
+            return None
+        logger.info(f"Refreshed {description}: {result}")
+        return result
+
+    def _sync_activity_events(self, legislatura: Legislatura) -> None:
+        """Refresh this mapper's activity timeline rows for a legislature"""
+        if not self.ACTIVITY_SOURCES or legislatura is None or self.defer_activity_events:
+            return
+
+        from scripts.data_processing.activity_events import sync_activity_events
+
+        self._run_derived_sync(
+            'activity_events', f"activity events for {legislatura.numero}",
+            lambda: sync_activity_events(self.session, self.ACTIVITY_SOURCES, legislatura.id),
+        )
+
+    def _sync_budget_vote_stats(self, legislatura: Legislatura) -> None:
+        """Recompute a legislature's per-party budget vote totals (OE mapper)"""
+        if legislatura is None:
+            return
+
+        from scripts.data_processing.budget_votes import sync_party_vote_stats
+
+        self._run_derived_sync(
+            'budget_vote_stats', f"budget party vote stats for {legislatura.numero}",
+            lambda: sync_party_vote_stats(self.session, legislatura.id),
+        )
+
+    def _sync_interest_links(self, legislatura: Legislatura) -> None:
+        """
+        Resolve the deputies and organizations named in a legislature's
+        interest declarations, in separate savepoints (entity counts and
+        co-occurrences are refreshed after the import run, see post_import.py)
+        """
+        from scripts.data_processing.interest_entities import sync_interest_entities
+        from scripts.data_processing.interest_links import resolve_spouse_links
+
+        self._run_derived_sync(
+            'interest_links', f"interest registry spouse links for {legislatura.numero}",
+            lambda: resolve_spouse_links(self.session, legislatura.id),
+        )
+        self._run_derived_sync(
+            'interest_entities', f"interest registry entity links for {legislatura.numero}",
+            lambda: sync_interest_entities(self.session, legislatura.id),
+        )
+
     def _normalize_name(self, name: str) -> str:
         """
         Normalize name to proper title case, handling Portuguese names correctly.
@@ -1064,7 +1286,8 @@ class EnhancedSchemaMapper(
         self, xml_root: ET.Element, file_info: Dict, strict_mode: bool = False
     ):
         """Validate schema coverage and raise SchemaError if unmapped fields are found"""
-        unmapped_fields = self.check_schema_coverage(xml_root)
+        with self._profile_phase('schema_coverage'):
+            unmapped_fields = self.check_schema_coverage(xml_root)
         if unmapped_fields:
             unmapped_summary = ", ".join(list(unmapped_fields)[:10])
             
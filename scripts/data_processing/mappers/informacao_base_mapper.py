@@ -39,6 +39,7 @@ from .common_utilities import DataValidationUtils
 from .enhanced_base_mapper import SchemaError, SchemaMapper
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+from database.legislature_registry import invalidate_legislature_registry
 from database.models import (
     CirculoEleitoral,
     DadosSituacaoDeputado,
@@ -312,6 +313,8 @@ class InformacaoBaseMapper(SchemaMapper):
                 legislatura.data_inicio = data_inicio
             if legislatura.data_fim is None and data_fim is not None:
                 legislatura.data_fim = data_fim
+                # The current legislature may have changed
+                invalidate_legislature_registry()
                 
             logger.info(f"Using legislature {legislatura.numero} (ID: {legislatura.id}) for sigla '{sigla}'")
 
@@ -127,6 +127,8 @@ logger = logging.getLogger(__name__)
 class InitiativasMapper(SchemaMapper):
     """Comprehensive schema mapper for legislative initiatives files"""
 
+    ACTIVITY_SOURCES = ['iniciativa']
+
     def __init__(self, session, import_status_record=None):
         # Accept SQLAlchemy session directly (passed by unified importer)
         super().__init__(session, import_status_record=import_status_record)
@@ -696,6 +698,9 @@ class InitiativasMapper(SchemaMapper):
             # Clear cache after processing
             self._iniciativa_cache.clear()
 
+            # Refresh the activity timeline before the importer commits
+            self._sync_activity_events(legislatura)
+
             return results
 
         except Exception as e:
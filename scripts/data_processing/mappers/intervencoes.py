@@ -62,6 +62,8 @@ class IntervencoesMapper(SchemaMapper):
     with comprehensive field mapping based on December 2017 specification.
     Includes coded value translation for debates, interventions, activities, and publications.
     """
+
+    ACTIVITY_SOURCES = ['intervencao']
     
     def __init__(self, session, import_status_record=None):
         # Accept SQLAlchemy session directly (passed by unified importer)
@@ -217,7 +219,8 @@ class IntervencoesMapper(SchemaMapper):
                         logger.error("STRICT MODE: Raising exception due to intervention processing error")
                         raise RuntimeError(f"STRICT MODE - Data integrity issue: {error_msg}")
             
-            # Commit all changes
+            # Refresh the activity timeline before the importer commits
+            self._sync_activity_events(legislatura)
             
             logger.info(f"Successfully processed Intervencoes file: {file_path}")
             logger.info(f"Statistics: {self.processed_interventions} interventions, "
@@ -38,6 +38,7 @@ from .common_utilities import DataValidationUtils
 from .enhanced_base_mapper import SchemaError, SchemaMapper
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+from scripts.data_processing.budget_votes import load_group_resolver, parse_grupos_element
 from database.models import (
     Legislatura,
     OrcamentoEstado,
@@ -246,6 +247,14 @@ class OrcamentoEstadoMapper(SchemaMapper):
         # Caches for upsert pattern - avoid duplicate database queries
         self._proposal_cache = {}  # proposta_id -> OrcamentoEstadoPropostaAlteracao
         self._item_cache = {}  # item_id -> OrcamentoEstadoItem
+        self._group_resolver_cache = None
+
+    @property
+    def _group_resolver(self):
+        """Group name -> party sigla for the vote matrix, loaded on first vote"""
+        if self._group_resolver_cache is None:
+            self._group_resolver_cache = load_group_resolver(self.session)
+        return self._group_resolver_cache
 
     def get_expected_fields(self) -> Set[str]:
         """
@@ -612,6 +621,8 @@ class OrcamentoEstadoMapper(SchemaMapper):
                 results["errors"].append(error_msg)
                 return results
 
+            self._sync_budget_vote_stats(legislatura)
+
             logger.info(f"Successfully processed Orçamento do Estado file: {file_path}")
             logger.info(
                 f"Statistics: {self.processed_proposals} proposals (legacy), "
@@ -805,6 +816,7 @@ class OrcamentoEstadoMapper(SchemaMapper):
                 "resultado": resultado,
                 "diplomas_terceiros": self._get_text_value(votacao_elem, "DiplomasTerceiros"),
                 "grupos_parlamentares": self._get_text_value(votacao_elem, "GruposParlamentares"),
+                "votos_grupos": parse_grupos_element(votacao_elem.find("GruposParlamentares")),
             }
         )
 
@@ -969,12 +981,14 @@ class OrcamentoEstadoMapper(SchemaMapper):
             votacao_obj = OrcamentoEstadoVotacao(
                 id=uuid.uuid4(),
                 proposta_id=parsed.db_obj.id,
+                legislatura_id=parsed.db_obj.legislatura_id,
                 data_votacao=votacao.data["data_votacao"],
                 descricao=votacao.data["descricao"],
                 sub_descricao=votacao.data["sub_descricao"],
                 resultado=votacao.data["resultado"],
                 diplomas_terceiros_texto=votacao.data["diplomas_terceiros"],
                 grupos_parlamentares_texto=votacao.data["grupos_parlamentares"],
+                votos_partidos=self._group_resolver.matrix(votacao.data["votos_grupos"]),
             )
             self._add_with_tracking(votacao_obj)
             self.processed_votes += 1
@@ -1394,6 +1408,7 @@ class OrcamentoEstadoMapper(SchemaMapper):
                 "resultado": resultado,
                 "diplomas_terceiros": diplomas_terceiros,
                 "grupos_parlamentares": grupos_parlamentares,
+                "votos_grupos": parse_grupos_element(grupos_elem),
             }
         )
 
@@ -1583,12 +1598,14 @@ class OrcamentoEstadoMapper(SchemaMapper):
             votacao_obj = OrcamentoEstadoVotacao(
                 id=uuid.uuid4(),
                 item_id=parsed.db_obj.id,
+                legislatura_id=parsed.db_obj.legislatura_id,
                 data_votacao=votacao.data["data_votacao"],
                 descricao=votacao.data["descricao"],
                 sub_descricao=votacao.data["sub_descricao"],
                 resultado=votacao.data["resultado"],
                 diplomas_terceiros_texto=votacao.data["diplomas_terceiros"],
                 grupos_parlamentares_texto=votacao.data["grupos_parlamentares"],
+                votos_partidos=self._group_resolver.matrix(votacao.data["votos_grupos"]),
             )
             self._add_with_tracking(votacao_obj)
             self.processed_votes += 1
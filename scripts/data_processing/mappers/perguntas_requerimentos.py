@@ -49,6 +49,8 @@ logger = logging.getLogger(__name__)
 class PerguntasRequerimentosMapper(EnhancedSchemaMapper):
     """Schema mapper for parliamentary questions and requests files"""
 
+    ACTIVITY_SOURCES = ['pergunta_requerimento']
+
     def __init__(self, session, import_status_record=None):
         # Accept SQLAlchemy session directly (passed by unified importer)
         super().__init__(session, import_status_record=import_status_record)
@@ -198,7 +200,8 @@ class PerguntasRequerimentosMapper(EnhancedSchemaMapper):
                     results["records_processed"] += 1
                     raise RuntimeError(f"Data integrity issue: {error_msg}")
 
-            # Commit all changes
+            # Refresh the activity timeline before the importer commits
+            self._sync_activity_events(legislatura)
             return results
 
         except Exception as e:
@@ -85,6 +85,8 @@ class PeticoesMapper(SchemaMapper):
     - Database session handling with integrity controls
     - Schema validation and error handling
     """
+
+    ACTIVITY_SOURCES = ['peticao']
     
     def __init__(self, session, import_status_record=None):
         # Accept SQLAlchemy session directly (passed by unified importer)
@@ -391,7 +393,8 @@ class PeticoesMapper(SchemaMapper):
                         raise SchemaError(f"Petition processing failed in strict mode: {e}")
                     continue  # Continue processing other petitions in non-strict mode
             
-            # Commit all changes
+            # Refresh the activity timeline before the importer commits
+            self._sync_activity_events(legislatura)
             return results
             
         except Exception as e:
@@ -183,15 +183,13 @@ class PoliticalEntityQueries:
         """
         entities = []
         
-        # Get all coalitions
-        coalitions = self.session.query(Coligacao).order_by(Coligacao.sigla).all()
-        
-        # Filter by activity status using calculated property if needed
+        # Get all coalitions with their active flag (one query)
+        coalitions = self.session.query(Coligacao, Coligacao.is_active).order_by(Coligacao.sigla)
         if not include_inactive:
-            coalitions = [c for c in coalitions if c.ativo]
+            coalitions = coalitions.filter(Coligacao.is_active)
         
-        for coalition in coalitions:
-            entity_data = self._format_coalition_entity(coalition, include_components)
+        for coalition, ativa in coalitions.all():
+            entity_data = self._format_coalition_entity(coalition, include_components, ativa=ativa)
             entities.append(entity_data)
         
         # Get individual parties (not part of coalitions)
@@ -236,7 +234,7 @@ class PoliticalEntityQueries:
         
         # Search coalitions
         if entity_type is None or entity_type == "coligacao":
-            coalitions_all = (
+            coalitions = (
                 self.session.query(Coligacao)
                 .filter(
                     or_(
@@ -244,15 +242,14 @@ class PoliticalEntityQueries:
                         Coligacao.nome.ilike(search_pattern)
                     )
                 )
+                .filter(Coligacao.is_active)
                 .order_by(Coligacao.sigla)
+                .limit(limit // 2 if entity_type is None else limit)
                 .all()
             )
             
-            # Filter active coalitions using calculated property
-            coalitions = [c for c in coalitions_all if c.ativo][:limit // 2 if entity_type is None else limit]
-            
             for coalition in coalitions:
-                entity_data = self._format_coalition_entity(coalition, False)
+                entity_data = self._format_coalition_entity(coalition, False, ativa=True)
                 entity_data["match_type"] = "coalition"
                 entities.append(entity_data)
         
@@ -284,12 +281,8 @@ class PoliticalEntityQueries:
     def get_entity_statistics(self) -> Dict[str, Any]:
         """Get comprehensive statistics about political entities"""
         
-        # Coalition statistics - using subquery for active count since ativo is now a calculated property
-        total_coalitions = self.session.query(func.count(Coligacao.id)).scalar()
-        
-        # Get all coalitions to calculate active count
-        all_coalitions = self.session.query(Coligacao).all()
-        active_count = len([c for c in all_coalitions if c.ativo])
+        # Coalition statistics - active flags are materialized, so this is one indexed count
+        active_count = self.session.query(func.count(Coligacao.id)).filter(Coligacao.is_active).scalar()
         
         coalition_stats = (
             self.session.query(
@@ -342,9 +335,14 @@ class PoliticalEntityQueries:
         }
     
     def _format_coalition_entity(
-        self, coalition: Coligacao, include_components: bool = False
+        self, coalition: Coligacao, include_components: bool = False, ativa: Optional[bool] = None
     ) -> Dict[str, Any]:
-        """Format coalition for unified entity response"""
+        """
+        Format coalition for unified entity response
+
+        ativa is the coalition's active flag when the caller already selected
+        it; otherwise it is looked up.
+        """
         result = {
             "id": coalition.id,
             "sigla": coalition.sigla,
@@ -354,7 +352,7 @@ class PoliticalEntityQueries:
             "espectro_politico": coalition.espectro_politico,
             "data_formacao": coalition.data_formacao.isoformat() if coalition.data_formacao else None,
             "data_dissolucao": coalition.data_dissolucao.isoformat() if coalition.data_dissolucao else None,
-            "ativa": coalition.ativo
+            "ativa": coalition.ativo if ativa is None else ativa
         }
         
         # Always include mandate stats (deputy_count, mandate_count)
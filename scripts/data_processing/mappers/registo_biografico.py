@@ -603,6 +603,7 @@ class RegistoBiograficoMapper(EnhancedSchemaMapper):
                             # Create base mandate record
                             mandate = DeputadoMandatoLegislativo(
                                 deputado_id=deputy.id,
+                                legislatura_id=legislatura_id,
                                 dep_nome_parlamentar=nome_parlamentar,
                                 leg_des=leg_des,
                                 ce_des=ce_des,  # New I Legislature field
@@ -1185,6 +1186,7 @@ class RegistoBiograficoMapper(EnhancedSchemaMapper):
                             # Create base mandate record
                             mandate = DeputadoMandatoLegislativo(
                                 deputado_id=mandate_deputy.id,
+                                legislatura_id=mandate_legislatura_id,
                                 dep_nome_parlamentar=nome_parlamentar,
                                 leg_des=leg_des,
                                 ce_des=ce_des,
@@ -522,6 +522,9 @@ class RegistoInteressesMapper(EnhancedSchemaMapper):
                         # No rollback recovery to mask underlying issues
                         raise SchemaError(f"V1 conflicts record processing failed - stopping importer: {e}") from e
 
+            # Link spouses to deputies before the importer commits
+            self._sync_interest_links(legislatura)
+
             # Commit all changes
             logger.info(
                 f"Imported {results['records_imported']} conflicts of interest records from {file_info['file_path']}"
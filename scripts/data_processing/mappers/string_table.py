@@ -0,0 +1,169 @@
+"""
+String Table
+============
+
+Per-file interning of the short strings that repeat on every record of an
+XML file: party acronyms (parSigla, gpSigla), legislature designations
+(legDes), electoral circles (ceDes), publication types, phase and status
+names. ElementTree creates a fresh str for every element's text, and ORM
+instances and mapper caches keep them alive until the file is done, so a
+large file holds thousands of copies of "PS" or "XVII".
+
+A StringTable maps each distinct value to one canonical str object:
+
+- intern_tree() rewrites the text of matching elements right after parsing,
+  so the tree itself holds one copy per distinct value
+- intern() canonicalizes values returned by the mapper text helpers
+
+Only tags that look like codes or designations are interned (see
+should_intern()); free text such as summaries and names is left alone so
+the table stays small. Coded fields documented in database/translators use
+a CodeTable instead, whose canonical strings are the enum member names and
+which also exposes compact lookup ids.
+
+A table lives as long as one mapper instance, i.e. one file.
+"""
+
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, Optional, Type
+import xml.etree.ElementTree as ET
+
+from database.translators.deputy_activities import TipodeAtividade
+from database.translators.general_activities import TipodeAutor, TipodeReuniao
+from database.translators.publications import TipodePublicacao
+from database.translators.registo_biografico import SexoType
+
+# Longest value interned; longer text is assumed to be free text
+MAX_INTERNED_LENGTH = 120
+
+# Local tag names (lower case) ending like this hold codes or designations
+INTERNED_TAG_SUFFIXES = (
+    'sigla', 'des', 'leg', 'legislatura', 'gp', 'tp', 'tipo', 'fase', 'estado', 'situacao',
+    'resultado', 'cargo', 'sexo', 'sessao', 'orgao',
+)
+
+# Coded tags backed by a translator enum (local tag name -> enum)
+CODE_TABLE_ENUMS: Dict[str, Type[Enum]] = {
+    'pubTp': TipodePublicacao,
+    'ActTp': TipodeAtividade,
+    'actTp': TipodeAtividade,
+    'TipoAutor': TipodeAutor,
+    'tipoAutor': TipodeAutor,
+    'TipoReuniao': TipodeReuniao,
+    'tipoReuniao': TipodeReuniao,
+    'cadSexo': SexoType,
+}
+
+
+class CodeTable:
+    """Codes of a translator enum, with their canonical strings and lookup ids"""
+
+    def __init__(self, enum_class: Type[Enum]):
+        self.enum_class = enum_class
+        self._codes = tuple(member.name for member in enum_class)
+        self._ids = {code: code_id for code_id, code in enumerate(self._codes)}
+
+    def canonical(self, text: str) -> Optional[str]:
+        """The enum's own str for a code (None if text is not a known code)"""
+        code_id = self._ids.get(text)
+        return None if code_id is None else self._codes[code_id]
+
+    def code_id(self, text: str) -> Optional[int]:
+        """Compact id of a code (position in the enum)"""
+        return self._ids.get(text)
+
+    def code(self, code_id: int) -> str:
+        """The code of a lookup id"""
+        return self._codes[code_id]
+
+
+@lru_cache(maxsize=None)
+def code_table(tag: str) -> Optional[CodeTable]:
+    """Shared CodeTable for a local tag name (None if the tag is not coded)"""
+    enum_class = CODE_TABLE_ENUMS.get(tag)
+    return CodeTable(enum_class) if enum_class else None
+
+
+@lru_cache(maxsize=4096)
+def should_intern(tag: str) -> bool:
+    """Whether values of a local tag name are interned"""
+    return tag in CODE_TABLE_ENUMS or tag.lower().endswith(INTERNED_TAG_SUFFIXES)
+
+
+def local_name(tag: str) -> str:
+    """Tag without namespace or path ('{ns}pubTp' and 'Pub/pubTp' -> 'pubTp')"""
+    return tag.rpartition('}')[2].rpartition('/')[2]
+
+
+class StringTable:
+    """Canonical str objects for the repeated values of one file"""
+
+    def __init__(self, max_entries: int = 50000):
+        """
+        Args:
+            max_entries: Distinct values kept; later new values are returned as-is
+        """
+        self.max_entries = max_entries
+        self._strings: Dict[str, str] = {}
+        self.lookups = 0
+        self.hits = 0
+
+    def intern(self, text: Optional[str], tag: str = None) -> Optional[str]:
+        """
+        Canonical object for text.
+
+        Args:
+            text: Value to intern (None is returned as-is)
+            tag: Element tag; when given, only values of interned tags are
+                 canonicalized and coded tags use their CodeTable
+        """
+        if text is None or len(text) > MAX_INTERNED_LENGTH:
+            return text
+        if tag is not None:
+            tag = local_name(tag)
+            if not should_intern(tag):
+                return text
+            table = code_table(tag)
+            if table is not None:
+                canonical = table.canonical(text)
+                if canonical is not None:
+                    self.lookups += 1
+                    self.hits += 1
+                    return canonical
+
+        self.lookups += 1
+        canonical = self._strings.get(text)
+        if canonical is not None:
+            self.hits += 1
+            return canonical
+        if len(self._strings) < self.max_entries:
+            self._strings[text] = text
+        return text
+
+    def intern_tree(self, root: ET.Element) -> int:
+        """
+        Replace the text of interned tags under root by canonical objects.
+
+        Returns:
+            Number of element texts replaced by an existing object
+        """
+        hits = self.hits
+        for element in root.iter():
+            text = element.text
+            if text is not None and isinstance(element.tag, str):
+                element.text = self.intern(text, element.tag)
+        return self.hits - hits
+
+    def stats(self) -> Dict:
+        """Distinct values, lookups and hit rate"""
+        return {
+            'distinct': len(self._strings),
+            'lookups': self.lookups,
+            'hits': self.hits,
+            'hit_rate': round(self.hits / self.lookups, 3) if self.lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
@@ -0,0 +1,133 @@
+"""
+Upsert Buffer
+=============
+
+Preload-and-upsert of one table, for mappers that look rows up by a natural
+key before inserting or updating them.
+
+The per-record pattern
+    existing = session.query(Model).filter_by(<natural key>).first()
+costs one round-trip per record, which dominates files that are re-imported
+often (the agenda changes daily). An UpsertBuffer loads the natural keys
+and ids of the legislature's existing rows with one SELECT, gives every
+record its final primary key up front (the existing one, or a new uuid4) and
+writes the records in batches of
+    INSERT ... VALUES (...), (...) ON CONFLICT (id) DO UPDATE
+Conflicts are resolved on the primary key, so the natural key needs no
+unique constraint (agenda annexes have none, and their id_field may be NULL).
+
+Buffered rows are written with Core statements, outside the ORM unit of
+work: a child buffer flushes its parent buffers first, and a mapper flushes
+its buffers before anything else reads the rows.
+
+Usage:
+    agendas = self._upsert_buffer(AgendaParlamentar, ('id_externo', 'legislatura_id'),
+                                  AgendaParlamentar.legislatura_id == legislatura.id)
+    agenda_id = agendas.upsert({'id_externo': 1, 'legislatura_id': legislatura.id, 'titulo': ...})
+    ...
+    agendas.flush()
+"""
+
+import logging
+import uuid
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+logger = logging.getLogger(__name__)
+
+# Rows per INSERT statement (PostgreSQL allows 65535 bind parameters per statement)
+UPSERT_BATCH_SIZE = 500
+
+
+class UpsertBuffer:
+    """Batched INSERT ... ON CONFLICT DO UPDATE of one model, keyed by a natural key"""
+
+    def __init__(self, session, model, key_columns: Sequence[str], batch_size: int = UPSERT_BATCH_SIZE,
+                 depends_on: Iterable['UpsertBuffer'] = (), import_status_id=None):
+        self.session = session
+        self.model = model
+        self.table = model.__table__
+        self.key_columns = tuple(key_columns)
+        self.batch_size = batch_size
+        self.depends_on: List[UpsertBuffer] = list(depends_on)
+        self._import_status_id = import_status_id if 'import_status_id' in self.table.c else None
+        self._ids: Dict[tuple, uuid.UUID] = {}
+        self._existing = set()
+        self._pending: Dict[tuple, Dict] = {}
+        self.inserted = 0
+        self.updated = 0
+
+    def preload(self, *criteria) -> int:
+        """
+        Load natural key -> id of the existing rows matching criteria.
+
+        Returns:
+            Number of rows loaded
+        """
+        key_cols = [self.table.c[name] for name in self.key_columns]
+        rows = self.session.execute(select(self.table.c.id, *key_cols).where(*criteria)).all()
+        for row in rows:
+            key = tuple(row[1:])
+            self._ids[key] = row[0]
+            self._existing.add(key)
+        logger.debug(f"Preloaded {len(rows)} {self.table.name} keys")
+        return len(rows)
+
+    def key_of(self, values: Dict) -> tuple:
+        return tuple(values.get(name) for name in self.key_columns)
+
+    def id_for(self, key: tuple) -> Optional[uuid.UUID]:
+        """Id of a natural key (preloaded or assigned in this import)"""
+        return self._ids.get(key)
+
+    def upsert(self, values: Dict) -> uuid.UUID:
+        """
+        Buffer a row (column -> value, including the natural key columns).
+
+        The same natural key buffered twice is written once, with the later values.
+        All rows of a buffer must set the same columns.
+
+        Returns:
+            The row's primary key
+        """
+        key = self.key_of(values)
+        row_id = self._ids.get(key)
+        if row_id is None:
+            row_id = self._ids[key] = uuid.uuid4()
+        row = dict(values, id=row_id)
+        if self._import_status_id is not None:
+            row['import_status_id'] = self._import_status_id
+        self._pending[key] = row
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+        return row_id
+
+    def statement(self, rows: List[Dict]):
+        """INSERT ... ON CONFLICT (id) DO UPDATE of the buffered columns"""
+        stmt = pg_insert(self.table).values(rows)
+        updates = {name: stmt.excluded[name] for name in rows[0] if name != 'id'}
+        if 'updated_at' in self.table.c and 'updated_at' not in updates:
+            updates['updated_at'] = func.now()
+        return stmt.on_conflict_do_update(index_elements=[self.table.c.id], set_=updates)
+
+    def flush(self) -> int:
+        """Write the buffered rows (after the buffers this one depends on). Returns rows written."""
+        for parent in self.depends_on:
+            parent.flush()
+        if not self._pending:
+            return 0
+        rows = list(self._pending.values())
+        self.session.execute(self.statement(rows))
+        for key in self._pending:
+            if key in self._existing:
+                self.updated += 1
+            else:
+                self.inserted += 1
+                self._existing.add(key)
+        self._pending.clear()
+        return len(rows)
+
+    def __len__(self) -> int:
+        return len(self._pending)
@@ -0,0 +1,231 @@
+"""
+Value Parsing Kernel for Parliament Data Mappers
+================================================
+
+Fast, memoized conversion of XML text values into dates and numbers.
+
+Dates are by far the most frequent conversion during an import. Instead of
+trying every format with datetime.strptime and catching ValueError, the
+kernel sniffs the string's shape (length and separator positions) and
+builds the datetime directly for the zero-padded shapes found in the
+Parliament files:
+
+    2023-12-25            25/12/2023            25-12-2023
+    2023/12/25            2023-12-25T14:30:00   25/12/2023 14:30:00
+    2014-08               2008                  2004-12-09 00:00:00
+
+Anything else (single-digit days, odd spacing) falls back to strptime over
+the requested formats in order, so results are identical to the trial
+parsing it replaces. Results are kept in an LRU memo keyed by the stripped
+string and format tuple - the same dates repeat thousands of times within
+a file - and unparseable values are logged once rather than on every miss.
+
+Usage:
+    from .value_parsers import parse_date_formats, parse_ints
+
+    parse_date_formats("25/12/2023")            # datetime(2023, 12, 25)
+    parse_date_formats("2023-12-25", ("%Y-%m-%d",))
+    parse_ints(["1", "211.0", None])            # [1, 211, None]
+"""
+
+import logging
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Common date formats found in Parliament XML files (tried in this order)
+DATE_FORMATS: Tuple[str, ...] = (
+    "%Y-%m-%d",     # 2023-12-25
+    "%d-%m-%Y",     # 25-12-2023
+    "%Y/%m/%d",     # 2023/12/25
+    "%d/%m/%Y",     # 25/12/2023
+    "%Y-%m-%dT%H:%M:%S",  # 2023-12-25T14:30:00
+    "%d-%m-%Y %H:%M:%S",  # 25-12-2023 14:30:00
+    "%d/%m/%Y %H:%M:%S",  # 18/11/2004 00:00:00
+    "%Y/%m/%d %H:%M:%S",  # 2004/11/18 00:00:00
+    "%d/%m/%Y",     # Single digit support: 1/1/2023
+    "%Y-%m",        # 2014-08 (year-month)
+    "%Y",           # 2008 (year-only)
+)
+
+# Distinct strings remembered by the date memo
+DATE_CACHE_SIZE = 65536
+
+TRUE_VALUES = frozenset(('true', '1', 'yes', 'sim', 's'))
+FALSE_VALUES = frozenset(('false', '0', 'no', 'não', 'nao', 'n'))
+
+
+def _digits(value: str) -> bool:
+    return value.isascii() and value.isdigit()
+
+
+def _sniff_date(value: str) -> Optional[Tuple[str, datetime]]:
+    """
+    Recognise a zero-padded date shape and build it without strptime.
+
+    Returns:
+        (matching format, datetime) or None when the shape is not a fast path
+        (or the date is invalid, e.g. 2023-02-30 - strptime then decides)
+    """
+    length = len(value)
+    try:
+        if length == 10:
+            sep4, sep2 = value[4], value[2]
+            if sep4 in '-/' and value[7] == sep4 and _digits(value[:4]) and _digits(value[5:7]) and _digits(value[8:]):
+                return ('%Y-%m-%d' if sep4 == '-' else '%Y/%m/%d',
+                        datetime(int(value[:4]), int(value[5:7]), int(value[8:])))
+            if sep2 in '-/' and value[5] == sep2 and _digits(value[:2]) and _digits(value[3:5]) and _digits(value[6:]):
+                return ('%d-%m-%Y' if sep2 == '-' else '%d/%m/%Y',
+                        datetime(int(value[6:]), int(value[3:5]), int(value[:2])))
+        elif length == 19:
+            time_part = value[11:]
+            if not (time_part[2] == ':' and time_part[5] == ':' and _digits(time_part[:2])
+                    and _digits(time_part[3:5]) and _digits(time_part[6:])):
+                return None
+            hour, minute, second = int(time_part[:2]), int(time_part[3:5]), int(time_part[6:])
+            sep4, sep2, mid = value[4], value[2], value[10]
+            if sep4 in '-/' and value[7] == sep4 and _digits(value[:4]) and _digits(value[5:7]) and _digits(value[8:10]):
+                if sep4 == '-' and mid in 'T ':
+                    fmt = '%Y-%m-%dT%H:%M:%S' if mid == 'T' else '%Y-%m-%d %H:%M:%S'
+                elif sep4 == '/' and mid == ' ':
+                    fmt = '%Y/%m/%d %H:%M:%S'
+                else:
+                    return None
+                return fmt, datetime(int(value[:4]), int(value[5:7]), int(value[8:10]), hour, minute, second)
+            if sep2 in '-/' and value[5] == sep2 and mid == ' ' and _digits(value[:2]) and _digits(value[3:5]) and _digits(value[6:10]):
+                fmt = '%d-%m-%Y %H:%M:%S' if sep2 == '-' else '%d/%m/%Y %H:%M:%S'
+                return fmt, datetime(int(value[6:10]), int(value[3:5]), int(value[:2]), hour, minute, second)
+        elif length == 7:
+            if value[4] == '-' and _digits(value[:4]) and _digits(value[5:]):
+                return '%Y-%m', datetime(int(value[:4]), int(value[5:]), 1)
+        elif length == 4:
+            if _digits(value):
+                return '%Y', datetime(int(value), 1, 1)
+    except ValueError:
+        return None
+    return None
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_date_cached(value: str, formats: Tuple[str, ...], warn: bool) -> Optional[datetime]:
+    sniffed = _sniff_date(value)
+    if sniffed is not None and sniffed[0] in formats:
+        return sniffed[1]
+
+    for date_format in formats:
+        try:
+            return datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+
+    # Memoized, so each distinct bad value is reported once
+    if warn:
+        logger.warning(f"Could not parse date: {value}")
+    return None
+
+
+def parse_date_formats(
+    date_str: Optional[str], formats: Tuple[str, ...] = DATE_FORMATS, warn: bool = True
+) -> Optional[datetime]:
+    """
+    Parse a date string trying the given formats in order.
+
+    Equivalent to calling datetime.strptime with each format and returning
+    the first success, but shape-sniffed and memoized.
+
+    Args:
+        date_str: Raw value (surrounding whitespace is ignored)
+        formats: Tuple of strptime formats, in priority order
+        warn: Log a warning (once per distinct value) when nothing matches
+
+    Returns:
+        Parsed datetime, or None if empty or unparseable
+    """
+    if not date_str:
+        return None
+    date_str = date_str.strip()
+    if not date_str:
+        return None
+    return _parse_date_cached(date_str, formats, warn)
+
+
+def parse_dates(values: Iterable[Optional[str]], formats: Tuple[str, ...] = DATE_FORMATS) -> List[Optional[datetime]]:
+    """Parse a batch of date strings (see parse_date_formats)"""
+    return [parse_date_formats(value, formats) for value in values]
+
+
+def date_cache_info():
+    """Hit/miss statistics of the date memo (functools CacheInfo)"""
+    return _parse_date_cached.cache_info()
+
+
+def clear_date_cache() -> None:
+    """Empty the date memo"""
+    _parse_date_cached.cache_clear()
+
+
+def parse_int(value: Optional[str]) -> Optional[int]:
+    """
+    Convert a string to int, accepting float strings like '211.0'.
+
+    Returns None for empty, non-numeric, infinite or NaN values.
+    """
+    if not value:
+        return None
+    try:
+        return int(value.strip())
+    except ValueError:
+        try:
+            # Float strings like "211.0"
+            float_val = float(value.strip())
+            # Check for infinity and NaN
+            if float_val == float('inf') or float_val == float('-inf') or float_val != float_val:
+                return None
+            return int(float_val)
+        except (ValueError, OverflowError):
+            return None
+    except AttributeError:
+        return None
+
+
+def parse_float(value: Optional[str]) -> Optional[float]:
+    """Convert a string to float, returning None for empty or invalid values"""
+    if not value:
+        return None
+    try:
+        return float(value.strip())
+    except (ValueError, AttributeError):
+        return None
+
+
+def parse_bool(value: Optional[str]) -> Optional[bool]:
+    """
+    Convert a string to bool (English and Portuguese spellings).
+
+    Returns None for None, empty or unrecognized values.
+    """
+    if value is None:
+        return None
+    value_lower = value.lower().strip()
+    if value_lower in TRUE_VALUES:
+        return True
+    if value_lower in FALSE_VALUES:
+        return False
+    return None
+
+
+def parse_ints(values: Iterable[Optional[str]]) -> List[Optional[int]]:
+    """Convert a batch of strings to ints (see parse_int)"""
+    return [parse_int(value) for value in values]
+
+
+def parse_floats(values: Iterable[Optional[str]]) -> List[Optional[float]]:
+    """Convert a batch of strings to floats (see parse_float)"""
+    return [parse_float(value) for value in values]
+
+
+def parse_bools(values: Iterable[Optional[str]]) -> List[Optional[bool]]:
+    """Convert a batch of strings to bools (see parse_bool)"""
+    return [parse_bool(value) for value in values]
@@ -0,0 +1,43 @@
+"""
+Name Normalization
+==================
+
+Accent-, case- and punctuation-insensitive forms of the free-text names in
+the source files, shared by the derived-data resolvers (interest registry
+persons and organizations, budget vote groups and positions):
+
+    fold('  Abstenção ')                       -> 'abstencao'
+    name_tokens('MARIA DA CONCEIÇÃO SILVA')    -> ['maria', 'conceicao', 'silva']
+"""
+
+import re
+import unicodedata
+from typing import List
+
+# Particles ignored when comparing Portuguese names
+NAME_PARTICLES = frozenset({'de', 'da', 'do', 'das', 'dos', 'e', 'd'})
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9 ]+")
+_NON_LETTERS_RE = re.compile(r"[^a-z ]+")
+
+
+def strip_accents(text: str) -> str:
+    """ASCII form of text ('Conceição' -> 'Conceicao'; other non-ASCII characters dropped)"""
+    return unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+
+
+def fold(text: str) -> str:
+    """Accent-, case- and whitespace-insensitive form of text"""
+    return ' '.join(strip_accents(text).lower().split())
+
+
+def name_tokens(name: str, letters_only: bool = False) -> List[str]:
+    """
+    Folded tokens of a name, punctuation and NAME_PARTICLES removed.
+
+    Args:
+        name: Name as written in the source
+        letters_only: Drop digits too (person names)
+    """
+    pattern = _NON_LETTERS_RE if letters_only else _NON_ALNUM_RE
+    return [token for token in pattern.sub(' ', fold(name)).split() if token not in NAME_PARTICLES]
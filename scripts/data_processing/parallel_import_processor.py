@@ -14,10 +14,11 @@ Features:
 """
 
 import asyncio
+import json
 import time
 from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Callable, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 
 
 @dataclass
@@ -32,6 +33,7 @@ class ImportResult:
     error_message: Optional[str] = None
     processing_duration: float = 0.0
     was_skipped: bool = False  # For permanently skipped files (corrupted data)
+    phase_profile: Optional[Dict] = None  # Per-phase profile of a successful import (see import_profiler)
 
 
 def _process_single_file(
@@ -120,7 +122,8 @@ def _process_single_file(
                 records_imported=record.records_imported or 0,
                 processing_duration=duration,
                 error_message=record.error_message if not success else None,
-                was_skipped=was_skipped
+                was_skipped=was_skipped,
+                phase_profile=json.loads(record.phase_profile) if success and record.phase_profile else None
             )
 
     except Exception as e:
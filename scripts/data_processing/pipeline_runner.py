@@ -45,6 +45,8 @@ except ImportError:
 
 import logging
 
+from scripts.data_processing.import_profiler import slowest_phase
+
 try:
     from rich.console import Console
     from rich.layout import Layout
@@ -316,6 +318,8 @@ class PipelineStats:
     error_occurred: bool = False
     pinned_errors: List[str] = None
     last_full_error: str = ""
+    last_profile: Optional[Dict] = None  # Phase profile of the last imported file (see import_profiler)
+    last_profile_file: str = ""
     active_downloads: Dict[int, ActiveWorker] = None
     active_imports: Dict[int, ActiveWorker] = None
     _next_download_id: int = 0
@@ -457,6 +461,23 @@ class PipelineStats:
 # Local Pipeline Runner (with Rich UI)
 # =============================================================================
 
+async def refresh_dashboard_aggregates_async() -> Optional[Dict[str, int]]:
+    """Refresh precomputed dashboard aggregates without blocking the event loop.
+
+    Called when the import queue drains after files were imported, so the
+    run-wide derived tables and the /estatisticas and /transparency/*
+    summary rows reflect the new data (see post_import.py).
+    """
+    from scripts.data_processing.post_import import refresh_after_import_run
+
+    loop = asyncio.get_event_loop()
+    try:
+        return await loop.run_in_executor(None, refresh_after_import_run)
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Dashboard aggregate refresh failed: {e}")
+        return None
+
+
 class LocalPipelineRunner:
     """
     Local pipeline runner with Rich terminal UI.
@@ -505,6 +526,7 @@ class LocalPipelineRunner:
         # Control
         self._running = False
         self._error_paused = False
+        self._imports_since_refresh = 0
 
     def _get_pending_files(self, limit: int = 10) -> List:
         """Get pending files from ImportStatus table."""
@@ -597,6 +619,20 @@ class LocalPipelineRunner:
 
         stats_table.add_row("Records", f"[bold]{self.stats.total_records_imported:,}[/bold] total imported")
 
+        profile = self.stats.last_profile
+        if profile:
+            phase = slowest_phase(profile)
+            total = profile['wall_seconds'] or 1
+            phase_str = ""
+            if phase:
+                phase_seconds = profile['phases'][phase]['wall_seconds']
+                phase_str = f" | {phase} {phase_seconds:.1f}s ({phase_seconds / total:.0%})"
+            file_display = self.stats.last_profile_file[:20] + ".." if len(self.stats.last_profile_file) > 22 else self.stats.last_profile_file
+            stats_table.add_row(
+                "Last Profile",
+                f"{file_display} {profile['wall_seconds']:.1f}s{phase_str} | SQL: {profile['sql_statements']:,}"
+            )
+
         layout["stats"].update(Panel(stats_table, title="Pipeline Status", border_style="green"))
 
         # Active Workers
@@ -869,7 +905,11 @@ class LocalPipelineRunner:
                         if result.success:
                             self.stats.import_completed += 1
                             self.stats.total_records_imported += result.records_imported
+                            self._imports_since_refresh += 1
                             self.stats.add_message(f"SUCCESS: {result.file_name} ({result.records_imported} records)", priority='success')
+                            if result.phase_profile:
+                                self.stats.last_profile = result.phase_profile
+                                self.stats.last_profile_file = result.file_name
                         elif result.was_skipped:
                             self.stats.import_skipped += 1
                         else:
@@ -935,6 +975,13 @@ class LocalPipelineRunner:
                                     })
                                 db_session.commit()
 
+                        if (not files_to_import and self._imports_since_refresh
+                                and import_queue.empty() and self._import_processor.active_imports == 0):
+                            # Import queue drained - rebuild dashboard aggregates
+                            self._imports_since_refresh = 0
+                            self.stats.add_message("Refreshing dashboard aggregates", priority='high')
+                            await refresh_dashboard_aggregates_async()
+
                     await asyncio.sleep(0.5)
 
                 except asyncio.CancelledError:
@@ -1118,6 +1165,7 @@ class HeadlessPipelineRunner:
         # Control
         self._running = False
         self._error_occurred = False
+        self._imports_since_refresh = 0
 
     async def _run_discovery(self, legislature_filter: str = None, category_filter: str = None):
         """Run discovery service."""
@@ -1258,6 +1306,11 @@ class HeadlessPipelineRunner:
                     files = query.limit(self.max_concurrent_imports).all()
 
                     if not files:
+                        if self._imports_since_refresh:
+                            # Import queue drained - rebuild dashboard aggregates
+                            self._imports_since_refresh = 0
+                            self.logger.info("Refreshing dashboard aggregates")
+                            await refresh_dashboard_aggregates_async()
                         await asyncio.sleep(1)
                         continue
 
@@ -1289,6 +1342,7 @@ class HeadlessPipelineRunner:
                         duration = (datetime.now() - start_time).total_seconds()
 
                         if result.success:
+                            self._imports_since_refresh += 1
                             self.progress.log_file_complete(
                                 file_info['file_name'],
                                 result.records_imported,
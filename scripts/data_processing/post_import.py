@@ -0,0 +1,79 @@
+"""
+Post-Import Refresh
+===================
+
+Work done once when an import run completes, after every file of the run
+has been committed.
+
+Some derived tables span all legislatures and are fed by files that are
+imported in parallel (ParallelImportProcessor runs biographical or
+interest registry files of different legislatures at once). Rebuilding
+them at the end of each file made concurrent file transactions delete and
+re-insert the same rows, and the file that lost the race kept stale data.
+They are rebuilt here instead, one transaction each, before the dashboard
+aggregates are recomputed (which also bumps the reference data version, so
+API workers see the new flags).
+
+Usage:
+    from scripts.data_processing.post_import import refresh_after_import_run
+
+    refresh_after_import_run()
+"""
+
+import logging
+import os
+import sys
+from typing import Dict
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+logger = logging.getLogger(__name__)
+
+
+def _rebuild_active_entities() -> Dict[str, int]:
+    from scripts.data_processing.active_entities import rebuild
+    return rebuild()
+
+
+def _refresh_interest_entity_stats() -> Dict[str, int]:
+    from database.connection import DatabaseSession
+    from scripts.data_processing.interest_entities import refresh_entity_stats
+
+    with DatabaseSession() as session:
+        counts = refresh_entity_stats(session)
+        session.commit()
+    return counts
+
+
+# Derived table -> rebuild committing its own transaction
+DERIVED_REBUILDS = {
+    'active_entities': _rebuild_active_entities,
+    'interest_entity_cooccurrences': _refresh_interest_entity_stats,
+}
+
+
+def refresh_derived_data() -> Dict[str, Dict]:
+    """
+    Rebuild the run-wide derived tables.
+
+    A failing rebuild is logged and skipped; the others still run.
+
+    Returns:
+        Dictionary of table -> rebuild counts (failed rebuilds are left out)
+    """
+    results = {}
+    for name, rebuild in DERIVED_REBUILDS.items():
+        try:
+            results[name] = rebuild()
+            logger.info(f"Rebuilt {name}: {results[name]}")
+        except Exception as e:
+            logger.warning(f"Could not rebuild {name}: {e}")
+    return results
+
+
+def refresh_after_import_run() -> Dict[str, int]:
+    """Rebuild the derived tables, then the dashboard aggregates (returns the aggregate stats)"""
+    from app.utils.dashboard_aggregates import refresh_dashboard_aggregates
+
+    refresh_derived_data()
+    return refresh_dashboard_aggregates()
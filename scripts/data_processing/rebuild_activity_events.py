@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Rebuild Activity Events
+=======================
+
+Backfills the activity_events timeline from the source tables. Mappers keep
+it current for the legislature they import; run this once after applying the
+activity_events migration, or to repair the table after manual data fixes.
+
+Usage:
+    python scripts/data_processing/rebuild_activity_events.py
+    python scripts/data_processing/rebuild_activity_events.py --legislatura XVII
+    python scripts/data_processing/rebuild_activity_events.py --source intervencao --source peticao
+"""
+
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from database.connection import DatabaseSession
+from database.models import Legislatura
+from scripts.data_processing.activity_events import ACTIVITY_SOURCES, rebuild_activity_events
+
+
+def rebuild(sources=None, legislatura=None):
+    """
+    Rebuild activity events and commit.
+
+    Args:
+        sources: Keys of ACTIVITY_SOURCES to rebuild (all when empty)
+        legislatura: Legislature number (e.g. 'XVII') to scope the rebuild to
+
+    Returns:
+        Total number of events written, or None if the legislature is unknown
+    """
+    with DatabaseSession() as db:
+        legislatura_id = None
+        if legislatura:
+            leg = db.query(Legislatura).filter_by(numero=legislatura).first()
+            if not leg:
+                print(f"ERROR: Legislature {legislatura} not found")
+                return None
+            legislatura_id = leg.id
+
+        counts = rebuild_activity_events(db, sources, legislatura_id)
+        db.commit()
+
+        for key, count in counts.items():
+            print(f"  {key:<25} {count:>10,} events")
+        total = sum(counts.values())
+        print(f"Rebuilt {total:,} activity events")
+        return total
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Rebuild the activity_events timeline")
+    parser.add_argument(
+        "--source",
+        action="append",
+        choices=sorted(ACTIVITY_SOURCES),
+        help="Source to rebuild (repeatable, default: all)",
+    )
+    parser.add_argument(
+        "--legislatura",
+        help="Only rebuild this legislature (e.g. XVII)",
+    )
+    args = parser.parse_args()
+
+    total = rebuild(args.source, args.legislatura)
+    sys.exit(0 if total is not None else 1)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Rebuild Agenda Text
+===================
+
+Backfills the sanitized plain text of agenda events (subtitulo_texto,
+descricao_texto) from the raw HTML. The agenda mapper renders it at import
+time; run this once after applying the migration that adds the columns, or
+with --all after changing the sanitizer (html_text.py).
+
+Usage:
+    python scripts/data_processing/rebuild_agenda_text.py
+    python scripts/data_processing/rebuild_agenda_text.py --all
+"""
+
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from sqlalchemy import bindparam, or_, select, update
+
+from database.connection import DatabaseSession
+from database.models import AgendaParlamentar
+from app.utils.html_text import clean_html_content
+
+BATCH_SIZE = 1000
+
+
+def pending_rows_query(rebuild_all: bool = False):
+    """Agenda rows whose plain text is missing (every row with rebuild_all)"""
+    query = select(AgendaParlamentar.id, AgendaParlamentar.subtitulo, AgendaParlamentar.descricao)
+    if not rebuild_all:
+        query = query.where(or_(
+            (AgendaParlamentar.subtitulo_texto.is_(None)) & AgendaParlamentar.subtitulo.isnot(None),
+            (AgendaParlamentar.descricao_texto.is_(None)) & AgendaParlamentar.descricao.isnot(None),
+        ))
+    return query.order_by(AgendaParlamentar.id)
+
+
+def rebuild(rebuild_all: bool = False) -> int:
+    """
+    Render and store the plain text of agenda events, committing per batch.
+
+    Returns:
+        Number of rows updated
+    """
+    stmt = update(AgendaParlamentar.__table__).where(
+        AgendaParlamentar.__table__.c.id == bindparam('row_id')
+    ).values(subtitulo_texto=bindparam('subtitulo_texto'), descricao_texto=bindparam('descricao_texto'))
+
+    total = 0
+    with DatabaseSession() as db:
+        rows = db.execute(pending_rows_query(rebuild_all)).all()
+        for start in range(0, len(rows), BATCH_SIZE):
+            batch = [
+                {
+                    'row_id': row_id,
+                    'subtitulo_texto': clean_html_content(subtitulo),
+                    'descricao_texto': clean_html_content(descricao),
+                }
+                for row_id, subtitulo, descricao in rows[start:start + BATCH_SIZE]
+            ]
+            db.connection().execute(stmt, batch)
+            db.commit()
+            total += len(batch)
+            print(f"  {total:>10,} / {len(rows):,} agenda events")
+
+    print(f"Rendered plain text of {total:,} agenda events")
+    return total
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Backfill the plain text of agenda events")
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Re-render every event, not only those without plain text",
+    )
+    args = parser.parse_args()
+
+    rebuild(args.all)
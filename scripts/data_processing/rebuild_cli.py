@@ -0,0 +1,71 @@
+"""
+Derived Data Rebuild CLI
+========================
+
+Shared plumbing of the rebuild() functions and command lines of the
+derived-data modules (interest_links, interest_entities, budget_votes):
+resolve an optional --legislatura to its id, run the module's sync in one
+committed transaction and report the counts.
+
+Usage:
+    def rebuild(legislatura: str = None):
+        return rebuild_for_legislature(legislatura, resolve_spouse_links)
+
+    if __name__ == "__main__":
+        rebuild_main("Re-resolve interest registry links to deputies", rebuild,
+                     lambda counts: f"  {counts['linked']:,} spouses linked")
+"""
+
+import argparse
+import os
+import sys
+from typing import Callable, Dict, Optional
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from database.models import Legislatura
+
+
+def rebuild_for_legislature(legislatura: Optional[str], sync: Callable) -> Optional[Dict[str, int]]:
+    """
+    Run sync(session, legislatura_id) and commit.
+
+    Args:
+        legislatura: Legislature number (e.g. 'XVII') to scope the rebuild to (all when None)
+        sync: Function of (session, legislatura_id) returning counts
+
+    Returns:
+        What sync returned, or None if the legislature is unknown
+    """
+    from database.connection import DatabaseSession
+
+    with DatabaseSession() as session:
+        legislatura_id = None
+        if legislatura:
+            legislatura_id = session.query(Legislatura.id).filter_by(numero=legislatura).scalar()
+            if legislatura_id is None:
+                print(f"ERROR: Legislature {legislatura} not found")
+                return None
+        counts = sync(session, legislatura_id)
+        session.commit()
+    return counts
+
+
+def rebuild_main(description: str, rebuild: Callable[..., Optional[Dict[str, int]]],
+                 report: Callable[[Dict[str, int]], str],
+                 legislatura_help: str = "Only this legislature's declarations (e.g. XVII)",
+                 add_arguments: Callable[[argparse.ArgumentParser], None] = None) -> None:
+    """
+    Command line of a rebuild() taking the parsed arguments as keywords.
+
+    Exits with status 1 when rebuild() returns None (unknown legislature).
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--legislatura", help=legislatura_help)
+    if add_arguments is not None:
+        add_arguments(parser)
+    args = parser.parse_args()
+
+    counts = rebuild(**vars(args))
+    if counts is None:
+        sys.exit(1)
+    print(report(counts))
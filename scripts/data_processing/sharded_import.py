@@ -0,0 +1,343 @@
+"""
+Sharded Import
+==============
+
+Parallel mapping of one very large file.
+
+ParallelImportProcessor parallelizes across files, but a legislature-wide
+AtividadeDeputado or Iniciativas file is mapped by one process and ends up
+as the tail of the whole run. In sharded mode the file's records (the same
+record elements differential import fingerprints, see
+differential_import.DIFFERENTIAL_SPECS) are split into N contiguous chunks.
+Each chunk becomes a standalone XML document with the file's skeleton and
+is mapped in its own process and transaction:
+
+- before mapping, a chunk deletes whatever an earlier attempt of the same
+  records wrote, so chunks are idempotent and can simply be retried
+- shared entities are created with concurrency-safe upserts (coalitions;
+  the file's legislature is committed by the coordinator before dispatch)
+  or in a short transaction of their own under a per-deputy advisory lock
+  (deputies, see EnhancedSchemaMapper.shared_entity_locks)
+- the activity timeline is not touched by chunks: its slice is deleted
+  and re-inserted per legislature, so it is synced once by the coordinator
+- a committed chunk is staged as an import_shards row (mapped or failed)
+
+The coordinator keeps the ImportStatus all-or-nothing: when every chunk
+is mapped it syncs the activity timeline and drops the staging rows in the
+importer's transaction, which then completes the ImportStatus in a single
+commit. Otherwise failed chunks
+are retried once, and if one still fails every chunk's records are deleted
+again and the import fails as a whole. Staging rows left behind by a
+crashed coordinator are cleaned up on the next import of the file.
+
+The mapped tables are shared by all files, so there is no per-file table to
+swap: chunk rows become visible as chunks commit, and a failed sharded
+re-import leaves the file's records absent (rather than at their previous
+version) until the ImportStatus is retried successfully.
+
+Usage:
+    sharded = ShardedImport.plan(xml_root, mapper_key, shards=4)
+    if sharded:
+        results = sharded.run(db_session, import_record, mapper_class, file_info, strict_mode)
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from sqlalchemy import delete, select
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from database.models import ImportShard, ImportStatus, Legislatura
+from scripts.data_processing.differential_import import (
+    DIFFERENTIAL_SPECS, DifferentialSpec, cascade_delete, collect_records,
+)
+
+logger = logging.getLogger(__name__)
+
+# Files with fewer records are mapped in one process
+SHARD_MIN_RECORDS = int(os.environ.get('IMPORT_SHARD_MIN_RECORDS', 2000))
+
+
+@dataclass
+class ShardResult:
+    """Outcome of one chunk (returned by worker processes)"""
+    shard_index: int
+    success: bool
+    records_imported: int = 0
+    error_message: Optional[str] = None
+    duration_seconds: float = 0.0
+
+
+def split_records(xml_root: ET.Element, spec: DifferentialSpec, shards: int) -> Optional[List[tuple]]:
+    """
+    Split a file into standalone chunk documents.
+
+    Every chunk keeps the file's skeleton (root and wrapper elements) with
+    a contiguous slice of the records. xml_root is left unchanged.
+
+    Returns:
+        [(record keys, XML bytes)] per chunk, or None if a record has no
+        natural id or an id repeats
+    """
+    records, fingerprints = collect_records(xml_root, spec)
+    if fingerprints is None or not records:
+        return None
+
+    for parent, child, _ in records:
+        parent.remove(child)
+    size = -(-len(records) // shards)
+    chunks = []
+    try:
+        for start in range(0, len(records), size):
+            chunk = records[start:start + size]
+            for parent, child, _ in chunk:
+                parent.append(child)
+            chunks.append(([key for _, _, key in chunk], ET.tostring(xml_root, encoding='utf-8')))
+            for parent, child, _ in chunk:
+                parent.remove(child)
+    finally:
+        for parent, child, _ in records:
+            parent.append(child)
+    return chunks
+
+
+def _legislatura_id(session, import_record: ImportStatus):
+    if not import_record.legislatura:
+        return None
+    return session.query(Legislatura.id).filter(Legislatura.numero == import_record.legislatura).scalar()
+
+
+def _delete_records(session, spec: DifferentialSpec, legislatura_id, keys: List[str]) -> int:
+    """Delete the rows written for some records (no-op when nothing was written)"""
+    if legislatura_id is None or not keys:
+        return 0
+    root_ids = session.execute(spec.root_ids(legislatura_id, keys)).scalars().all()
+    return cascade_delete(session, spec.model.__table__, root_ids)
+
+
+def _stage(session, status_id, result: ShardResult, keys: List[str]) -> None:
+    session.execute(delete(ImportShard).where(
+        ImportShard.import_status_id == status_id, ImportShard.shard_index == result.shard_index,
+    ))
+    session.add(ImportShard(
+        import_status_id=status_id,
+        shard_index=result.shard_index,
+        record_keys=json.dumps(keys),
+        status='mapped' if result.success else 'failed',
+        records_imported=result.records_imported,
+        error_message=result.error_message,
+        duration_seconds=result.duration_seconds,
+    ))
+
+
+def _map_shard(status_id, mapper_key: str, mapper_class: type, shard_index: int, keys: List[str],
+               content: bytes, file_info: Dict, strict_mode: bool) -> ShardResult:
+    """
+    Map one chunk in a worker process and stage its outcome.
+
+    Runs in ProcessPoolExecutor: opens its own connections and commits its
+    own transaction.
+    """
+    from database.connection import DatabaseSession, get_engine
+
+    # Connections inherited from the coordinator through fork must not be reused
+    get_engine().dispose(close=False)
+
+    spec = DIFFERENTIAL_SPECS[mapper_key]
+    started = time.perf_counter()
+    try:
+        with DatabaseSession() as session:
+            import_record = session.get(ImportStatus, status_id)
+            _delete_records(session, spec, _legislatura_id(session, import_record), keys)
+
+            mapper = mapper_class(session, import_status_record=import_record)
+            mapper.shared_entity_locks = True
+            mapper.defer_activity_events = True
+            xml_root = ET.fromstring(content)
+            mapper.intern_tree(xml_root)
+            results = mapper.validate_and_map(xml_root, file_info, strict_mode)
+
+            result = ShardResult(shard_index, True, results.get('records_imported', 0),
+                                 duration_seconds=time.perf_counter() - started)
+            _stage(session, status_id, result, keys)
+            session.commit()
+            return result
+    except Exception as e:
+        logger.error(f"Shard {shard_index} of {file_info.get('file_path')} failed: {e}")
+        result = ShardResult(shard_index, False, error_message=str(e)[:2000],
+                             duration_seconds=time.perf_counter() - started)
+        try:
+            with DatabaseSession() as session:
+                _stage(session, status_id, result, keys)
+                session.commit()
+        except Exception as stage_error:
+            logger.warning(f"Could not stage failure of shard {shard_index}: {stage_error}")
+        return result
+
+
+class ShardedImport:
+    """Sharded mapping of one file, coordinated from the importer's transaction"""
+
+    def __init__(self, mapper_key: str, chunks: List[tuple]):
+        self.mapper_key = mapper_key
+        self.spec = DIFFERENTIAL_SPECS[mapper_key]
+        self.chunks = chunks
+
+    @staticmethod
+    def supports(mapper_key: str) -> bool:
+        return mapper_key in DIFFERENTIAL_SPECS
+
+    @classmethod
+    def plan(cls, xml_root: ET.Element, mapper_key: str, shards: int,
+             min_records: int = None) -> Optional['ShardedImport']:
+        """
+        A sharded import of the file, or None when it should be mapped in one process
+        (sharding disabled, unsupported file type, small file, records without ids).
+        """
+        if shards < 2 or not cls.supports(mapper_key):
+            return None
+        min_records = SHARD_MIN_RECORDS if min_records is None else min_records
+        spec = DIFFERENTIAL_SPECS[mapper_key]
+        if sum(1 for _ in xml_root.iter(spec.record_tag)) < min_records:
+            return None
+        chunks = split_records(xml_root, spec, shards)
+        if not chunks or len(chunks) < 2:
+            return None
+        return cls(mapper_key, chunks)
+
+    @staticmethod
+    def has_leftovers(session, import_record: ImportStatus) -> bool:
+        """Whether an interrupted sharded import of the file left staging rows behind"""
+        return session.query(select(ImportShard.id).where(
+            ImportShard.import_status_id == import_record.id
+        ).exists()).scalar()
+
+    @staticmethod
+    def discard_leftovers(import_record: ImportStatus, mapper_key: str) -> int:
+        """
+        Delete the records and staging rows of an interrupted sharded import.
+
+        Runs in its own committed transaction. Returns the number of leftover chunks.
+        """
+        from database.connection import DatabaseSession
+
+        with DatabaseSession() as session:
+            shards = session.execute(select(ImportShard.record_keys).where(
+                ImportShard.import_status_id == import_record.id
+            )).scalars().all()
+            if not shards:
+                return 0
+            if mapper_key in DIFFERENTIAL_SPECS:
+                legislatura_id = _legislatura_id(session, import_record)
+                for record_keys in shards:
+                    _delete_records(session, DIFFERENTIAL_SPECS[mapper_key], legislatura_id, json.loads(record_keys))
+            session.execute(delete(ImportShard).where(ImportShard.import_status_id == import_record.id))
+            session.commit()
+        logger.info(f"Discarded {len(shards)} leftover shards of {import_record.file_name}")
+        return len(shards)
+
+    @staticmethod
+    def _commit_legislatura(import_record: ImportStatus, mapper_class: type) -> None:
+        """
+        Create the file's legislature before dispatch.
+
+        Deputies are committed outside the chunk transactions and reference
+        it, so it must not be created (uncommitted) by one of the chunks.
+        """
+        from database.connection import DatabaseSession
+
+        if not import_record.legislatura:
+            return
+        with DatabaseSession() as session:
+            mapper = mapper_class(session, import_status_record=session.get(ImportStatus, import_record.id))
+            mapper._get_or_create_legislatura(import_record.legislatura)
+            session.commit()
+
+    @staticmethod
+    def _sync_activity_events(session, import_record: ImportStatus, mapper_class: type) -> None:
+        """Refresh the file's activity timeline once every chunk is committed (see _map_shard)"""
+        legislatura_id = _legislatura_id(session, import_record)
+        if not mapper_class.ACTIVITY_SOURCES or legislatura_id is None:
+            return
+
+        from scripts.data_processing.activity_events import sync_activity_events
+
+        try:
+            with session.begin_nested():
+                counts = sync_activity_events(session, mapper_class.ACTIVITY_SOURCES, legislatura_id)
+            logger.info(f"Activity events refreshed for {import_record.legislatura}: {counts}")
+        except Exception as e:
+            logger.warning(f"Could not refresh activity events for {import_record.legislatura}: {e}")
+
+    def _run_chunks(self, indexes: List[int], workers: int, import_record, mapper_class,
+                    file_info: Dict, strict_mode: bool) -> Dict[int, ShardResult]:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                index: pool.submit(
+                    _map_shard, import_record.id, self.mapper_key, mapper_class, index,
+                    self.chunks[index][0], self.chunks[index][1], file_info, strict_mode,
+                )
+                for index in indexes
+            }
+            results = {}
+            for index, future in futures.items():
+                try:
+                    results[index] = future.result()
+                except Exception as e:  # Worker process died
+                    results[index] = ShardResult(index, False, error_message=str(e))
+        return results
+
+    def run(self, session, import_record: ImportStatus, mapper_class: type, file_info: Dict,
+            strict_mode: bool = False) -> Dict:
+        """
+        Map all chunks in parallel and settle the outcome.
+
+        On success the staging rows are deleted in `session` (committed by the
+        importer together with the ImportStatus). On failure the chunks'
+        records are deleted in a separate transaction and RuntimeError is
+        raised, so the importer records the file as failed.
+
+        Returns:
+            Mapper-style results: records_processed, records_imported, errors, shards
+        """
+        if self.has_leftovers(session, import_record):
+            self.discard_leftovers(import_record, self.mapper_key)
+        self._commit_legislatura(import_record, mapper_class)
+
+        started = time.perf_counter()
+        indexes = list(range(len(self.chunks)))
+        results = self._run_chunks(indexes, len(indexes), import_record, mapper_class, file_info, strict_mode)
+
+        failed = [i for i in indexes if not results[i].success]
+        if failed:
+            # Chunks are idempotent; a retry one at a time avoids lock conflicts between them
+            logger.warning(f"Retrying {len(failed)} failed shards of {import_record.file_name}")
+            results.update(self._run_chunks(failed, 1, import_record, mapper_class, file_info, strict_mode))
+            failed = [i for i in indexes if not results[i].success]
+
+        if failed:
+            self.discard_leftovers(import_record, self.mapper_key)
+            raise RuntimeError(
+                f"{len(failed)} of {len(indexes)} shards failed; import rolled back: "
+                f"{results[failed[0]].error_message}"
+            )
+
+        self._sync_activity_events(session, import_record, mapper_class)
+        session.execute(delete(ImportShard).where(ImportShard.import_status_id == import_record.id))
+        return {
+            'records_processed': sum(len(keys) for keys, _ in self.chunks),
+            'records_imported': sum(r.records_imported for r in results.values()),
+            'errors': [],
+            'shards': {
+                'count': len(indexes),
+                'wall_seconds': round(time.perf_counter() - started, 2),
+                'max_shard_seconds': round(max(r.duration_seconds for r in results.values()), 2),
+            },
+        }
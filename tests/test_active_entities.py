@@ -0,0 +1,72 @@
+"""
+Unit tests for the active entity flags
+======================================
+
+Compiles the INSERT ... SELECT per entity type for PostgreSQL and checks
+that is_active is an indexed EXISTS instead of a LIKE scan.
+"""
+
+import unittest
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from database.legislature_registry import (
+    LegislatureInfo, LegislatureRegistry, invalidate_legislature_registry, set_legislature_registry,
+)
+from database.models import Coligacao, Deputado, Partido
+from scripts.data_processing.active_entities import ACTIVE_ENTITY_SOURCES, active_entities_select
+
+
+def compile_pg(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={'literal_binds': True}))
+
+
+class TestActiveEntitiesSelect(unittest.TestCase):
+    """Per-type SELECTs feeding active_entities"""
+
+    def test_columns_match_insert(self):
+        for entity_type in ACTIVE_ENTITY_SOURCES:
+            with self.subTest(entity_type=entity_type):
+                stmt = active_entities_select(entity_type)
+                self.assertEqual([c.name for c in stmt.selected_columns],
+                                 ['id', 'entity_type', 'entity_id', 'legislatura_numero'])
+                sql = compile_pg(stmt)
+                self.assertIn('md5', sql)
+                self.assertIn('DISTINCT', sql)
+
+    def test_coalition_matches_id_or_sigla(self):
+        sql = compile_pg(active_entities_select('coligacao'))
+        self.assertIn('deputado_mandatos_legislativos.coligacao_id = coligacoes.id', sql)
+        self.assertIn('deputado_mandatos_legislativos.par_sigla = coligacoes.sigla', sql)
+
+
+class TestIsActiveExpression(unittest.TestCase):
+    """is_active at class level is a set-based EXISTS over active_entities"""
+
+    def setUp(self):
+        set_legislature_registry(LegislatureRegistry([
+            LegislatureInfo(1, 'XVI', '16.ª Legislatura'),
+            LegislatureInfo(2, 'XVII', '17.ª Legislatura'),
+        ]))
+
+    def tearDown(self):
+        invalidate_legislature_registry()
+
+    def test_filters(self):
+        for model, entity_type in [(Partido, 'partido'), (Coligacao, 'coligacao'), (Deputado, 'deputado')]:
+            with self.subTest(entity_type=entity_type):
+                sql = compile_pg(select(model.id).where(model.is_active))
+                self.assertIn('EXISTS (SELECT', sql)
+                self.assertIn(f"active_entities.entity_type = '{entity_type}'", sql)
+                self.assertIn("active_entities.legislatura_numero = 'XVII'", sql)
+                self.assertNotIn('LIKE', sql)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Unit tests for the activity_events builder
+==========================================
+
+Compiles each source's INSERT ... SELECT for PostgreSQL and checks the
+mapper declarations point at existing sources.
+"""
+
+import unittest
+import uuid
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy.dialects import postgresql
+
+from scripts.data_processing.activity_events import ACTIVITY_SOURCES, activity_events_select
+from scripts.data_processing.mappers.atividades import AtividadesMapper
+from scripts.data_processing.mappers.delegacao_eventual import DelegacaoEventualMapper
+from scripts.data_processing.mappers.iniciativas import InitiativasMapper
+from scripts.data_processing.mappers.intervencoes import IntervencoesMapper
+from scripts.data_processing.mappers.perguntas_requerimentos import PerguntasRequerimentosMapper
+from scripts.data_processing.mappers.peticoes import PeticoesMapper
+
+EXPECTED_COLUMNS = [
+    'id', 'id_cadastro', 'event_type', 'event_date', 'title',
+    'source_table', 'source_id', 'legislatura_id', 'is_feed_entry',
+]
+
+
+def compile_pg(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestActivityEventsSelect(unittest.TestCase):
+    """Per-source SELECTs feeding activity_events"""
+
+    def test_columns_match_insert(self):
+        for key, source in ACTIVITY_SOURCES.items():
+            with self.subTest(source=key):
+                stmt = activity_events_select(source)
+                self.assertEqual([c.name for c in stmt.selected_columns], EXPECTED_COLUMNS)
+                self.assertIn('md5', compile_pg(stmt))
+
+    def test_feed_entry_flag(self):
+        for key, source in ACTIVITY_SOURCES.items():
+            with self.subTest(source=key):
+                sql = compile_pg(activity_events_select(source))
+                if source.authors is not None:
+                    # One feed entry per source record among its authors
+                    self.assertIn('row_number() OVER (PARTITION BY', sql)
+                    self.assertIn('LEFT OUTER JOIN', sql)
+                else:
+                    self.assertNotIn('row_number()', sql)
+
+    def test_legislature_scope(self):
+        source = ACTIVITY_SOURCES['intervencao']
+        unscoped = compile_pg(activity_events_select(source))
+        scoped = compile_pg(activity_events_select(source, uuid.uuid4()))
+        self.assertNotIn('WHERE intervencao_parlamentar.legislatura_id', unscoped)
+        self.assertIn('WHERE intervencao_parlamentar.legislatura_id', scoped)
+
+    def test_mapper_sources_exist(self):
+        mappers = [AtividadesMapper, DelegacaoEventualMapper, InitiativasMapper,
+                   IntervencoesMapper, PerguntasRequerimentosMapper, PeticoesMapper]
+        declared = set()
+        for mapper in mappers:
+            with self.subTest(mapper=mapper.__name__):
+                self.assertTrue(mapper.ACTIVITY_SOURCES)
+                self.assertTrue(set(mapper.ACTIVITY_SOURCES) <= set(ACTIVITY_SOURCES))
+                declared.update(mapper.ACTIVITY_SOURCES)
+        self.assertEqual(declared, set(ACTIVITY_SOURCES))
+
+
+if __name__ == '__main__':
+    unittest.main()
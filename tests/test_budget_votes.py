@@ -0,0 +1,92 @@
+"""
+Unit tests for the budget vote matrix
+=====================================
+
+Covers parsing of GruposParlamentares (XML and flattened text), party
+sigla resolution, the per-party stats SELECT and the party history query.
+"""
+
+import unittest
+import os
+import sys
+import xml.etree.ElementTree as ET
+from unittest.mock import MagicMock
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.routes.parlamento import budget_party_votes, budget_votes_query
+from scripts.data_processing.budget_votes import (
+    GroupSiglaResolver, normalize_budget_vote, parse_grupos_element, parse_grupos_texto, party_vote_stats_select
+)
+
+GRUPOS_XML = """
+<GruposParlamentares>
+    <GrupoParlamentar>Partido Social Democrata</GrupoParlamentar>
+    <Voto>Abstenção</Voto>
+    <GrupoParlamentar>PS</GrupoParlamentar>
+    <Voto>a favor</Voto>
+    <GrupoParlamentar>CH</GrupoParlamentar>
+</GruposParlamentares>
+"""
+
+
+class TestParsing(unittest.TestCase):
+    """(group, vote) pairs"""
+
+    def test_element_pairs_in_document_order(self):
+        pairs = parse_grupos_element(ET.fromstring(GRUPOS_XML))
+        self.assertEqual(pairs, [('Partido Social Democrata', 'Abstenção'), ('PS', 'a favor')])
+        self.assertEqual(parse_grupos_element(None), [])
+
+    def test_flattened_text(self):
+        self.assertEqual(parse_grupos_texto('PS; PSD; Voto: Favor; Voto: Contra'), [('PS', 'Favor'), ('PSD', 'Contra')])
+        self.assertEqual(parse_grupos_texto('PS; PSD; Voto: Favor'), [])
+        self.assertEqual(parse_grupos_texto('Aprovado por unanimidade'), [])
+        self.assertEqual(parse_grupos_texto(None), [])
+
+    def test_normalize_vote(self):
+        self.assertEqual(normalize_budget_vote(' ABSTENCAO '), 'Abstenção')
+        self.assertEqual(normalize_budget_vote('A Favor'), 'Favor')
+        self.assertEqual(normalize_budget_vote('Ausência'), 'Ausente')
+        self.assertEqual(normalize_budget_vote('Outro'), 'Outro')
+        self.assertIsNone(normalize_budget_vote(' '))
+
+
+class TestMatrix(unittest.TestCase):
+    """votos_partidos keyed by party sigla"""
+
+    def test_names_resolved_to_siglas(self):
+        resolver = GroupSiglaResolver([('PSD', 'Partido Social Democrata'), ('PS', 'Partido Socialista')])
+        matrix = resolver.matrix(parse_grupos_element(ET.fromstring(GRUPOS_XML)))
+        self.assertEqual(matrix, {'PSD': 'Abstenção', 'PS': 'Favor'})
+        self.assertEqual(resolver.resolve(' Livre '), 'Livre')
+        self.assertIsNone(resolver.matrix([('PS', None)]))
+
+    def test_route_serialization(self):
+        votacao = MagicMock(votos_partidos={'PS': 'Favor'})
+        self.assertEqual(budget_party_votes(votacao), [{'partido': 'PS', 'voto': 'Favor'}])
+        self.assertEqual(budget_party_votes(MagicMock(votos_partidos=None)), [])
+
+
+class TestQueries(unittest.TestCase):
+    """SQL of the stats rebuild and the party history"""
+
+    def test_stats_select(self):
+        sql = str(party_vote_stats_select().compile(dialect=postgresql.dialect()))
+        self.assertIn('jsonb_each_text(orcamento_estado_votacoes.votos_partidos)', sql)
+        self.assertIn('FILTER (WHERE', sql)
+        self.assertIn('GROUP BY orcamento_estado_votacoes.legislatura_id', sql)
+
+    def test_party_history_uses_key_operator(self):
+        query = budget_votes_query(Session(), 'PS')
+        sql = str(query.statement.compile(dialect=postgresql.dialect()))
+        self.assertIn('orcamento_estado_votacoes.votos_partidos ?', sql)
+        self.assertIn('ORDER BY orcamento_estado_votacoes.data_votacao DESC', sql)
+
+
+if __name__ == '__main__':
+    unittest.main()
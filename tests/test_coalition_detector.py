@@ -0,0 +1,71 @@
+"""
+Unit tests for coalition detection
+==================================
+
+Covers the compiled rule alternation (same rule as the per-rule loop), the
+sigla memo and the process-wide detector.
+"""
+
+import unittest
+import os
+import re
+import sys
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from scripts.data_processing.mappers.coalition_detector import CoalitionDetector, shared_coalition_detector
+
+
+class TestCompiledRules(unittest.TestCase):
+    """The alternation picks the first matching rule"""
+
+    def setUp(self):
+        self.detector = CoalitionDetector()
+
+    def first_rule(self, sigla):
+        for rule in self.detector.pattern_rules:
+            if re.match(rule['pattern'], sigla):
+                return rule['description']
+        return None
+
+    def test_rule_examples(self):
+        siglas = [example.upper() for rule in self.detector.pattern_rules for example in rule['examples']]
+        siglas += ['PS', 'CH', 'L', 'PCTP/MRPP', 'UEDS/ASDI', 'PSD.CDS-PP', 'A/B.C', 'PS-M', 'AB.C']
+        for sigla in siglas:
+            with self.subTest(sigla=sigla):
+                detection = self.detector._detect_by_patterns(sigla)
+                expected = self.first_rule(sigla)
+                if expected is None:
+                    self.assertFalse(detection.is_coalition)
+                else:
+                    self.assertEqual(detection.detection_method, f'pattern_match: {expected}')
+
+    def test_known_and_individual(self):
+        self.assertEqual(self.detector.detect('cdu').detection_method, 'known_coalition_database')
+        self.assertFalse(self.detector.detect('BE').is_coalition)
+        self.assertFalse(self.detector.detect(' ps ').is_coalition)
+        self.assertFalse(self.detector.detect('').is_coalition)
+
+
+class TestMemo(unittest.TestCase):
+    """Sigla -> detection memo"""
+
+    def test_normalized_siglas_share_one_entry(self):
+        detector = CoalitionDetector()
+        first = detector.detect('MDP/CDE')
+        self.assertIs(detector.detect(' mdp/cde '), first)
+        info = detector.memo_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_context_bypasses_memo(self):
+        detector = CoalitionDetector()
+        self.assertFalse(detector.detect('PS', context={'legislatura': 'XVII'}).is_coalition)
+        self.assertEqual(detector.memo_info().currsize, 0)
+
+    def test_shared_detector(self):
+        self.assertIs(shared_coalition_detector(), shared_coalition_detector())
+
+
+if __name__ == '__main__':
+    unittest.main()
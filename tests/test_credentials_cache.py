@@ -0,0 +1,94 @@
+"""
+Unit tests for the database credentials cache
+=============================================
+
+Covers reuse of resolved credentials within the TTL, expiry, keeping them
+out of the process environment, the optional cache file and invalidation
+when the secret changes.
+"""
+
+import unittest
+import json
+import os
+import stat
+import sys
+import tempfile
+from unittest import mock
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from database import connection
+
+SECRET_ARN = 'arn:aws:secretsmanager:eu-west-1:000000000000:secret:parliament-db'
+CREDENTIALS = {'host': 'db.internal', 'port': 5432, 'username': 'parl', 'password': 'p@ss', 'database': 'parliament'}
+
+
+class TestCredentialsCache(unittest.TestCase):
+    """get_database_credentials() fetches once per TTL"""
+
+    def setUp(self):
+        self.fetch = mock.Mock(return_value=dict(CREDENTIALS))
+        patches = [
+            mock.patch.object(connection, '_fetch_database_credentials', self.fetch),
+            mock.patch.object(connection, 'DATABASE_SECRET_ARN', SECRET_ARN),
+            mock.patch.object(connection, 'CREDENTIALS_CACHE_FILE', ''),
+            mock.patch.object(connection, '_credentials_cache', None),
+            mock.patch.dict(os.environ),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_fetched_once_within_ttl(self):
+        self.assertEqual(connection.get_database_credentials(), CREDENTIALS)
+        self.assertEqual(connection.get_database_credentials(), CREDENTIALS)
+        self.assertEqual(self.fetch.call_count, 1)
+
+    def test_expired_entry_is_refetched(self):
+        with mock.patch.object(connection, 'CREDENTIALS_CACHE_TTL', -1):
+            connection.get_database_credentials()
+            connection.get_database_credentials()
+        self.assertEqual(self.fetch.call_count, 2)
+
+    def test_not_exported_to_environment(self):
+        environment = dict(os.environ)
+        connection.get_database_credentials()
+        self.assertEqual(dict(os.environ), environment)
+        self.assertFalse(any(CREDENTIALS['password'] in value for value in os.environ.values()))
+
+    def test_other_secret_is_not_reused(self):
+        connection.get_database_credentials()
+        with mock.patch.object(connection, 'DATABASE_SECRET_ARN', SECRET_ARN + '-rotated'):
+            connection.get_database_credentials()
+        self.assertEqual(self.fetch.call_count, 2)
+
+    def test_cache_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_file = os.path.join(tmp, 'credentials.json')
+            with mock.patch.object(connection, 'CREDENTIALS_CACHE_FILE', cache_file):
+                connection.get_database_credentials()
+                self.assertEqual(stat.S_IMODE(os.stat(cache_file).st_mode), 0o600)
+                with open(cache_file) as f:
+                    self.assertEqual(json.load(f)['credentials'], CREDENTIALS)
+
+                # Another process on the host: nothing in memory
+                connection._credentials_cache = None
+                connection.get_database_credentials()
+                self.assertEqual(self.fetch.call_count, 1)
+
+                connection.clear_credentials_cache()
+                self.assertFalse(os.path.exists(cache_file))
+                connection.get_database_credentials()
+                self.assertEqual(self.fetch.call_count, 2)
+
+    def test_database_info_without_secret(self):
+        with mock.patch.object(connection, 'DATABASE_SECRET_ARN', ''), \
+                mock.patch.object(connection, 'DATABASE_URL', 'postgresql://parl@localhost/parliament'):
+            info = connection.get_database_info()
+        self.assertEqual(info['host'], connection.PG_HOST)
+        self.fetch.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Unit tests for dashboard aggregates
+===================================
+
+Dashboards whose windows are relative to today are only served from an
+aggregate computed today, on an in-memory SQLite database.
+"""
+
+import unittest
+import os
+import sys
+import json
+import uuid
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.utils import dashboard_aggregates
+from app.utils.dashboard_aggregates import (
+    AGGREGATE_CITIZEN_PARTICIPATION, get_daily_dashboard_aggregate, get_dashboard_aggregate,
+)
+from database.models import DashboardAggregate
+
+
+class TestDailyAggregates(unittest.TestCase):
+    """Stored payloads expire at the end of the day they were computed"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        DashboardAggregate.__table__.create(self.engine)
+        self.patcher = patch.object(dashboard_aggregates, 'DatabaseSession', lambda: Session(self.engine))
+        self.patcher.start()
+        self.computed = []
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.engine.dispose()
+
+    def store(self, payload, refreshed_at):
+        with Session(self.engine) as session:
+            session.add(DashboardAggregate(
+                id=uuid.uuid4(), aggregate_key=AGGREGATE_CITIZEN_PARTICIPATION, legislatura_numero='XVII',
+                payload=json.dumps(payload), refreshed_at=refreshed_at,
+            ))
+            session.commit()
+
+    def stored(self):
+        with Session(self.engine) as session:
+            return session.query(DashboardAggregate).filter_by(
+                aggregate_key=AGGREGATE_CITIZEN_PARTICIPATION, legislatura_numero='XVII'
+            ).one()
+
+    def compute(self, session):
+        self.computed.append(session)
+        return {'source': 'live'}
+
+    def daily(self):
+        return get_daily_dashboard_aggregate(AGGREGATE_CITIZEN_PARTICIPATION, 'XVII', self.compute)
+
+    def test_served_when_computed_today(self):
+        self.store({'source': 'stored'}, datetime.now())
+        self.assertEqual(self.daily(), {'source': 'stored'})
+        self.assertEqual(self.computed, [])
+
+    def test_stale_row_replaced(self):
+        self.store({'source': 'stored'}, datetime.now() - timedelta(days=1))
+        # Without a cutoff the stale row is readable (e.g. /estatisticas)
+        self.assertEqual(get_dashboard_aggregate(AGGREGATE_CITIZEN_PARTICIPATION, 'XVII'), {'source': 'stored'})
+
+        self.assertEqual(self.daily(), {'source': 'live'})
+        row = self.stored()
+        self.assertEqual(json.loads(row.payload), {'source': 'live'})
+        self.assertEqual(row.refreshed_at.date(), date.today())
+
+        # Later requests of the day are served from the replaced row
+        self.assertEqual(self.daily(), {'source': 'live'})
+        self.assertEqual(len(self.computed), 1)
+
+    def test_computed_when_missing(self):
+        self.assertEqual(self.daily(), {'source': 'live'})
+        self.assertEqual(json.loads(self.stored().payload), {'source': 'live'})
+        self.assertEqual(self.daily(), {'source': 'live'})
+        self.assertEqual(len(self.computed), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
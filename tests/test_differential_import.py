@@ -0,0 +1,129 @@
+"""
+Unit tests for differential re-import
+=====================================
+
+Covers record fingerprinting, diff classification, tree pruning and the
+foreign-key cascade used to drop stale records.
+"""
+
+import unittest
+import uuid
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import Column, ForeignKey, Integer, MetaData, Table, Uuid, create_engine, func, select
+from sqlalchemy.orm import Session
+
+from scripts.data_processing.differential_import import (
+    DIFFERENTIAL_SPECS, cascade_delete, collect_records, diff_fingerprints, prune_records,
+)
+
+SPEC = DIFFERENTIAL_SPECS['atividade_deputados']
+
+
+def atividade_file(records):
+    """ArrayOfAtividadeDeputado with one AtividadeDeputado per (cad_id, payload)"""
+    items = ''.join(
+        f'<AtividadeDeputado><Deputado><DepCadId>{cad_id}</DepCadId></Deputado>'
+        f'<AtividadeDeputadoList><ActividadeOut><Rel>{payload}</Rel></ActividadeOut></AtividadeDeputadoList>'
+        f'</AtividadeDeputado>\n  '
+        for cad_id, payload in records
+    )
+    return ET.fromstring(f'<ArrayOfAtividadeDeputado>\n  {items}</ArrayOfAtividadeDeputado>')
+
+
+class TestRecordDiff(unittest.TestCase):
+    """Fingerprints and diff classification"""
+
+    def test_fingerprints_ignore_position(self):
+        _, first = collect_records(atividade_file([(1, 'a'), (2, 'b')]), SPEC)
+        _, reordered = collect_records(atividade_file([(2, 'b'), (1, 'a')]), SPEC)
+        self.assertEqual(first, reordered)
+
+    def test_diff_classification(self):
+        _, old = collect_records(atividade_file([(1, 'a'), (2, 'b'), (3, 'c')]), SPEC)
+        _, new = collect_records(atividade_file([(1, 'a'), (2, 'B'), (4, 'd')]), SPEC)
+        diff = diff_fingerprints(old, new)
+        self.assertEqual(diff.unchanged, {'1'})
+        self.assertEqual(diff.changed, {'2'})
+        self.assertEqual(diff.added, {'4'})
+        self.assertEqual(diff.removed, {'3'})
+
+    def test_float_ids_normalized(self):
+        _, fingerprints = collect_records(atividade_file([('16572.0', 'a')]), SPEC)
+        self.assertEqual(list(fingerprints), ['16572'])
+
+    def test_lowercase_variant(self):
+        root = ET.fromstring(
+            '<ArrayOfAtividadeDeputado><AtividadeDeputado><deputado><depCadId>7</depCadId>'
+            '</deputado></AtividadeDeputado></ArrayOfAtividadeDeputado>'
+        )
+        _, fingerprints = collect_records(root, SPEC)
+        self.assertEqual(list(fingerprints), ['7'])
+
+    def test_duplicate_or_missing_ids_disable_diff(self):
+        _, fingerprints = collect_records(atividade_file([(1, 'a'), (1, 'b')]), SPEC)
+        self.assertIsNone(fingerprints)
+        _, fingerprints = collect_records(atividade_file([('', 'a')]), SPEC)
+        self.assertIsNone(fingerprints)
+
+    def test_prune_keeps_only_changed(self):
+        root = atividade_file([(1, 'a'), (2, 'b'), (3, 'c')])
+        records, _ = collect_records(root, SPEC)
+        self.assertEqual(prune_records(records, {'2'}), 2)
+        remaining = [e.findtext('Deputado/DepCadId') for e in root.findall('.//AtividadeDeputado')]
+        self.assertEqual(remaining, ['2'])
+
+
+class TestCascadeDelete(unittest.TestCase):
+    """Stale records are removed with everything referencing them"""
+
+    def setUp(self):
+        metadata = MetaData()
+        self.parent = Table('parent', metadata, Column('id', Uuid(), primary_key=True))
+        self.child = Table('child', metadata, Column('id', Uuid(), primary_key=True),
+                           Column('parent_id', Uuid(), ForeignKey('parent.id')))
+        self.grandchild = Table('grandchild', metadata, Column('id', Uuid(), primary_key=True),
+                                Column('child_id', Uuid(), ForeignKey('child.id')))
+        self.link = Table('link', metadata, Column('parent_id', Uuid(), ForeignKey('parent.id')),
+                          Column('n', Integer))
+        self.audit = Table('audit', metadata, Column('id', Uuid(), primary_key=True),
+                           Column('parent_id', Uuid(), ForeignKey('parent.id', ondelete='SET NULL')))
+        engine = create_engine('sqlite://')
+        metadata.create_all(engine)
+        self.session = Session(engine)
+
+        self.parents = [uuid.uuid4(), uuid.uuid4()]
+        for parent_id in self.parents:
+            child_id = uuid.uuid4()
+            self.session.execute(self.parent.insert().values(id=parent_id))
+            self.session.execute(self.child.insert().values(id=child_id, parent_id=parent_id))
+            self.session.execute(self.grandchild.insert().values(id=uuid.uuid4(), child_id=child_id))
+            self.session.execute(self.link.insert().values(parent_id=parent_id, n=1))
+            self.session.execute(self.audit.insert().values(id=uuid.uuid4(), parent_id=parent_id))
+
+    def tearDown(self):
+        self.session.close()
+
+    def count(self, table):
+        return self.session.execute(select(func.count()).select_from(table)).scalar()
+
+    def test_deletes_subtree_only(self):
+        deleted = cascade_delete(self.session, self.parent, [self.parents[0]])
+        self.assertEqual(deleted, 4)
+        for table in (self.parent, self.child, self.grandchild, self.link):
+            self.assertEqual(self.count(table), 1, table.name)
+        # Foreign keys with an ON DELETE action are left to the database
+        self.assertEqual(self.count(self.audit), 2)
+
+    def test_no_ids(self):
+        self.assertEqual(cascade_delete(self.session, self.parent, []), 0)
+        self.assertEqual(self.count(self.parent), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
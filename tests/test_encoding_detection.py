@@ -0,0 +1,137 @@
+"""
+Unit tests for XML encoding detection
+=====================================
+
+Corpus tests ensuring the UTF-8 fast path in EncodingDetector produces exactly
+the same decoded output as the original Portuguese-aware heuristics.
+"""
+
+import unittest
+import xml.etree.ElementTree as ET
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from scripts.data_processing.encoding_detection import (
+    EncodingDetector,
+    source_url_pattern,
+    strip_byte_order_mark,
+)
+
+
+def _document(*names):
+    """Build a small deputy list XML document"""
+    deputies = ''.join(
+        f'<Deputado><DepNomeCompleto>{name}</DepNomeCompleto><DepCPDes>Lisboa</DepCPDes></Deputado>'
+        for name in names
+    )
+    return f'<?xml version="1.0"?><ArrayOfDeputado>{deputies}</ArrayOfDeputado>'
+
+
+PORTUGUESE_DOCUMENT = _document('João Gonçalves', 'José Pereira', 'Maria Antónia Fernandes')
+ASCII_DOCUMENT = _document('Ana Silva', 'Rui Costa')
+ACUTE_A_ONLY_DOCUMENT = _document('Álvaro Cunhal', 'Sá Carneiro')
+LONG_DOCUMENT = _document(*(['Luís Montenegro'] * 300 + ['João Gonçalves']))
+
+
+class TestEncodingDetectionCorpus(unittest.TestCase):
+    """Fast path and heuristics must agree on every corpus file"""
+
+    CORPUS = {
+        'utf8_portuguese': PORTUGUESE_DOCUMENT.encode('utf-8'),
+        'utf8_ascii': ASCII_DOCUMENT.encode('utf-8'),
+        'utf8_acute_a_only': ACUTE_A_ONLY_DOCUMENT.encode('utf-8'),
+        'utf8_long': LONG_DOCUMENT.encode('utf-8'),
+        'utf8_bom': b'\xef\xbb\xbf' + PORTUGUESE_DOCUMENT.encode('utf-8'),
+        'utf8_leading_garbage': b'\xa0\xa0' + PORTUGUESE_DOCUMENT.encode('utf-8'),
+        'windows_1252': PORTUGUESE_DOCUMENT.encode('windows-1252'),
+        'latin_1': ACUTE_A_ONLY_DOCUMENT.encode('iso-8859-1'),
+        'utf16_bom': b'\xff\xfe' + PORTUGUESE_DOCUMENT.encode('utf-16-le'),
+        'double_encoded': PORTUGUESE_DOCUMENT.encode('utf-8').decode('windows-1252').encode('utf-8'),
+        'replacement_chars': _document('Jo\ufffd\ufffdo Gon\ufffd\ufffdalves').encode('utf-8'),
+        'question_marks': _document('Jo?o Gon?alves', 'Jos??').encode('utf-8'),
+    }
+
+    def test_fast_path_matches_heuristics(self):
+        """Decoded output is identical with and without the fast path"""
+        for name, content in self.CORPUS.items():
+            with self.subTest(file=name):
+                fast = EncodingDetector().detect(content)
+                slow = EncodingDetector().detect(content, use_fast_path=False)
+
+                self.assertEqual(fast.encoding, slow.encoding)
+                self.assertEqual(ET.tostring(fast.root), ET.tostring(slow.root))
+
+    def test_clean_utf8_uses_fast_path(self):
+        """Clean UTF-8 files skip the heuristics"""
+        for name in ('utf8_portuguese', 'utf8_ascii', 'utf8_long', 'utf8_bom'):
+            with self.subTest(file=name):
+                result = EncodingDetector().detect(self.CORPUS[name])
+                self.assertEqual(result.method, 'fast_path')
+                self.assertEqual(result.encoding, 'utf-8')
+
+    def test_suspicious_files_use_heuristics(self):
+        """Legacy encodings and mojibake fall back to the heuristics"""
+        for name in ('windows_1252', 'double_encoded', 'replacement_chars', 'utf8_acute_a_only'):
+            with self.subTest(file=name):
+                result = EncodingDetector().detect(self.CORPUS[name])
+                self.assertEqual(result.method, 'heuristic')
+
+    def test_decoded_names(self):
+        """Portuguese names survive decoding of legacy files"""
+        root = EncodingDetector().parse(self.CORPUS['windows_1252'])
+        names = [element.text for element in root.iter('DepNomeCompleto')]
+        self.assertEqual(names, ['João Gonçalves', 'José Pereira', 'Maria Antónia Fernandes'])
+
+
+class TestEncodingDetectorCache(unittest.TestCase):
+    """Per source pattern encoding cache and timings"""
+
+    def test_source_url_pattern_ignores_legislature(self):
+        """URLs differing only in legislature/year share a cache key"""
+        self.assertEqual(
+            source_url_pattern('https://app.parlamento.pt/doc.xml?fich=AtividadeDeputadoXVII.xml'),
+            source_url_pattern('https://app.parlamento.pt/doc.xml?fich=AtividadeDeputadoXIV.xml'),
+        )
+        self.assertEqual(
+            source_url_pattern('https://app.parlamento.pt/doc.xml?fich=OE2023Or.xml'),
+            source_url_pattern('https://app.parlamento.pt/doc.xml?fich=OE2024Or.xml'),
+        )
+        self.assertIsNone(source_url_pattern(None))
+
+    def test_legacy_pattern_skips_fast_path(self):
+        """A pattern detected as legacy encoding goes straight to the heuristics"""
+        detector = EncodingDetector()
+        legacy = PORTUGUESE_DOCUMENT.encode('windows-1252')
+        detector.detect(legacy, source_url='https://example.pt/Registo_XV.xml')
+
+        result = detector.detect(ASCII_DOCUMENT.encode('utf-8'), source_url='https://example.pt/Registo_XVI.xml')
+        self.assertEqual(result.method, 'heuristic')
+        self.assertEqual(result.encoding, 'utf-8')
+
+    def test_timings_recorded_per_file(self):
+        """Each detection records its duration and method"""
+        detector = EncodingDetector()
+        detector.detect(PORTUGUESE_DOCUMENT.encode('utf-8'), file_name='a.xml')
+        detector.detect(PORTUGUESE_DOCUMENT.encode('windows-1252'), file_name='b.xml')
+
+        timings = detector.get_timings()
+        self.assertEqual([timing['file_name'] for timing in timings], ['a.xml', 'b.xml'])
+        self.assertEqual([timing['method'] for timing in timings], ['fast_path', 'heuristic'])
+        self.assertTrue(all(timing['duration_seconds'] >= 0 for timing in timings))
+
+        stats = detector.get_statistics()
+        self.assertEqual(stats['files'], 2)
+        self.assertEqual(stats['by_method']['fast_path']['files'], 1)
+
+    def test_strip_byte_order_mark(self):
+        """BOMs and leading non-ASCII bytes are removed"""
+        self.assertEqual(strip_byte_order_mark(b'\xef\xbb\xbf<a/>'), b'<a/>')
+        self.assertEqual(strip_byte_order_mark(b'\xff\xfe\xa0\xa0<a/>'), b'<a/>')
+        self.assertEqual(strip_byte_order_mark(b'<a/>'), b'<a/>')
+
+
+if __name__ == '__main__':
+    unittest.main()
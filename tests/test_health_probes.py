@@ -0,0 +1,81 @@
+"""
+Unit tests for the health probes
+================================
+
+Probes reuse the shared engine, are cached for a short TTL and report the
+pool's occupancy and checkout wait times.
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import Flask
+from sqlalchemy import create_engine
+
+import database.connection as connection
+from app.routes import health
+
+
+class TestHealthProbes(unittest.TestCase):
+    """Shared engine, cached probes, pool status"""
+
+    def setUp(self):
+        self.tmp = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        self.tmp.close()
+        self.engine = create_engine(
+            f'sqlite:///{self.tmp.name}', poolclass=connection.TimedQueuePool, pool_size=2, max_overflow=1
+        )
+        self.previous_engine = connection._engine
+        connection._engine = self.engine
+        health._probe_cache.clear()
+
+        app = Flask(__name__)
+        app.register_blueprint(health.health_bp, url_prefix='/api')
+        self.client = app.test_client()
+
+    def tearDown(self):
+        connection._engine = self.previous_engine
+        health._probe_cache.clear()
+        self.engine.dispose()
+        os.unlink(self.tmp.name)
+
+    def test_health_uses_shared_engine(self):
+        data = self.client.get('/api/health').get_json()
+        self.assertEqual(data['database'], 'healthy')
+        self.assertEqual(data['database_type'], 'sqlite')
+        self.assertIsNone(data['cache_age_seconds'])
+        self.assertEqual(data['pool']['size'], 2)
+        self.assertEqual(data['pool']['checked_out'], 0)
+        self.assertGreaterEqual(data['pool']['checkout_wait_ms']['count'], 1)
+
+    def test_probe_cached_within_ttl(self):
+        calls = []
+
+        def probe():
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(health._cached_probe('test', probe), (1, None))
+        result, age = health._cached_probe('test', probe)
+        self.assertEqual(result, 1)
+        self.assertIsNotNone(age)
+        self.assertEqual(len(calls), 1)
+
+    def test_pool_occupancy(self):
+        with self.engine.connect(), self.engine.connect():
+            status = connection.get_pool_status()
+        self.assertEqual(status['checked_out'], 2)
+        self.assertAlmostEqual(status['occupancy'], 2 / 3, places=2)
+
+    def test_no_engine_no_status(self):
+        connection._engine = None
+        self.assertIsNone(connection.get_pool_status())
+
+
+if __name__ == '__main__':
+    unittest.main()
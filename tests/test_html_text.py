@@ -0,0 +1,65 @@
+"""
+Unit tests for agenda HTML sanitization
+=======================================
+
+Covers the plain-text rendering of agenda HTML, the request-time fallback
+for rows without stored text and the backfill selection.
+"""
+
+import unittest
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy.dialects import postgresql
+
+from app.routes.agenda import agenda_text
+from app.utils.html_text import clean_html_content
+from scripts.data_processing.rebuild_agenda_text import pending_rows_query
+
+
+class TestCleanHtmlContent(unittest.TestCase):
+    """Plain text of agenda HTML"""
+
+    def test_multiply_encoded_line_breaks(self):
+        self.assertEqual(clean_html_content('Audição&amp;lt;br /&amp;gt;Sala 2'), 'Audição\nSala 2')
+        self.assertEqual(clean_html_content('&amp;amp;amp;lt;b&amp;amp;amp;gt;x'), 'x')
+
+    def test_blocks_removed_with_content(self):
+        content = '<head><title>t</title></head><style>p {color: red}</style><script>alert(1)</script><p>Texto</p>'
+        self.assertEqual(clean_html_content(content), 'Texto')
+
+    def test_paragraphs_and_whitespace(self):
+        content = '<p>Um&nbsp; dois</p>\n\n\n<ul><li>  três</li><li>quatro</li></ul>'
+        self.assertEqual(clean_html_content(content), 'Um dois\ntrês\nquatro')
+
+    def test_empty(self):
+        self.assertIsNone(clean_html_content(None))
+        self.assertEqual(clean_html_content(''), '')
+
+
+class TestAgendaText(unittest.TestCase):
+    """Stored text first, sanitized raw HTML for rows not backfilled"""
+
+    def test_stored_text(self):
+        self.assertEqual(agenda_text('<p>raw</p>', 'stored'), 'stored')
+        self.assertEqual(agenda_text('<style>x</style>', ''), '')
+
+    def test_fallback(self):
+        self.assertEqual(agenda_text('<p>raw</p>', None), 'raw')
+        self.assertIsNone(agenda_text(None, None))
+
+
+class TestBackfillQuery(unittest.TestCase):
+    """Rows selected by rebuild_agenda_text"""
+
+    def test_missing_text_only(self):
+        sql = str(pending_rows_query().compile(dialect=postgresql.dialect()))
+        self.assertIn('descricao_texto IS NULL', sql)
+        self.assertNotIn('WHERE', str(pending_rows_query(rebuild_all=True).compile(dialect=postgresql.dialect())))
+
+
+if __name__ == '__main__':
+    unittest.main()
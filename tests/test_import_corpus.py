@@ -0,0 +1,72 @@
+"""
+Unit tests for the synthetic import corpus
+==========================================
+
+Generated files must pass each mapper's schema coverage check, be
+reproducible from their seed and import end-to-end on the SQLite stand-in.
+"""
+
+import unittest
+import logging
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from scripts.benchmarks.import_benchmark import compare_to_baseline, create_sqlite_engine, import_file
+from scripts.benchmarks.import_corpus import CORPUS_SPECS, CorpusGenerator
+
+
+class TestCorpusGenerator(unittest.TestCase):
+    """Schema-faithful, seeded files"""
+
+    def test_schema_coverage(self):
+        for category, spec in CORPUS_SPECS.items():
+            with self.subTest(category=category):
+                _, content = CorpusGenerator(category).generate(5)
+                mapper = spec.mapper.__new__(spec.mapper)
+                self.assertEqual(mapper.check_schema_coverage(ET.fromstring(content)), [])
+
+    def test_seeded(self):
+        first = CorpusGenerator('intervencoes', seed=7).generate(10)
+        self.assertEqual(first, CorpusGenerator('intervencoes', seed=7).generate(10))
+        self.assertNotEqual(first, CorpusGenerator('intervencoes', seed=8).generate(10))
+
+    def test_scales_with_records(self):
+        generator = CorpusGenerator('agenda_parlamentar')
+        _, content = generator.generate(25)
+        self.assertEqual(len(ET.fromstring(content)), 25)
+
+    def test_imports_on_sqlite(self):
+        logging.disable(logging.WARNING)
+        try:
+            file_name, content = CorpusGenerator('agenda_parlamentar').generate(10)
+            results = import_file(create_sqlite_engine(), 'agenda_parlamentar', file_name, content)
+        finally:
+            logging.disable(logging.NOTSET)
+        self.assertEqual(results['records_imported'], 10)
+        self.assertEqual(results['errors'], [])
+
+
+class TestBaselineComparison(unittest.TestCase):
+    """Regression detection"""
+
+    BASELINE = {'agenda': {'records_per_sec': 1000.0, 'statements_per_record': 1.0}}
+
+    def test_within_threshold(self):
+        current = {'agenda': {'records_per_sec': 850.0, 'statements_per_record': 1.1}}
+        self.assertEqual(compare_to_baseline(current, self.BASELINE, 0.2), [])
+
+    def test_regressions(self):
+        current = {'agenda': {'records_per_sec': 700.0, 'statements_per_record': 1.5}}
+        self.assertEqual(len(compare_to_baseline(current, self.BASELINE, 0.2)), 2)
+
+    def test_errors_and_new_categories_ignored(self):
+        current = {'agenda': {'error': 'boom'}, 'new': {'records_per_sec': 1.0, 'statements_per_record': 9.0}}
+        self.assertEqual(compare_to_baseline(current, self.BASELINE, 0.2), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Unit tests for the import phase profiler
+========================================
+
+Covers phase nesting and accumulation, SQL statement and row counters,
+profile aggregation and the optional cProfile dump of slow files.
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+import threading
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, select, text
+
+from scripts.data_processing.import_profiler import (
+    ImportProfiler, profile_phase, slowest_phase, summarize_profiles,
+)
+
+
+class TestImportProfiler(unittest.TestCase):
+    """Phases, counters and serialization"""
+
+    def setUp(self):
+        metadata = MetaData()
+        self.table = Table('t', metadata, Column('id', Integer, primary_key=True), Column('n', Integer))
+        self.engine = create_engine('sqlite://')
+        metadata.create_all(self.engine)
+
+    def test_sql_counters_per_phase(self):
+        profiler = ImportProfiler(self.engine)
+        with profiler, self.engine.begin() as conn:
+            with profiler.phase('mapper'):
+                conn.execute(self.table.insert(), [{'n': i} for i in range(5)])
+                with profiler.phase('flush'):
+                    conn.execute(self.table.update().values(n=0))
+            with profiler.phase('commit'):
+                conn.execute(select(self.table))
+
+        profile = profiler.to_dict()
+        self.assertEqual(profile['phases']['mapper']['rows_written'], 10)
+        self.assertEqual(profile['phases']['mapper/flush']['rows_written'], 5)
+        self.assertEqual(profile['phases']['mapper/flush']['sql_statements'], 1)
+        self.assertEqual(profile['phases']['commit']['sql_statements'], 1)
+        self.assertEqual(profile['phases']['commit']['rows_written'], 0)
+        self.assertEqual(profile['sql_statements'], 3)
+        json.dumps(profile)
+
+    def test_listener_removed_and_other_threads_ignored(self):
+        profiler = ImportProfiler(self.engine)
+        with profiler:
+            worker = threading.Thread(target=lambda: self.engine.connect().execute(text('SELECT 1')))
+            worker.start()
+            worker.join()
+        with self.engine.connect() as conn:
+            conn.execute(text('SELECT 1'))
+        self.assertEqual(profiler.to_dict()['sql_statements'], 0)
+
+    def test_repeated_phases_accumulate(self):
+        profiler = ImportProfiler()
+        for _ in range(3):
+            with profiler.phase('flush'):
+                pass
+        self.assertEqual(profiler.phases['flush']['calls'], 3)
+
+    def test_profile_phase_without_profiler(self):
+        with profile_phase(None, 'flush'):
+            pass
+
+    def test_slow_file_dump(self):
+        with tempfile.TemporaryDirectory() as profile_dir:
+            profiler = ImportProfiler(profile_dir=profile_dir, slow_seconds=0)
+            profiler.start()
+            sum(range(1000))
+            profiler.stop('Atividade Deputado XVII.xml')
+            profile = profiler.to_dict()
+            if 'cprofile' in profile:  # Not when another profiler is active (e.g. coverage)
+                self.assertTrue(os.path.exists(profile['cprofile']))
+                self.assertNotIn(' ', os.path.basename(profile['cprofile']))
+
+
+class TestSummarizeProfiles(unittest.TestCase):
+    """Aggregation for /api/admin/import-stats"""
+
+    @staticmethod
+    def profile(parse, mapper):
+        return {
+            'wall_seconds': parse + mapper, 'sql_statements': 1, 'peak_rss_mb': 100.0,
+            'phases': {
+                'parse': {'wall_seconds': parse, 'cpu_seconds': parse, 'sql_statements': 0, 'rows_written': 0},
+                'mapper': {'wall_seconds': mapper, 'cpu_seconds': mapper, 'sql_statements': 1, 'rows_written': 4},
+                'mapper/flush': {'wall_seconds': mapper, 'cpu_seconds': 0, 'sql_statements': 1, 'rows_written': 4},
+            },
+        }
+
+    def test_slowest_phase_is_top_level(self):
+        self.assertEqual(slowest_phase(self.profile(1.0, 2.0)), 'mapper')
+        self.assertEqual(slowest_phase(self.profile(3.0, 2.0)), 'parse')
+        self.assertIsNone(slowest_phase(None))
+
+    def test_summary(self):
+        summary = summarize_profiles([('a.xml', self.profile(1.0, 2.0)), ('b.xml', self.profile(5.0, 1.0))])
+        self.assertEqual(summary['files'], 2)
+        self.assertEqual(summary['phases']['parse']['avg_wall_seconds'], 3.0)
+        self.assertEqual(summary['phases']['mapper']['rows_written'], 8)
+        self.assertEqual([f['file_name'] for f in summary['slowest_files']], ['b.xml', 'a.xml'])
+        self.assertEqual(summary['slowest_files'][0]['slowest_phase'], 'parse')
+
+
+if __name__ == '__main__':
+    unittest.main()
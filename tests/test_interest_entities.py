@@ -0,0 +1,113 @@
+"""
+Unit tests for interest registry entities
+=========================================
+
+Covers organization name normalization, NIPC extraction, grouping of
+declaration items into entities and the co-occurrence SELECT.
+"""
+
+import unittest
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy.dialects import postgresql
+
+from scripts.data_processing.interest_entities import (
+    EntityResolver, cooccurrences_select, extract_nipc, normalize_organization_name, valid_nipc
+)
+
+
+class TestNormalizeOrganizationName(unittest.TestCase):
+    """Accent, case, punctuation and legal-form insensitive names"""
+
+    def test_legal_forms(self):
+        expected = 'banco portugues investimento'
+        for name in ('Banco Português de Investimento, S.A.', 'BANCO PORTUGUES DE INVESTIMENTO SA',
+                     'Banco Português de Investimento - SGPS, S.A.'):
+            with self.subTest(name=name):
+                self.assertEqual(normalize_organization_name(name), expected)
+        self.assertEqual(normalize_organization_name('Silva & Filhos, Lda.'), 'silva filhos')
+        self.assertEqual(normalize_organization_name('Cooperativa Agrícola, C.R.L.'), 'cooperativa agricola')
+
+    def test_placeholders(self):
+        for name in (None, '', '-', 'N/A', 'Não aplicável', 'Nada a declarar', 'S.A.'):
+            with self.subTest(name=name):
+                self.assertIsNone(normalize_organization_name(name))
+
+    def test_nipc_removed_from_name(self):
+        self.assertEqual(normalize_organization_name('Empresa X, Lda (NIPC 500 000 000)'), 'empresa x')
+
+
+class TestNipc(unittest.TestCase):
+    """Check digit validation and extraction"""
+
+    def test_valid(self):
+        self.assertTrue(valid_nipc('500000000'))
+        self.assertTrue(valid_nipc('501442600'))
+        self.assertFalse(valid_nipc('501442601'))
+        self.assertFalse(valid_nipc('012345678'))
+        self.assertFalse(valid_nipc('5000'))
+
+    def test_extract(self):
+        self.assertEqual(extract_nipc('Empresa X (NIPC: 501 442 600)'), '501442600')
+        self.assertEqual(extract_nipc('Empresa X, NIF 501442600'), '501442600')
+        self.assertIsNone(extract_nipc('Empresa X, NIF 501442601'))
+        self.assertIsNone(extract_nipc('Rua 501442600'))
+        self.assertIsNone(extract_nipc(None))
+
+
+class TestEntityResolver(unittest.TestCase):
+    """Declaration items -> entities"""
+
+    def resolve(self, *declared, known=()):
+        resolver = EntityResolver(known)
+        for position, (id_cadastro, name) in enumerate(declared):
+            resolver.add('t', position, f'r{position}', 'leg', id_cadastro, name)
+        return resolver.resolve()
+
+    def test_spellings_share_entity(self):
+        entities, links = self.resolve((1, 'Banco X, S.A.'), (2, 'BANCO X SA'), (2, 'Banco X, S.A.'), (3, 'Banco Y'))
+        self.assertEqual(len(entities), 2)
+        self.assertEqual(len({link['entity_id'] for link in links[:3]}), 1)
+        banco_x = next(e for e in entities if e['chave'] == 'nome:banco x')
+        self.assertEqual(banco_x['nome'], 'Banco X, S.A.')
+
+    def test_name_merged_into_single_nipc(self):
+        entities, links = self.resolve((1, 'Empresa X, Lda (NIPC 501442600)'), (2, 'Empresa X'))
+        self.assertEqual([e['chave'] for e in entities], ['nipc:501442600'])
+        self.assertEqual(links[0]['entity_id'], links[1]['entity_id'])
+
+    def test_name_with_known_nipc(self):
+        entities, _ = self.resolve((1, 'Empresa X'), known=[('empresa x', '501442600')])
+        self.assertEqual(entities[0]['chave'], 'nipc:501442600')
+
+    def test_ambiguous_name_not_merged(self):
+        entities, _ = self.resolve((1, 'Empresa X'), known=[('empresa x', '501442600'), ('empresa x', '500000000')])
+        self.assertEqual(entities[0]['chave'], 'nome:empresa x')
+
+    def test_placeholders_skipped(self):
+        resolver = EntityResolver()
+        self.assertFalse(resolver.add('t', 1, 'r', 'leg', 1, 'Não aplicável'))
+        self.assertEqual(resolver.resolve(), ([], []))
+
+    def test_deterministic_ids(self):
+        first, _ = self.resolve((1, 'Banco X'))
+        second, _ = self.resolve((9, 'BANCO X'))
+        self.assertEqual(first[0]['id'], second[0]['id'])
+
+
+class TestCooccurrencesSelect(unittest.TestCase):
+    """Pairs of distinct deputies per capped entity"""
+
+    def test_sql(self):
+        sql = str(cooccurrences_select(10).compile(dialect=postgresql.dialect()))
+        self.assertIn('deputy_count BETWEEN', sql)
+        self.assertIn('!=', sql)
+        self.assertIn('DISTINCT', sql)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Unit tests for interest registry person links
+=============================================
+
+Covers name normalization and spouse resolution against the deputy name
+index (exact and partial names, ambiguity, self-links, latest row).
+"""
+
+import unittest
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from scripts.data_processing.interest_links import DeputyNameIndex, normalize_person_name
+
+
+def index():
+    """(deputado_id, id_cadastro, nome_completo, nome, legislatura_numero)"""
+    return DeputyNameIndex([
+        ('ana-xiv', 1, 'Ana Maria da Conceição Silva', 'Ana Silva', 'XIV'),
+        ('ana-xvi', 1, 'Ana Maria da Conceição Silva', 'Ana Silva', 'XVI'),
+        ('rui-xv', 2, 'Rui Pedro dos Santos Costa', 'Rui Costa', 'XV'),
+        ('rui2-xiii', 3, 'Rui Manuel Costa Pereira', 'Rui Pereira', 'XIII'),
+    ])
+
+
+class TestNormalizePersonName(unittest.TestCase):
+    """Accent, case and particle insensitive names"""
+
+    def test_normalize(self):
+        self.assertEqual(normalize_person_name('MARIA DA CONCEIÇÃO  SILVA'), 'maria conceicao silva')
+        self.assertEqual(normalize_person_name("João d'Almeida e Sousa"), 'joao almeida sousa')
+        self.assertIsNone(normalize_person_name(''))
+        self.assertIsNone(normalize_person_name(' de '))
+
+
+class TestDeputyNameIndex(unittest.TestCase):
+    """Spouse resolution"""
+
+    def test_exact_name_links_latest_row(self):
+        self.assertEqual(index().resolve('ANA MARIA DA CONCEICAO SILVA'), 'ana-xvi')
+
+    def test_partial_name(self):
+        self.assertEqual(index().resolve('Rui Santos Costa'), 'rui-xv')
+        self.assertEqual(index().resolve('Ana Conceição Silva'), 'ana-xvi')
+
+    def test_ambiguous_or_unknown(self):
+        self.assertIsNone(index().resolve('Rui Costa Pereira Santos'))
+        self.assertEqual(index().persons('Rui Costa'), {2})
+        self.assertIsNone(index().resolve('Costa'))
+        self.assertIsNone(index().resolve('José Silva'))
+        self.assertIsNone(index().resolve(None))
+
+    def test_declarant_excluded(self):
+        self.assertIsNone(index().resolve('Ana Silva', exclude_person=1))
+        self.assertEqual(index().resolve('Ana Silva', exclude_person=2), 'ana-xvi')
+
+    def test_len(self):
+        self.assertEqual(len(index()), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
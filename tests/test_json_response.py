@@ -0,0 +1,135 @@
+"""
+Unit tests for the JSON response pipeline
+=========================================
+
+Covers sparse fieldset parsing, encoder parity with Flask's JSON provider,
+Accept-Encoding negotiation and opaque cursors.
+"""
+
+import unittest
+import gzip
+import json
+import uuid
+import decimal
+import os
+import sys
+from datetime import date, datetime
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import Flask
+
+from app.utils.json_response import (
+    dumps, json_response, negotiate_encoding, parse_fields, select_fields, wants,
+    MIN_COMPRESS_BYTES,
+)
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+ITEM = {
+    'id': 1,
+    'nome': 'Ana',
+    'partido_sigla': 'PS',
+    'career_info': {'total_mandates': 2, 'first_mandate': 'XV'},
+}
+
+
+class TestFieldSelection(unittest.TestCase):
+    """fields= parsing and pruning"""
+
+    def test_no_fields_selects_everything(self):
+        self.assertIsNone(parse_fields(None))
+        self.assertIsNone(parse_fields(' , '))
+        self.assertIs(select_fields(ITEM, None), ITEM)
+        self.assertTrue(wants(None, 'anything'))
+
+    def test_top_level_selection_keeps_id(self):
+        fields = parse_fields('nome')
+        self.assertEqual(select_fields(ITEM, fields), {'id': 1, 'nome': 'Ana'})
+
+    def test_nested_selection(self):
+        fields = parse_fields('career_info.total_mandates')
+        self.assertEqual(
+            select_fields(ITEM, fields),
+            {'id': 1, 'career_info': {'total_mandates': 2}}
+        )
+        self.assertTrue(wants(fields, 'career_info'))
+        self.assertFalse(wants(fields, 'partido_sigla'))
+
+    def test_whole_object_wins_over_subfield(self):
+        fields = parse_fields('career_info.total_mandates,career_info')
+        self.assertEqual(select_fields(ITEM, fields)['career_info'], ITEM['career_info'])
+
+    def test_invalid_fields_rejected(self):
+        with self.assertRaises(ValueError):
+            parse_fields('nome;drop')
+        with self.assertRaises(ValueError):
+            parse_fields(','.join(f'f{i}' for i in range(100)))
+
+
+class TestEncoder(unittest.TestCase):
+    """Encoder output matches Flask's default JSON provider"""
+
+    def test_values_match_flask(self):
+        app = Flask(__name__)
+        payload = {
+            'b': date(2025, 3, 1),
+            'a': datetime(2025, 3, 1, 12, 30),
+            'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'decimal': decimal.Decimal('1.50'),
+            'nome': 'João',
+            'lista': [1, None, True],
+        }
+        with app.app_context():
+            expected = json.loads(app.json.dumps(payload))
+        self.assertEqual(json.loads(dumps(payload)), expected)
+
+    def test_keys_sorted(self):
+        self.assertEqual(dumps({'b': 1, 'a': 2}), b'{"a":2,"b":1}')
+
+
+class TestCompression(unittest.TestCase):
+    """Accept-Encoding negotiation"""
+
+    def test_negotiate_encoding(self):
+        self.assertIsNone(negotiate_encoding(None))
+        self.assertIsNone(negotiate_encoding('identity'))
+        self.assertIsNone(negotiate_encoding('gzip;q=0'))
+        self.assertEqual(negotiate_encoding('deflate, gzip;q=0.5'), 'gzip')
+        self.assertIn(negotiate_encoding('*'), ('gzip', 'br'))
+
+    def test_large_response_compressed(self):
+        app = Flask(__name__)
+        payload = {'items': [ITEM] * 100}
+        with app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+            response = json_response(payload)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+        self.assertEqual(json.loads(gzip.decompress(response.get_data())), json.loads(dumps(payload)))
+
+    def test_small_response_not_compressed(self):
+        app = Flask(__name__)
+        with app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+            response = json_response({'error': 'x'}, status=400)
+        self.assertLess(len(response.get_data()), MIN_COMPRESS_BYTES)
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertEqual(response.status_code, 400)
+
+
+class TestCursors(unittest.TestCase):
+    """Opaque cursor encoding"""
+
+    def test_round_trip(self):
+        state = {'o': 40, 'd': '2025-01-01'}
+        self.assertEqual(decode_cursor(encode_cursor(state)), state)
+        self.assertEqual(decode_cursor(None), {})
+
+    def test_invalid_cursor(self):
+        for cursor in ('not base64!', encode_cursor({'o': -1})[:-2] + '!!', 'W10'):
+            with self.subTest(cursor=cursor), self.assertRaises(ValueError):
+                decode_cursor(cursor)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Unit tests for the legislature registry
+=======================================
+
+Covers designation aliases, current-legislature resolution, date lookups,
+the process-wide cache and the routes' current-legislature filter.
+"""
+
+import unittest
+import os
+import sys
+from datetime import date, timedelta
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from database import legislature_registry
+from database.legislature_registry import (
+    LegislatureInfo, LegislatureRegistry, canonical_numero, get_legislature_registry,
+    invalidate_legislature_registry, legislature_ordinal, set_legislature_registry,
+)
+
+LEGISLATURES = [
+    LegislatureInfo('id-xvi', 'XVI', '16.ª Legislatura', date(2024, 3, 26), date(2025, 6, 2)),
+    LegislatureInfo('id-cons', 'CONSTITUINTE', 'Assembleia Constituinte', date(1975, 6, 2), date(1976, 4, 2)),
+    LegislatureInfo('id-xvii', 'XVII', '17.ª Legislatura', date(2025, 6, 3), None),
+    LegislatureInfo('id-i', 'I', '1.ª Legislatura', date(1976, 6, 3), date(1980, 11, 12)),
+]
+
+
+class TestDesignations(unittest.TestCase):
+    """Source designations map to canonical numeros"""
+
+    def test_aliases(self):
+        self.assertEqual(canonical_numero(' ib '), 'I')
+        self.assertEqual(canonical_numero('Cons'), 'CONSTITUINTE')
+        self.assertEqual(canonical_numero('xvii'), 'XVII')
+        self.assertIsNone(canonical_numero(''))
+
+    def test_ordinals(self):
+        self.assertEqual(legislature_ordinal('XVII'), 17)
+        self.assertEqual(legislature_ordinal('IA'), 1)
+        self.assertEqual(legislature_ordinal('CONSTITUINTE'), 0)
+        self.assertIsNone(legislature_ordinal('Outra'))
+
+
+class TestRegistry(unittest.TestCase):
+    """Lookups over a fixed set of legislatures"""
+
+    def setUp(self):
+        self.registry = LegislatureRegistry(LEGISLATURES)
+
+    def test_ordered_by_ordinal(self):
+        self.assertEqual([leg.numero for leg in self.registry.legislatures], ['CONSTITUINTE', 'I', 'XVI', 'XVII'])
+
+    def test_current_is_latest_running(self):
+        self.assertEqual(self.registry.current.numero, 'XVII')
+        self.assertTrue(self.registry.is_current('xvii'))
+        self.assertFalse(self.registry.is_current('XVI'))
+
+    def test_current_when_all_ended(self):
+        ended = [LegislatureInfo('a', 'XV', '', date(2022, 3, 29), date.today() - timedelta(days=1)),
+                 LegislatureInfo('b', 'XIV', '', date(2019, 10, 25), date(2022, 3, 28))]
+        self.assertEqual(LegislatureRegistry(ended).current.numero, 'XV')
+
+    def test_lookups(self):
+        self.assertEqual(self.registry.get('IB').id, 'id-i')
+        self.assertEqual(self.registry.by_id('id-xvi').numero, 'XVI')
+        self.assertEqual(self.registry.by_ordinal(0).numero, 'CONSTITUINTE')
+        self.assertEqual(self.registry.id_of('XVII'), 'id-xvii')
+        self.assertIsNone(self.registry.id_of('XX'))
+
+    def test_for_date(self):
+        self.assertEqual(self.registry.for_date(date(1978, 1, 1)).numero, 'I')
+        self.assertEqual(self.registry.for_date(date(2025, 6, 3)).numero, 'XVII')
+        self.assertIsNone(self.registry.for_date(date(1990, 1, 1)))
+
+    def test_empty(self):
+        self.assertIsNone(LegislatureRegistry([]).current)
+
+
+class TestProcessCache(unittest.TestCase):
+    """The registry is loaded once per TTL"""
+
+    def tearDown(self):
+        invalidate_legislature_registry()
+
+    def test_loaded_once_until_invalidated(self):
+        with patch.object(legislature_registry, 'load_legislature_registry',
+                          return_value=LegislatureRegistry(LEGISLATURES)) as load:
+            session = object()
+            first = get_legislature_registry(session)
+            self.assertIs(get_legislature_registry(session), first)
+            self.assertEqual(load.call_count, 1)
+
+            invalidate_legislature_registry()
+            get_legislature_registry(session)
+            self.assertEqual(load.call_count, 2)
+
+    def test_installed_registry(self):
+        registry = LegislatureRegistry(LEGISLATURES)
+        set_legislature_registry(registry)
+        self.assertIs(get_legislature_registry(), registry)
+
+
+class TestCurrentLegislatureFilter(unittest.TestCase):
+    """Route filters on the current legislature"""
+
+    def tearDown(self):
+        invalidate_legislature_registry()
+
+    def compiled(self):
+        from app.routes.parlamento import _in_current_legislatura
+        from database.models import DeputadoMandatoLegislativo
+        return _in_current_legislatura(DeputadoMandatoLegislativo.legislatura_id).compile()
+
+    def test_current_legislature(self):
+        set_legislature_registry(LegislatureRegistry(LEGISLATURES))
+        compiled = self.compiled()
+        self.assertIn('legislatura_id = :legislatura_id_1', str(compiled))
+        self.assertEqual(list(compiled.params.values()), ['id-xvii'])
+
+    def test_matches_nothing_without_legislatures(self):
+        set_legislature_registry(LegislatureRegistry([]))
+        self.assertEqual(str(self.compiled()), 'false')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+"""
+Unit tests for name normalization
+=================================
+
+Covers the accent/case folding and name tokens shared by the interest
+registry and budget vote resolvers.
+"""
+
+import unittest
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from scripts.data_processing.name_normalization import fold, name_tokens, strip_accents
+
+
+class TestNameNormalization(unittest.TestCase):
+    """Folded forms of free-text names"""
+
+    def test_fold(self):
+        self.assertEqual(strip_accents('Conceição'), 'Conceicao')
+        self.assertEqual(fold('  Abstenção\t a  FAVOR '), 'abstencao a favor')
+
+    def test_name_tokens(self):
+        self.assertEqual(name_tokens('MARIA DA CONCEIÇÃO D\'ÁVILA'), ['maria', 'conceicao', 'avila'])
+        self.assertEqual(name_tokens('Empresa 2000, S.A.'), ['empresa', '2000', 's', 'a'])
+        self.assertEqual(name_tokens('Empresa 2000', letters_only=True), ['empresa'])
+
+
+if __name__ == '__main__':
+    unittest.main()
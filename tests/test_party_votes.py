@@ -0,0 +1,125 @@
+"""
+Unit tests for party vote queries
+=================================
+
+Checks the set-based party vote queries against the per-deputy loop they
+replaced in /partidos/<sigla>/voting-analytics, on an in-memory SQLite
+database.
+"""
+
+import unittest
+import os
+import sys
+import uuid
+from datetime import date
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy.orm import Session
+
+from app.utils.party_votes import party_activity_vote_counts, party_deputies
+from database.models import AtividadeParlamentarVotacao, Deputado, DeputadoMandatoLegislativo, IntervencaoDeputado
+from scripts.benchmarks.import_benchmark import create_sqlite_engine
+
+SINCE = date(2025, 1, 1)
+
+# SQLite does not enforce the foreign keys, so rows only need the ids
+LEGISLATURA_ID = uuid.uuid4()
+
+
+def loop_party_votes(session, sigla):
+    """The original route code: deputies, then one join query per deputy"""
+    deputados_partido_ids = session.query(DeputadoMandatoLegislativo.deputado_id).filter(
+        DeputadoMandatoLegislativo.par_sigla == sigla
+    ).distinct().all()
+    if not deputados_partido_ids:
+        deputados_partido_ids = session.query(DeputadoMandatoLegislativo.deputado_id).filter(
+            DeputadoMandatoLegislativo.par_sigla.like(f'%{sigla}%')
+        ).distinct().all()
+    deputados_partido = session.query(Deputado).filter(
+        Deputado.id.in_([d[0] for d in deputados_partido_ids])
+    ).all()
+
+    parlamentar_votacoes = []
+    for deputado in deputados_partido:
+        parlamentar_votacoes.extend(session.query(AtividadeParlamentarVotacao).join(
+            IntervencaoDeputado, AtividadeParlamentarVotacao.atividade_id == IntervencaoDeputado.intervencao_id
+        ).filter(
+            IntervencaoDeputado.id_cadastro == deputado.id_cadastro
+        ).all())
+    unique = {votacao.id: votacao for votacao in parlamentar_votacoes}
+    counts = {
+        'total': len(unique),
+        'unanimes': len([v for v in unique.values() if v.unanime]),
+        'recentes': len([v for v in unique.values() if v.data and v.data >= SINCE]),
+    }
+    return {d.id for d in deputados_partido}, counts
+
+
+class TestPartyVotesParity(unittest.TestCase):
+    """Same deputies and counts as the per-deputy loop"""
+
+    def setUp(self):
+        self.engine = create_sqlite_engine()
+        self.session = Session(self.engine)
+        self.deputies = {}
+
+        # (id_cadastro, siglas of their mandates)
+        for id_cadastro, siglas in ((1, ['PS']), (2, ['PS', 'PS']), (3, ['PSD']),
+                                    (4, ['PPD/PSD.CDS-PP']), (5, ['BE'])):
+            deputado = Deputado(id=uuid.uuid4(), id_cadastro=id_cadastro, nome=f'Deputado {id_cadastro}',
+                                legislatura_id=LEGISLATURA_ID)
+            self.session.add(deputado)
+            self.deputies[id_cadastro] = deputado
+            for sigla in siglas:
+                self.session.add(DeputadoMandatoLegislativo(id=uuid.uuid4(), deputado_id=deputado.id, par_sigla=sigla))
+
+        # (activity participants, votes as (unanime, data))
+        activities = [
+            ([1, 2], [(True, date(2025, 3, 1)), (False, date(2024, 5, 1))]),
+            ([2], [(None, None)]),
+            ([3, 4], [(False, date(2025, 6, 1))]),
+            ([4], [(True, date(2023, 1, 1))]),
+            ([5], [(True, date(2025, 2, 1))]),
+            ([], [(True, date(2025, 2, 1))]),
+        ]
+        for participants, votes in activities:
+            atividade_id = uuid.uuid4()
+            for id_cadastro in participants:
+                self.session.add(IntervencaoDeputado(
+                    id=uuid.uuid4(), intervencao_id=atividade_id, id_cadastro=id_cadastro
+                ))
+            for unanime, data in votes:
+                self.session.add(AtividadeParlamentarVotacao(
+                    id=uuid.uuid4(), atividade_id=atividade_id, unanime=unanime, data=data
+                ))
+        self.session.flush()
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def set_based(self, sigla):
+        deputados = party_deputies(self.session, sigla)
+        counts = party_activity_vote_counts(self.session, [d.id_cadastro for d in deputados], SINCE)
+        return {d.id for d in deputados}, counts
+
+    def test_parity(self):
+        for sigla in ('PS', 'PSD', 'CDS-PP', 'BE', 'IL'):
+            with self.subTest(sigla=sigla):
+                self.assertEqual(self.set_based(sigla), loop_party_votes(self.session, sigla))
+
+    def test_counts(self):
+        deputies, counts = self.set_based('PS')
+        self.assertEqual(deputies, {self.deputies[1].id, self.deputies[2].id})
+        self.assertEqual(counts, {'total': 3, 'unanimes': 1, 'recentes': 1})
+
+    def test_substring_fallback(self):
+        deputies, counts = self.set_based('CDS-PP')
+        self.assertEqual(deputies, {self.deputies[4].id})
+        self.assertEqual(counts, {'total': 2, 'unanimes': 1, 'recentes': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+Unit tests for the post-import refresh
+======================================
+
+Run-wide derived tables are rebuilt once per import run, before the
+dashboard aggregates, and one failing rebuild does not stop the others.
+"""
+
+import unittest
+import os
+import sys
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from scripts.data_processing import post_import
+
+
+class TestRefreshAfterImportRun(unittest.TestCase):
+    """Derived tables first, then aggregates"""
+
+    def test_rebuilds_then_aggregates(self):
+        calls = []
+
+        def failing():
+            calls.append('failing')
+            raise RuntimeError('relation does not exist')
+
+        rebuilds = {'failing': failing, 'active_entities': lambda: calls.append('active_entities') or {'deputado': 2}}
+        with patch.dict(post_import.DERIVED_REBUILDS, rebuilds, clear=True), \
+                patch('app.utils.dashboard_aggregates.refresh_dashboard_aggregates',
+                      lambda: calls.append('aggregates') or {'refreshed': 1, 'failed': 0}):
+            self.assertEqual(post_import.refresh_derived_data(), {'active_entities': {'deputado': 2}})
+            calls.clear()
+            self.assertEqual(post_import.refresh_after_import_run(), {'refreshed': 1, 'failed': 0})
+
+        self.assertEqual(calls, ['failing', 'active_entities', 'aggregates'])
+
+    def test_registered_rebuilds(self):
+        self.assertEqual(set(post_import.DERIVED_REBUILDS), {'active_entities', 'interest_entity_cooccurrences'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+Unit tests for the reference data cache
+=======================================
+
+Covers snapshot lookups, loading from the reference tables, versioned
+invalidation across workers and the hit-rate counters, on an in-memory
+SQLite database.
+"""
+
+import unittest
+import os
+import sys
+import uuid
+from datetime import date
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from database import reference_cache
+from database.legislature_registry import LegislatureInfo, LegislatureRegistry, get_legislature_registry
+from database.models import ActiveEntity, CacheVersion, CirculoEleitoral, Coligacao, Legislatura, Partido
+from database.reference_cache import (
+    CircleInfo, CoalitionInfo, PartyInfo, ReferenceData, bump_reference_data_version, circle_by_id,
+    get_reference_data, invalidate_reference_data, legislature_by_numero, party_by_sigla,
+    reference_cache_stats, reference_parties, reset_reference_cache_stats,
+)
+from scripts.benchmarks.import_benchmark import create_sqlite_engine
+
+
+class TestSnapshot(unittest.TestCase):
+    """Lookups over a fixed snapshot"""
+
+    def setUp(self):
+        self.data = ReferenceData(
+            LegislatureRegistry([LegislatureInfo('id-xvii', 'XVII', '17.ª Legislatura', date(2025, 6, 3))]),
+            parties=[PartyInfo('id-ps', 'PS', 'Partido Socialista'), PartyInfo('id-be', 'BE', 'Bloco de Esquerda')],
+            circles=[CircleInfo('id-lx', 'Lisboa', codigo='11')],
+            coalitions=[CoalitionInfo('id-ad', 'PPD/PSD.CDS-PP', 'Aliança Democrática', ativo=True)],
+        )
+
+    def test_lookups(self):
+        self.assertEqual(self.data.party_by_sigla(' PS ').nome, 'Partido Socialista')
+        self.assertIsNone(self.data.party_by_sigla(None))
+        self.assertEqual(self.data.party_by_id('id-be').sigla, 'BE')
+        self.assertEqual(self.data.circle_by_designacao('  LISBOA').codigo, '11')
+        self.assertEqual(self.data.circle_by_id('id-lx').designacao, 'Lisboa')
+        self.assertTrue(self.data.coalition_by_sigla('PPD/PSD.CDS-PP').ativo)
+        self.assertEqual(self.data.legislatures.get('xvii').id, 'id-xvii')
+
+    def test_ordered_and_sized(self):
+        self.assertEqual([party.sigla for party in self.data.parties], ['BE', 'PS'])
+        self.assertEqual(self.data.sizes(), {'legislaturas': 1, 'partidos': 2, 'circulos': 1, 'coligacoes': 1})
+
+
+class TestProcessCache(unittest.TestCase):
+    """Loaded once, reloaded when the version counter moves"""
+
+    def setUp(self):
+        invalidate_reference_data()
+        reset_reference_cache_stats()
+        self.engine = create_sqlite_engine()
+        self.session = Session(self.engine)
+
+        self.legislatura_id = uuid.uuid4()
+        self.coligacao_id = uuid.uuid4()
+        self.circulo_id = uuid.uuid4()
+        self.session.add_all([
+            Legislatura(id=self.legislatura_id, numero='XVII', designacao='17.ª Legislatura',
+                        data_inicio=date(2025, 6, 3)),
+            Partido(id=uuid.uuid4(), sigla='PS', nome='Partido Socialista'),
+            CirculoEleitoral(id=self.circulo_id, designacao='Lisboa', codigo='11'),
+            Coligacao(id=self.coligacao_id, sigla='CDU', nome='Coligação Democrática Unitária'),
+            Coligacao(id=uuid.uuid4(), sigla='APU', nome='Aliança Povo Unido'),
+            ActiveEntity(id=uuid.uuid4(), entity_type='coligacao', entity_id=self.coligacao_id,
+                         legislatura_numero='XVII'),
+        ])
+        self.session.commit()
+
+    def tearDown(self):
+        invalidate_reference_data()
+        reset_reference_cache_stats()
+        self.session.close()
+        self.engine.dispose()
+
+    def test_loaded_from_tables(self):
+        self.assertEqual(legislature_by_numero('XVII', self.session).id, self.legislatura_id)
+        self.assertEqual(party_by_sigla('PS', self.session).nome, 'Partido Socialista')
+        self.assertEqual(circle_by_id(self.circulo_id, self.session).codigo, '11')
+        data = get_reference_data(self.session)
+        self.assertTrue(data.coalition_by_sigla('CDU').ativo)
+        self.assertFalse(data.coalition_by_sigla('APU').ativo)
+        self.assertIs(get_legislature_registry(), data.legislatures)
+
+    def test_hit_rate(self):
+        for _ in range(4):
+            party_by_sigla('PS', self.session)
+        stats = reference_cache_stats()
+        self.assertEqual((stats['lookups'], stats['hits'], stats['misses']), (4, 3, 1))
+        self.assertEqual(stats['hit_rate'], 0.75)
+        self.assertEqual(stats['entries']['partidos'], 1)
+
+    def test_reloaded_when_version_moves(self):
+        self.assertEqual(bump_reference_data_version(self.session), 1)
+        self.session.commit()
+        first = get_reference_data(self.session)
+        self.assertEqual(first.version, 1)
+
+        self.session.add(Partido(id=uuid.uuid4(), sigla='BE', nome='Bloco de Esquerda'))
+        self.session.commit()
+        with patch.object(reference_cache, 'REFERENCE_CACHE_CHECK_INTERVAL', 0):
+            # Same version: the snapshot is kept
+            self.assertIs(get_reference_data(self.session), first)
+            self.assertIsNone(party_by_sigla('BE', self.session))
+
+            # Another process completed an import
+            self.session.execute(update(CacheVersion).values(version=CacheVersion.version + 1))
+            self.session.commit()
+            self.assertEqual([party.sigla for party in reference_parties(self.session)], ['BE', 'PS'])
+            self.assertEqual(get_reference_data(self.session).version, 2)
+
+    def test_check_interval_skips_version_reads(self):
+        get_reference_data(self.session)
+        with patch.object(reference_cache, 'read_reference_data_version') as read_version:
+            get_reference_data(self.session)
+            read_version.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+"""
+Unit tests for sharded import
+=============================
+
+Covers splitting a file into standalone chunk documents, the decision
+whether a file is sharded at all, and a sharded import against a file
+SQLite database shared with the worker processes.
+"""
+
+import unittest
+import os
+import sys
+import hashlib
+import tempfile
+import uuid
+from datetime import datetime
+import xml.etree.ElementTree as ET
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from database import connection
+from database.models import ActivityEvent, Base, ImportShard, ImportStatus, Legislatura, PeticaoParlamentar
+from scripts.benchmarks.import_benchmark import create_sqlite_engine
+from scripts.benchmarks.import_corpus import CORPUS_SPECS, CorpusGenerator
+from scripts.data_processing.differential_import import DIFFERENTIAL_SPECS, collect_records
+from scripts.data_processing.sharded_import import ShardedImport, split_records
+
+SPEC = DIFFERENTIAL_SPECS['atividade_deputados']
+
+
+class TimelineMapper(CORPUS_SPECS['atividade_deputados'].mapper):
+    """Refreshes an activity timeline source at the end of the file, like the Iniciativas mapper"""
+
+    ACTIVITY_SOURCES = ['peticao']
+
+    def validate_and_map(self, xml_root, file_info, strict_mode=False):
+        results = super().validate_and_map(xml_root, file_info, strict_mode)
+        self._sync_activity_events(self._get_or_create_legislatura('XV'))
+        return results
+
+
+def atividade_file(cad_ids):
+    """ArrayOfAtividadeDeputado with one AtividadeDeputado per cad_id"""
+    items = ''.join(
+        f'<AtividadeDeputado><Deputado><DepCadId>{cad_id}</DepCadId></Deputado></AtividadeDeputado>'
+        for cad_id in cad_ids
+    )
+    return ET.fromstring(f'<ArrayOfAtividadeDeputado>{items}</ArrayOfAtividadeDeputado>')
+
+
+class TestSplitRecords(unittest.TestCase):
+    """Chunk documents"""
+
+    def test_chunks_cover_all_records_in_order(self):
+        xml_root = atividade_file(range(1, 11))
+        chunks = split_records(xml_root, SPEC, 3)
+        self.assertEqual([keys for keys, _ in chunks],
+                         [['1', '2', '3', '4'], ['5', '6', '7', '8'], ['9', '10']])
+        for keys, content in chunks:
+            chunk_root = ET.fromstring(content)
+            self.assertEqual(chunk_root.tag, 'ArrayOfAtividadeDeputado')
+            _, fingerprints = collect_records(chunk_root, SPEC)
+            self.assertEqual(list(fingerprints), keys)
+
+    def test_source_tree_unchanged(self):
+        xml_root = atividade_file(range(1, 6))
+        before = ET.tostring(xml_root)
+        split_records(xml_root, SPEC, 2)
+        self.assertEqual(ET.tostring(xml_root), before)
+
+    def test_duplicate_ids_not_split(self):
+        self.assertIsNone(split_records(atividade_file([1, 2, 2]), SPEC, 2))
+
+
+class TestPlan(unittest.TestCase):
+    """When a file is sharded"""
+
+    def test_large_supported_file(self):
+        sharded = ShardedImport.plan(atividade_file(range(1, 101)), 'atividade_deputados', 4, min_records=50)
+        self.assertEqual(len(sharded.chunks), 4)
+
+    def test_not_sharded(self):
+        xml_root = atividade_file(range(1, 101))
+        self.assertIsNone(ShardedImport.plan(xml_root, 'atividade_deputados', 1, min_records=50))
+        self.assertIsNone(ShardedImport.plan(xml_root, 'atividade_deputados', 4, min_records=500))
+        self.assertIsNone(ShardedImport.plan(xml_root, 'intervencoes', 4, min_records=50))
+
+
+class TestShardedRun(unittest.TestCase):
+    """A file imported in chunks leaves the same rows as a single-process import"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.file_name, content = CorpusGenerator('atividade_deputados', seed=7).generate(40)
+        # Records of the file's legislature, as in the real files
+        xml_root = ET.fromstring(content)
+        for leg_des in xml_root.iter('LegDes'):
+            leg_des.text = 'XV'
+        self.content = ET.tostring(xml_root, encoding='utf-8')
+        self.file_info = {'file_path': self.file_name, 'file_type': 'atividade_deputados',
+                          'skip_video_processing': True}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def engine(self, name):
+        engine = create_sqlite_engine(f"sqlite:///{os.path.join(self.tmp.name, name)}")
+        event.listen(engine, 'connect', self.add_sql_functions)
+        engine.dispose()  # The schema was created on a connection without them
+        with Session(engine) as session:
+            legislatura = Legislatura(id=uuid.uuid4(), numero='XV', designacao='15.ª Legislatura')
+            session.add(legislatura)
+            session.add_all([
+                PeticaoParlamentar(id=uuid.uuid4(), pet_id=pet_id, pet_assunto=f'Petição {pet_id}',
+                                   legislatura_id=legislatura.id, updated_at=datetime.now())
+                for pet_id in (1, 2, 3)
+            ])
+            session.commit()
+        return engine
+
+    @staticmethod
+    def add_sql_functions(dbapi_connection, _):
+        """PostgreSQL functions used to build activity_events ids"""
+        dbapi_connection.create_function('md5', 1, lambda value: hashlib.md5(value.encode()).hexdigest())
+        dbapi_connection.create_function(
+            'concat', -1, lambda *values: ''.join('' if value is None else str(value) for value in values))
+
+    def import_record(self, session):
+        record = ImportStatus(id=uuid.uuid4(), file_url=f'https://example.org/{self.file_name}',
+                              file_name=self.file_name, file_type='XML', category='atividade_deputados',
+                              legislatura='XV', status='processing')
+        session.add(record)
+        session.commit()
+        return record
+
+    def row_counts(self, engine):
+        with engine.connect() as conn:
+            return {
+                table.name: conn.execute(select(func.count()).select_from(table)).scalar()
+                for table in Base.metadata.sorted_tables
+                if table.name not in (ImportStatus.__tablename__, ImportShard.__tablename__)
+            }
+
+    def test_same_rows_as_single_process(self):
+        single = self.engine('single.db')
+        with Session(single) as session:
+            mapper = TimelineMapper(session, import_status_record=self.import_record(session))
+            results = mapper.validate_and_map(ET.fromstring(self.content), self.file_info, False)
+            session.commit()
+        self.assertEqual(results['errors'], [])
+
+        engine = self.engine('sharded.db')
+        # Worker processes are forked and inherit the patched engine
+        with patch.object(connection, '_engine', engine), \
+                patch.object(connection, '_SessionLocal', sessionmaker(bind=engine)):
+            with Session(engine) as session:
+                import_record = self.import_record(session)
+                sharded = ShardedImport.plan(ET.fromstring(self.content), 'atividade_deputados', 2, min_records=1)
+                sharded_results = sharded.run(session, import_record, TimelineMapper, self.file_info)
+                session.commit()
+                self.assertFalse(ShardedImport.has_leftovers(session, import_record))
+
+        self.assertEqual(sharded_results['shards']['count'], 2)
+        self.assertEqual(sharded_results['records_imported'], results['records_imported'])
+        counts = self.row_counts(engine)
+        self.assertEqual(counts, self.row_counts(single))
+        self.assertEqual(counts[ActivityEvent.__tablename__], 3)
+        single.dispose()
+        engine.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
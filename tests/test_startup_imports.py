@@ -0,0 +1,58 @@
+"""
+Unit tests for API startup import cost
+======================================
+
+Each test starts a fresh interpreter, since the lazy blueprint mode only
+shows on a cold process. Covers route modules not loading the importer
+package and blueprint registration on the first request. The import-time
+budget is wall-clock dependent and checked by
+scripts/benchmarks/startup_benchmark.py --check-import-budget instead.
+"""
+
+import unittest
+import json
+import os
+import subprocess
+import sys
+
+# Add project root to path
+PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.append(PROJECT_ROOT)
+
+
+def run_python(code: str, lazy: bool, *options: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, API_LAZY_BLUEPRINTS='1' if lazy else '0', PYTHONDONTWRITEBYTECODE='1')
+    return subprocess.run(
+        [sys.executable, *options, '-c', code],
+        cwd=os.path.abspath(PROJECT_ROOT), env=env, capture_output=True, text=True, timeout=120,
+    )
+
+
+class TestStartupImports(unittest.TestCase):
+    """Cold-process imports of the API"""
+
+    def test_route_modules_do_not_import_importer(self):
+        code = (
+            "import sys, json\n"
+            "import app.routes.parlamento, app.routes.admin, app.routes.agenda, app.routes.transparency\n"
+            "print(json.dumps(sorted(m for m in sys.modules if m.startswith('scripts.'))))\n"
+        )
+        result = run_python(code, False)
+        self.assertEqual(result.returncode, 0, result.stderr[-2000:])
+        self.assertEqual(json.loads(result.stdout.strip().splitlines()[-1]), [])
+
+    def test_lazy_blueprints_registered_on_first_request(self):
+        code = (
+            "import json\n"
+            "from app.main import app\n"
+            "status = app.test_client().get('/api/ping').status_code\n"
+            "rules = {rule.rule for rule in app.url_map.iter_rules()}\n"
+            "print(json.dumps([status, '/api/deputados' in rules, '/api/admin/import-stats' in rules]))\n"
+        )
+        result = run_python(code, True)
+        self.assertEqual(result.returncode, 0, result.stderr[-2000:])
+        self.assertEqual(json.loads(result.stdout.strip().splitlines()[-1]), [200, True, True])
+
+
+if __name__ == '__main__':
+    unittest.main()
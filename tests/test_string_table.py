@@ -0,0 +1,91 @@
+"""
+Unit tests for the per-file string table
+========================================
+
+Covers interning of code and designation tags, translator-backed code
+tables, the free-text and size limits, and mapper text extraction.
+"""
+
+import unittest
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from database.translators.publications import TipodePublicacao
+from scripts.data_processing.mappers.enhanced_base_mapper import XMLProcessingMixin
+from scripts.data_processing.mappers.string_table import (
+    MAX_INTERNED_LENGTH, StringTable, code_table, local_name, should_intern,
+)
+
+
+def fresh(text: str) -> str:
+    """An equal str that is a distinct object, as ElementTree produces"""
+    return ''.join(list(text))
+
+
+class TestStringTable(unittest.TestCase):
+    """Canonical objects per distinct value"""
+
+    def test_designations_share_one_object(self):
+        table = StringTable()
+        first = table.intern(fresh('Partido Socialista'), 'parDes')
+        second = table.intern(fresh('Partido Socialista'), 'parDes')
+        self.assertIs(first, second)
+        self.assertEqual(table.stats()['hits'], 1)
+
+    def test_free_text_is_not_interned(self):
+        table = StringTable()
+        self.assertFalse(should_intern('Resumo'))
+        table.intern(fresh('Intervenção sobre o orçamento'), 'Resumo')
+        table.intern('x' * (MAX_INTERNED_LENGTH + 1), 'legDes')
+        self.assertEqual(len(table), 0)
+
+    def test_code_table_backed_by_translator_enum(self):
+        table = code_table('pubTp')
+        self.assertIs(table.enum_class, TipodePublicacao)
+        self.assertIs(table.canonical(fresh('A')), TipodePublicacao.A.name)
+        self.assertEqual(table.code(table.code_id('D')), 'D')
+        self.assertIsNone(table.canonical('not a code'))
+        self.assertIsNone(code_table('Resumo'))
+
+    def test_max_entries(self):
+        table = StringTable(max_entries=1)
+        table.intern('PS', 'gpSigla')
+        value = fresh('PSD')
+        self.assertIs(table.intern(value, 'gpSigla'), value)
+        self.assertEqual(len(table), 1)
+
+    def test_local_name(self):
+        self.assertEqual(local_name('{http://tempuri.org/}legDes'), 'legDes')
+        self.assertEqual(local_name('Publicacao/pubTp'), 'pubTp')
+
+    def test_intern_tree(self):
+        root = ET.fromstring(
+            '<Root>' + '<Rec><gpSigla>PS</gpSigla><Resumo>texto</Resumo></Rec>' * 3 + '</Root>'
+        )
+        StringTable().intern_tree(root)
+        siglas = [e.text for e in root.iter('gpSigla')]
+        self.assertTrue(all(s is siglas[0] for s in siglas))
+
+
+class TestMixinTextExtraction(unittest.TestCase):
+    """_get_text_value returns canonical objects when a table is set"""
+
+    def test_get_text_value(self):
+        mapper = XMLProcessingMixin()
+        mapper.string_table = StringTable()
+        records = ET.fromstring('<Root><Rec><legDes> XVII </legDes></Rec><Rec><legDes>XVII</legDes></Rec></Root>')
+        values = [mapper._get_text_value(rec, 'legDes') for rec in records]
+        self.assertEqual(values, ['XVII', 'XVII'])
+        self.assertIs(values[0], values[1])
+
+    def test_without_table(self):
+        rec = ET.fromstring('<Rec><legDes>XVII</legDes></Rec>')
+        self.assertEqual(XMLProcessingMixin()._get_text_value(rec, 'legDes'), 'XVII')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Unit tests for the upsert buffer
+================================
+
+Covers id assignment from preloaded natural keys, batching, parent-first
+flushing and the generated INSERT ... ON CONFLICT statement.
+"""
+
+import unittest
+import os
+import sys
+import uuid
+from unittest.mock import MagicMock
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy.dialects import postgresql
+
+from database.models import AgendaParlamentar, AgendaParlamentarAnexo
+from scripts.data_processing.mappers.upsert_buffer import UpsertBuffer
+
+LEGISLATURA_ID = uuid.uuid4()
+
+
+def agenda_row(id_externo, titulo='Plenário'):
+    return {'id_externo': id_externo, 'legislatura_id': LEGISLATURA_ID, 'titulo': titulo}
+
+
+def agenda_buffer(session, existing=(), **kwargs):
+    """Agenda buffer preloaded with [(id, id_externo)]"""
+    session.execute.return_value.all.return_value = [
+        (row_id, id_externo, LEGISLATURA_ID) for row_id, id_externo in existing
+    ]
+    buffer = UpsertBuffer(session, AgendaParlamentar, ('id_externo', 'legislatura_id'), **kwargs)
+    buffer.preload(AgendaParlamentar.legislatura_id == LEGISLATURA_ID)
+    session.execute.reset_mock()
+    return buffer
+
+
+class TestUpsertBuffer(unittest.TestCase):
+    """Ids and batches"""
+
+    def test_existing_rows_keep_their_id(self):
+        existing_id = uuid.uuid4()
+        buffer = agenda_buffer(MagicMock(), [(existing_id, 10)])
+        self.assertEqual(buffer.upsert(agenda_row(10)), existing_id)
+        new_id = buffer.upsert(agenda_row(11))
+        self.assertNotEqual(new_id, existing_id)
+        self.assertEqual(buffer.id_for((11, LEGISLATURA_ID)), new_id)
+
+    def test_duplicate_keys_written_once(self):
+        session = MagicMock()
+        buffer = agenda_buffer(session)
+        first = buffer.upsert(agenda_row(1, 'old'))
+        self.assertEqual(buffer.upsert(agenda_row(1, 'new')), first)
+        self.assertEqual(buffer.flush(), 1)
+        self.assertEqual((buffer.inserted, buffer.updated), (1, 0))
+        buffer.upsert(agenda_row(1, 'newer'))
+        buffer.flush()
+        self.assertEqual((buffer.inserted, buffer.updated), (1, 1))
+        self.assertEqual(session.execute.call_count, 2)
+
+    def test_batches(self):
+        session = MagicMock()
+        buffer = agenda_buffer(session, batch_size=2)
+        for id_externo in range(5):
+            buffer.upsert(agenda_row(id_externo))
+        self.assertEqual(session.execute.call_count, 2)
+        self.assertEqual(len(buffer), 1)
+        buffer.flush()
+        self.assertEqual(session.execute.call_count, 3)
+        self.assertEqual(buffer.flush(), 0)
+
+    def test_parent_flushed_first(self):
+        session = MagicMock()
+        agendas = agenda_buffer(session)
+        anexos = UpsertBuffer(session, AgendaParlamentarAnexo, ('agenda_id', 'id_field', 'tipo_anexo'),
+                              depends_on=[agendas])
+        agenda_id = agendas.upsert(agenda_row(1))
+        anexos.upsert({'agenda_id': agenda_id, 'id_field': None, 'tipo_anexo': 'plenario', 'titulo_field': 'Guião'})
+        anexos.flush()
+        tables = [call.args[0].table.name for call in session.execute.call_args_list]
+        self.assertEqual(tables, ['agenda_parlamentar', 'agenda_parlamentar_anexos'])
+
+
+class TestStatement(unittest.TestCase):
+    """Generated SQL"""
+
+    def test_on_conflict_updates_buffered_columns(self):
+        buffer = UpsertBuffer(MagicMock(), AgendaParlamentar, ('id_externo', 'legislatura_id'))
+        rows = [dict(agenda_row(1), id=uuid.uuid4()), dict(agenda_row(2), id=uuid.uuid4())]
+        sql = str(buffer.statement(rows).compile(dialect=postgresql.dialect()))
+        self.assertIn('ON CONFLICT (id) DO UPDATE SET', sql)
+        self.assertIn('titulo = excluded.titulo', sql)
+        self.assertIn('updated_at = now()', sql)
+        self.assertNotIn('id = excluded.id', sql)
+        self.assertNotIn('created_at = ', sql)
+
+
+if __name__ == '__main__':
+    unittest.main()
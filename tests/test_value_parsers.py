@@ -0,0 +1,181 @@
+"""
+Golden tests for the value parsing kernel
+=========================================
+
+The kernel must return exactly what the original trial-parsing
+implementations returned. Those implementations are reproduced here as
+reference functions and compared over a corpus of real-world shapes,
+edge cases and randomly generated strings.
+"""
+
+import unittest
+import random
+import os
+import sys
+from datetime import datetime
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from scripts.data_processing.mappers.value_parsers import (
+    DATE_FORMATS, clear_date_cache, date_cache_info, parse_bool, parse_bools,
+    parse_date_formats, parse_dates, parse_float, parse_floats, parse_int, parse_ints,
+)
+from scripts.data_processing.mappers.common_utilities import DataValidationUtils
+from scripts.data_processing.mappers.enhanced_base_mapper import XMLProcessingMixin
+
+
+def reference_parse_date(date_str, formats=DATE_FORMATS):
+    """Original DataValidationUtils.parse_date_flexible"""
+    if not date_str:
+        return None
+    date_str = date_str.strip()
+    if not date_str:
+        return None
+    for date_format in formats:
+        try:
+            return datetime.strptime(date_str, date_format)
+        except ValueError:
+            continue
+    return None
+
+
+def reference_safe_int(value):
+    """Original DataValidationUtils.safe_int_convert"""
+    if not value:
+        return None
+    try:
+        return int(value.strip())
+    except ValueError:
+        try:
+            float_val = float(value.strip())
+            if float_val == float('inf') or float_val == float('-inf') or float_val != float_val:
+                return None
+            return int(float_val)
+        except (ValueError, AttributeError, OverflowError):
+            return None
+    except AttributeError:
+        return None
+
+
+def reference_safe_float(value):
+    """Original DataValidationUtils.safe_float_convert"""
+    if not value:
+        return None
+    try:
+        return float(value.strip())
+    except (ValueError, AttributeError):
+        return None
+
+
+DATE_CORPUS = [
+    # Fast-path shapes
+    '2023-12-25', '25-12-2023', '2023/12/25', '25/12/2023', '2023-12-25T14:30:00',
+    '25-12-2023 14:30:00', '18/11/2004 00:00:00', '2004/11/18 00:00:00', '2014-08', '2008',
+    '2004-12-09 00:00:00',
+    # Fallback shapes
+    '1/1/2023', '1-1-2023', '2023-1-5', '2023/1/5', '5/12/2023 9:05:01', '  2023-12-25  ',
+    '2023-12-25T14:30', '2023-12-25 14:30:00.0', '0001-01-01', '9999-12-31',
+    # Invalid values
+    '2023-02-30', '2023-13-01', '31/04/2023', '2023-00-10', '0000-01-01', '2014-13',
+    '2023-12-25T25:00:00', '25/12/2023 14:60:00', '１２３４', '2023-12-2a', '+023-12-25',
+    '2023_12_25', '25.12.2023', 'abc', '', '   ', None, '20231225', '2023-12-25Z',
+]
+
+
+def random_date_strings(count, seed=1234):
+    """Strings built from date-like characters, biased towards real shapes"""
+    rng = random.Random(seed)
+    alphabet = '0123456789-/: T'
+    shapes = ['dddd-dd-dd', 'dd/dd/dddd', 'dd-dd-dddd', 'dddd/dd/dd', 'dddd-dd-ddTdd:dd:dd',
+              'dd/dd/dddd dd:dd:dd', 'dddd-dd', 'dddd', 'd/d/dddd']
+    values = []
+    for _ in range(count):
+        if rng.random() < 0.7:
+            shape = rng.choice(shapes)
+            values.append(''.join(rng.choice('0123456789') if c == 'd' else c for c in shape))
+        else:
+            values.append(''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 20))))
+    return values
+
+
+class TestDateKernel(unittest.TestCase):
+    """Dates match the strptime trial parsing exactly"""
+
+    def test_corpus_matches_reference(self):
+        for value in DATE_CORPUS:
+            with self.subTest(value=value):
+                self.assertEqual(parse_date_formats(value, warn=False), reference_parse_date(value))
+                self.assertEqual(DataValidationUtils.parse_date_flexible(value), reference_parse_date(value))
+
+    def test_random_strings_match_reference(self):
+        for value in random_date_strings(5000):
+            self.assertEqual(parse_date_formats(value, warn=False), reference_parse_date(value), value)
+
+    def test_format_subsets(self):
+        subsets = [('%Y-%m-%d',), ('%d/%m/%Y',), ('%Y-%m-%d %H:%M:%S',), ('%d-%m-%Y', '%Y')]
+        for formats in subsets:
+            for value in DATE_CORPUS:
+                with self.subTest(formats=formats, value=value):
+                    self.assertEqual(
+                        parse_date_formats(value, formats, warn=False), reference_parse_date(value, formats)
+                    )
+
+    def test_safe_date_extract(self):
+        element = type('Element', (), {})()
+        for value in DATE_CORPUS:
+            element.text = value
+            expected = None
+            if value:
+                expected = reference_parse_date(value, ('%Y-%m-%d', '%d-%m-%Y', '%Y/%m/%d', '%d/%m/%Y'))
+            with self.subTest(value=value):
+                self.assertEqual(XMLProcessingMixin.safe_date_extract(element), expected)
+
+    def test_memo_hits_and_single_warning(self):
+        clear_date_cache()
+        with self.assertLogs('scripts.data_processing.mappers.value_parsers', 'WARNING') as logs:
+            for _ in range(3):
+                parse_date_formats('not a date')
+        self.assertEqual(len(logs.output), 1)
+
+        parse_dates(['2023-12-25'] * 10)
+        info = date_cache_info()
+        self.assertGreaterEqual(info.hits, 11)
+
+
+class TestNumberKernel(unittest.TestCase):
+    """Numbers and booleans match the original converters"""
+
+    NUMBERS = ['1', ' 42 ', '211.0', '-5', '+7', '1_000', '1e3', 'inf', '-inf', 'nan', '1e400',
+               '3.7', '', '   ', None, 'abc', '１２', '0x10', '12 34', '007']
+
+    def test_ints(self):
+        for value in self.NUMBERS:
+            with self.subTest(value=value):
+                self.assertEqual(parse_int(value), reference_safe_int(value))
+                self.assertEqual(DataValidationUtils.safe_int_convert(value), reference_safe_int(value))
+        self.assertEqual(parse_ints(self.NUMBERS), [reference_safe_int(v) for v in self.NUMBERS])
+
+    def test_floats(self):
+        for value in self.NUMBERS:
+            with self.subTest(value=value):
+                expected = reference_safe_float(value)
+                result = parse_float(value)
+                if expected != expected:  # NaN
+                    self.assertNotEqual(result, result)
+                else:
+                    self.assertEqual(result, expected)
+        self.assertEqual(len(parse_floats(self.NUMBERS)), len(self.NUMBERS))
+
+    def test_bools(self):
+        cases = {'true': True, 'TRUE': True, ' Sim ': True, 's': True, '1': True,
+                 'false': False, 'Não': False, 'nao': False, 'N': False, '0': False,
+                 'maybe': None, '': None, None: None}
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                self.assertIs(parse_bool(value), expected)
+        self.assertEqual(parse_bools(list(cases)), list(cases.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()